@@ -0,0 +1,277 @@
+"""
+Answer Key Module - Proyecto Alpha v4.0
+Claves de respuesta compiladas: índice canónico por opción y tabla de feedback.
+"""
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # La corrección por lotes funciona igual en Python puro
+    np = None
+
+# Índice de una opción que no pertenece al ítem
+UNKNOWN_OPTION = -1
+
+
+class GradeResult(NamedTuple):
+    """Resultado de corregir una respuesta."""
+
+    correct: bool
+    option_index: int
+    feedback: str
+
+
+class CompiledItem(NamedTuple):
+    """
+    Ítem corregible compilado una sola vez.
+
+    Corregir es buscar el índice de la opción elegida y compararlo con
+    `correct_index`; el feedback sale de la tabla `feedback` por índice.
+    """
+
+    item_id: Hashable
+    options: Tuple[str, ...]
+    option_index: Mapping[str, int]
+    correct_index: int
+    feedback: Tuple[str, ...]
+    fallback: Callable[[str], str]
+
+    @property
+    def answer(self) -> str:
+        return self.options[self.correct_index]
+
+    def index_of(self, option: str) -> int:
+        """Índice canónico de una opción (UNKNOWN_OPTION si no existe)."""
+        return self.option_index.get(option, UNKNOWN_OPTION)
+
+    def grade(self, option: str) -> GradeResult:
+        """
+        Corrige una opción elegida.
+
+        Args:
+            option: Texto de la opción elegida
+
+        Returns:
+            GradeResult con el feedback precalculado
+        """
+        index = self.option_index.get(option, UNKNOWN_OPTION)
+        if index == UNKNOWN_OPTION:
+            return GradeResult(False, index, self.fallback(option))
+        return GradeResult(index == self.correct_index, index, self.feedback[index])
+
+
+def compile_item(item_id: Hashable, options: Iterable[str], answer: str,
+                 feedback_for: Callable[[str], str]) -> CompiledItem:
+    """
+    Compila un ítem a partir de sus opciones y su respuesta.
+
+    Args:
+        item_id: Identificador del ítem en el banco
+        options: Opciones en orden canónico
+        answer: Opción correcta
+        feedback_for: Construye el feedback de una opción (se llama una vez por opción)
+
+    Returns:
+        CompiledItem inmutable
+
+    Raises:
+        ValueError: Si la respuesta no está entre las opciones
+    """
+    options = tuple(options)
+    option_index = {option: index for index, option in enumerate(options)}
+    if answer not in option_index:
+        raise ValueError(f"Ítem {item_id}: la respuesta '{answer}' no está entre las opciones")
+    return CompiledItem(
+        item_id=item_id,
+        options=options,
+        option_index=MappingProxyType(option_index),
+        correct_index=option_index[answer],
+        feedback=tuple(feedback_for(option) for option in options),
+        fallback=feedback_for,
+    )
+
+
+# ----------------------------------------------------------------------
+# Plantillas de feedback de cada origen
+# ----------------------------------------------------------------------
+
+def mission_feedback(mission: Dict[str, Any], option: str) -> str:
+    """
+    Feedback de GameController.handle_answer para una misión.
+
+    En las respuestas correctas falta la línea de racha, que depende del
+    estado de la sesión y se añade al mostrarla.
+    """
+    answer = mission["answer"]
+    if option == answer:
+        feedback = f"✅ ¡EXCELENTE! ¡Respuesta correcta!\n\n"
+        feedback += f"🎯 Tu respuesta: {option}\n\n"
+        feedback += f"📚 Explicación: {mission['options'][option]}\n\n"
+        if 'explanation' in mission:
+            feedback += f"💡 ¿Por qué es correcta? {mission['explanation']}\n\n"
+        return feedback
+    feedback = f"❌ Respuesta incorrecta, pero ¡no te preocupes! Así se aprende.\n\n"
+    feedback += f"🔴 Tu respuesta: {option}\n"
+    feedback += f"✅ Respuesta correcta: {answer}\n\n"
+    feedback += f"📚 ¿Por qué es correcta? {mission['options'][answer]}\n\n"
+    if 'explanation' in mission:
+        feedback += f"💡 Explicación detallada: {mission['explanation']}\n\n"
+    feedback += "💪 ¡Puedes intentarlo de nuevo o continuar a la siguiente misión!"
+    return feedback
+
+
+def streak_line(streak: int) -> str:
+    """Línea final del feedback correcto de una misión."""
+    return f"🔥 ¡Llevas {streak} respuestas correctas seguidas!"
+
+
+def question_feedback(answer: str, option: str) -> str:
+    """Feedback de QuizGame.check_answer (sin la explicación del modo estudio)."""
+    if option == answer:
+        return "✅ ¡Correcto!"
+    return f"❌ Incorrecto. Respuesta correcta: {answer}"
+
+
+def compile_mission(mission_id: int, mission: Dict[str, Any]) -> CompiledItem:
+    """Compila una misión de MISSIONS."""
+    return compile_item(mission_id, mission["options"], mission["answer"],
+                        lambda option: mission_feedback(mission, option))
+
+
+def compile_question(item_id: Hashable, question) -> CompiledItem:
+    """Compila una pregunta de repaso_ia (Question o diccionario)."""
+    options = question["options"] if isinstance(question, dict) else question.options
+    answer = question["answer"] if isinstance(question, dict) else question.answer
+    return compile_item(item_id, options, answer, lambda option: question_feedback(answer, option))
+
+
+def compile_puzzle(item_id: Hashable, puzzle) -> CompiledItem:
+    """Compila un SimplePuzzle con el feedback de validate_puzzle_answer."""
+    from simple_puzzles import _build_feedback
+
+    return compile_item(item_id, puzzle.options, puzzle.answer,
+                        lambda option: _build_feedback(puzzle, option))
+
+
+class AnswerKey:
+    """
+    Banco de ítems compilados con corrección individual y por lotes.
+
+    Los ítems se numeran en orden de inserción; `correct_indices` guarda
+    la respuesta canónica de cada uno para comparar lotes de enteros.
+    """
+
+    def __init__(self, items: Iterable[CompiledItem] = ()):
+        self.items: Dict[Hashable, CompiledItem] = {}
+        self._positions: Dict[Hashable, int] = {}
+        self.correct_indices: List[int] = []
+        for item in items:
+            self.add(item)
+
+    def add(self, item: CompiledItem) -> None:
+        """Añade (o reemplaza) un ítem compilado."""
+        if item.item_id in self._positions:
+            self.correct_indices[self._positions[item.item_id]] = item.correct_index
+        else:
+            self._positions[item.item_id] = len(self.correct_indices)
+            self.correct_indices.append(item.correct_index)
+        self.items[item.item_id] = item
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item_id: Hashable) -> bool:
+        return item_id in self.items
+
+    def get(self, item_id: Hashable) -> Optional[CompiledItem]:
+        return self.items.get(item_id)
+
+    def grade(self, item_id: Hashable, option: str) -> GradeResult:
+        """
+        Corrige una respuesta.
+
+        Raises:
+            KeyError: Si el ítem no está en el banco
+        """
+        return self.items[item_id].grade(option)
+
+    def encode(self, item_ids: Sequence[Hashable], options: Sequence[str]) -> Tuple[List[int], List[int]]:
+        """
+        Convierte filas (ítem, opción) en enteros.
+
+        Returns:
+            (posición del ítem o -1, índice de la opción o -1) por fila
+        """
+        positions, chosen = [], []
+        get_position, items = self._positions.get, self.items
+        for item_id, option in zip(item_ids, options):
+            position = get_position(item_id, UNKNOWN_OPTION)
+            positions.append(position)
+            chosen.append(items[item_id].option_index.get(option, UNKNOWN_OPTION)
+                          if position != UNKNOWN_OPTION else UNKNOWN_OPTION)
+        return positions, chosen
+
+    def grade_batch(self, item_ids: Sequence[Hashable], options: Sequence[str],
+                    use_numpy: Optional[bool] = None) -> List[bool]:
+        """
+        Corrige muchas respuestas: una búsqueda por fila y una comparación de enteros.
+
+        Las filas con ítems u opciones desconocidos cuentan como incorrectas.
+
+        Args:
+            item_ids: Ítem de cada fila
+            options: Opción elegida en cada fila
+            use_numpy: Forzar (True) o evitar (False) NumPy; None = usarlo si está instalado
+
+        Returns:
+            Lista de aciertos por fila
+        """
+        positions, chosen = self.encode(item_ids, options)
+        return self.grade_encoded(positions, chosen, use_numpy)
+
+    def grade_encoded(self, positions: Sequence[int], chosen: Sequence[int],
+                      use_numpy: Optional[bool] = None) -> List[bool]:
+        """Corrige filas ya codificadas por `encode`."""
+        if use_numpy is None:
+            use_numpy = np is not None
+        if use_numpy and np is None:
+            raise ImportError("NumPy no está instalado")
+        if use_numpy:
+            positions_array = np.asarray(positions, dtype=np.int64)
+            chosen_array = np.asarray(chosen, dtype=np.int64)
+            # El centinela -1 nunca coincide: la respuesta canónica es >= 0
+            correct = np.append(np.asarray(self.correct_indices, dtype=np.int64), -2)[positions_array]
+            return (chosen_array == correct).tolist()
+        correct_indices = self.correct_indices
+        return [position != UNKNOWN_OPTION and index == correct_indices[position]
+                for position, index in zip(positions, chosen)]
+
+
+def build_mission_key(missions: Dict[int, Dict[str, Any]]) -> AnswerKey:
+    """
+    Compila las misiones con opciones y respuesta válidas.
+
+    Args:
+        missions: Diccionario id -> misión
+
+    Returns:
+        AnswerKey indexado por ID de misión
+    """
+    return AnswerKey(compile_mission(mission_id, mission)
+                     for mission_id, mission in sorted(missions.items())
+                     if mission.get("answer") in mission.get("options", {}))
+
+
+_mission_key: Optional[AnswerKey] = None
+
+
+def get_mission_key() -> AnswerKey:
+    """Obtiene la clave compilada de MISSIONS (se construye la primera vez)."""
+    global _mission_key
+    if _mission_key is None:
+        from missions import MISSIONS
+
+        _mission_key = build_mission_key(MISSIONS)
+    return _mission_key
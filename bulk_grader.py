@@ -0,0 +1,374 @@
+"""
+Bulk Grader Module - Proyecto Alpha v4.0
+Corrección fuera de línea de hojas de respuestas exportadas (CSV o JSONL) en streaming.
+"""
+
+import csv
+import gzip
+import json
+import statistics
+import sys
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from answer_key import AnswerKey, UNKNOWN_OPTION, compile_question, get_mission_key
+
+# Filas que se corrigen juntas: el tamaño del lote acota la memoria de trabajo
+DEFAULT_BATCH_SIZE = 50_000
+
+# Nombres de columna aceptados (el primero es el canónico)
+COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "student": ("student", "student_id", "alumno"),
+    "question_id": ("question_id", "mission_id", "question", "pregunta"),
+    "option": ("option", "answer", "respuesta"),
+    "time": ("time", "time_taken", "tiempo"),
+    "hints": ("hints", "hints_used", "pistas"),
+    "retried": ("retried", "reintento"),
+}
+
+_TRUE_VALUES = ("1", "true", "yes", "si", "sí", "x")
+
+
+class AnswerRow(NamedTuple):
+    """Una respuesta exportada."""
+
+    student: str
+    question_id: Any
+    option: str
+    time_taken: float
+    hints_used: bool
+    retried: bool
+
+
+def _flag(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in _TRUE_VALUES
+
+
+def _pick(record: Dict[str, Any], field: str) -> Any:
+    for name in COLUMN_ALIASES[field]:
+        if name in record:
+            return record[name]
+    return None
+
+
+def _open_text(path: str):
+    if path == "-":
+        return sys.stdin
+    opener = gzip.open if path.endswith(".gz") else open
+    return opener(path, "rt", encoding="utf-8", newline="")
+
+
+def read_records(path: str) -> Iterator[Optional[Dict[str, Any]]]:
+    """
+    Itera los registros de un CSV o JSONL (también .gz) sin cargarlo entero.
+
+    Args:
+        path: Archivo de entrada ("-" = entrada estándar en JSONL)
+
+    Yields:
+        Un diccionario por fila; None si una línea JSONL no es un objeto
+        JSON válido (se cuenta como mal formada sin detener la corrección)
+    """
+    name = path[:-3] if path.endswith(".gz") else path
+    f = _open_text(path)
+    try:
+        if name.endswith(".csv"):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                yield record if isinstance(record, dict) else None
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+class StudentMetrics:
+    """
+    Acumulador por alumno equivalente a AcademicMetrics.record_answer.
+
+    En lugar del historial de diccionarios guarda un byte por respuesta
+    (acierto/fallo), suficiente para recalcular consistencia y velocidad
+    de aprendizaje al final exactamente como lo hace la aplicación.
+    """
+
+    __slots__ = ("total", "correct", "incorrect", "hints", "retries",
+                 "time_spent", "streak_current", "streak_best", "history")
+
+    def __init__(self):
+        self.total = 0
+        self.correct = 0
+        self.incorrect = 0
+        self.hints = 0
+        self.retries = 0
+        self.time_spent = 0
+        self.streak_current = 0
+        self.streak_best = 0
+        self.history = bytearray()
+
+    def record(self, correct: bool, time_taken: float, hints_used: bool = False, retried: bool = False) -> None:
+        """Registra una respuesta con las mismas reglas que AcademicMetrics.record_answer."""
+        self.total += 1
+        if correct:
+            self.correct += 1
+            self.streak_current += 1
+            if self.streak_current > self.streak_best:
+                self.streak_best = self.streak_current
+        else:
+            self.incorrect += 1
+            self.streak_current = 0
+        if hints_used:
+            self.hints += 1
+        if retried:
+            self.retries += 1
+        self.time_spent += time_taken
+        self.history.append(1 if correct else 0)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Métricas finales con las claves de AcademicMetrics.metrics.
+
+        Las derivadas reproducen `_update_derived_metrics` tras la última
+        respuesta: la consistencia usa las 10 últimas (con 5 o más) y la
+        velocidad de aprendizaje conserva 0.0 mientras la primera mitad no
+        tenga aciertos, que es cuando la aplicación nunca la actualiza.
+        """
+        total = self.total
+        history = self.history
+        consistency = 0.0
+        if total >= 5:
+            recent = list(history[-10:])
+            consistency = 1 - (statistics.stdev(recent) / 0.5)
+        velocity = 0.0
+        if total >= 10:
+            first_half = sum(history[:total // 2])
+            second_half = sum(history[total // 2:])
+            if first_half > 0:
+                velocity = (second_half - first_half) / first_half
+        return {
+            "total_questions": total,
+            "correct_answers": self.correct,
+            "incorrect_answers": self.incorrect,
+            "hints_used": self.hints,
+            "retries_used": self.retries,
+            "time_spent": self.time_spent,
+            "average_time_per_question": self.time_spent / total if total > 0 else 0,
+            "streak_current": self.streak_current,
+            "streak_best": self.streak_best,
+            "mastery_level": self.correct / total if total > 0 else 0.0,
+            "difficulty_progression": [],
+            "concept_mastery": {},
+            "learning_velocity": velocity,
+            "consistency_score": consistency,
+        }
+
+
+class GradingReport:
+    """Resultado de una corrección masiva."""
+
+    def __init__(self):
+        self.students: Dict[str, StudentMetrics] = defaultdict(StudentMetrics)
+        self.rows = 0
+        self.graded = 0
+        self.unknown_items = 0
+        self.malformed = 0
+        self.batches = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "graded": self.graded,
+            "unknown_items": self.unknown_items,
+            "malformed": self.malformed,
+            "students": {student: metrics.metrics() for student, metrics in sorted(self.students.items())},
+        }
+
+
+def load_bank(source: str = "missions") -> Tuple[AnswerKey, Callable[[Any], Any]]:
+    """
+    Carga el banco compilado contra el que se corrige.
+
+    Args:
+        source: "missions" (IDs de misión) o ruta a un JSON de preguntas
+            de repaso_ia (ID = texto de la pregunta)
+
+    Returns:
+        (AnswerKey, función que normaliza el ID leído de la fila)
+    """
+    if source == "missions":
+        def mission_id(value: Any) -> Any:
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return value
+
+        return get_mission_key(), mission_id
+    from storage import load_json
+
+    answer_key = AnswerKey()
+    for question in load_json(source):
+        try:
+            answer_key.add(compile_question(question["question"], question))
+        except (KeyError, ValueError):
+            continue
+    return answer_key, lambda value: value
+
+
+def parse_rows(records: Iterable[Optional[Dict[str, Any]]], normalize_id: Callable[[Any], Any],
+               report: GradingReport) -> Iterator[AnswerRow]:
+    """Convierte registros en AnswerRow; los ilegibles (None) o incompletos cuentan como mal formados."""
+    for record in records:
+        report.rows += 1
+        if record is None:
+            report.malformed += 1
+            continue
+        student = _pick(record, "student")
+        question_id = _pick(record, "question_id")
+        try:
+            time_taken = float(_pick(record, "time") or 0)
+        except (TypeError, ValueError):
+            report.malformed += 1
+            continue
+        if student in (None, "") or question_id in (None, ""):
+            report.malformed += 1
+            continue
+        yield AnswerRow(str(student), normalize_id(question_id), str(_pick(record, "option") or ""),
+                        time_taken, _flag(_pick(record, "hints")), _flag(_pick(record, "retried")))
+
+
+def _batches(rows: Iterator[AnswerRow], size: int) -> Iterator[List[AnswerRow]]:
+    batch: List[AnswerRow] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def grade_rows(records: Iterable[Optional[Dict[str, Any]]], answer_key: AnswerKey,
+               normalize_id: Callable[[Any], Any] = lambda value: value,
+               batch_size: int = DEFAULT_BATCH_SIZE, use_numpy: Optional[bool] = None,
+               report: Optional[GradingReport] = None) -> GradingReport:
+    """
+    Corrige registros por lotes y acumula las métricas de cada alumno.
+
+    Cada lote se codifica a enteros y se corrige de una vez
+    (AnswerKey.grade_encoded); después las filas se aplican en orden a su
+    alumno. Las preguntas que no están en el banco no se registran, igual
+    que en la aplicación, donde no se pueden responder.
+
+    Args:
+        records: Diccionarios de fila (ver COLUMN_ALIASES)
+        answer_key: Banco compilado
+        normalize_id: Conversión del ID leído al ID del banco
+        batch_size: Filas por lote
+        use_numpy: Forzar (True) o evitar (False) NumPy; None = usarlo si está instalado
+        report: Informe a completar (se crea uno si es None)
+
+    Returns:
+        GradingReport con las métricas por alumno
+    """
+    report = report or GradingReport()
+    students = report.students
+    for batch in _batches(parse_rows(records, normalize_id, report), batch_size):
+        report.batches += 1
+        positions, chosen = answer_key.encode([row.question_id for row in batch],
+                                              [row.option for row in batch])
+        results = answer_key.grade_encoded(positions, chosen, use_numpy)
+        for row, position, correct in zip(batch, positions, results):
+            if position == UNKNOWN_OPTION:
+                report.unknown_items += 1
+                continue
+            students[row.student].record(correct, row.time_taken, row.hints_used, row.retried)
+            report.graded += 1
+    return report
+
+
+def grade_files(paths: List[str], bank: str = "missions", batch_size: int = DEFAULT_BATCH_SIZE,
+                use_numpy: Optional[bool] = None) -> GradingReport:
+    """
+    Corrige uno o varios archivos en orden.
+
+    Args:
+        paths: Archivos CSV/JSONL (opcionalmente .gz)
+        bank: Banco de preguntas (ver load_bank)
+        batch_size: Filas por lote
+        use_numpy: Ver grade_rows
+
+    Returns:
+        GradingReport combinado
+    """
+    answer_key, normalize_id = load_bank(bank)
+    report = GradingReport()
+    for path in paths:
+        grade_rows(read_records(path), answer_key, normalize_id, batch_size, use_numpy, report)
+    return report
+
+
+def write_csv(path: str, report: GradingReport) -> None:
+    """Guarda las métricas por alumno en CSV (una fila por alumno)."""
+    columns = ["student", "total_questions", "correct_answers", "incorrect_answers", "hints_used",
+               "retries_used", "time_spent", "average_time_per_question", "streak_current",
+               "streak_best", "mastery_level", "learning_velocity", "consistency_score"]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for student in sorted(report.students):
+            metrics = report.students[student].metrics()
+            writer.writerow([student] + [metrics[column] for column in columns[1:]])
+
+
+def format_report(report: GradingReport, top: int = 10) -> str:
+    """Resumen legible de la corrección."""
+    lines = [
+        f"📄 Filas: {report.rows}  corregidas: {report.graded}  "
+        f"preguntas desconocidas: {report.unknown_items}  mal formadas: {report.malformed}",
+        f"👥 Alumnos: {len(report.students)}  lotes: {report.batches}",
+    ]
+    ranked = sorted(report.students.items(), key=lambda item: (-item[1].correct, item[0]))[:top]
+    for student, metrics in ranked:
+        accuracy = metrics.correct / metrics.total if metrics.total else 0
+        lines.append(f"  {student:<20} {metrics.correct:>6}/{metrics.total:<6} {accuracy:6.1%}  "
+                     f"racha {metrics.streak_best}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Corrige hojas de respuestas exportadas")
+    parser.add_argument("paths", nargs="+", help="Archivos CSV o JSONL (.gz admitido, '-' = stdin JSONL)")
+    parser.add_argument("--bank", default="missions",
+                        help="'missions' o ruta a un JSON de preguntas de repaso_ia")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Filas por lote")
+    parser.add_argument("--no-numpy", action="store_true", help="Corregir en Python puro")
+    parser.add_argument("--top", type=int, default=10, help="Alumnos a mostrar")
+    parser.add_argument("--output", help="Guarda las métricas por alumno (.csv o .json)")
+    args = parser.parse_args(argv)
+
+    report = grade_files(args.paths, bank=args.bank, batch_size=max(1, args.batch_size),
+                         use_numpy=False if args.no_numpy else None)
+    print(format_report(report, args.top))
+    if args.output:
+        if args.output.endswith(".csv"):
+            write_csv(args.output, report)
+        else:
+            from storage import save_json
+
+            save_json(args.output, report.to_dict(), compression="none")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
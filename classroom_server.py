@@ -0,0 +1,490 @@
+"""
+Classroom Server Module - Proyecto Alpha v4.0
+Servidor asyncio de aula: salas de quiz por JSON delimitado por líneas y cliente de carga.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from answer_key import AnswerKey, compile_question, get_mission_key
+from bulk_grader import StudentMetrics
+from config import CLASSROOM_CONFIG
+from latency_monitor import LatencyHistogram
+
+PROTOCOL_VERSION = 1
+
+logger = logging.getLogger("ClassroomServer")
+
+
+class RoomQuestion(NamedTuple):
+    """Pregunta tal como se envía a los clientes (sin la respuesta)."""
+
+    item_id: Any
+    title: str
+    prompt: str
+    options: Tuple[str, ...]
+
+
+def load_room_bank(source: str = "missions") -> Tuple[List[RoomQuestion], AnswerKey]:
+    """
+    Carga las preguntas de las salas y su clave compilada.
+
+    Args:
+        source: "missions" o ruta a un JSON de preguntas de repaso_ia
+
+    Returns:
+        (preguntas en orden, AnswerKey con los mismos IDs)
+    """
+    if source == "missions":
+        from missions import MISSIONS
+
+        answer_key = get_mission_key()
+        # Las misiones de una sola opción (cierre de evaluación) no son preguntas
+        questions = [RoomQuestion(mission_id, MISSIONS[mission_id]["title"], MISSIONS[mission_id]["story"],
+                                  answer_key.get(mission_id).options)
+                     for mission_id in sorted(MISSIONS)
+                     if mission_id in answer_key and len(answer_key.get(mission_id).options) > 1]
+        return questions, answer_key
+    from storage import load_json
+
+    questions, answer_key = [], AnswerKey()
+    for data in load_json(source):
+        try:
+            item = compile_question(data["question"], data)
+        except (KeyError, ValueError):
+            continue
+        answer_key.add(item)
+        questions.append(RoomQuestion(item.item_id, data.get("category", ""), data["question"], item.options))
+    return questions, answer_key
+
+
+class StudentSession:
+    """Progreso de un alumno dentro de una sala."""
+
+    __slots__ = ("student", "position", "pushed_at", "metrics", "connected")
+
+    def __init__(self, student: str):
+        self.student = student
+        self.position = 0
+        self.pushed_at: Optional[float] = None
+        self.metrics = StudentMetrics()
+        self.connected = True
+
+
+class QuizRoom:
+    """
+    Sala de quiz: lógica de juego sin red.
+
+    Cada alumno avanza a su ritmo por las mismas preguntas. El tiempo de
+    respuesta lo mide el servidor (desde que envía la pregunta hasta que
+    recibe la respuesta), así no depende del reloj de cada equipo.
+    """
+
+    def __init__(self, room_id: str, questions: List[RoomQuestion], answer_key: AnswerKey,
+                 clock: Callable[[], float] = time.monotonic):
+        self.room_id = room_id
+        self.questions = questions
+        self.answer_key = answer_key
+        self.clock = clock
+        self.students: Dict[str, StudentSession] = {}
+        self.answers = 0
+
+    def join(self, student: str) -> StudentSession:
+        """Entra (o vuelve a entrar, conservando el progreso) en la sala."""
+        session = self.students.get(student)
+        if session is None:
+            session = self.students[student] = StudentSession(student)
+        session.connected = True
+        return session
+
+    def question_message(self, session: StudentSession) -> Dict[str, Any]:
+        """Siguiente mensaje para el alumno: pregunta o fin de la sala."""
+        if session.position >= len(self.questions):
+            session.pushed_at = None
+            return {"type": "finished", "room": self.room_id, "metrics": session.metrics.metrics()}
+        question = self.questions[session.position]
+        session.pushed_at = self.clock()
+        return {
+            "type": "question",
+            "index": session.position,
+            "total": len(self.questions),
+            "title": question.title,
+            "prompt": question.prompt,
+            "options": list(question.options),
+        }
+
+    def answer(self, session: StudentSession, index: int, option: str) -> Dict[str, Any]:
+        """
+        Corrige la respuesta a la pregunta actual del alumno.
+
+        Args:
+            session: Alumno que responde
+            index: Índice de la pregunta respondida
+            option: Opción elegida
+
+        Returns:
+            Mensaje de resultado
+
+        Raises:
+            ValueError: Si no es la pregunta pendiente del alumno
+        """
+        if session.pushed_at is None or index != session.position:
+            raise ValueError(f"La pregunta {index} no está pendiente")
+        question = self.questions[index]
+        graded = self.answer_key.grade(question.item_id, option)
+        time_taken = self.clock() - session.pushed_at
+        session.metrics.record(graded.correct, time_taken)
+        session.position += 1
+        self.answers += 1
+        return {
+            "type": "result",
+            "index": index,
+            "correct": graded.correct,
+            "feedback": graded.feedback,
+            "score": session.metrics.correct,
+            "time_taken": round(time_taken, 3),
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Resultados de la sala por alumno."""
+        return {
+            "room": self.room_id,
+            "questions": len(self.questions),
+            "answers": self.answers,
+            "students": {student: dict(session.metrics.metrics(), position=session.position,
+                                       connected=session.connected)
+                         for student, session in sorted(self.students.items())},
+        }
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Serializa un mensaje del protocolo (una línea JSON)."""
+    return (json.dumps(message, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class ClassroomServer:
+    """
+    Servidor de aula sobre asyncio.
+
+    Protocolo: una línea JSON por mensaje en cada sentido.
+      cliente -> {"type": "join", "room": ..., "student": ...}
+                 {"type": "answer", "index": n, "option": ...}
+                 {"type": "stats"} | {"type": "leave"}
+      servidor -> joined, question, result, finished, stats, error
+    Tras cada respuesta el servidor envía el resultado y, en el mismo
+    envío, la pregunta siguiente.
+    """
+
+    def __init__(self, questions: List[RoomQuestion], answer_key: AnswerKey,
+                 host: Optional[str] = None, port: Optional[int] = None):
+        """
+        Inicializa el servidor.
+
+        Args:
+            questions: Preguntas de cada sala
+            answer_key: Clave compilada de esas preguntas
+            host: Interfaz de escucha (CLASSROOM_CONFIG si es None)
+            port: Puerto (CLASSROOM_CONFIG si es None; 0 = libre)
+        """
+        self.questions = questions
+        self.answer_key = answer_key
+        self.host = host if host is not None else CLASSROOM_CONFIG.get("host", "127.0.0.1")
+        self.port = port if port is not None else CLASSROOM_CONFIG.get("port", 8765)
+        self.rooms: Dict[str, QuizRoom] = {}
+        self.handle_latency = LatencyHistogram()
+        self.messages = 0
+        self.connections = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def room(self, room_id: str) -> QuizRoom:
+        """Obtiene (o crea) una sala."""
+        room = self.rooms.get(room_id)
+        if room is None:
+            room = self.rooms[room_id] = QuizRoom(room_id, self.questions, self.answer_key)
+            logger.info(f"Sala creada: {room_id}")
+        return room
+
+    async def start(self) -> int:
+        """
+        Empieza a escuchar.
+
+        Returns:
+            Puerto en uso (útil con port=0)
+        """
+        limit = CLASSROOM_CONFIG.get("max_line_bytes", 65536)
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port, limit=limit)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Servidor de aula en {self.host}:{self.port}")
+        return self.port
+
+    async def close(self) -> None:
+        """Deja de aceptar conexiones y espera al cierre del socket."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def handle_message(self, state: Dict[str, Any], message: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Procesa un mensaje de un cliente.
+
+        Args:
+            state: Estado de la conexión (sala y alumno)
+            message: Mensaje recibido
+
+        Returns:
+            Mensajes de respuesta en orden
+        """
+        kind = message.get("type")
+        if kind == "join":
+            student = str(message.get("student") or "").strip()
+            if not student:
+                return [{"type": "error", "message": "Falta el alumno"}]
+            room = self.room(str(message.get("room") or CLASSROOM_CONFIG.get("default_room", "aula")))
+            session = room.join(student)
+            state["room"], state["session"] = room, session
+            return [{"type": "joined", "protocol": PROTOCOL_VERSION, "room": room.room_id,
+                     "student": student, "questions": len(room.questions)},
+                    room.question_message(session)]
+        room, session = state.get("room"), state.get("session")
+        if kind == "stats":
+            return [dict(self.stats(), type="stats")]
+        if room is None:
+            return [{"type": "error", "message": "Primero hay que unirse a una sala"}]
+        if kind == "answer":
+            try:
+                index = int(message.get("index", -1))
+            except (TypeError, ValueError):
+                return [{"type": "error", "message": f"Índice de pregunta no válido: {message.get('index')!r}"}]
+            try:
+                result = room.answer(session, index, str(message.get("option", "")))
+            except ValueError as e:
+                return [{"type": "error", "message": str(e)}]
+            return [result, room.question_message(session)]
+        if kind == "leave":
+            session.connected = False
+            state["room"] = state["session"] = None
+            return [{"type": "bye"}]
+        return [{"type": "error", "message": f"Tipo de mensaje desconocido: {kind}"}]
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        state: Dict[str, Any] = {}
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(encode_message({"type": "error", "message": "Línea demasiado larga"}))
+                    break
+                if not line:
+                    break
+                start = time.perf_counter()
+                try:
+                    message = json.loads(line)
+                    if not isinstance(message, dict):
+                        raise ValueError("se esperaba un objeto")
+                except ValueError as e:
+                    replies = [{"type": "error", "message": f"JSON inválido: {e}"}]
+                else:
+                    try:
+                        replies = self.handle_message(state, message)
+                    except (TypeError, ValueError) as e:
+                        # Un mensaje con campos de tipo inesperado no cierra la conexión
+                        replies = [{"type": "error", "message": f"Mensaje no válido: {e}"}]
+                self.messages += 1
+                writer.write(b"".join(encode_message(reply) for reply in replies))
+                self.handle_latency.record((time.perf_counter() - start) * 1000)
+                await writer.drain()
+                if replies[-1].get("type") == "bye":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if state.get("session") is not None:
+                state["session"].connected = False
+            self.connections -= 1
+            writer.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores del servidor y latencia de proceso por mensaje."""
+        return {
+            "rooms": len(self.rooms),
+            "connections": self.connections,
+            "messages": self.messages,
+            "answers": sum(room.answers for room in self.rooms.values()),
+            "handle_latency": self.handle_latency.summary(),
+        }
+
+    def results(self) -> Dict[str, Any]:
+        """Resultados de todas las salas (para guardar al cerrar)."""
+        return {"stats": self.stats(), "rooms": [room.summary() for room in self.rooms.values()]}
+
+
+# ----------------------------------------------------------------------
+# Cliente de carga
+# ----------------------------------------------------------------------
+
+class LoadTestReport(NamedTuple):
+    """Resultado de una prueba de carga."""
+
+    clients: int
+    answers: int
+    errors: int
+    elapsed_s: float
+    round_trip: Dict[str, float]
+
+    @property
+    def answers_per_second(self) -> float:
+        return self.answers / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+async def _read_message(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("El servidor cerró la conexión")
+    return json.loads(line)
+
+
+async def _simulated_student(host: str, port: int, room: str, student: str, rng: random.Random,
+                             think_time_s: float, histogram: LatencyHistogram, totals: Dict[str, int]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(encode_message({"type": "join", "room": room, "student": student}))
+        await writer.drain()
+        await _read_message(reader)                       # joined
+        message = await _read_message(reader)             # primera pregunta
+        while message.get("type") == "question":
+            if think_time_s:
+                await asyncio.sleep(rng.uniform(0, 2 * think_time_s))
+            start = time.perf_counter()
+            writer.write(encode_message({"type": "answer", "index": message["index"],
+                                         "option": rng.choice(message["options"])}))
+            await writer.drain()
+            result = await _read_message(reader)
+            histogram.record((time.perf_counter() - start) * 1000)
+            if result.get("type") != "result":
+                totals["errors"] += 1
+                break
+            totals["answers"] += 1
+            message = await _read_message(reader)
+        writer.write(encode_message({"type": "leave"}))
+        await writer.drain()
+    except (ConnectionError, OSError, ValueError):
+        totals["errors"] += 1
+    finally:
+        writer.close()
+
+
+async def run_load_test(host: str, port: int, clients: int = 200, room: str = "carga",
+                        think_time_s: float = 0.0, seed: int = 48) -> LoadTestReport:
+    """
+    Simula muchos alumnos concurrentes contra un servidor.
+
+    Cada alumno se une a la sala y responde todas las preguntas con una
+    opción al azar; se mide el tiempo de ida y vuelta de cada respuesta.
+
+    Args:
+        host: Servidor
+        port: Puerto
+        clients: Alumnos simultáneos
+        room: Sala
+        think_time_s: Pausa media antes de cada respuesta
+        seed: Semilla de las respuestas
+
+    Returns:
+        LoadTestReport con rendimiento y percentiles de latencia
+    """
+    histogram = LatencyHistogram()
+    totals = {"answers": 0, "errors": 0}
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _simulated_student(host, port, room, f"alumno{n:04d}", random.Random(f"{seed}:{n}"),
+                           think_time_s, histogram, totals)
+        for n in range(clients)
+    ))
+    elapsed = time.perf_counter() - start
+    return LoadTestReport(clients, totals["answers"], totals["errors"], elapsed, histogram.summary())
+
+
+def format_load_report(report: LoadTestReport) -> str:
+    """Resumen legible de una prueba de carga."""
+    rt = report.round_trip
+    return (f"👥 {report.clients} alumnos, {report.answers} respuestas, {report.errors} errores "
+            f"en {report.elapsed_s:.2f}s ({report.answers_per_second:.0f} respuestas/s)\n"
+            f"⏱️ ida y vuelta: p50={rt['p50_ms']:.2f}ms p95={rt['p95_ms']:.2f}ms "
+            f"p99={rt['p99_ms']:.2f}ms max={rt['max_ms']:.2f}ms")
+
+
+async def _serve(args) -> None:
+    questions, answer_key = load_room_bank(args.bank)
+    server = ClassroomServer(questions, answer_key, args.host, args.port)
+    await server.start()
+    print(f"🏫 Servidor de aula en {server.host}:{server.port} ({len(questions)} preguntas). Ctrl+C para salir.")
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await server.close()
+        if args.results:
+            from storage import save_json
+
+            save_json(args.results, server.results(), compression="none")
+
+
+async def _load_test(args) -> LoadTestReport:
+    server = None
+    host, port = args.host, args.port
+    if args.spawn_server:
+        questions, answer_key = load_room_bank(args.bank)
+        server = ClassroomServer(questions, answer_key, host, 0)
+        port = await server.start()
+    try:
+        return await run_load_test(host, port, args.clients, args.room, args.think_time)
+    finally:
+        if server is not None:
+            print(f"🖥️ Proceso en servidor: {server.stats()['handle_latency']['p99_ms']:.3f}ms p99")
+            await server.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor de aula de Proyecto Alpha")
+    commands = parser.add_subparsers(dest="command")
+    serve = commands.add_parser("serve", help="Aloja salas de quiz")
+    load = commands.add_parser("loadtest", help="Simula alumnos concurrentes")
+    for sub in (serve, load):
+        sub.add_argument("--host", default=CLASSROOM_CONFIG.get("host", "127.0.0.1"))
+        sub.add_argument("--port", type=int, default=CLASSROOM_CONFIG.get("port", 8765))
+        sub.add_argument("--bank", default="missions",
+                         help="'missions' o ruta a un JSON de preguntas de repaso_ia")
+    serve.add_argument("--results", help="Guarda los resultados de las salas al cerrar (JSON)")
+    load.add_argument("--clients", type=int, default=200, help="Alumnos simultáneos")
+    load.add_argument("--room", default="carga", help="Sala")
+    load.add_argument("--think-time", type=float, default=0.0, help="Pausa media antes de responder (s)")
+    load.add_argument("--spawn-server", action="store_true", help="Arranca un servidor en este proceso")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        try:
+            asyncio.run(_serve(args))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if args.command == "loadtest":
+        report = asyncio.run(_load_test(args))
+        print(format_load_report(report))
+        return 1 if report.errors else 0
+    parser.print_help()
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -69,6 +69,29 @@ COLORS: Dict[str, str] = {
 SAVE_FILE: str = "alpha_progress_v3.json"
 CONFIG_FILE: str = "alpha_config.json"
 LOG_FILE: str = "alpha_session.log"
+MISSION_CACHE_FILE: str = "missions_catalog.cache"
+
+# --- CONFIGURACIÓN DE EXPORTACIÓN DE MÉTRICAS ---
+METRICS_CONFIG: Dict[str, Any] = {
+    "enabled": False,                  # Publicar métricas (o ALPHA_METRICS=1)
+    "mode": "http",                    # "http" (endpoint local) o "textfile"
+    "host": "127.0.0.1",               # Sólo accesible desde la propia máquina
+    "port": 9464,                      # Puerto del endpoint /metrics
+    "textfile": "alpha_metrics.prom",  # Archivo para el recolector de textfiles
+    "interval_s": 15,                  # Periodo de reescritura del archivo
+}
+
+# --- CONFIGURACIÓN DE LOGGING ---
+LOGGING_CONFIG: Dict[str, Any] = {
+    "async": True,              # Escritura en un hilo aparte (QueueHandler/QueueListener)
+    "queue_size": 10000,        # Registros en cola antes de descartar
+    "rotation": "size",         # "size", "time" o None
+    "max_bytes": 1048576,       # Tamaño máximo por archivo (rotación por tamaño)
+    "when": "midnight",         # Momento de rotación (rotación por tiempo)
+    "backup_count": 5,          # Archivos rotados que se conservan
+    "json_lines": False,        # Archivo en formato JSON Lines estructurado
+    "sampling": {},             # Prefijo de mensaje -> conservar 1 de cada N
+}
 
 # --- CONSTANTES DE PROFESIONALIZACIÓN ---
 PROFESSIONAL_CONFIG: Dict[str, Any] = {
@@ -97,6 +120,9 @@ ACADEMIC_CONFIG: Dict[str, Any] = {
 
 # --- CONFIGURACIÓN DE UI MODERNA ---
 UI_CONFIG: Dict[str, Any] = {
+    # Skin de interfaz (ver ui_registry.UI_BACKENDS)
+    "skin": "default",
+
     # Dimensiones de ventana
     "window_width": 1400,
     "window_height": 900,
@@ -165,6 +191,74 @@ GAMIFICATION_CONFIG: Dict[str, Any] = {
     "animations": True,
 }
 
+# --- CONFIGURACIÓN DE PUZZLES GENERADOS ---
+PUZZLE_GENERATOR_CONFIG: Dict[str, Any] = {
+    "enabled": True,                               # Puzzles generados desde el banco (False = catálogo fijo)
+    "questions_file": "questions_data.json",       # Banco de preguntas adicional a MISSIONS
+    "cache_file": "puzzle_pools.cache",            # Reservas generadas, por versión del banco
+    "pool_size": 40,                               # Puzzles por tipo
+    "seed": 7,                                     # Semilla de generación (determinista)
+}
+
+# --- CONFIGURACIÓN DE PERFILES ---
+PROFILES_CONFIG: Dict[str, Any] = {
+    "directory": "profiles",           # Carpeta con un archivo por alumno
+    "index_file": "index.json",        # Índice de usuarios dentro de la carpeta
+    "lru_size": 8,                     # Perfiles que se mantienen cargados en memoria
+    "default_user": "default_user",    # Usuario inicial (importa SAVE_FILE si existe)
+}
+
+# --- CONFIGURACIÓN DEL SERVIDOR DE AULA ---
+CLASSROOM_CONFIG: Dict[str, Any] = {
+    "host": "127.0.0.1",         # Interfaz de escucha (0.0.0.0 para toda la red del aula)
+    "port": 8765,                # Puerto del servidor de aula
+    "default_room": "aula",      # Sala si el cliente no indica ninguna
+    "max_line_bytes": 65536,     # Tamaño máximo de un mensaje JSON
+}
+
+# --- CONFIGURACIÓN DE SALAS MULTIJUGADOR ---
+QUIZ_ROOMS_CONFIG: Dict[str, Any] = {
+    "deadline_s": 20.0,          # Tiempo para responder cada ronda
+    "review_s": 5.0,             # Pausa con la respuesta correcta antes de la siguiente ronda
+    "auto_advance": True,        # Pasar de ronda sin esperar al profesor
+    "base_points": 100,          # Puntos por acierto
+    "speed_bonus": 50,           # Bonificación máxima por responder rápido
+    "top_n": 10,                 # Puestos incluidos en cada difusión del marcador
+}
+
+# --- CONFIGURACIÓN DE EXPORTACIÓN ESTÁTICA ---
+STATIC_EXPORT_CONFIG: Dict[str, Any] = {
+    "output_dir": "web_export",                # Paquete HTML/JS para aulas sin Python
+    "questions_file": "questions_data.json",   # Banco de preguntas de repaso_ia
+}
+
+# --- CONFIGURACIÓN DE ALMACENAMIENTO ---
+STORAGE_CONFIG: Dict[str, Any] = {
+    "compression": None,       # None, "gzip", "zlib" o "lzma"
+    "compression_level": 6,    # 1-9 (para lzma se usa como preset)
+    "compact_json": False,     # JSON sin indentación ni espacios
+}
+
+# --- CONFIGURACIÓN DE DIAGNÓSTICO ---
+DIAGNOSTICS_CONFIG: Dict[str, Any] = {
+    "startup_profiling": False,                    # Medir fases de arranque (o ALPHA_STARTUP_PROFILE=1)
+    "startup_report_file": "startup_report.json",  # Informe generado por startup_profiler
+    "startup_budget_file": None,                   # JSON de presupuesto; None = sin comprobación
+    "latency_monitor": False,                      # Sonda del bucle Tk (o ALPHA_LATENCY_MONITOR=1)
+    "latency_probe_ms": 10,                        # Periodo de la sonda
+    "latency_overlay": False,                      # Mostrar el panel al iniciar (F12 lo alterna)
+    "latency_dump_file": "latency_report.json",    # Volcado de histogramas al salir
+    "tracing": False,                              # Trazas de rutas críticas (o ALPHA_TRACE=1)
+    "trace_file": "alpha_trace.json",              # Exportación Chrome trace_event al salir
+    "trace_max_events": 200000,                    # Límite de eventos en memoria
+    "memory_profiling": False,                     # Instantáneas tracemalloc (o ALPHA_MEMORY_PROFILE=1)
+    "memory_snapshot_interval_s": 60,              # Periodo entre instantáneas
+    "memory_top_n": 15,                            # Líneas de mayor crecimiento por muestra
+    "memory_report_file": "memory_report.json",    # Informe escrito al salir
+    "session_recording": False,                    # Grabar entradas de la sesión (o ALPHA_RECORD_SESSION=1)
+    "recording_dir": "recordings",                 # Carpeta de grabaciones para session_recorder
+}
+
 # --- CONFIGURACIÓN DE ACCESIBILIDAD ---
 ACCESSIBILITY_CONFIG: Dict[str, Any] = {
     "high_contrast_mode": False,
@@ -0,0 +1,352 @@
+"""
+Frame Scheduler Module - Proyecto Alpha v4.0
+Planificador central de tareas periódicas sobre el bucle de eventos de Tk.
+"""
+
+import logging
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Prioridades de referencia (mayor número = se ejecuta antes dentro del frame)
+PRIORITY_HIGH = 100     # Respuesta directa a la entrada del usuario
+PRIORITY_NORMAL = 50    # Animaciones visibles (teletipo, transiciones)
+PRIORITY_LOW = 10       # Relojes y refrescos informativos
+
+DEFAULT_FRAME_MS = 16
+DEFAULT_FRAME_BUDGET_MS = 8.0
+
+
+class _ScheduledTask:
+    """Estado interno de una tarea registrada."""
+
+    __slots__ = ("name", "callback", "interval", "priority", "budget", "repeat",
+                 "due", "calls", "total_ms", "max_ms", "last_ms",
+                 "drift_total_ms", "drift_max_ms", "over_budget", "deferred")
+
+    def __init__(self, name: str, callback: Callable[[], Any], interval: float,
+                 priority: int, budget: Optional[float], repeat: bool, due: float):
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.priority = priority
+        self.budget = budget
+        self.repeat = repeat
+        self.due = due
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        self.drift_total_ms = 0.0
+        self.drift_max_ms = 0.0
+        self.over_budget = 0
+        self.deferred = 0
+
+
+class FrameScheduler:
+    """
+    Planificador de frames con un único temporizador `after` por ventana.
+
+    Multiplexa tareas con nombre (relojes, animaciones, retrasos puntuales)
+    sobre un solo tick. Cada tarea tiene prioridad y presupuesto de tiempo;
+    el tick sólo se programa para el próximo vencimiento real, de modo que
+    sin tareas pendientes no hay despertares del bucle de eventos.
+    """
+
+    def __init__(self, root, frame_ms: int = DEFAULT_FRAME_MS,
+                 frame_budget_ms: float = DEFAULT_FRAME_BUDGET_MS,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Inicializa el planificador.
+
+        Args:
+            root: Ventana Tk (o cualquier objeto con after/after_cancel)
+            frame_ms: Intervalo mínimo entre ticks en milisegundos
+            frame_budget_ms: Tiempo máximo de trabajo por tick
+            clock: Reloj monotónico en segundos (inyectable para pruebas)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.root = root
+        self.frame_ms = frame_ms
+        self.frame_budget_ms = frame_budget_ms
+        self.clock = clock
+
+        self._tasks: Dict[str, _ScheduledTask] = {}
+        self._redraws: Dict[str, Callable[[], Any]] = {}
+        self._after_id = None
+        self._after_due: Optional[float] = None
+        self._closed = False
+
+        self.ticks = 0
+        self.redraws_requested = 0
+        self.redraws_flushed = 0
+
+    # ------------------------------------------------------------------
+    # Registro de tareas
+    # ------------------------------------------------------------------
+
+    def add_task(self, name: str, callback: Callable[[], Any], interval_ms: float = 0,
+                 priority: int = PRIORITY_NORMAL, budget_ms: Optional[float] = None,
+                 repeat: bool = True, delay_ms: Optional[float] = None) -> None:
+        """
+        Registra (o reemplaza) una tarea con nombre.
+
+        Args:
+            name: Identificador único; registrar el mismo nombre reemplaza la tarea
+            callback: Función sin argumentos. Si devuelve False la tarea termina
+            interval_ms: Periodo de repetición (0 = cada frame)
+            priority: Prioridad dentro del frame (mayor se ejecuta antes)
+            budget_ms: Presupuesto esperado por llamada, para estadísticas
+            repeat: False para tareas de una sola ejecución
+            delay_ms: Retraso de la primera ejecución (por defecto, interval_ms)
+        """
+        now = self.clock()
+        first_delay = interval_ms if delay_ms is None else delay_ms
+        previous = self._tasks.get(name)
+        task = _ScheduledTask(name, callback, interval_ms / 1000.0, priority,
+                              budget_ms, repeat, now + first_delay / 1000.0)
+        if previous is not None:
+            # Conservar las estadísticas acumuladas del mismo nombre
+            for field in ("calls", "total_ms", "max_ms", "last_ms", "drift_total_ms",
+                          "drift_max_ms", "over_budget", "deferred"):
+                setattr(task, field, getattr(previous, field))
+        self._tasks[name] = task
+        self._schedule()
+
+    def call_later(self, name: str, delay_ms: float, callback: Callable[[], Any],
+                   priority: int = PRIORITY_HIGH) -> None:
+        """
+        Programa una ejecución única con nombre.
+
+        Volver a programar el mismo nombre reemplaza la llamada pendiente,
+        evitando ejecuciones duplicadas por clics repetidos.
+
+        Args:
+            name: Identificador de la llamada
+            delay_ms: Retraso en milisegundos
+            callback: Función sin argumentos
+            priority: Prioridad dentro del frame
+        """
+        self.add_task(name, callback, interval_ms=0, priority=priority,
+                      repeat=False, delay_ms=delay_ms)
+
+    def remove_task(self, name: str) -> bool:
+        """
+        Elimina una tarea.
+
+        Args:
+            name: Identificador de la tarea
+
+        Returns:
+            True si la tarea existía
+        """
+        removed = self._tasks.pop(name, None) is not None
+        if removed and not self._tasks and not self._redraws:
+            self._cancel_tick()
+        return removed
+
+    def has_task(self, name: str) -> bool:
+        """Indica si una tarea sigue registrada."""
+        return name in self._tasks
+
+    def request_redraw(self, key: str, callback: Callable[[], Any]) -> None:
+        """
+        Solicita un refresco visual coalescido.
+
+        Varias solicitudes con la misma clave dentro de un frame se reducen a
+        una sola llamada (la última registrada) al final del tick.
+
+        Args:
+            key: Clave del elemento a refrescar
+            callback: Función que aplica el refresco
+        """
+        self.redraws_requested += 1
+        self._redraws[key] = callback
+        self._schedule()
+
+    def flush(self) -> None:
+        """Ejecuta inmediatamente las tareas vencidas y los refrescos pendientes."""
+        self._cancel_tick()
+        self._tick()
+
+    def shutdown(self) -> None:
+        """Detiene el planificador y descarta todas las tareas."""
+        self._closed = True
+        self._cancel_tick()
+        self._tasks.clear()
+        self._redraws.clear()
+
+    # ------------------------------------------------------------------
+    # Estadísticas
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtiene estadísticas de tiempo por tarea.
+
+        Returns:
+            Diccionario nombre -> métricas (llamadas, tiempos, deriva, excesos)
+        """
+        stats = {}
+        for name, task in self._tasks.items():
+            stats[name] = {
+                "calls": task.calls,
+                "priority": task.priority,
+                "interval_ms": task.interval * 1000.0,
+                "avg_ms": task.total_ms / task.calls if task.calls else 0.0,
+                "max_ms": task.max_ms,
+                "last_ms": task.last_ms,
+                "avg_drift_ms": task.drift_total_ms / task.calls if task.calls else 0.0,
+                "max_drift_ms": task.drift_max_ms,
+                "over_budget": task.over_budget,
+                "deferred": task.deferred,
+            }
+        return stats
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Resumen global del planificador."""
+        return {
+            "ticks": self.ticks,
+            "active_tasks": len(self._tasks),
+            "redraws_requested": self.redraws_requested,
+            "redraws_flushed": self.redraws_flushed,
+        }
+
+    # ------------------------------------------------------------------
+    # Bucle interno
+    # ------------------------------------------------------------------
+
+    def _next_due(self) -> Optional[float]:
+        """Calcula el próximo instante en que hay trabajo."""
+        if self._redraws:
+            return self.clock()
+        if not self._tasks:
+            return None
+        return min(task.due for task in self._tasks.values())
+
+    def _schedule(self) -> None:
+        """Programa el tick para el próximo vencimiento."""
+        if self._closed:
+            return
+        due = self._next_due()
+        if due is None:
+            self._cancel_tick()
+            return
+        if self._after_id is not None and self._after_due is not None and self._after_due <= due:
+            return  # Ya hay un tick igual o más temprano
+
+        self._cancel_tick()
+        # Redondeo hacia arriba: despertar antes del vencimiento sólo
+        # provocaría un tick vacío y otro after(0) inmediato
+        delay_ms = max(0, math.ceil(round((due - self.clock()) * 1000, 3)))
+        try:
+            self._after_id = self.root.after(delay_ms, self._on_after)
+            self._after_due = due
+        except Exception as e:
+            # La ventana fue destruida: no hay bucle al que volver
+            self.logger.debug(f"No se pudo programar el tick: {e}")
+            self._closed = True
+
+    def _cancel_tick(self) -> None:
+        """Cancela el tick pendiente, si existe."""
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+        self._after_due = None
+
+    def _on_after(self) -> None:
+        """Punto de entrada desde el bucle de eventos."""
+        self._after_id = None
+        self._after_due = None
+        self._tick()
+
+    def _tick(self) -> None:
+        """Ejecuta las tareas vencidas respetando el presupuesto del frame."""
+        if self._closed:
+            return
+        self.ticks += 1
+        frame_start = self.clock()
+
+        due_tasks: List[_ScheduledTask] = [t for t in self._tasks.values() if t.due <= frame_start]
+        due_tasks.sort(key=lambda t: (-t.priority, t.due))
+
+        for index, task in enumerate(due_tasks):
+            elapsed_ms = (self.clock() - frame_start) * 1000.0
+            if index > 0 and elapsed_ms >= self.frame_budget_ms:
+                # Frame agotado: el resto queda vencido para el siguiente tick
+                for pending in due_tasks[index:]:
+                    pending.deferred += 1
+                break
+            if self._tasks.get(task.name) is not task:
+                continue  # Eliminada o reemplazada por otra tarea en este frame
+            self._run_task(task)
+
+        if self._redraws:
+            redraws, self._redraws = self._redraws, {}
+            for key, callback in redraws.items():
+                try:
+                    callback()
+                except Exception as e:
+                    self.logger.error(f"Error en refresco '{key}': {e}")
+                self.redraws_flushed += 1
+
+        self._schedule()
+
+    def _run_task(self, task: _ScheduledTask) -> None:
+        """Ejecuta una tarea y actualiza sus estadísticas y vencimiento."""
+        start = self.clock()
+        drift_ms = max(0.0, (start - task.due) * 1000.0)
+        try:
+            result = task.callback()
+        except Exception as e:
+            self.logger.error(f"Error en tarea '{task.name}': {e}")
+            result = False
+        duration_ms = (self.clock() - start) * 1000.0
+
+        task.calls += 1
+        task.total_ms += duration_ms
+        task.last_ms = duration_ms
+        task.max_ms = max(task.max_ms, duration_ms)
+        task.drift_total_ms += drift_ms
+        task.drift_max_ms = max(task.drift_max_ms, drift_ms)
+        if task.budget is not None and duration_ms > task.budget:
+            task.over_budget += 1
+
+        if self._tasks.get(task.name) is not task:
+            return  # El callback reemplazó o eliminó su propia tarea
+        if not task.repeat or result is False:
+            del self._tasks[task.name]
+            return
+
+        interval = task.interval if task.interval > 0 else self.frame_ms / 1000.0
+        # Vencimientos absolutos: el periodo no acumula deriva
+        task.due += interval
+        now = self.clock()
+        if task.due <= now:
+            missed = int((now - task.due) / interval) + 1
+            task.due += missed * interval
+
+
+def get_scheduler(widget) -> FrameScheduler:
+    """
+    Obtiene el planificador compartido de la ventana de un widget.
+
+    Todas las vistas de una misma ventana Tk comparten un único planificador,
+    de modo que sólo existe un tick activo por ventana.
+
+    Args:
+        widget: Ventana Tk o cualquier widget contenido en ella
+
+    Returns:
+        Instancia de FrameScheduler asociada a la ventana raíz
+    """
+    root_getter = getattr(widget, "_root", None)
+    root = root_getter() if callable(root_getter) else widget
+    scheduler = getattr(root, "_frame_scheduler", None)
+    if scheduler is None or scheduler._closed:
+        scheduler = FrameScheduler(root)
+        root._frame_scheduler = scheduler
+    return scheduler
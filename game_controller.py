@@ -4,8 +4,7 @@ Controlador principal del juego educativo.
 """
 
 import tkinter as tk
-from tkinter import messagebox, filedialog, scrolledtext
-import json
+from tkinter import messagebox, filedialog, scrolledtext, simpledialog
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional, List
@@ -14,10 +13,23 @@ import logging
 from academic_metrics import AcademicMetrics
 from achievement_system import AchievementSystem
 from learning_manager import LearningModeManager
-from ui_manager import UIManager
+from ui_registry import create_ui_manager
 from missions import MISSIONS
-from config import SAVE_FILE, PROFESSIONAL_CONFIG, ACADEMIC_CONFIG, LOG_FILE
-from simple_puzzles import get_random_puzzle, validate_puzzle_answer
+from config import PROFESSIONAL_CONFIG, ACADEMIC_CONFIG, LOG_FILE, PROFILES_CONFIG
+from simple_puzzles import validate_puzzle_answer
+from storage import save_json, suggested_extension
+from frame_scheduler import get_scheduler, PRIORITY_LOW
+from startup_profiler import get_profiler
+from latency_monitor import get_latency_monitor
+from tracing import setup_tracing
+from logging_setup import configure_logging
+from metrics_exporter import get_metrics, start_exporter
+from memory_profiler import get_memory_profiler
+from session_recorder import SessionRecorder, get_session_recorder
+from puzzle_generator import get_puzzle_generator
+from prefetch import MissionPrefetcher, PreparedContent, shuffled_layout
+from answer_key import get_mission_key, compile_mission, streak_line
+from profile_store import Profile, ProfileStore, get_profile_store
 
 
 class GameController:
@@ -29,32 +41,66 @@ class GameController:
     y lógica del juego educativo.
     """
 
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk, ui_backend: Any = None, headless: bool = False):
         self.logger = logging.getLogger(self.__class__.__name__)
-        """Inicializa el controlador del juego."""
+        """
+        Inicializa el controlador del juego.
+
+        Args:
+            root: Ventana Tk principal
+            ui_backend: Skin de interfaz o clase del gestor de UI (usa UI_CONFIG["skin"] si es None)
+            headless: Sin pantalla ni persistencia (reproducción de sesiones)
+        """
         self.root = root
+        self.headless = headless
+        # Reloj de la lógica del juego; la reproducción lo sustituye por uno virtual
+        self.clock = time.time
+        self.startup_profiler = get_profiler()
+        self.metrics = get_metrics()
+        # Antes de crear componentes: los métodos enlazados ya quedan trazados
+        setup_tracing()
 
         # Componentes principales
         self.academic_metrics = AcademicMetrics()
         self.achievement_system = AchievementSystem()
         self.learning_manager = LearningModeManager()
-        self.ui_manager = UIManager(root)
-        # Modo puzzle activado
+        self.ui_manager = create_ui_manager(root, ui_backend)
+        self.scheduler = get_scheduler(root)
+        self.latency_monitor = get_latency_monitor(root)
+        self.memory_profiler = get_memory_profiler(root)
+        start_exporter()
+        # Modo puzzle activado (las reservas se generan en segundo plano)
         self.puzzle_mode = True
+        self.puzzle_generator = get_puzzle_generator()
+        # La siguiente misión se prepara mientras se lee el feedback
+        self.prefetcher = MissionPrefetcher(root, self._prepare_mission, warm_ui=self._warm_option_slots)
 
         # Temporizadores
         self.question_timer = None
         self.question_start_time = None
-        self.session_timer = None
 
         # Estado del juego
         self.game_state = self._initialize_game_state()
 
+        # Perfiles de alumno (sin pantalla sólo en memoria)
+        if headless:
+            self.profile_store = ProfileStore(state_factory=self._initialize_game_state)
+        else:
+            self.profile_store = get_profile_store(self._initialize_game_state)
+        self.profile: Optional[Profile] = None
+        self._shut_down = False
+
         # Configurar UI
-        self._setup_ui()
+        with self.startup_profiler.phase("_setup_ui"):
+            self._setup_ui()
 
         # Inicializar sistema
         self._initialize_system()
+        self.startup_profiler.watch_first_paint(root, self._log_startup_phases)
+
+        # Grabación de entradas (la reproducción nunca graba)
+        self.recorder = SessionRecorder(enabled=False) if headless else get_session_recorder()
+        self.recorder.begin(self)
 
     def _initialize_game_state(self) -> Dict[str, Any]:
         """Inicializa el estado del juego."""
@@ -90,7 +136,7 @@ class GameController:
                 "adaptive_difficulty": True
             },
             "session_id": f"session_{int(time.time())}",
-            "user_id": "default_user",
+            "user_id": PROFILES_CONFIG.get("default_user", "default_user"),
             "accessibility_mode": False,
             "high_contrast": False,
             "keyboard_navigation": True,
@@ -123,6 +169,7 @@ class GameController:
         # Crear barra de menú con callbacks
         menu_callbacks = {
             "new_session": self.restart_session,
+            "switch_user": self.ask_switch_user,
             "save_progress": self.save_progress,
             "load_progress": self.load_progress,
             "export_report": self.export_report,
@@ -138,27 +185,31 @@ class GameController:
             "show_feedback": self.show_feedback_form,
             "show_about": self.ui_manager.show_about
         }
-        self.ui_manager.create_menu_bar(menu_callbacks)
+        # Con el monitor de latencia activo cada opción de menú queda cronometrada
+        self.ui_manager.create_menu_bar(self.latency_monitor.instrument(menu_callbacks, prefix="menu"))
 
         # Conectar botones principales
-        self.ui_manager.next_button.config(command=self.next_mission)
-        self.ui_manager.hint_button.config(command=self.show_hint)
-        self.ui_manager.retry_button.config(command=self.retry_mission)
+        monitor = self.latency_monitor
+        self.ui_manager.next_button.config(command=monitor.wrap("button:next_mission", self.next_mission))
+        self.ui_manager.hint_button.config(command=monitor.wrap("button:show_hint", self.show_hint))
+        self.ui_manager.retry_button.config(command=monitor.wrap("button:retry_mission", self.retry_mission))
 
     def _initialize_system(self) -> None:
         """Inicializa el sistema completo."""
         try:
             # Cargar configuración guardada
-            self.load_system_config()
+            with self.startup_profiler.phase("load_system_config"):
+                self.load_system_config()
 
             # Inicializar métricas de sesión
-            self.academic_metrics.session_start_time = time.time()
+            self.academic_metrics.session_start_time = self.clock()
 
             # Configurar adaptabilidad inicial
             self.learning_manager.adapt_difficulty(self.academic_metrics)
 
             # Cargar progreso si existe
-            self.load_progress()
+            with self.startup_profiler.phase("load_progress"):
+                self.load_progress()
 
             # Iniciar sesión
             self.start_session()
@@ -169,6 +220,11 @@ class GameController:
                                 f"No se pudo inicializar el sistema correctamente:\n{str(e)}")
             self.root.quit()
 
+    def _log_startup_phases(self) -> None:
+        """Registra en el log la duración de cada fase de arranque."""
+        phases = ", ".join(f"{name}={ms:.1f}ms" for name, ms in self.startup_profiler.phases.items())
+        self.log_event(f"Fases de arranque: {phases}", "INFO")
+
     def start_session(self) -> None:
         """Inicia la sesión educativa."""
         try:
@@ -177,7 +233,7 @@ class GameController:
             self.game_state["score"] = 0
             self.game_state["current_story_idx"] = 0
             self.game_state["status"] = "Sistema Educativo Profesional Listo"
-            self.game_state["time_started"] = time.time()
+            self.game_state["time_started"] = self.clock()
 
             # Configurar indicadores visuales
             self.ui_manager.progress_text_var.set(f"📊 Misión 0/{len(MISSIONS)} | Puntuación: 0/{self.game_state['max_score']}")
@@ -206,6 +262,9 @@ class GameController:
             # Iniciar temporizador de sesión
             self.start_session_timer()
 
+            # Preparar la primera misión en tiempo ocioso
+            self.prefetcher.schedule(1)
+
             # Log de inicio de sesión
             self.log_event("Sesión iniciada", "INFO")
 
@@ -239,8 +298,54 @@ class GameController:
             "¡Cada puzzle ejercitará tu mente de forma diferente!"
         )
 
+    def _prepare_mission(self, mission_num: int) -> PreparedContent:
+        """
+        Prepara el contenido de una misión sin tocar widgets.
+
+        Args:
+            mission_num: Número de misión (1..len(MISSIONS))
+
+        Returns:
+            Título, historia, opciones barajadas y feedback inicial
+        """
+        if self.puzzle_mode:
+            puzzle = self.puzzle_generator.puzzle_for(mission_num - 1)
+            return PreparedContent(
+                mission_num=mission_num,
+                title=puzzle.title,
+                story=puzzle.story,
+                options=shuffled_layout(puzzle.options, f"{mission_num}:{puzzle.title}"),
+                answer=puzzle.answer,
+                intro_feedback=(f"🧠 Desafío Mental: {puzzle.puzzle_type.title()}\n"
+                                "Lee cuidadosamente y usa tu lógica para resolver este puzzle."),
+                source=puzzle,
+            )
+        mission = MISSIONS[mission_num]
+        return PreparedContent(
+            mission_num=mission_num,
+            title=f"📚 {mission['title']}",
+            story=f"🎯 CONCEPTO CLAVE: {mission['concept_name']}\n\n{mission['story']}",
+            options=shuffled_layout(mission["options"], f"{mission_num}:{mission['title']}"),
+            answer=mission["answer"],
+            intro_feedback="📖 Lee la historia con atención y elige la respuesta que crees correcta. ¡No hay prisa, tómate tu tiempo para pensar!",
+            source=mission,
+        )
+
+    def _warm_option_slots(self, content: PreparedContent) -> None:
+        """Crea por adelantado las tarjetas de opción que necesitará la misión preparada."""
+        reserve = getattr(self.ui_manager, "reserve_option_slots", None)
+        if reserve is not None:
+            reserve(len(content.options))
+
+    def _prefetch_next(self) -> None:
+        """Programa la preparación de la misión siguiente a la actual."""
+        next_mission = self.game_state["mission"] + 1
+        if next_mission <= len(MISSIONS):
+            self.prefetcher.schedule(next_mission)
+
     def next_mission(self) -> None:
         """Avanza a la siguiente misión o inicia un puzzle."""
+        self.recorder.record("next")
         try:
             if self.game_state["mission"] == 0:
                 # Primera misión - mostrar puzzle
@@ -250,7 +355,7 @@ class GameController:
                 self.start_puzzle_mission()
             else:
                 # Completar sesión
-                self.complete_session()
+                self.complete_evaluation()
                 
         except Exception as e:
             self.log_error(f"Error en next_mission: {str(e)}")
@@ -262,17 +367,18 @@ class GameController:
             self.game_state["mission"] += 1
             current_mission = self.game_state["mission"]
             
-            # Crear puzzle mental
-            puzzle = get_random_puzzle(current_mission - 1)
+            # Puzzle mental (normalmente ya preparado durante el feedback anterior)
+            prepared = self.prefetcher.take(current_mission)
+            puzzle = prepared.source
             self.game_state["current_puzzle"] = puzzle
             
             # Actualizar UI con el puzzle
-            self.ui_manager.mission_title_label.config(text=puzzle.title)
-            self.ui_manager.story_text_var.set(puzzle.story)
+            self.ui_manager.mission_title_label.config(text=prepared.title)
+            self.ui_manager.story_text_var.set(prepared.story)
             
             # Crear opciones del puzzle
             self.ui_manager.clear_options()
-            self.create_puzzle_options(puzzle)
+            self.create_puzzle_options(puzzle, prepared.options)
             
             # Actualizar progreso
             self.ui_manager.progress_text_var.set(
@@ -285,23 +391,20 @@ class GameController:
             self.ui_manager.retry_button.config(state=tk.DISABLED)
             
             # Feedback inicial
-            self.ui_manager.feedback_text_var.set(
-                f"🧠 Desafío Mental: {puzzle.puzzle_type.title()}\n"
-                "Lee cuidadosamente y usa tu lógica para resolver este puzzle."
-            )
+            self.ui_manager.feedback_text_var.set(prepared.intro_feedback)
             
             # Iniciar temporizador
-            self.question_start_time = time.time()
+            self.question_start_time = self.clock()
             
         except Exception as e:
             self.log_error(f"Error al iniciar puzzle: {str(e)}")
             messagebox.showerror("Error", f"No se pudo cargar el puzzle: {str(e)}")
     
-    def create_puzzle_options(self, puzzle) -> None:
+    def create_puzzle_options(self, puzzle, options: Optional[Dict[str, str]] = None) -> None:
         """Crea las opciones del puzzle usando la UI existente."""
         # Simular estructura de misión para usar el sistema existente
         fake_mission = {
-            "options": puzzle.options,
+            "options": options if options is not None else puzzle.options,
             "answer": puzzle.answer
         }
         
@@ -313,6 +416,7 @@ class GameController:
     
     def handle_puzzle_answer(self, selected_option: str, option_widget) -> None:
         """Maneja la respuesta del puzzle."""
+        self.recorder.record("answer", selected_option)
         try:
             puzzle = self.game_state["current_puzzle"]
             
@@ -320,7 +424,16 @@ class GameController:
             is_correct, feedback = validate_puzzle_answer(puzzle, selected_option)
             
             # Calcular tiempo
-            time_taken = time.time() - self.question_start_time if self.question_start_time else 0
+            time_taken = self.clock() - self.question_start_time if self.question_start_time else 0
+
+            # Registrar en métricas académicas
+            self.academic_metrics.record_answer(
+                mission_id=self.game_state["mission"],
+                correct=is_correct,
+                time_taken=time_taken,
+                hints_used=self.game_state["hints_used"] > 0
+            )
+            self.metrics.record_answer(is_correct, time_taken)
             
             # Actualizar estadísticas del puzzle
             if is_correct:
@@ -333,8 +446,9 @@ class GameController:
                 if self.game_state["puzzle_streak"] > self.game_state["best_streak"]:
                     self.game_state["best_streak"] = self.game_state["puzzle_streak"]
                 
-                # Registrar en métricas académicas
-                self.academic_metrics.record_correct_answer(time_taken)
+                # Verificar logros
+                self.metrics.record_achievements(
+                    self.achievement_system.check_achievements(self.academic_metrics))
                 
                 # Habilitar siguiente puzzle
                 next_mission = self.game_state["mission"] + 1
@@ -347,9 +461,6 @@ class GameController:
                 self.game_state["streak"] = 0
                 self.game_state["retries"] += 1
                 
-                # Registrar respuesta incorrecta
-                self.academic_metrics.record_incorrect_answer(time_taken)
-                
                 # Habilitar reintento y continuar
                 self.ui_manager.retry_button.config(state=tk.NORMAL, text="🔄 Nuevo Puzzle")
                 self.ui_manager.next_button.config(text="➡️ Continuar", state=tk.NORMAL)
@@ -366,6 +477,9 @@ class GameController:
             
             # Resetear pistas para próximo puzzle
             self.game_state["hints_used"] = 0
+
+            # Preparar el siguiente puzzle mientras se lee el feedback
+            self._prefetch_next()
             
         except Exception as e:
             self.log_error(f"Error al manejar respuesta del puzzle: {str(e)}")
@@ -373,6 +487,7 @@ class GameController:
     
     def show_hint(self) -> None:
         """Muestra una pista para el puzzle actual."""
+        self.recorder.record("hint")
         try:
             if "current_puzzle" in self.game_state and self.game_state["current_puzzle"]:
                 puzzle = self.game_state["current_puzzle"]
@@ -403,11 +518,12 @@ class GameController:
     
     def retry_mission(self) -> None:
         """Reintenta el puzzle actual o carga uno nuevo."""
+        self.recorder.record("retry")
         try:
             if self.puzzle_mode and "current_puzzle" in self.game_state:
                 # Generar nuevo puzzle del mismo tipo
                 current_mission = self.game_state["mission"]
-                new_puzzle = get_random_puzzle(current_mission + 100)  # Offset para variedad
+                new_puzzle = self.puzzle_generator.puzzle_for(current_mission + 100)  # Offset para variedad
 
                 self.game_state["current_puzzle"] = new_puzzle
                 self.game_state["retries"] += 1
@@ -431,7 +547,7 @@ class GameController:
                 )
 
                 # Reiniciar temporizador
-                self.question_start_time = time.time()
+                self.question_start_time = self.clock()
 
                 self.log_event(f"Nuevo puzzle generado para misión {current_mission}", "INFO")
             else:
@@ -458,6 +574,7 @@ class GameController:
     
     def handle_answer(self, selected_option: str, option_widget) -> None:
         """Maneja respuestas del modo tradicional."""
+        self.recorder.record("answer", selected_option)
         try:
             if not hasattr(self, 'current_mission'):
                 return
@@ -465,7 +582,7 @@ class GameController:
             mission = self.current_mission
             correct_answer = mission["answer"]
             is_correct = selected_option == correct_answer
-            time_taken = time.time() - self.question_start_time if self.question_start_time else 0
+            time_taken = self.clock() - self.question_start_time if self.question_start_time else 0
 
             # Registrar respuesta
             self.academic_metrics.record_answer(
@@ -475,6 +592,7 @@ class GameController:
                 hints_used=self.game_state.get("hint_used_this_question", False),
                 retried=self.game_state.get("retried_this_question", False)
             )
+            self.metrics.record_answer(is_correct, time_taken)
 
             # Actualizar estado
             if is_correct:
@@ -539,11 +657,10 @@ class GameController:
         """Completa la evaluación de puzzles."""
         try:
             # Detener temporizadores
-            if self.session_timer:
-                self.root.after_cancel(self.session_timer)
+            self.scheduler.remove_task("session_timer")
             
             # Calcular métricas finales
-            total_time = time.time() - self.game_state["time_started"]
+            total_time = self.clock() - self.game_state["time_started"]
             final_score = self.game_state["puzzle_score"]
             puzzles_completed = self.game_state["puzzles_completed"]
             accuracy = (puzzles_completed / len(MISSIONS)) * 100 if len(MISSIONS) > 0 else 0
@@ -593,20 +710,22 @@ class GameController:
             if mission_id not in MISSIONS:
                 raise ValueError(f"Misión {mission_id} no encontrada")
 
-            mission = MISSIONS[mission_id]
+            prepared = self.prefetcher.take(mission_id)
+            mission = prepared.source
             self.current_mission = mission
-            self.question_start_time = time.time()
+            # Clave compilada: corregir es comparar índices y leer la tabla de feedback
+            self.current_answer_key = get_mission_key().get(mission_id) or compile_mission(mission_id, mission)
+            self.question_start_time = self.clock()
 
             # Actualizar título de misión de forma más clara
-            self.ui_manager.mission_title_label.config(text=f"📚 {mission['title']}")
+            self.ui_manager.mission_title_label.config(text=prepared.title)
 
             # Mostrar el concepto clave de forma destacada
-            concept_text = f"🎯 CONCEPTO CLAVE: {mission['concept_name']}\n\n{mission['story']}"
-            self.ui_manager.story_text_var.set(concept_text)
+            self.ui_manager.story_text_var.set(prepared.story)
 
             # Crear opciones
             self.ui_manager.clear_options()
-            self.ui_manager.create_option_buttons(mission, self.handle_answer)
+            self.ui_manager.create_option_buttons(dict(mission, options=prepared.options), self.handle_answer)
 
             # Configurar controles
             self.ui_manager.next_button.config(state=tk.DISABLED)
@@ -617,7 +736,7 @@ class GameController:
             self.update_progress_display()
 
             # Feedback inicial más amigable
-            self.ui_manager.feedback_text_var.set("📖 Lee la historia con atención y elige la respuesta que crees correcta. ¡No hay prisa, tómate tu tiempo para pensar!")
+            self.ui_manager.feedback_text_var.set(prepared.intro_feedback)
             self.ui_manager.metrics_text_var.set(f"💡 Puedes usar una pista si la necesitas. Categoría: {mission.get('category', 'General')}")
 
             # Log
@@ -629,14 +748,14 @@ class GameController:
 
     def handle_answer(self, selected_option: str, option_widget) -> None:
         """Maneja la respuesta seleccionada por el usuario."""
+        self.recorder.record("answer", selected_option)
         try:
             if not hasattr(self, 'current_mission'):
                 return
 
-            mission = self.current_mission
-            correct_answer = mission["answer"]
-            is_correct = selected_option == correct_answer
-            time_taken = time.time() - self.question_start_time if self.question_start_time else 0
+            graded = self.current_answer_key.grade(selected_option)
+            is_correct = graded.correct
+            time_taken = self.clock() - self.question_start_time if self.question_start_time else 0
 
             # Registrar respuesta en métricas
             self.academic_metrics.record_answer(
@@ -646,6 +765,7 @@ class GameController:
                 hints_used=self.game_state.get("hint_used_this_question", False),
                 retried=self.game_state.get("retried_this_question", False)
             )
+            self.metrics.record_answer(is_correct, time_taken)
 
             # Actualizar estado del juego
             if is_correct:
@@ -654,18 +774,12 @@ class GameController:
                 if self.game_state["streak"] > self.game_state["best_streak"]:
                     self.game_state["best_streak"] = self.game_state["streak"]
                 
-                # Feedback positivo muy claro
-                feedback = f"✅ ¡EXCELENTE! ¡Respuesta correcta!\n\n"
-                feedback += f"🎯 Tu respuesta: {selected_option}\n\n"
-                feedback += f"📚 Explicación: {mission['options'][selected_option]}\n\n"
-                if 'explanation' in mission:
-                    feedback += f"💡 ¿Por qué es correcta? {mission['explanation']}\n\n"
-                feedback += f"🔥 ¡Llevas {self.game_state['streak']} respuestas correctas seguidas!"
-                
-                self.ui_manager.feedback_text_var.set(feedback)
+                # Feedback positivo muy claro (la racha es lo único que no está precalculado)
+                self.ui_manager.feedback_text_var.set(graded.feedback + streak_line(self.game_state['streak']))
                 
                 # Verificar logros
-                self.achievement_system.check_achievements(self.academic_metrics)
+                self.metrics.record_achievements(
+                    self.achievement_system.check_achievements(self.academic_metrics))
                 
                 # Habilitar siguiente misión
                 next_mission_num = self.game_state["mission"] + 1
@@ -678,15 +792,7 @@ class GameController:
                 self.game_state["streak"] = 0
                 
                 # Feedback de error educativo
-                feedback = f"❌ Respuesta incorrecta, pero ¡no te preocupes! Así se aprende.\n\n"
-                feedback += f"🔴 Tu respuesta: {selected_option}\n"
-                feedback += f"✅ Respuesta correcta: {correct_answer}\n\n"
-                feedback += f"📚 ¿Por qué es correcta? {mission['options'][correct_answer]}\n\n"
-                if 'explanation' in mission:
-                    feedback += f"💡 Explicación detallada: {mission['explanation']}\n\n"
-                feedback += "💪 ¡Puedes intentarlo de nuevo o continuar a la siguiente misión!"
-                
-                self.ui_manager.feedback_text_var.set(feedback)
+                self.ui_manager.feedback_text_var.set(graded.feedback)
                 
                 # Habilitar reintento y continuar
                 self.ui_manager.retry_button.config(state=tk.NORMAL)
@@ -702,6 +808,9 @@ class GameController:
             # Actualizar displays
             self.update_progress_display()
             self.update_stats_display()
+
+            # Preparar la siguiente misión mientras se lee el feedback
+            self._prefetch_next()
             
             # Log
             self.log_event(f"Respuesta {'correcta' if is_correct else 'incorrecta'} en misión {self.game_state['mission']}", "INFO")
@@ -712,6 +821,7 @@ class GameController:
 
     def show_hint(self) -> None:
         """Muestra una pista para la misión actual."""
+        self.recorder.record("hint")
         try:
             if not hasattr(self, 'current_mission'):
                 return
@@ -743,6 +853,7 @@ class GameController:
 
     def retry_mission(self) -> None:
         """Permite reintentar la misión actual."""
+        self.recorder.record("retry")
         try:
             if hasattr(self, 'current_mission'):
                 # Marcar reintento
@@ -762,8 +873,7 @@ class GameController:
         """Completa la evaluación y muestra resultados finales."""
         try:
             # Detener temporizadores
-            if self.session_timer:
-                self.root.after_cancel(self.session_timer)
+            self.scheduler.remove_task("session_timer")
             
             # Calcular métricas finales
             final_score = self.game_state["score"]
@@ -801,18 +911,21 @@ class GameController:
         """Inicia el temporizador de sesión."""
         def update_timer():
             try:
-                if self.game_state["time_started"]:
-                    elapsed = time.time() - self.game_state["time_started"]
-                    self.game_state["time_spent"] = elapsed
-                    formatted_time = self.format_time(elapsed)
-                    self.ui_manager.timer_text_var.set(formatted_time)
-                    
-                    # Programar siguiente actualización
-                    self.session_timer = self.root.after(1000, update_timer)
+                if not self.game_state["time_started"]:
+                    return False  # Sin sesión activa: detener la tarea
+                elapsed = self.clock() - self.game_state["time_started"]
+                self.game_state["time_spent"] = elapsed
+                formatted_time = self.format_time(elapsed)
+                self.ui_manager.timer_text_var.set(formatted_time)
             except Exception as e:
                 self.log_error(f"Error en temporizador: {str(e)}")
-        
+                return False
+
+        # El planificador mantiene un vencimiento absoluto cada segundo,
+        # así el reloj no acumula deriva; re-registrar reemplaza la tarea.
         update_timer()
+        self.scheduler.add_task("session_timer", update_timer,
+                                interval_ms=1000, priority=PRIORITY_LOW)
 
     def format_time(self, seconds: float) -> str:
         """Formatea tiempo en formato HH:MM:SS."""
@@ -905,16 +1018,11 @@ class GameController:
 
     def save_progress(self) -> None:
         """Guarda el progreso actual."""
+        if self.headless:
+            return
         try:
-            save_data = {
-                "game_state": self.game_state,
-                "academic_metrics": self.academic_metrics.metrics,
-                "achievements": self.achievement_system.get_earned_achievements(),
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            with open(SAVE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            with self.metrics.save_duration.time():
+                self.profile_store.save(self._current_profile())
             
             self.log_event("Progreso guardado exitosamente", "INFO")
             messagebox.showinfo("Guardado", "Progreso guardado exitosamente")
@@ -925,43 +1033,76 @@ class GameController:
 
     def load_progress(self) -> None:
         """Carga progreso guardado."""
+        if self.headless:
+            return
         try:
-            import os
-            if not os.path.exists(SAVE_FILE):
-                return
-            
-            with open(SAVE_FILE, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
-            
-            # Restaurar estado del juego
-            if "game_state" in save_data:
-                self.game_state.update(save_data["game_state"])
-            
-            # Restaurar métricas académicas
-            if "academic_metrics" in save_data:
-                self.academic_metrics.metrics.update(save_data["academic_metrics"])
-            
-            # Restaurar logros
-            if "achievements" in save_data:
-                self.achievement_system.unlocked_achievements = set(save_data["achievements"])
+            # Se vuelve a leer el perfil del usuario actual desde su archivo
+            with self.metrics.load_duration.time():
+                profile = self.profile_store.reload(self.game_state["user_id"])
+            self._bind_profile(profile)
             
             self.log_event("Progreso cargado exitosamente", "INFO")
             
         except Exception as e:
             self.log_error(f"Error al cargar progreso: {str(e)}")
 
+    def _current_profile(self) -> Profile:
+        """Perfil del usuario activo (se crea a partir del estado actual si aún no existe)."""
+        if self.profile is None:
+            self.profile = self.profile_store.adopt(Profile(
+                self.game_state["user_id"], self.game_state, self.academic_metrics, self.achievement_system))
+        return self.profile
+
+    def _bind_profile(self, profile: Profile) -> None:
+        """Hace activo un perfil: el controlador pasa a usar sus objetos directamente."""
+        self.profile = profile
+        self.game_state = profile.game_state
+        self.academic_metrics = profile.academic_metrics
+        self.achievement_system = profile.achievement_system
+
+    def switch_user(self, user_id: str) -> None:
+        """
+        Cambia de alumno sin reinicializar el sistema.
+
+        El perfil saliente queda en la caché marcado para guardar; el
+        entrante se toma de la caché o se lee de su archivo. Después sólo
+        se reinicia la sesión, como tras cargar el progreso al arrancar.
+
+        Args:
+            user_id: Identificador del alumno
+        """
+        user_id = (user_id or "").strip()
+        if not user_id or user_id == self.game_state["user_id"]:
+            return
+        self.recorder.record("user", user_id)
+        try:
+            self._current_profile().dirty = True
+            self.prefetcher.clear()
+            self._bind_profile(self.profile_store.get(user_id))
+            self.academic_metrics.session_start_time = self.clock()
+            self.learning_manager.adapt_difficulty(self.academic_metrics)
+            self.start_session()
+            self.update_stats_display()
+            self.log_event(f"Usuario activo: {user_id}", "INFO")
+        except Exception as e:
+            self.log_error(f"Error al cambiar de usuario: {str(e)}")
+
+    def ask_switch_user(self) -> None:
+        """Pide el identificador del alumno y cambia de usuario."""
+        known = ", ".join(self.profile_store.users()) or "ninguno"
+        user_id = simpledialog.askstring(
+            "Cambiar Usuario", f"Identificador del alumno:\n(Conocidos: {known})",
+            initialvalue=self.game_state["user_id"], parent=self.root)
+        if user_id:
+            self.switch_user(user_id)
+
     def load_system_config(self) -> None:
         """Carga configuración del sistema."""
+        if self.headless:
+            return
         try:
             # Configurar logging
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.FileHandler(LOG_FILE, encoding='utf-8'),
-                    logging.StreamHandler()
-                ]
-            )
+            configure_logging(LOG_FILE, fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             
         except Exception as e:
             print(f"Error al configurar logging: {str(e)}")
@@ -981,6 +1122,7 @@ class GameController:
     def log_error(self, message: str) -> None:
         """Registra un error en el log."""
         self.log_event(message, "ERROR")
+        self.metrics.record_error(message)
         self.game_state["error_log"].append({
             "timestamp": datetime.now().isoformat(),
             "message": message
@@ -988,12 +1130,18 @@ class GameController:
 
     def restart_session(self) -> None:
         """Reinicia la sesión completa."""
+        self.recorder.record("restart")
         try:
             # Resetear métricas
             self.academic_metrics.reset_session()
             
-            # Resetear estado del juego
+            # Resetear estado del juego (el perfil activo conserva su usuario)
+            user_id = self.game_state["user_id"]
             self.game_state = self._initialize_game_state()
+            self.game_state["user_id"] = user_id
+            if self.profile is not None:
+                self.profile.game_state = self.game_state
+            self.prefetcher.clear()
             
             # Reiniciar UI
             self.start_session()
@@ -1008,16 +1156,16 @@ class GameController:
         try:
             report = self.generate_final_report()
             
-            filename = f"reporte_alpha_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            extension = suggested_extension()
+            filename = f"reporte_alpha_{datetime.now().strftime('%Y%m%d_%H%M%S')}{extension}"
             filepath = filedialog.asksaveasfilename(
-                defaultextension=".json",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                defaultextension=extension,
+                filetypes=[("JSON files", f"*{extension}"), ("All files", "*.*")],
                 initialname=filename
             )
             
             if filepath:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(report, f, indent=2, ensure_ascii=False)
+                save_json(filepath, report)
                 
                 messagebox.showinfo("Exportado", f"Reporte exportado a: {filepath}")
                 self.log_event(f"Reporte exportado a {filepath}", "INFO")
@@ -1026,29 +1174,42 @@ class GameController:
             self.log_error(f"Error al exportar reporte: {str(e)}")
             messagebox.showerror("Error", f"Error al exportar: {str(e)}")
 
-    def quit_application(self) -> None:
-        """Cierra la aplicación de forma segura."""
+    def shutdown(self) -> None:
+        """
+        Guarda y libera lo que no debe perderse al cerrar el juego.
+
+        Lo usan quit_application y el launcher antes de desmontar el modo;
+        sólo actúa la primera vez.
+        """
+        if self._shut_down:
+            return
+        self._shut_down = True
         try:
-            # Guardar progreso antes de salir
+            # Guardar progreso (también los perfiles cambiados en esta sesión)
             self.save_progress()
+            self.profile_store.flush()
             
             # Detener temporizadores
-            if self.session_timer:
-                self.root.after_cancel(self.session_timer)
+            self.scheduler.remove_task("session_timer")
+
+            # Guardar la grabación de la sesión (si está activa)
+            self.recorder.finish()
             
             # Log final
             self.log_event("Aplicación cerrada", "INFO")
             
-            # Cerrar ventana
-            self.root.quit()
-            
         except Exception as e:
             self.log_error(f"Error al cerrar aplicación: {str(e)}")
-            self.root.quit()
+
+    def quit_application(self) -> None:
+        """Cierra la aplicación de forma segura."""
+        self.shutdown()
+        self.root.quit()
 
     # Métodos adicionales para funcionalidades del menú
     def set_learning_mode(self, mode: str) -> None:
         """Establece el modo de aprendizaje."""
+        self.recorder.record("mode", mode)
         try:
             self.learning_manager.set_mode(mode)
             self.game_state["learning_mode"] = mode
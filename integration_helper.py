@@ -2,6 +2,8 @@ import json
 import logging
 from datetime import datetime
 
+from storage import load_json
+
 class TriviaIntegrator:
     """Helper class to integrate PDF extracted content with trivia application"""
     
@@ -24,8 +26,7 @@ class TriviaIntegrator:
     def load_extracted_templates(self):
         """Load extracted question templates"""
         try:
-            with open(self.extracted_file, 'r', encoding='utf-8') as file:
-                return json.load(file)
+            return load_json(self.extracted_file)
         except FileNotFoundError:
             logging.warning(f"Extracted file {self.extracted_file} not found")
             return []
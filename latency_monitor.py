@@ -0,0 +1,375 @@
+"""
+Latency Monitor Module - Proyecto Alpha v4.0
+Medición de la latencia del bucle de eventos de Tk y de los callbacks de la UI.
+"""
+
+import atexit
+import logging
+import math
+import os
+import time
+import tkinter as tk
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from config import DIAGNOSTICS_CONFIG
+from frame_scheduler import get_scheduler, PRIORITY_LOW
+from metrics_exporter import get_metrics, metrics_enabled
+from storage import save_json
+
+# Variable de entorno que activa el monitor sin tocar config.py
+MONITOR_ENV_VAR = "ALPHA_LATENCY_MONITOR"
+
+# Histograma logarítmico: cubetas de ~10 % entre 0.01 ms y ~1 min
+HISTOGRAM_MIN_MS = 0.01
+HISTOGRAM_GROWTH = 1.1
+HISTOGRAM_BUCKETS = 170
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """
+    Histograma de latencias con memoria constante.
+
+    Las cubetas crecen geométricamente, así que los percentiles tienen un
+    error relativo acotado (~10 %) sin guardar cada muestra.
+    """
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms", "min_ms")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.min_ms = math.inf
+
+    @staticmethod
+    def _bucket(value_ms: float) -> int:
+        if value_ms <= HISTOGRAM_MIN_MS:
+            return 0
+        index = int(math.log(value_ms / HISTOGRAM_MIN_MS) / math.log(HISTOGRAM_GROWTH)) + 1
+        return min(index, HISTOGRAM_BUCKETS - 1)
+
+    @staticmethod
+    def _upper_bound(index: int) -> float:
+        return HISTOGRAM_MIN_MS * HISTOGRAM_GROWTH ** index
+
+    def record(self, value_ms: float) -> None:
+        """Añade una muestra en milisegundos."""
+        value_ms = max(0.0, value_ms)
+        self.counts[self._bucket(value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+        if value_ms < self.min_ms:
+            self.min_ms = value_ms
+
+    def percentile(self, p: float) -> float:
+        """
+        Obtiene un percentil aproximado.
+
+        Args:
+            p: Percentil entre 0 y 100
+
+        Returns:
+            Límite superior de la cubeta que contiene el percentil (acotado por el máximo)
+        """
+        if self.count == 0:
+            return 0.0
+        target = max(1, math.ceil(self.count * p / 100.0))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(self._upper_bound(index), self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> Dict[str, float]:
+        """Resumen con conteo, media, máximo y percentiles."""
+        data = {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "min_ms": self.min_ms if self.count else 0.0,
+            "max_ms": self.max_ms,
+        }
+        for p in PERCENTILES:
+            data[f"p{p}_ms"] = self.percentile(p)
+        return data
+
+
+class LatencyMonitor:
+    """
+    Monitor de latencia para una ventana Tk.
+
+    Una sonda de alta frecuencia se programa directamente con `after` (no a
+    través del planificador de frames) para medir el retraso real con que
+    el bucle de eventos atiende los temporizadores. Los callbacks de menús y
+    botones se envuelven para medir su duración. Desactivado, `wrap()`
+    devuelve el callback original y `timed()` no mide nada.
+    """
+
+    def __init__(self, root, enabled: bool = False, probe_interval_ms: int = 10,
+                 dump_file: Optional[str] = None, clock: Callable[[], float] = time.perf_counter):
+        """
+        Inicializa el monitor.
+
+        Args:
+            root: Ventana Tk (o cualquier objeto con after/after_cancel)
+            enabled: Si se mide algo
+            probe_interval_ms: Periodo de la sonda del bucle de eventos
+            dump_file: Archivo donde volcar los histogramas al salir
+            clock: Reloj monotónico en segundos (inyectable para pruebas)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.root = root
+        self.enabled = enabled
+        self.probe_interval_ms = probe_interval_ms
+        self.dump_file = dump_file
+        self.clock = clock
+
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        # Receptores adicionales de cada muestra (p. ej. el exportador de métricas)
+        self.listeners: List[Callable[[str, float], None]] = []
+        self._probe_id = None
+        self._probe_expected: Optional[float] = None
+        self._dump_registered = False
+        self.overlay: Optional["LatencyOverlay"] = None
+
+    # ------------------------------------------------------------------
+    # Registro de muestras
+    # ------------------------------------------------------------------
+
+    def record(self, name: str, value_ms: float) -> None:
+        """Añade una muestra al histograma indicado."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        histogram.record(value_ms)
+        for listener in self.listeners:
+            listener(name, value_ms)
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """
+        Mide la duración de un bloque.
+
+        Args:
+            name: Nombre del histograma
+        """
+        if not self.enabled:
+            yield
+            return
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.record(name, (self.clock() - start) * 1000.0)
+
+    def wrap(self, name: str, callback: Optional[Callable]) -> Optional[Callable]:
+        """
+        Envuelve un callback para medir su duración.
+
+        Args:
+            name: Nombre del histograma
+            callback: Función a envolver
+
+        Returns:
+            Función envuelta (o la original si el monitor está desactivado)
+        """
+        if not self.enabled or callback is None:
+            return callback
+
+        def timed_callback(*args, **kwargs):
+            start = self.clock()
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                self.record(name, (self.clock() - start) * 1000.0)
+
+        timed_callback.__wrapped__ = callback
+        return timed_callback
+
+    def instrument(self, callbacks: Dict[str, Callable], prefix: str = "callback") -> Dict[str, Callable]:
+        """
+        Envuelve un diccionario de callbacks (menús, atajos).
+
+        Args:
+            callbacks: Nombre -> función
+            prefix: Prefijo de los histogramas
+
+        Returns:
+            Nuevo diccionario con los callbacks envueltos
+        """
+        if not self.enabled:
+            return callbacks
+        return {name: self.wrap(f"{prefix}:{name}", cb) for name, cb in callbacks.items()}
+
+    # ------------------------------------------------------------------
+    # Sonda del bucle de eventos
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Arranca la sonda y registra el volcado al salir."""
+        if not self.enabled or self._probe_id is not None:
+            return
+        self._arm_probe()
+        if self.dump_file and not self._dump_registered:
+            atexit.register(self.dump)
+            self._dump_registered = True
+
+    def stop(self) -> None:
+        """Detiene la sonda."""
+        if self._probe_id is not None:
+            try:
+                self.root.after_cancel(self._probe_id)
+            except Exception:
+                pass
+        self._probe_id = None
+        self._probe_expected = None
+
+    def _arm_probe(self) -> None:
+        self._probe_expected = self.clock() + self.probe_interval_ms / 1000.0
+        try:
+            self._probe_id = self.root.after(self.probe_interval_ms, self._probe)
+        except Exception:
+            self._probe_id = None  # Ventana destruida
+
+    def _probe(self) -> None:
+        """Registra cuánto tarde llegó la sonda respecto a lo pedido."""
+        now = self.clock()
+        if self._probe_expected is not None:
+            self.record("loop_drift", (now - self._probe_expected) * 1000.0)
+        self._arm_probe()
+
+    # ------------------------------------------------------------------
+    # Informes
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Resumen de todos los histogramas."""
+        return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())}
+
+    def dump(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Vuelca los histogramas a disco.
+
+        Args:
+            path: Ruta destino (por defecto, dump_file)
+
+        Returns:
+            Ruta escrita o None si no había nada que volcar
+        """
+        path = path or self.dump_file
+        if not path or not self.histograms:
+            return None
+        try:
+            save_json(path, {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "probe_interval_ms": self.probe_interval_ms,
+                "histograms": self.snapshot(),
+            }, compression="none")
+            return path
+        except Exception as e:
+            self.logger.error(f"No se pudo volcar el informe de latencia: {e}")
+            return None
+
+    def attach(self) -> None:
+        """
+        Vuelve a abrir el panel si la ventana tiene un planificador nuevo.
+
+        El launcher cierra el planificador (y destruye los widgets) al
+        cambiar de modo; el panel abierto se recrea sobre el actual.
+        """
+        if self.overlay is not None and self.overlay.scheduler is not get_scheduler(self.root):
+            self.overlay.destroy()
+            self.overlay = LatencyOverlay(self.root, self)
+
+    def toggle_overlay(self) -> None:
+        """Muestra u oculta el panel de depuración."""
+        if not self.enabled:
+            return
+        if self.overlay is None:
+            self.overlay = LatencyOverlay(self.root, self)
+        else:
+            self.overlay.destroy()
+            self.overlay = None
+
+
+class LatencyOverlay:
+    """Panel de depuración superpuesto con los percentiles en vivo."""
+
+    REFRESH_MS = 500
+
+    def __init__(self, root, monitor: LatencyMonitor, max_rows: int = 8):
+        self.root = root
+        self.monitor = monitor
+        self.max_rows = max_rows
+        self.scheduler = get_scheduler(root)
+        self.label = tk.Label(root, font=("Courier New", 9), justify=tk.LEFT, anchor="w",
+                              bg="#111827", fg="#F9FAFB", padx=6, pady=4)
+        self.label.place(relx=1.0, rely=1.0, anchor="se")
+        self.label.lift()
+        self.scheduler.add_task("latency_overlay", self.refresh, interval_ms=self.REFRESH_MS,
+                                priority=PRIORITY_LOW, delay_ms=0)
+
+    def refresh(self) -> bool:
+        """Actualiza el texto del panel; devuelve False si el widget ya no existe."""
+        snapshot = self.monitor.snapshot()
+        # Primero la deriva del bucle, luego los callbacks más lentos
+        names = sorted(snapshot, key=lambda n: (n != "loop_drift", -snapshot[n]["p95_ms"]))
+        lines = [f"{'métrica':<26}{'n':>6}{'p50':>8}{'p95':>8}{'p99':>8}"]
+        for name in names[:self.max_rows]:
+            s = snapshot[name]
+            lines.append(f"{name[:26]:<26}{s['count']:>6}{s['p50_ms']:>8.1f}{s['p95_ms']:>8.1f}{s['p99_ms']:>8.1f}")
+        try:
+            self.label.config(text="\n".join(lines))
+            return True
+        except tk.TclError:
+            return False
+
+    def destroy(self) -> None:
+        """Elimina el panel."""
+        self.scheduler.remove_task("latency_overlay")
+        try:
+            self.label.destroy()
+        except tk.TclError:
+            pass
+
+
+def get_latency_monitor(widget) -> LatencyMonitor:
+    """
+    Obtiene el monitor compartido de la ventana de un widget.
+
+    La primera llamada lo crea según DIAGNOSTICS_CONFIG (o la variable de
+    entorno ALPHA_LATENCY_MONITOR=1) y arranca la sonda si está activo.
+    Con la exportación de métricas activada también se activa, y sus
+    muestras alimentan los histogramas exportados.
+
+    Args:
+        widget: Ventana Tk o cualquier widget contenido en ella
+
+    Returns:
+        LatencyMonitor asociado a la ventana raíz
+    """
+    root_getter = getattr(widget, "_root", None)
+    root = root_getter() if callable(root_getter) else widget
+    monitor = getattr(root, "_latency_monitor", None)
+    if monitor is None:
+        exporting = metrics_enabled()
+        enabled = (bool(DIAGNOSTICS_CONFIG.get("latency_monitor"))
+                   or os.environ.get(MONITOR_ENV_VAR) == "1" or exporting)
+        monitor = LatencyMonitor(root, enabled=enabled,
+                                 probe_interval_ms=DIAGNOSTICS_CONFIG.get("latency_probe_ms", 10),
+                                 dump_file=DIAGNOSTICS_CONFIG.get("latency_dump_file"))
+        if exporting:
+            monitor.listeners.append(get_metrics().record_latency)
+        root._latency_monitor = monitor
+        monitor.start()
+        if enabled and DIAGNOSTICS_CONFIG.get("latency_overlay"):
+            root.after_idle(monitor.toggle_overlay)
+    else:
+        monitor.attach()
+    return monitor
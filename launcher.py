@@ -1,27 +1,132 @@
 """
 Launcher - Selector de Modo de Juego
-Permite elegir entre el juego original y los puzzles mentales.
+Permite elegir entre el juego original, los puzzles mentales, el quiz y la
+aventura de texto sin salir del proceso.
 """
 
+import importlib
+import logging
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox
-import subprocess
-import sys
-import os
+from typing import Callable, Dict, Iterable, Optional
+
+from config import UI_CONFIG
+
+# Módulos compartidos que se importan en segundo plano mientras se muestra el menú
+PRELOAD_MODULES = (
+    "config", "storage", "missions", "academic_metrics", "achievement_system",
+    "learning_manager", "simple_puzzles", "frame_scheduler", "typewriter",
+    "ui_registry", "game_controller", "main_puzzle",
+)
+
+
+class ModulePreloader:
+    """Importa módulos en un hilo en segundo plano para calentar la caché."""
+
+    def __init__(self, modules: Iterable[str]):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.modules = list(modules)
+        self.load_times: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._done = threading.Event()
+
+    def start(self) -> None:
+        """Inicia la precarga (sólo la primera vez)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="module-preloader", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que termine la precarga.
+
+        Args:
+            timeout: Segundos máximos de espera (None = sin límite)
+
+        Returns:
+            True si la precarga terminó (o nunca se inició)
+        """
+        if self._thread is None:
+            return True
+        return self._done.wait(timeout)
+
+    def _run(self) -> None:
+        """Importa cada módulo registrando su tiempo o su error."""
+        for name in self.modules:
+            start = time.perf_counter()
+            try:
+                importlib.import_module(name)
+                self.load_times[name] = (time.perf_counter() - start) * 1000.0
+            except Exception as e:
+                # Un módulo roto no debe impedir que se abra el menú
+                self.errors[name] = str(e)
+                self.logger.warning(f"No se pudo precargar {name}: {e}")
+        self._done.set()
+
 
 class GameLauncher:
-    """Lanzador de juegos."""
-    
-    def __init__(self):
+    """
+    Lanzador de juegos en proceso.
+
+    El juego original y los puzzles se montan sobre la misma ventana Tk del
+    menú. El quiz y la aventura son subclases de tk.Tk con su propio
+    intérprete: se ejecutan en este mismo proceso (con los módulos ya
+    importados) y al cerrarse se vuelve al menú.
+    """
+
+    def __init__(self, preload: bool = True):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.preloader = ModulePreloader(self._preload_modules())
+        self.active_mode: Optional[str] = None
+        self.controller = None
+        self._standalone_factory: Optional[Callable[[], tk.Tk]] = None
+
         self.root = tk.Tk()
-        self.root.title("Proyecto Alpha - Selector de Modo")
-        self.root.geometry("600x500")
-        self.root.configure(bg="#f0f8ff")
-        
         self.create_ui()
-    
+        if preload:
+            self.root.after_idle(self.preloader.start)
+
+    @staticmethod
+    def _preload_modules() -> list:
+        """Módulos a precargar, incluida la skin de interfaz configurada."""
+        modules = list(PRELOAD_MODULES)
+        try:
+            from ui_registry import UI_BACKENDS, DEFAULT_SKIN
+            skin = UI_CONFIG.get("skin", DEFAULT_SKIN)
+            modules.append(UI_BACKENDS.get(skin, UI_BACKENDS[DEFAULT_SKIN])[0])
+        except Exception:
+            pass
+        # La skin 'clean' es la de los puzzles
+        modules.append("ui_manager_clean")
+        return modules
+
+    def _reset_root(self) -> None:
+        """Deja la ventana vacía: sin widgets, menús, atajos ni tareas pendientes."""
+        scheduler = getattr(self.root, "_frame_scheduler", None)
+        if scheduler is not None:
+            scheduler.shutdown()
+        for child in self.root.winfo_children():
+            child.destroy()
+        self.root.config(menu="")
+        for sequence in self.root.bind():
+            self.root.unbind(sequence)
+        self.root.unbind_all("<MouseWheel>")
+        self.root.minsize(1, 1)
+
     def create_ui(self):
         """Crea la interfaz del launcher."""
+        self._reset_root()
+        self.active_mode = None
+        self.controller = None
+        self.root.title("Proyecto Alpha - Selector de Modo")
+        self.root.geometry("600x580")
+        self.root.configure(bg="#f0f8ff")
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
+
         # Título principal
         title_frame = tk.Frame(self.root, bg="#4a90e2", height=80)
         title_frame.pack(fill=tk.X)
@@ -67,6 +172,18 @@ class GameLauncher:
                  font=("Arial", 12, "bold"), bg="#9b59b6", fg="white",
                  command=self.launch_puzzles, padx=20, pady=5).pack(pady=10)
         
+        # Otros modos
+        other_frame = tk.Frame(content_frame, bg="#f0f8ff")
+        other_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Button(other_frame, text="📝 Quiz de Repaso", 
+                 font=("Arial", 11, "bold"), bg="#16a085", fg="white",
+                 command=self.launch_quiz, padx=15, pady=3).pack(side=tk.LEFT, expand=True)
+        
+        tk.Button(other_frame, text="🚀 Aventura de Texto", 
+                 font=("Arial", 11, "bold"), bg="#d35400", fg="white",
+                 command=self.launch_adventure, padx=15, pady=3).pack(side=tk.LEFT, expand=True)
+        
         # Información adicional
         info_frame = tk.Frame(content_frame, bg="#e8f5e8", relief=tk.RAISED, bd=1)
         info_frame.pack(fill=tk.X, pady=20)
@@ -81,32 +198,142 @@ class GameLauncher:
         # Botón de salir
         tk.Button(content_frame, text="❌ Salir", 
                  font=("Arial", 11), bg="#e74c3c", fg="white",
-                 command=self.root.quit, padx=15, pady=3).pack(pady=20)
+                 command=self.quit, padx=15, pady=3).pack(pady=20)
     
     def launch_original(self):
-        """Lanza el juego original."""
+        """Lanza el juego original en esta misma ventana."""
+        def factory():
+            from game_controller import GameController
+            return GameController(self.root)
+        self._mount("original", factory)
+    
+    def launch_puzzles(self):
+        """Lanza los puzzles mentales en esta misma ventana."""
+        def factory():
+            from main_puzzle import create_puzzle_controller
+            return create_puzzle_controller(self.root)
+        self._mount("puzzles", factory)
+    
+    def launch_quiz(self):
+        """Lanza el quiz de repaso en este mismo proceso."""
+        def factory():
+            from repaso_ia import QuizGame
+            return QuizGame()
+        self._run_standalone(factory)
+    
+    def launch_adventure(self):
+        """Lanza la aventura de texto en este mismo proceso."""
+        def factory():
+            from main_game import AITextAdventure
+            return AITextAdventure()
+        self._run_standalone(factory)
+    
+    def launch(self, mode: str) -> None:
+        """
+        Lanza un modo por nombre.
+
+        Args:
+            mode: "original", "puzzles", "quiz" o "adventure"
+        """
+        launchers = {
+            "original": self.launch_original,
+            "puzzles": self.launch_puzzles,
+            "quiz": self.launch_quiz,
+            "adventure": self.launch_adventure,
+        }
+        if mode not in launchers:
+            raise ValueError(f"Modo desconocido: {mode}")
+        launchers[mode]()
+    
+    def show_menu(self):
+        """Desmonta el modo activo y vuelve al menú."""
+        self.logger.info(f"Volviendo al menú desde '{self.active_mode}'")
+        self._teardown()
+        self.create_ui()
+    
+    def quit(self):
+        """Cierra el modo activo (si lo hay) y sale del launcher."""
+        self._teardown()
+        self.root.quit()
+    
+    def _teardown(self) -> None:
+        """
+        Ejecuta el cierre del controlador montado antes de destruir sus widgets.
+
+        Los modos que tienen algo que guardar (progreso, perfiles, grabación)
+        exponen `shutdown()`; el resto se desmonta sin más.
+        """
+        controller, self.controller = self.controller, None
+        shutdown = getattr(controller, "shutdown", None)
+        if shutdown is None:
+            return
         try:
-            self.root.destroy()
-            subprocess.run([sys.executable, "main.py"], cwd=os.getcwd())
+            shutdown()
         except Exception as e:
-            messagebox.showerror("Error", f"No se pudo iniciar el juego original:\n{str(e)}")
+            self.logger.error(f"Error al cerrar el modo '{self.active_mode}': {e}")
     
-    def launch_puzzles(self):
-        """Lanza los puzzles mentales."""
+    def _mount(self, mode: str, factory: Callable[[], object]) -> None:
+        """Monta un controlador sobre la ventana del menú."""
+        self.preloader.wait()
+        start = time.perf_counter()
+        self._teardown()
+        self._reset_root()
         try:
-            self.root.destroy()
-            subprocess.run([sys.executable, "main_puzzle.py"], cwd=os.getcwd())
+            self.controller = factory()
+            self.active_mode = mode
         except Exception as e:
-            messagebox.showerror("Error", f"No se pudo iniciar los puzzles:\n{str(e)}")
+            self.logger.error(f"No se pudo iniciar el modo '{mode}': {e}")
+            messagebox.showerror("Error", f"No se pudo iniciar el modo seleccionado:\n{str(e)}")
+            self.create_ui()
+            return
+        # Cerrar la ventana del juego devuelve al menú
+        self.root.protocol("WM_DELETE_WINDOW", self.show_menu)
+        self.logger.info(f"Modo '{mode}' montado en {(time.perf_counter() - start) * 1000.0:.1f} ms")
+    
+    def _run_standalone(self, factory: Callable[[], tk.Tk]) -> None:
+        """Sale del bucle del menú para ejecutar una app con ventana propia."""
+        self._standalone_factory = factory
+        self.root.quit()
     
     def run(self):
         """Ejecuta el launcher."""
-        self.root.mainloop()
+        while True:
+            self.root.mainloop()
+            factory, self._standalone_factory = self._standalone_factory, None
+            if factory is None:
+                break
+            
+            # Sólo puede haber un intérprete Tk vivo: se cierra el del menú
+            self.preloader.wait()
+            self.root.destroy()
+            try:
+                app = factory()
+                app.mainloop()
+            except Exception as e:
+                self.logger.error(f"Error en la aplicación: {e}")
+                messagebox.showerror("Error", f"No se pudo iniciar el modo seleccionado:\n{str(e)}")
+            
+            self.root = tk.Tk()
+            self.create_ui()
+        
+        # El modo montado puede haber cerrado el bucle por su cuenta (p. ej. menú Salir)
+        self._teardown()
+        try:
+            self.root.destroy()
+        except tk.TclError:
+            pass
+
+def main(initial_mode: Optional[str] = None):
+    """
+    Función principal.
 
-def main():
-    """Función principal."""
+    Args:
+        initial_mode: Modo a abrir directamente (None = mostrar el menú)
+    """
     launcher = GameLauncher()
+    if initial_mode:
+        launcher.root.after_idle(lambda: launcher.launch(initial_mode))
     launcher.run()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,439 @@
+"""
+Log Analyzer Module - Proyecto Alpha v4.0
+Análisis en streaming de los logs de sesión: firmas de error, sesiones y franjas de tiempo.
+"""
+
+import gzip
+import json
+import os
+import re
+import sys
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# Formatos conocidos:
+#   alpha_session.log  -> "fecha - logger - NIVEL - mensaje"
+#   quiz_game.log      -> "fecha - NIVEL - mensaje"
+#   repaso_ia.log      -> cualquiera de los dos
+LINE_PATTERN = re.compile(
+    r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})(?:,\d{3})? - "
+    r"(?:(.+?) - )?(DEBUG|INFO|WARNING|ERROR|CRITICAL) - (.*)$"
+)
+
+# Mensajes del arranque de la aplicación; el primero tras actividad abre otra sesión
+SESSION_START_MARKERS = (
+    "Verificación de integridad",
+    "Sistema profesional inicializado",
+    "Progreso cargado",
+    "Sesión iniciada",
+    "Sesión profesional iniciada",
+    "Iniciando aplicación",
+)
+
+# Errores que indican un fallo durante el arranque
+INIT_ERROR_MARKERS = ("inicializ", "al iniciar", "al configurar")
+
+# Sin eventos durante este tiempo se considera que empieza otra sesión
+SESSION_GAP = timedelta(minutes=30)
+
+BUCKET_SIZES = ("hour", "day", "week")
+ERROR_LEVELS = ("WARNING", "ERROR", "CRITICAL")
+
+# Límites de memoria: por encima se agrupa en "<otras>" o se descartan detalles
+MAX_SIGNATURES = 5000
+MAX_SESSIONS = 10000
+OTHER_SIGNATURE = "<otras>"
+
+_NUMBER = re.compile(r"\b\d+(?:[.,]\d+)*\b")
+_HEX = re.compile(r"\b0x[0-9a-fA-F]+\b")
+_LONG_QUOTED = re.compile(r"'[^']{40,}'|\"[^\"]{40,}\"")
+_PATH = re.compile(r"(?:[A-Za-z]:)?[\\/][^\s'\"]+")
+
+
+class LogRecord(NamedTuple):
+    """Registro de log ya interpretado."""
+
+    timestamp: datetime
+    logger_name: str
+    level: str
+    message: str
+
+
+def parse_line(line: str) -> Optional[LogRecord]:
+    """
+    Interpreta una línea en formato texto o JSON Lines.
+
+    Args:
+        line: Línea sin el salto final
+
+    Returns:
+        LogRecord o None si la línea no es el inicio de un registro
+    """
+    if line.startswith("{"):
+        try:
+            entry = json.loads(line)
+            return LogRecord(datetime.fromisoformat(entry["ts"]), entry.get("logger", ""),
+                             entry["level"], entry.get("message", ""))
+        except (ValueError, KeyError, TypeError):
+            return None
+    match = LINE_PATTERN.match(line)
+    if match is None:
+        return None
+    stamp, logger_name, level, message = match.groups()
+    timestamp = datetime(int(stamp[0:4]), int(stamp[5:7]), int(stamp[8:10]),
+                         int(stamp[11:13]), int(stamp[14:16]), int(stamp[17:19]))
+    return LogRecord(timestamp, logger_name or "", level, message)
+
+
+def error_signature(record: LogRecord) -> str:
+    """
+    Normaliza un mensaje para agrupar errores equivalentes.
+
+    Los números, direcciones, rutas y textos entrecomillados largos se
+    sustituyen por marcadores; los nombres cortos entre comillas (atributos,
+    tipos) se conservan porque distinguen la causa.
+
+    Args:
+        record: Registro de nivel WARNING o superior
+
+    Returns:
+        Firma "logger: mensaje normalizado"
+    """
+    message = _LONG_QUOTED.sub("'<texto>'", record.message)
+    message = _PATH.sub("<ruta>", message)
+    message = _HEX.sub("<hex>", message)
+    message = _NUMBER.sub("<n>", message)
+    return f"{record.logger_name}: {message}" if record.logger_name else message
+
+
+def bucket_key(timestamp: datetime, bucket: str) -> str:
+    """
+    Clave de la franja de tiempo de un registro.
+
+    Args:
+        timestamp: Momento del registro
+        bucket: "hour", "day" o "week"
+
+    Returns:
+        Inicio de la franja como texto ordenable
+    """
+    if bucket == "hour":
+        return timestamp.strftime("%Y-%m-%d %H:00")
+    if bucket == "week":
+        year, week, _ = timestamp.isocalendar()
+        return f"{year}-W{week:02d}"
+    return timestamp.strftime("%Y-%m-%d")
+
+
+def open_log(path: str) -> Iterator[str]:
+    """Itera las líneas de un log (texto plano o .gz) sin cargarlo entero."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+class LogReport:
+    """
+    Agregados de uno o varios archivos de log.
+
+    La memoria depende del número de firmas, franjas y sesiones (todas
+    acotadas), no del tamaño de los archivos. Los informes de distintos
+    archivos se combinan con `merge`.
+    """
+
+    def __init__(self, bucket: str = "day"):
+        if bucket not in BUCKET_SIZES:
+            raise ValueError(f"Franja no válida: {bucket} (usar {', '.join(BUCKET_SIZES)})")
+        self.bucket = bucket
+        self.files: List[str] = []
+        self.lines = 0
+        self.records = 0
+        self.continuation_lines = 0
+        self.unparsed = 0
+        self.by_level: Counter = Counter()
+        self.signatures: Counter = Counter()
+        self.examples: Dict[str, str] = {}
+        self.buckets: Dict[str, Counter] = {}
+        self.sessions: List[Dict[str, Any]] = []
+        self.sessions_total = 0
+        self.sessions_with_errors = 0
+        self.sessions_crashed_on_init = 0
+        self.first_seen: Optional[datetime] = None
+        self.last_seen: Optional[datetime] = None
+
+    # ------------------------------------------------------------------
+    # Agregación
+    # ------------------------------------------------------------------
+
+    def add_signature(self, signature: str, count: int = 1, example: str = "") -> None:
+        """Suma ocurrencias de una firma respetando el límite de firmas distintas."""
+        if signature not in self.signatures and len(self.signatures) >= MAX_SIGNATURES:
+            signature = OTHER_SIGNATURE
+        self.signatures[signature] += count
+        if example and signature not in self.examples:
+            self.examples[signature] = example
+
+    def add_session(self, session: Dict[str, Any]) -> None:
+        """Registra una sesión cerrada."""
+        self.sessions_total += 1
+        if session["errors"]:
+            self.sessions_with_errors += 1
+        if session["crashed_on_init"]:
+            self.sessions_crashed_on_init += 1
+        if len(self.sessions) < MAX_SESSIONS:
+            self.sessions.append(session)
+
+    def merge(self, other: "LogReport") -> "LogReport":
+        """
+        Combina otro informe en este.
+
+        Args:
+            other: Informe con la misma franja de tiempo
+
+        Returns:
+            Este mismo informe
+        """
+        self.files.extend(other.files)
+        self.lines += other.lines
+        self.records += other.records
+        self.continuation_lines += other.continuation_lines
+        self.unparsed += other.unparsed
+        self.by_level.update(other.by_level)
+        for signature, count in other.signatures.items():
+            self.add_signature(signature, count, other.examples.get(signature, ""))
+        for key, counts in other.buckets.items():
+            self.buckets.setdefault(key, Counter()).update(counts)
+        for session in other.sessions:
+            if len(self.sessions) < MAX_SESSIONS:
+                self.sessions.append(session)
+        self.sessions_total += other.sessions_total
+        self.sessions_with_errors += other.sessions_with_errors
+        self.sessions_crashed_on_init += other.sessions_crashed_on_init
+        for seen in (other.first_seen, other.last_seen):
+            if seen is not None:
+                self.first_seen = seen if self.first_seen is None else min(self.first_seen, seen)
+                self.last_seen = seen if self.last_seen is None else max(self.last_seen, seen)
+        return self
+
+    # ------------------------------------------------------------------
+    # Resultados
+    # ------------------------------------------------------------------
+
+    def top_signatures(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Firmas más frecuentes con un mensaje de ejemplo."""
+        return [{"signature": signature, "count": count, "example": self.examples.get(signature, "")}
+                for signature, count in self.signatures.most_common(n)]
+
+    def to_dict(self, top: int = 10) -> Dict[str, Any]:
+        """Resumen serializable a JSON."""
+        return {
+            "files": self.files,
+            "lines": self.lines,
+            "records": self.records,
+            "continuation_lines": self.continuation_lines,
+            "unparsed": self.unparsed,
+            "first_seen": self.first_seen.isoformat() if self.first_seen else None,
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+            "by_level": dict(self.by_level),
+            "top_signatures": self.top_signatures(top),
+            "bucket": self.bucket,
+            "buckets": {key: dict(self.buckets[key]) for key in sorted(self.buckets)},
+            "sessions": {
+                "total": self.sessions_total,
+                "with_errors": self.sessions_with_errors,
+                "crashed_on_init": self.sessions_crashed_on_init,
+            },
+        }
+
+
+def analyze_lines(lines: Iterable[str], source: str = "<stream>", bucket: str = "day",
+                  since: Optional[datetime] = None, until: Optional[datetime] = None) -> LogReport:
+    """
+    Analiza un flujo de líneas en una sola pasada.
+
+    Args:
+        lines: Líneas del log (sin salto final)
+        source: Nombre del origen para el informe y las sesiones
+        bucket: Tamaño de las franjas de tiempo
+        since: Ignora registros anteriores
+        until: Ignora registros posteriores
+
+    Returns:
+        LogReport con los agregados
+    """
+    report = LogReport(bucket)
+    report.files.append(source)
+    session: Optional[Dict[str, Any]] = None
+    last_record: Optional[LogRecord] = None
+
+    def close_session():
+        if session is not None:
+            report.add_session(session)
+
+    for line in lines:
+        report.lines += 1
+        record = parse_line(line)
+        if record is None:
+            # Trazas de excepción y mensajes multilínea pertenecen al registro anterior
+            if last_record is not None and line:
+                report.continuation_lines += 1
+            elif line:
+                report.unparsed += 1
+            continue
+        last_record = record
+        if (since and record.timestamp < since) or (until and record.timestamp > until):
+            continue
+
+        report.records += 1
+        report.by_level[record.level] += 1
+        if report.first_seen is None or record.timestamp < report.first_seen:
+            report.first_seen = record.timestamp
+        if report.last_seen is None or record.timestamp > report.last_seen:
+            report.last_seen = record.timestamp
+        key = bucket_key(record.timestamp, bucket)
+        counts = report.buckets.get(key)
+        if counts is None:
+            counts = report.buckets[key] = Counter()
+        counts[record.level] += 1
+
+        starts = record.message.startswith(SESSION_START_MARKERS)
+        if session is None or record.timestamp - session["_last"] > SESSION_GAP or (
+                starts and session["_active"]):
+            close_session()
+            session = {"source": source, "start": record.timestamp.isoformat(),
+                       "end": None, "events": 0, "errors": 0, "crashed_on_init": False,
+                       "_active": False, "_last": record.timestamp}
+        if not starts:
+            session["_active"] = True
+        session["events"] += 1
+        session["_last"] = record.timestamp
+        session["end"] = record.timestamp.isoformat()
+
+        if record.level in ERROR_LEVELS:
+            report.add_signature(error_signature(record), example=record.message)
+            if record.level != "WARNING":
+                session["errors"] += 1
+                lowered = record.message.lower()
+                if any(marker in lowered for marker in INIT_ERROR_MARKERS):
+                    session["crashed_on_init"] = True
+
+    close_session()
+    for item in report.sessions:
+        item.pop("_last", None)
+        item.pop("_active", None)
+    return report
+
+
+def analyze_file(path: str, bucket: str = "day", since: Optional[datetime] = None,
+                 until: Optional[datetime] = None) -> LogReport:
+    """
+    Analiza un archivo de log (texto o .gz) en streaming.
+
+    Args:
+        path: Ruta del archivo
+        bucket: Tamaño de las franjas de tiempo
+        since: Ignora registros anteriores
+        until: Ignora registros posteriores
+
+    Returns:
+        LogReport del archivo
+    """
+    return analyze_lines(open_log(path), source=os.path.basename(path),
+                         bucket=bucket, since=since, until=until)
+
+
+def _analyze_file_args(args):
+    """Adaptador para el pool de procesos."""
+    return analyze_file(*args)
+
+
+def analyze_files(paths: List[str], bucket: str = "day", since: Optional[datetime] = None,
+                  until: Optional[datetime] = None, workers: int = 1) -> LogReport:
+    """
+    Analiza varios archivos, opcionalmente en paralelo (un proceso por archivo).
+
+    Args:
+        paths: Archivos de log
+        bucket: Tamaño de las franjas de tiempo
+        since: Ignora registros anteriores
+        until: Ignora registros posteriores
+        workers: Procesos en paralelo (1 = secuencial)
+
+    Returns:
+        LogReport combinado
+    """
+    report = LogReport(bucket)
+    jobs = [(path, bucket, since, until) for path in paths]
+    if workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            for partial in pool.map(_analyze_file_args, jobs):
+                report.merge(partial)
+    else:
+        for job in jobs:
+            report.merge(_analyze_file_args(job))
+    return report
+
+
+def format_report(report: LogReport, top: int = 10) -> str:
+    """
+    Formatea el informe como texto legible.
+
+    Args:
+        report: Informe a mostrar
+        top: Número de firmas a listar
+
+    Returns:
+        Texto del informe
+    """
+    lines = [
+        f"📄 Archivos: {len(report.files)}  Líneas: {report.lines}  Registros: {report.records}",
+        f"🕒 Periodo: {report.first_seen or '-'} → {report.last_seen or '-'}",
+        "📊 Niveles: " + ", ".join(f"{level}={count}" for level, count in sorted(report.by_level.items())),
+        f"🎮 Sesiones: {report.sessions_total}  con errores: {report.sessions_with_errors}"
+        f"  fallo al iniciar: {report.sessions_crashed_on_init}",
+        "",
+        f"🔥 Errores más frecuentes (top {top}):",
+    ]
+    for item in report.top_signatures(top):
+        lines.append(f"  {item['count']:>6}  {item['signature']}")
+    lines.append("")
+    lines.append(f"📅 Por {report.bucket}:")
+    for key in sorted(report.buckets):
+        counts = report.buckets[key]
+        errors = sum(counts.get(level, 0) for level in ERROR_LEVELS)
+        lines.append(f"  {key}  registros={sum(counts.values()):>6}  avisos/errores={errors:>5}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Analiza logs de sesión de Proyecto Alpha")
+    parser.add_argument("paths", nargs="+", help="Archivos de log (.log o .gz)")
+    parser.add_argument("--bucket", choices=BUCKET_SIZES, default="day", help="Tamaño de franja")
+    parser.add_argument("--since", help="Fecha inicial (AAAA-MM-DD)")
+    parser.add_argument("--until", help="Fecha final (AAAA-MM-DD, incluida)")
+    parser.add_argument("--top", type=int, default=10, help="Firmas de error a mostrar")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos en paralelo")
+    parser.add_argument("--json", dest="json_output", help="Guarda el informe en JSON")
+    args = parser.parse_args(argv)
+
+    since = datetime.fromisoformat(args.since) if args.since else None
+    until = datetime.fromisoformat(args.until) + timedelta(days=1) if args.until else None
+    report = analyze_files(args.paths, bucket=args.bucket, since=since, until=until,
+                           workers=args.workers)
+    print(format_report(report, args.top))
+    if args.json_output:
+        from storage import save_json
+
+        save_json(args.json_output, report.to_dict(args.top), compression="none")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Logging Setup Module - Proyecto Alpha v4.0
+Configuración central del logging: cola asíncrona, rotación, muestreo y JSON Lines.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from config import LOGGING_CONFIG
+
+DEFAULT_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+# Atributos estándar de LogRecord (el resto se considera contexto extra)
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Deja pasar sólo uno de cada N registros de eventos frecuentes.
+
+    Las reglas asocian un prefijo del mensaje con N. Los avisos y errores
+    nunca se muestrean; los registros conservados llevan `sample_rate`.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, int]] = None):
+        super().__init__()
+        self.rules = {prefix: max(1, int(rate)) for prefix, rate in (rules or {}).items()}
+        self.seen: Dict[str, int] = {}
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not self.rules or record.levelno >= logging.WARNING:
+            return True
+        message = str(record.msg)
+        for prefix, rate in self.rules.items():
+            if message.startswith(prefix):
+                with self._lock:
+                    count = self.seen.get(prefix, 0)
+                    self.seen[prefix] = count + 1
+                if count % rate:
+                    self.dropped += 1
+                    return False
+                record.sample_rate = rate
+                return True
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formatea cada registro como un objeto JSON en una línea."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que nunca bloquea: si la cola está llena, descarta y cuenta."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LoggingPipeline:
+    """
+    Handlers activos del proceso.
+
+    El hilo de la UI sólo formatea el mensaje y lo encola; la escritura en
+    disco y consola la hace el hilo del QueueListener.
+    """
+
+    def __init__(self, log_file: str, fmt: str, level: int, console: bool,
+                 settings: Dict[str, Any]):
+        self.log_file = log_file
+        self.settings = settings
+        self.handlers: List[logging.Handler] = []
+        self.listener: Optional[logging.handlers.QueueListener] = None
+
+        file_handler = _build_file_handler(log_file, settings)
+        file_handler.setFormatter(JsonLinesFormatter() if settings.get("json_lines")
+                                  else logging.Formatter(fmt))
+        self.handlers.append(file_handler)
+        if console:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(logging.Formatter(fmt))
+            self.handlers.append(console_handler)
+
+        self.sampling = SamplingFilter(settings.get("sampling"))
+        if settings.get("async", True):
+            self.root_handler: logging.Handler = _DroppingQueueHandler(
+                queue.Queue(maxsize=settings.get("queue_size", 10000)))
+            self.listener = logging.handlers.QueueListener(
+                self.root_handler.queue, *self.handlers, respect_handler_level=True)
+            self.root_handlers = [self.root_handler]
+        else:
+            self.root_handler = None
+            self.root_handlers = list(self.handlers)
+        for handler in self.root_handlers:
+            handler.addFilter(self.sampling)
+
+        root = logging.getLogger()
+        root.setLevel(level)
+        for handler in self.root_handlers:
+            root.addHandler(handler)
+        if self.listener is not None:
+            self.listener.start()
+
+    @property
+    def dropped(self) -> int:
+        """Registros descartados por muestreo o por cola llena."""
+        return self.sampling.dropped + getattr(self.root_handler, "dropped", 0)
+
+    def stop(self) -> None:
+        """Vacía la cola, cierra los archivos y retira los handlers del logger raíz."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        root = logging.getLogger()
+        for handler in self.root_handlers:
+            root.removeHandler(handler)
+        for handler in self.handlers:
+            handler.close()
+
+
+def _build_file_handler(log_file: str, settings: Dict[str, Any]) -> logging.Handler:
+    """Crea el handler de archivo según la política de rotación."""
+    rotation = settings.get("rotation")
+    if rotation == "size":
+        return logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=settings.get("max_bytes", 1048576),
+            backupCount=settings.get("backup_count", 5), encoding="utf-8", delay=True)
+    if rotation == "time":
+        return logging.handlers.TimedRotatingFileHandler(
+            log_file, when=settings.get("when", "midnight"),
+            backupCount=settings.get("backup_count", 5), encoding="utf-8", delay=True)
+    return logging.FileHandler(log_file, encoding="utf-8", delay=True)
+
+
+_pipeline: Optional[LoggingPipeline] = None
+_atexit_registered = False
+
+
+def configure_logging(log_file: str, fmt: str = DEFAULT_FORMAT, level: int = logging.INFO,
+                      console: bool = True, force: bool = False, **overrides) -> Optional[LoggingPipeline]:
+    """
+    Configura el logging del proceso (sustituye a logging.basicConfig).
+
+    Como basicConfig, la primera llamada gana: las siguientes devuelven la
+    configuración existente salvo que se pida `force`, y no se hace nada si
+    el logger raíz ya tenía handlers de otro origen.
+
+    Args:
+        log_file: Archivo de log
+        fmt: Formato de texto (consola y archivo en modo texto)
+        level: Nivel mínimo del logger raíz
+        console: Si también se escribe en consola
+        force: Reemplaza una configuración previa
+        **overrides: Claves de LOGGING_CONFIG a sobrescribir
+
+    Returns:
+        LoggingPipeline activo (None si el logging ya estaba configurado fuera)
+    """
+    global _pipeline, _atexit_registered
+    if not force and (_pipeline is not None or logging.getLogger().handlers):
+        return _pipeline
+    shutdown_logging()
+    settings = dict(LOGGING_CONFIG, **overrides)
+    _pipeline = LoggingPipeline(log_file, fmt, level, console, settings)
+    if not _atexit_registered:
+        atexit.register(shutdown_logging)
+        _atexit_registered = True
+    return _pipeline
+
+
+def shutdown_logging() -> None:
+    """Detiene el pipeline activo asegurando que se escriben los registros pendientes."""
+    global _pipeline
+    if _pipeline is not None:
+        _pipeline.stop()
+        _pipeline = None
+
+
+def get_pipeline() -> Optional[LoggingPipeline]:
+    """Pipeline activo (None si aún no se configuró)."""
+    return _pipeline
@@ -7,8 +7,13 @@ Archivo principal de entrada a la aplicación.
 import sys
 import traceback
 
-# Importar módulos refactorizados
-from repaso_ia_refactored import main as run_application
+# Lanzador en proceso (una sola ventana Tk y módulos precargados)
+from launcher import main as run_launcher
+
+
+def run_application():
+    """Abre el sistema educativo directamente en el modo tradicional."""
+    run_launcher(initial_mode="original")
 
 def global_exception_handler(exc_type, exc_value, exc_traceback):
     """Manejador global de excepciones no capturadas."""
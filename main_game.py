@@ -13,10 +13,14 @@ MEJORAS IMPLEMENTADAS:
 - Diseño responsive mejorado
 """
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import messagebox
 import random
 import time
 
+from frame_scheduler import get_scheduler
+from typewriter import TextWidgetTarget, TypewriterRenderer
+
 # --- PALETA DE COLORES Y ESTILOS MEJORADA ---
 COLORS = {
     "bg_primary": "#0A192F",
@@ -143,12 +147,11 @@ class AITextAdventure(tk.Tk):
         self.font_feedback = ('Roboto Mono', 11, 'italic')
         self.font_stats = ('Roboto Mono', 10, 'normal')
 
-        self.story_text_var = tk.StringVar()
         self.progress_text_var = tk.StringVar()
         self.feedback_text_var = tk.StringVar()
         self.stats_text_var = tk.StringVar()
         
-        self.after_id = None
+        self.scheduler = get_scheduler(self)
         self.create_widgets()
         self.start_game()
 
@@ -188,9 +191,16 @@ class AITextAdventure(tk.Tk):
         story_frame = tk.Frame(main_frame, bg=COLORS["bg_secondary"], padx=20, pady=20, relief=tk.FLAT, bd=1)
         story_frame.pack(fill="x", pady=10)
         
-        self.story_label = tk.Label(story_frame, textvariable=self.story_text_var, wraplength=950, justify=tk.LEFT, 
-                                    font=self.font_story, bg=COLORS["bg_secondary"], fg=COLORS["text_white"])
-        self.story_label.pack(fill='x')
+        # Text de solo lectura: el teletipo inserta sólo cada bloque nuevo
+        story_font = tkfont.Font(font=self.font_story)
+        self.story_text = tk.Text(story_frame, wrap=tk.WORD, font=self.font_story,
+                                  width=950 // max(1, story_font.measure("0")), height=1,
+                                  bg=COLORS["bg_secondary"], fg=COLORS["text_white"],
+                                  relief=tk.FLAT, bd=0, highlightthickness=0, padx=0, pady=0,
+                                  cursor="arrow", takefocus=0, state=tk.DISABLED)
+        self.story_text.pack(anchor='w')
+        self.story_target = TextWidgetTarget(self.story_text, fit_height=True)
+        self.typewriter = TypewriterRenderer(self.scheduler, self.story_target, chars_per_second=40)
 
         # Área de Feedback
         feedback_frame = tk.Frame(main_frame, bg=COLORS["bg_primary"])
@@ -226,12 +236,16 @@ class AITextAdventure(tk.Tk):
         self.skip_button.pack()
         self.skip_button.pack_forget()
 
+    def stop_story_effect(self):
+        """Detiene la animación de teletipo en curso, si existe."""
+        self.typewriter.stop()
+
     def skip_animation(self):
         """Salta la animación de teletipo."""
-        if self.after_id:
-            self.after_cancel(self.after_id)
-            self.after_id = None
-        self.story_text_var.set(GAME_STATE["story_full_text"])
+        if self.typewriter.running:
+            self.typewriter.skip()
+        else:
+            self.story_target.replace(GAME_STATE["story_full_text"])
         self.skip_button.pack_forget()
 
     def update_stats(self):
@@ -251,20 +265,16 @@ class AITextAdventure(tk.Tk):
 
     def type_story_effect(self):
         """Efecto de escritura con mejor control."""
-        full_text = GAME_STATE["story_full_text"]
-        if GAME_STATE["current_story_idx"] < len(full_text):
-            current_text = full_text[:GAME_STATE["current_story_idx"] + 1]
-            self.story_text_var.set(current_text)
-            GAME_STATE["current_story_idx"] += 1
-            self.after_id = self.after(25, self.type_story_effect)
-        else:
-            self.after_id = None
-            self.skip_button.pack_forget()
+        self.typewriter.start(GAME_STATE["story_full_text"], on_complete=self._on_story_typed)
+
+    def _on_story_typed(self):
+        """Sincroniza el estado al terminar (o saltar) el teletipo."""
+        GAME_STATE["current_story_idx"] = len(GAME_STATE["story_full_text"])
+        self.skip_button.pack_forget()
 
     def start_game(self):
         """Inicializa el juego con mejor feedback."""
-        if self.after_id:
-            self.after_cancel(self.after_id)
+        self.stop_story_effect()
         
         GAME_STATE.update({
             "mission": 0,
@@ -290,7 +300,6 @@ class AITextAdventure(tk.Tk):
         )
         
         GAME_STATE["story_full_text"] = intro_text
-        self.story_text_var.set("")
         self.skip_button.pack()
         self.type_story_effect()
         
@@ -306,8 +315,7 @@ class AITextAdventure(tk.Tk):
 
     def next_mission(self):
         """Avanza a la siguiente misión con mejor transición."""
-        if self.after_id:
-            self.after_cancel(self.after_id)
+        self.stop_story_effect()
         GAME_STATE["mission"] += 1
         self.load_mission(GAME_STATE["mission"])
 
@@ -329,7 +337,6 @@ class AITextAdventure(tk.Tk):
         full_story = f"🔍 CONCEPTO: {mission_data['concept_name']}\n\n{mission_data['story']}"
         GAME_STATE["story_full_text"] = full_story
         GAME_STATE["current_story_idx"] = 0
-        self.story_text_var.set("")
         self.skip_button.pack()
         self.type_story_effect()
         
@@ -370,8 +377,7 @@ class AITextAdventure(tk.Tk):
             self.next_mission()
             return
 
-        if self.after_id:
-            self.after_cancel(self.after_id)
+        self.stop_story_effect()
 
         mission_data = MISSIONS[GAME_STATE["mission"]]
         GAME_STATE["total_answers"] += 1
@@ -435,8 +441,7 @@ class AITextAdventure(tk.Tk):
 
     def show_results(self):
         """Muestra resultados finales mejorados."""
-        if self.after_id:
-            self.after_cancel(self.after_id)
+        self.stop_story_effect()
             
         self.clear_options()
         self.next_button.pack_forget()
@@ -463,7 +468,6 @@ class AITextAdventure(tk.Tk):
         final_story = MISSIONS[4]["story"]
         GAME_STATE["story_full_text"] = final_story
         GAME_STATE["current_story_idx"] = 0
-        self.story_text_var.set("")
         self.type_story_effect()
 
         # Resultados detallados
@@ -517,8 +521,8 @@ class AITextAdventure(tk.Tk):
 
     def restart_app(self):
         """Reinicia la aplicación."""
-        if self.after_id:
-            self.after_cancel(self.after_id)
+        self.stop_story_effect()
+        self.scheduler.shutdown()
         self.destroy()
         AITextAdventure().mainloop()
 
@@ -7,14 +7,15 @@ import tkinter as tk
 from tkinter import messagebox
 import time
 from puzzle_game_simple import PuzzleGame
-from ui_manager_clean import UIManager
+from ui_registry import create_ui_manager
+from frame_scheduler import get_scheduler, PRIORITY_LOW
 
 class PuzzleController:
     """Controlador simplificado para puzzles mentales."""
     
     def __init__(self, root: tk.Tk):
         self.root = root
-        self.ui_manager = UIManager(root)
+        self.ui_manager = create_ui_manager(root, "clean")
         self.puzzle_game = PuzzleGame(self.ui_manager)
         
         # Estado del juego
@@ -181,9 +182,11 @@ class PuzzleController:
         """Inicia el temporizador."""
         def update_timer():
             self.ui_manager.timer_text_var.set(f"⏱️ {self.format_time()}")
-            self.root.after(1000, update_timer)
         
+        # Tarea con nombre: reiniciar el juego reemplaza el reloj existente
         update_timer()
+        get_scheduler(self.root).add_task("session_timer", update_timer,
+                                          interval_ms=1000, priority=PRIORITY_LOW)
     
     def restart_game(self):
         """Reinicia el juego."""
@@ -212,13 +215,16 @@ class PuzzleController:
         )
         messagebox.showinfo("Cómo Jugar", help_text)
 
-def main():
-    """Función principal."""
-    root = tk.Tk()
-    root.title("Puzzles Mentales de IA")
-    root.geometry("1200x800")
-    
-    # Configurar el controlador
+def create_puzzle_controller(root: tk.Tk) -> PuzzleController:
+    """
+    Crea el controlador de puzzles sobre una ventana existente.
+
+    Args:
+        root: Ventana Tk donde montar el juego
+
+    Returns:
+        Controlador de puzzles listo para usar
+    """
     controller = PuzzleController(root)
     
     # Conectar el manejador de respuestas
@@ -230,6 +236,16 @@ def main():
         return original_create_options(mission_data, new_callback)
     
     controller.ui_manager.create_option_buttons = create_options_with_handler
+    return controller
+
+def main():
+    """Función principal."""
+    root = tk.Tk()
+    root.title("Puzzles Mentales de IA")
+    root.geometry("1200x800")
+    
+    # Configurar el controlador
+    create_puzzle_controller(root)
     
     root.mainloop()
 
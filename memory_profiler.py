@@ -0,0 +1,331 @@
+"""
+Memory Profiler Module - Proyecto Alpha v4.0
+Instantáneas periódicas de tracemalloc con atribución por subsistema.
+"""
+
+import atexit
+import fnmatch
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import DIAGNOSTICS_CONFIG
+from frame_scheduler import get_scheduler, PRIORITY_LOW
+from storage import save_json, load_json
+
+# Variable de entorno que activa el perfilado sin tocar config.py
+MEMORY_ENV_VAR = "ALPHA_MEMORY_PROFILE"
+
+# Subsistema -> patrones de nombre de archivo (se comparan con el nombre base
+# y con la ruta, para reconocer también módulos de la biblioteca estándar)
+SUBSYSTEMS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("metrics", ("academic_metrics.py", "metrics_exporter.py", "latency_monitor.py",
+                 "stats_manager.py", "learning_manager.py")),
+    ("achievements", ("achievement_system.py",)),
+    ("puzzles", ("simple_puzzles.py", "puzzle_generator.py", "puzzle_games.py", "puzzle_game_simple.py", "puzzle_ui.py")),
+    ("missions", ("missions.py", "mission_catalog.py")),
+    ("storage", ("storage.py", "*/json/*", "*/gzip.py", "*/zlib*", "*/lzma.py")),
+    ("ui", ("ui_*.py", "typewriter.py", "frame_scheduler.py", "*/tkinter/*")),
+    ("logging", ("logging_setup.py", "*/logging/*")),
+    ("controller", ("game_controller.py", "launcher.py", "main*.py")),
+)
+OTHER_SUBSYSTEM = "other"
+
+# Asignaciones internas que no interesan
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+_classify_cache: Dict[str, str] = {}
+
+
+def classify(filename: str) -> str:
+    """
+    Asigna un archivo de código a un subsistema.
+
+    Args:
+        filename: Ruta del archivo que hizo la asignación
+
+    Returns:
+        Nombre del subsistema ("other" si no coincide ninguno)
+    """
+    subsystem = _classify_cache.get(filename)
+    if subsystem is None:
+        path = filename.replace("\\", "/")
+        base = os.path.basename(path)
+        subsystem = OTHER_SUBSYSTEM
+        for name, patterns in SUBSYSTEMS:
+            if any(fnmatch.fnmatch(base, p) or fnmatch.fnmatch(path, p) for p in patterns):
+                subsystem = name
+                break
+        _classify_cache[filename] = subsystem
+    return subsystem
+
+
+def _by_subsystem(snapshot: tracemalloc.Snapshot) -> Dict[str, int]:
+    """Bytes vivos por subsistema."""
+    totals: Dict[str, int] = {}
+    for stat in snapshot.statistics("filename"):
+        subsystem = classify(stat.traceback[0].filename)
+        totals[subsystem] = totals.get(subsystem, 0) + stat.size
+    return totals
+
+
+def _growth(snapshot: tracemalloc.Snapshot, reference: tracemalloc.Snapshot,
+            top_n: int) -> List[Dict[str, Any]]:
+    """Líneas con mayor crecimiento respecto a una instantánea anterior."""
+    growth = []
+    for stat in snapshot.compare_to(reference, "lineno"):
+        if stat.size_diff <= 0:
+            continue
+        frame = stat.traceback[0]
+        growth.append({
+            "location": f"{os.path.basename(frame.filename)}:{frame.lineno}",
+            "subsystem": classify(frame.filename),
+            "size_diff_kb": round(stat.size_diff / 1024, 2),
+            "count_diff": stat.count_diff,
+            "size_kb": round(stat.size / 1024, 2),
+        })
+        if len(growth) >= top_n:
+            break
+    return growth
+
+
+class MemoryProfiler:
+    """
+    Modo de perfilado de memoria para sesiones largas.
+
+    Toma una instantánea de referencia al arrancar y luego otras periódicas;
+    cada muestra guarda los bytes vivos por subsistema y las N líneas que
+    más han crecido desde el inicio y desde la muestra anterior. Sólo se
+    conservan en memoria la referencia y la última instantánea.
+    """
+
+    def __init__(self, enabled: bool = False, interval_s: float = 60.0, top_n: int = 15,
+                 report_file: Optional[str] = None, frames: int = 1, max_samples: int = 500,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializa el perfilador.
+
+        Args:
+            enabled: Si se perfila algo
+            interval_s: Periodo entre instantáneas
+            top_n: Líneas de crecimiento a guardar por muestra
+            report_file: Archivo del informe (se escribe al detenerse)
+            frames: Profundidad de pila que guarda tracemalloc
+            max_samples: Máximo de muestras conservadas (se descartan las intermedias)
+            clock: Reloj monotónico en segundos (inyectable para pruebas)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.enabled = enabled
+        self.interval_s = interval_s
+        self.top_n = top_n
+        self.report_file = report_file
+        self.frames = frames
+        self.max_samples = max_samples
+        self.clock = clock
+
+        self.samples: List[Dict[str, Any]] = []
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._baseline_totals: Dict[str, int] = {}
+        self._started_at: Optional[float] = None
+        self._owns_tracing = False
+        self._scheduler = None
+
+    @property
+    def running(self) -> bool:
+        """Indica si hay una sesión de perfilado activa."""
+        return self._baseline is not None
+
+    def start(self, root=None) -> None:
+        """
+        Arranca el trazado y toma la instantánea de referencia.
+
+        Args:
+            root: Ventana Tk; si se indica, las instantáneas se programan solas
+        """
+        if not self.enabled or self.running:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._owns_tracing = True
+        self._started_at = self.clock()
+        self._baseline = self._previous = self._snapshot()
+        self._baseline_totals = _by_subsystem(self._baseline)
+        if root is not None:
+            self.attach(root)
+
+    def attach(self, root) -> None:
+        """
+        Programa las instantáneas en el planificador actual de la ventana.
+
+        El launcher cierra el planificador al cambiar de modo; al volver a
+        pedir el perfilador se reprograma la tarea en el planificador nuevo.
+
+        Args:
+            root: Ventana Tk
+        """
+        if not self.running:
+            return
+        scheduler = get_scheduler(root)
+        if scheduler is self._scheduler and scheduler.has_task("memory_snapshot"):
+            return
+        self._scheduler = scheduler
+        scheduler.add_task("memory_snapshot", self._periodic,
+                           interval_ms=self.interval_s * 1000, priority=PRIORITY_LOW)
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(_IGNORED)
+
+    def _periodic(self) -> bool:
+        self.take_snapshot()
+        return self.running
+
+    def take_snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Toma una instantánea y registra la muestra.
+
+        Returns:
+            Muestra registrada (None si el perfilador no está activo)
+        """
+        if not self.running:
+            return None
+        snapshot = self._snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        by_subsystem = _by_subsystem(snapshot)
+        baseline = self._baseline_totals
+        sample = {
+            "elapsed_s": round(self.clock() - self._started_at, 1),
+            "traced_kb": round(current / 1024, 1),
+            "peak_kb": round(peak / 1024, 1),
+            "by_subsystem_kb": {name: round(size / 1024, 1) for name, size in sorted(by_subsystem.items())},
+            "subsystem_growth_kb": {
+                name: round((by_subsystem.get(name, 0) - baseline.get(name, 0)) / 1024, 1)
+                for name in sorted(set(by_subsystem) | set(baseline))
+            },
+            "top_growth_since_start": _growth(snapshot, self._baseline, self.top_n),
+            "top_growth_since_last": _growth(snapshot, self._previous, self.top_n),
+        }
+        self._previous = snapshot
+        if len(self.samples) >= self.max_samples:
+            # Se conserva la primera muestra para comparar la tendencia completa
+            del self.samples[1]
+        self.samples.append(sample)
+        return sample
+
+    def report(self) -> Dict[str, Any]:
+        """Informe de la sesión de perfilado."""
+        return {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "interval_s": self.interval_s,
+            "top_n": self.top_n,
+            "samples": self.samples,
+        }
+
+    def save_report(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Guarda el informe en JSON.
+
+        Args:
+            path: Ruta destino (por defecto, report_file)
+
+        Returns:
+            Ruta escrita o None si no había muestras
+        """
+        path = path or self.report_file
+        if not path or not self.samples:
+            return None
+        try:
+            save_json(path, self.report(), compression="none")
+            return path
+        except Exception as e:
+            self.logger.error(f"No se pudo guardar el informe de memoria: {e}")
+            return None
+
+    def stop(self) -> None:
+        """Toma la última muestra, guarda el informe y libera tracemalloc."""
+        if not self.running:
+            return
+        self.take_snapshot()
+        if self._scheduler is not None:
+            self._scheduler.remove_task("memory_snapshot")
+            self._scheduler = None
+        self.save_report()
+        self._baseline = self._previous = None
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+
+def format_report(report: Dict[str, Any], top: int = 10) -> str:
+    """
+    Formatea un informe como texto legible.
+
+    Args:
+        report: Informe generado por MemoryProfiler.report()
+        top: Líneas de crecimiento a listar
+
+    Returns:
+        Texto del informe
+    """
+    samples = report.get("samples", [])
+    if not samples:
+        return "Sin muestras de memoria"
+    last = samples[-1]
+    lines = [f"🧠 {len(samples)} muestras, {last['elapsed_s']:.0f} s, "
+             f"{last['traced_kb']:.0f} KB vivos (pico {last['peak_kb']:.0f} KB)", "",
+             f"{'subsistema':<14}{'KB':>10}{'crecimiento':>14}"]
+    for name, size in sorted(last["by_subsystem_kb"].items(), key=lambda item: -item[1]):
+        lines.append(f"{name:<14}{size:>10.1f}{last['subsystem_growth_kb'].get(name, 0.0):>+14.1f}")
+    lines += ["", f"📈 Mayor crecimiento desde el inicio (top {top}):"]
+    for item in last["top_growth_since_start"][:top]:
+        lines.append(f"  {item['size_diff_kb']:>+10.1f} KB  {item['count_diff']:>+7}  "
+                     f"[{item['subsystem']}] {item['location']}")
+    return "\n".join(lines)
+
+
+def get_memory_profiler(widget=None) -> MemoryProfiler:
+    """
+    Obtiene el perfilador de memoria compartido.
+
+    La primera llamada lo crea según DIAGNOSTICS_CONFIG (o la variable de
+    entorno ALPHA_MEMORY_PROFILE=1) y, si está activo, lo arranca y registra
+    el guardado del informe al salir. Las siguientes lo reprograman si la
+    ventana tiene un planificador nuevo.
+
+    Args:
+        widget: Ventana Tk o widget contenido en ella (programa las instantáneas)
+
+    Returns:
+        MemoryProfiler compartido
+    """
+    root_getter = getattr(widget, "_root", None)
+    root = root_getter() if callable(root_getter) else widget
+    profiler = getattr(root, "_memory_profiler", None) if root is not None else None
+    if profiler is None:
+        enabled = bool(DIAGNOSTICS_CONFIG.get("memory_profiling")) or os.environ.get(MEMORY_ENV_VAR) == "1"
+        profiler = MemoryProfiler(enabled=enabled,
+                                  interval_s=DIAGNOSTICS_CONFIG.get("memory_snapshot_interval_s", 60),
+                                  top_n=DIAGNOSTICS_CONFIG.get("memory_top_n", 15),
+                                  report_file=DIAGNOSTICS_CONFIG.get("memory_report_file"))
+        if root is not None:
+            root._memory_profiler = profiler
+        if enabled:
+            profiler.start(root)
+            atexit.register(profiler.stop)
+    elif root is not None:
+        profiler.attach(root)
+    return profiler
+
+
+if __name__ == "__main__":
+    report_path = sys.argv[1] if len(sys.argv) > 1 else DIAGNOSTICS_CONFIG.get("memory_report_file")
+    print(format_report(load_json(report_path)))
@@ -0,0 +1,371 @@
+"""
+Metrics Exporter Module - Proyecto Alpha v4.0
+Contadores e histogramas exportados en formato de texto OpenMetrics (Prometheus).
+"""
+
+import bisect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from config import METRICS_CONFIG
+
+# Variable de entorno que activa la exportación sin tocar config.py
+METRICS_ENV_VAR = "ALPHA_METRICS"
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Límites de los histogramas (segundos)
+ANSWER_TIME_BUCKETS = (1, 2, 5, 10, 20, 30, 60, 120, 300)
+IO_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+UI_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.016, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+
+# Categorías fijas de alpha_errors (la etiqueta nunca toma texto libre).
+# Se busca la primera palabra clave presente en la parte del mensaje
+# anterior a los dos puntos; lo que no encaja cuenta como "other".
+ERROR_KINDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("persistence", ("guardar", "cargar progreso", "exportar")),
+    ("profiles", ("usuario",)),
+    ("session", ("inicializ", "iniciar sesión", "reiniciar", "cerrar")),
+    ("gameplay", ("misión", "mission", "puzzle", "respuesta", "pista", "reintentar", "evaluación")),
+    ("ui", ("mostrar", "actualizar", "alternar", "contraste", "temporizador", "reporte", "modo")),
+)
+OTHER_ERROR_KIND = "other"
+
+logger = logging.getLogger("MetricsExporter")
+
+
+def _escape(value: str) -> str:
+    """Escapa el valor de una etiqueta según el formato de texto."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class CounterMetric:
+    """
+    Contador monótono con etiquetas opcionales.
+
+    Sólo el hilo de la UI escribe; el exportador lee copias de los valores,
+    así que las actualizaciones no necesitan bloqueo (una suma a un entero
+    bajo el GIL).
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, *labels: str) -> None:
+        """Incrementa el contador para la combinación de etiquetas dada."""
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def get(self, *labels: str) -> float:
+        """Valor actual del contador."""
+        return self.values.get(labels, 0)
+
+    def samples(self) -> List[str]:
+        return [f"{self.name}_total{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                for labels, value in sorted(list(self.values.items()))]
+
+
+class _HistogramSeries:
+    """Cubetas (no acumuladas), suma y conteo de una combinación de etiquetas."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.total = 0.0
+        self.count = 0
+
+
+class HistogramMetric:
+    """Histograma de cubetas fijas con etiquetas opcionales."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float],
+                 labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.bounds = tuple(sorted(buckets))
+        self.labelnames = tuple(labelnames)
+        self.series: Dict[Tuple[str, ...], _HistogramSeries] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Añade una observación (en segundos)."""
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = _HistogramSeries(len(self.bounds) + 1)
+        series.counts[bisect.bisect_left(self.bounds, value)] += 1
+        series.total += value
+        series.count += 1
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """Observa la duración de un bloque."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def samples(self) -> List[str]:
+        lines = []
+        for labels, series in sorted(list(self.series.items())):
+            counts = list(series.counts)
+            cumulative = 0
+            for bound, count in zip(self.bounds + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="' + _format_value(float(bound)) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(series.total)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Conjunto de métricas que se exportan juntas."""
+
+    def __init__(self):
+        self.metrics: Dict[str, Any] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> CounterMetric:
+        """Registra (o devuelve) un contador."""
+        return self.metrics.setdefault(name, CounterMetric(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, buckets: Sequence[float],
+                  labelnames: Sequence[str] = ()) -> HistogramMetric:
+        """Registra (o devuelve) un histograma."""
+        return self.metrics.setdefault(name, HistogramMetric(name, documentation, buckets, labelnames))
+
+    def render(self) -> str:
+        """
+        Genera la exposición en formato de texto OpenMetrics.
+
+        Returns:
+            Texto terminado en "# EOF"
+        """
+        lines = []
+        for name, metric in sorted(self.metrics.items()):
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.extend(metric.samples())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def error_kind(message: str) -> str:
+    """
+    Categoría de un mensaje de log_error.
+
+    Args:
+        message: Mensaje del error ("Error al guardar progreso: ...")
+
+    Returns:
+        Una de las categorías de ERROR_KINDS u OTHER_ERROR_KIND
+    """
+    prefix = str(message).split(":", 1)[0].lower()
+    for kind, keywords in ERROR_KINDS:
+        if any(keyword in prefix for keyword in keywords):
+            return kind
+    return OTHER_ERROR_KIND
+
+
+class AppMetrics:
+    """Métricas de la aplicación, con ayudantes para los puntos de instrumentación."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+        self.answers = r.counter("alpha_answers", "Respuestas registradas", ("result",))
+        self.answer_time = r.histogram("alpha_answer_time_seconds",
+                                       "Tiempo empleado en responder", ANSWER_TIME_BUCKETS)
+        self.save_duration = r.histogram("alpha_save_duration_seconds",
+                                         "Duración del guardado de progreso", IO_BUCKETS)
+        self.load_duration = r.histogram("alpha_load_duration_seconds",
+                                         "Duración de la carga de progreso", IO_BUCKETS)
+        self.ui_callback = r.histogram("alpha_ui_callback_seconds",
+                                       "Duración de callbacks de la UI", UI_BUCKETS, ("callback",))
+        self.loop_drift = r.histogram("alpha_event_loop_drift_seconds",
+                                      "Retraso del bucle de eventos de Tk", UI_BUCKETS)
+        self.achievements = r.counter("alpha_achievements_unlocked", "Logros desbloqueados", ("rarity",))
+        self.errors = r.counter("alpha_errors", "Errores registrados con log_error", ("kind",))
+
+    def record_answer(self, correct: bool, time_taken: float) -> None:
+        """Cuenta una respuesta y su tiempo."""
+        self.answers.inc(1, "correct" if correct else "incorrect")
+        self.answer_time.observe(time_taken)
+
+    def record_achievements(self, achievements: List[Dict[str, Any]]) -> None:
+        """Cuenta los logros recién desbloqueados."""
+        for achievement in achievements or ():
+            self.achievements.inc(1, achievement.get("rarity", "common"))
+
+    def record_error(self, message: str) -> None:
+        """Cuenta un error en su categoría fija (ver error_kind)."""
+        self.errors.inc(1, error_kind(message))
+
+    def record_latency(self, name: str, value_ms: float) -> None:
+        """Receptor para LatencyMonitor: reparte deriva del bucle y callbacks."""
+        if name == "loop_drift":
+            self.loop_drift.observe(value_ms / 1000.0)
+        else:
+            self.ui_callback.observe(value_ms / 1000.0, name)
+
+    def render(self) -> str:
+        """Exposición de todas las métricas."""
+        return self.registry.render()
+
+
+def write_textfile(path: str, content: str) -> None:
+    """Reescribe el archivo de forma atómica (el recolector nunca ve uno a medias)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+class MetricsExporter:
+    """
+    Publica las métricas por HTTP local o en un archivo de texto.
+
+    Ambos modos trabajan en un hilo demonio: el hilo de la UI nunca espera
+    a la red ni al disco.
+    """
+
+    def __init__(self, metrics: AppMetrics, mode: str = "http", host: str = "127.0.0.1",
+                 port: int = 9464, textfile: str = "alpha_metrics.prom", interval_s: float = 15.0):
+        if mode not in ("http", "textfile"):
+            raise ValueError(f"Modo de exportación no válido: {mode}")
+        self.metrics = metrics
+        self.mode = mode
+        self.host = host
+        self.port = port
+        self.textfile = textfile
+        self.interval_s = interval_s
+        self.server = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Arranca el servidor o el volcado periódico."""
+        if self._thread is not None:
+            return
+        if self.mode == "http":
+            self.server = self._build_server()
+            self.port = self.server.server_address[1]
+            target = self.server.serve_forever
+        else:
+            target = self._textfile_loop
+        self._thread = threading.Thread(target=target, name="metrics-exporter", daemon=True)
+        self._thread.start()
+        logger.info(f"Exportador de métricas activo ({self.mode})")
+
+    def stop(self) -> None:
+        """Detiene el exportador; en modo archivo escribe un último volcado."""
+        self._stop.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self.mode == "textfile":
+            self.write_textfile()
+
+    def write_textfile(self) -> None:
+        """Vuelca la exposición al archivo configurado."""
+        try:
+            write_textfile(self.textfile, self.metrics.render())
+        except OSError as e:
+            logger.warning(f"No se pudo escribir {self.textfile}: {e}")
+
+    def _textfile_loop(self) -> None:
+        while not self._stop.is_set():
+            self.write_textfile()
+            self._stop.wait(self.interval_s)
+
+    def _build_server(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self.metrics
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Sin ruido en consola por cada recolección
+
+        server = ThreadingHTTPServer((self.host, self.port), MetricsHandler)
+        server.daemon_threads = True
+        return server
+
+
+_metrics: Optional[AppMetrics] = None
+_exporter: Optional[MetricsExporter] = None
+
+
+def get_metrics() -> AppMetrics:
+    """Obtiene las métricas compartidas del proceso (siempre se recogen, son baratas)."""
+    global _metrics
+    if _metrics is None:
+        _metrics = AppMetrics()
+    return _metrics
+
+
+def metrics_enabled() -> bool:
+    """Indica si la exportación está activada por configuración o entorno."""
+    return bool(METRICS_CONFIG.get("enabled")) or os.environ.get(METRICS_ENV_VAR) == "1"
+
+
+def start_exporter() -> Optional[MetricsExporter]:
+    """
+    Arranca el exportador compartido si la configuración lo pide.
+
+    Returns:
+        MetricsExporter activo o None si la exportación está desactivada
+    """
+    global _exporter
+    if _exporter is None and metrics_enabled():
+        exporter = MetricsExporter(get_metrics(),
+                                   mode=METRICS_CONFIG.get("mode", "http"),
+                                   host=METRICS_CONFIG.get("host", "127.0.0.1"),
+                                   port=METRICS_CONFIG.get("port", 9464),
+                                   textfile=METRICS_CONFIG.get("textfile", "alpha_metrics.prom"),
+                                   interval_s=METRICS_CONFIG.get("interval_s", 15))
+        try:
+            exporter.start()
+        except OSError as e:
+            logger.warning(f"No se pudo iniciar el exportador de métricas: {e}")
+            return None
+        _exporter = exporter
+    return _exporter
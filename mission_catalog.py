@@ -0,0 +1,283 @@
+"""
+Mission Catalog Module - Proyecto Alpha v4.0
+Catálogo inmutable de misiones con índices precalculados y validación cacheada.
+"""
+
+import hashlib
+import logging
+import os
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+from config import MISSION_CACHE_FILE
+from storage import save_json, load_json
+
+# Versión del formato del artefacto en disco; cambiarla invalida las cachés
+CATALOG_FORMAT = 1
+
+REQUIRED_FIELDS = ("title", "story", "concept_name", "options", "answer", "decisions")
+
+logger = logging.getLogger("MissionCatalog")
+
+
+class MissionRecord(NamedTuple):
+    """Misión inmutable (tupla con nombre: sin __dict__ y de solo lectura)."""
+
+    mission_id: int
+    title: str
+    story: str
+    concept_name: str
+    options: Mapping[str, str]
+    answer: str
+    decisions: int
+    difficulty: Optional[str]
+    category: Optional[str]
+    learning_objectives: Tuple[str, ...]
+    hints: Tuple[str, ...]
+    explanation: str
+
+    @property
+    def option_keys(self) -> Tuple[str, ...]:
+        """Claves de las opciones en orden de presentación."""
+        return tuple(self.options)
+
+
+def freeze_mission(mission_id: int, mission: Dict[str, Any]) -> MissionRecord:
+    """
+    Convierte una misión en diccionario a un registro inmutable.
+
+    Args:
+        mission_id: Identificador de la misión
+        mission: Diccionario con los datos de la misión
+
+    Returns:
+        MissionRecord equivalente
+    """
+    return MissionRecord(
+        mission_id=mission_id,
+        title=mission["title"],
+        story=mission["story"],
+        concept_name=mission["concept_name"],
+        options=MappingProxyType(dict(mission["options"])),
+        answer=mission["answer"],
+        decisions=mission["decisions"],
+        difficulty=mission.get("difficulty"),
+        category=mission.get("category"),
+        learning_objectives=tuple(mission.get("learning_objectives", ())),
+        hints=tuple(mission.get("hints", ())),
+        explanation=mission.get("explanation", ""),
+    )
+
+
+def validate_mission_data(missions: Dict[int, Dict[str, Any]]) -> List[str]:
+    """
+    Valida la estructura de las misiones.
+
+    Args:
+        missions: Diccionario id -> misión
+
+    Returns:
+        Lista de errores (vacía si todo es válido)
+    """
+    errors = []
+    for mission_id, mission in missions.items():
+        missing = [field for field in REQUIRED_FIELDS if field not in mission]
+        for field in missing:
+            errors.append(f"Misión {mission_id} falta campo requerido: {field}")
+        if missing:
+            continue
+
+        # Validar que la respuesta esté en las opciones
+        if mission["answer"] not in mission["options"]:
+            errors.append(f"Misión {mission_id}: respuesta '{mission['answer']}' no está en opciones")
+    return errors
+
+
+def build_indexes(missions: Dict[int, Dict[str, Any]]) -> Dict[str, Dict[str, List[int]]]:
+    """
+    Construye los índices por categoría, dificultad y concepto.
+
+    Args:
+        missions: Diccionario id -> misión
+
+    Returns:
+        Diccionario tipo de índice -> valor -> lista ordenada de IDs
+    """
+    indexes: Dict[str, Dict[str, List[int]]] = {"category": {}, "difficulty": {}, "concept": {}}
+    for mission_id in sorted(missions):
+        mission = missions[mission_id]
+        for index_name, field in (("category", "category"), ("difficulty", "difficulty"),
+                                  ("concept", "concept_name")):
+            value = mission.get(field)
+            if value is not None:
+                indexes[index_name].setdefault(value, []).append(mission_id)
+    return indexes
+
+
+def source_fingerprint(path: str) -> Optional[str]:
+    """
+    Huella del archivo fuente de las misiones.
+
+    Args:
+        path: Ruta del módulo de misiones
+
+    Returns:
+        Hash SHA-256 abreviado o None si el archivo no se puede leer
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()[:32]
+    except OSError:
+        return None
+
+
+def _freeze_index(index: Dict[str, List[int]]) -> Mapping[str, Tuple[int, ...]]:
+    """Convierte un índice a un mapeo de solo lectura con tuplas."""
+    return MappingProxyType({key: tuple(ids) for key, ids in index.items()})
+
+
+class MissionCatalog:
+    """
+    Catálogo de misiones con índices inmutables.
+
+    Los índices y el resultado de la validación se guardan en un artefacto
+    en disco asociado a la huella del código fuente de las misiones; si la
+    huella no cambia, el siguiente arranque los reutiliza sin revalidar.
+    """
+
+    __slots__ = ("_records", "by_category", "by_difficulty", "by_concept",
+                 "validation_errors", "source_hash", "from_cache")
+
+    def __init__(self, missions: Dict[int, Dict[str, Any]], source_hash: Optional[str] = None,
+                 cache_path: Optional[str] = None):
+        """
+        Construye el catálogo.
+
+        Args:
+            missions: Diccionario id -> misión
+            source_hash: Huella del origen de los datos (None desactiva la caché)
+            cache_path: Ruta del artefacto de caché
+        """
+        self.source_hash = source_hash
+        self.from_cache = False
+
+        artifact = self._load_artifact(cache_path, source_hash)
+        if artifact is not None:
+            errors = artifact["errors"]
+            indexes = artifact["indexes"]
+            self.from_cache = True
+        else:
+            errors = validate_mission_data(missions)
+            indexes = build_indexes(missions)
+            self._save_artifact(cache_path, source_hash, errors, indexes)
+
+        self.validation_errors: Tuple[str, ...] = tuple(errors)
+        # Sólo se congelan las misiones completas; las inválidas quedan en los errores
+        self._records: Mapping[int, MissionRecord] = MappingProxyType({
+            mission_id: freeze_mission(mission_id, missions[mission_id])
+            for mission_id in sorted(missions)
+            if all(field in missions[mission_id] for field in REQUIRED_FIELDS)
+        })
+        self.by_category = _freeze_index(indexes["category"])
+        self.by_difficulty = _freeze_index(indexes["difficulty"])
+        self.by_concept = _freeze_index(indexes["concept"])
+
+    # ------------------------------------------------------------------
+    # Artefacto en disco
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _load_artifact(cache_path: Optional[str], source_hash: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Carga el artefacto si corresponde a la misma versión del origen."""
+        if not cache_path or not source_hash or not os.path.exists(cache_path):
+            return None
+        try:
+            artifact = load_json(cache_path)
+        except Exception as e:
+            logger.warning(f"Caché de misiones ilegible, se reconstruye: {e}")
+            return None
+        if artifact.get("format") != CATALOG_FORMAT or artifact.get("source_hash") != source_hash:
+            return None
+        return artifact
+
+    @staticmethod
+    def _save_artifact(cache_path: Optional[str], source_hash: Optional[str],
+                       errors: List[str], indexes: Dict[str, Dict[str, List[int]]]) -> None:
+        """Guarda el artefacto validado (sin interrumpir si el disco falla)."""
+        if not cache_path or not source_hash:
+            return
+        try:
+            save_json(cache_path, {
+                "format": CATALOG_FORMAT,
+                "source_hash": source_hash,
+                "errors": errors,
+                "indexes": indexes,
+            }, compact=True)
+        except Exception as e:
+            logger.warning(f"No se pudo guardar la caché de misiones: {e}")
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    @property
+    def valid(self) -> bool:
+        """Indica si todas las misiones superaron la validación."""
+        return not self.validation_errors
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[MissionRecord]:
+        return iter(self._records.values())
+
+    def __contains__(self, mission_id: int) -> bool:
+        return mission_id in self._records
+
+    def get(self, mission_id: int) -> Optional[MissionRecord]:
+        """Obtiene una misión por ID (None si no existe)."""
+        return self._records.get(mission_id)
+
+    def ids(self) -> Tuple[int, ...]:
+        """IDs de todas las misiones en orden."""
+        return tuple(self._records)
+
+    def ids_by_category(self, category: str) -> Tuple[int, ...]:
+        """IDs de las misiones de una categoría."""
+        return self.by_category.get(category, ())
+
+    def ids_by_difficulty(self, difficulty: str) -> Tuple[int, ...]:
+        """IDs de las misiones de un nivel de dificultad."""
+        return self.by_difficulty.get(difficulty, ())
+
+    def by_category_records(self, category: str) -> Tuple[MissionRecord, ...]:
+        """Misiones inmutables de una categoría."""
+        return tuple(self._records[i] for i in self.ids_by_category(category) if i in self._records)
+
+    def by_difficulty_records(self, difficulty: str) -> Tuple[MissionRecord, ...]:
+        """Misiones inmutables de un nivel de dificultad."""
+        return tuple(self._records[i] for i in self.ids_by_difficulty(difficulty) if i in self._records)
+
+    def for_concept(self, concept_name: str) -> Tuple[MissionRecord, ...]:
+        """Misiones que trabajan un concepto."""
+        return tuple(self._records[i] for i in self.by_concept.get(concept_name, ()) if i in self._records)
+
+
+_catalog: Optional[MissionCatalog] = None
+
+
+def get_catalog() -> MissionCatalog:
+    """
+    Obtiene el catálogo compartido, construyéndolo la primera vez.
+
+    Returns:
+        MissionCatalog de MISSIONS
+    """
+    global _catalog
+    if _catalog is None:
+        import missions
+
+        _catalog = MissionCatalog(missions.MISSIONS,
+                                  source_hash=source_fingerprint(missions.__file__),
+                                  cache_path=MISSION_CACHE_FILE)
+    return _catalog
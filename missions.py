@@ -392,7 +392,8 @@ def get_missions_by_category(category: str) -> List[Dict[str, Any]]:
     Returns:
         Lista de misiones de la categoría especificada
     """
-    return [mission for mission in MISSIONS.values() if mission.get("category") == category]
+    from mission_catalog import get_catalog
+    return [MISSIONS[mission_id] for mission_id in get_catalog().ids_by_category(category)]
 
 def get_missions_by_difficulty(difficulty: str) -> List[Dict[str, Any]]:
     """
@@ -404,7 +405,8 @@ def get_missions_by_difficulty(difficulty: str) -> List[Dict[str, Any]]:
     Returns:
         Lista de misiones del nivel especificado
     """
-    return [mission for mission in MISSIONS.values() if mission.get("difficulty") == difficulty]
+    from mission_catalog import get_catalog
+    return [MISSIONS[mission_id] for mission_id in get_catalog().ids_by_difficulty(difficulty)]
 
 def get_total_missions() -> int:
     """
@@ -428,20 +430,15 @@ def validate_missions() -> bool:
     """
     Valida que todas las misiones tengan la estructura correcta.
 
+    El resultado se cachea junto al catálogo y sólo se recalcula cuando
+    cambia este archivo.
+
     Returns:
         True si todas las misiones son válidas
     """
-    required_fields = ["title", "story", "concept_name", "options", "answer", "decisions"]
-
-    for mission_id, mission in MISSIONS.items():
-        for field in required_fields:
-            if field not in mission:
-                print(f"Misión {mission_id} falta campo requerido: {field}")
-                return False
-
-        # Validar que la respuesta esté en las opciones
-        if mission["answer"] not in mission["options"]:
-            print(f"Misión {mission_id}: respuesta '{mission['answer']}' no está en opciones")
-            return False
-
-    return True
\ No newline at end of file
+    from mission_catalog import get_catalog
+    catalog = get_catalog()
+    if catalog.validation_errors:
+        print(catalog.validation_errors[0])
+        return False
+    return True
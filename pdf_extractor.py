@@ -1,23 +1,18 @@
 import fitz  # PyMuPDF library (install with: pip install PyMuPDF)
 import os
-import json
 import logging
 from datetime import datetime
 
+from storage import save_json
+from logging_setup import configure_logging
+
 # --- CONFIGURATION ---
 NOMBRE_ARCHIVO_PDF = "Clase - Repaso de conceptos.pptx - Presentaciones de Google.pdf"
 NOMBRE_ARCHIVO_SALIDA = "texto_repaso_completo.txt"
 QUESTIONS_OUTPUT = "extracted_questions.json"
 
 # Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('pdf_extractor.log'),
-        logging.StreamHandler()
-    ]
-)
+configure_logging('pdf_extractor.log', fmt='%(asctime)s - %(levelname)s - %(message)s')
 
 class PDFExtractor:
     """Enhanced PDF text extractor with question generation capabilities"""
@@ -104,8 +99,7 @@ class PDFExtractor:
     def save_questions_template(self, questions, output_path):
         """Save question templates to JSON file"""
         try:
-            with open(output_path, "w", encoding="utf-8") as file:
-                json.dump(questions, file, ensure_ascii=False, indent=2)
+            save_json(output_path, questions)
             
             logging.info(f"Question templates saved to: '{output_path}'")
             return True
@@ -0,0 +1,136 @@
+"""
+Prefetch Module - Proyecto Alpha v4.0
+Preparación en tiempo de inactividad de la siguiente misión o puzzle.
+"""
+
+import logging
+import random
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class PreparedContent(NamedTuple):
+    """Contenido listo para mostrar una misión o puzzle."""
+
+    mission_num: int
+    title: str
+    story: str
+    options: Dict[str, str]      # En el orden de presentación ya barajado
+    answer: str
+    intro_feedback: str
+    source: Any                  # SimplePuzzle o diccionario de misión original
+
+
+def shuffled_layout(options: Dict[str, str], seed: str) -> Dict[str, str]:
+    """
+    Baraja el orden de presentación de las opciones de forma determinista.
+
+    Args:
+        options: Opción -> descripción
+        seed: Semilla (la misma misión siempre se presenta igual)
+
+    Returns:
+        Nuevo diccionario con las mismas opciones en otro orden
+    """
+    items: List[Tuple[str, str]] = list(options.items())
+    random.Random(seed).shuffle(items)
+    return dict(items)
+
+
+class MissionPrefetcher:
+    """
+    Prepara la siguiente misión mientras el alumno lee el feedback.
+
+    `schedule(n)` encola la preparación con `after_idle`, de modo que se
+    ejecuta después del repintado del feedback actual; `take(n)` devuelve
+    el contenido ya preparado o lo construye en el momento si la tarea
+    ociosa no llegó a ejecutarse. La preparación es pura (no toca widgets),
+    así que el resultado es idéntico en ambos caminos.
+    """
+
+    def __init__(self, root, prepare: Callable[[int], PreparedContent],
+                 warm_ui: Optional[Callable[[PreparedContent], None]] = None, max_entries: int = 4):
+        """
+        Inicializa el prefetcher.
+
+        Args:
+            root: Ventana Tk (para after_idle)
+            prepare: Construye el contenido de un número de misión
+            warm_ui: Preparación opcional de widgets en el hilo de Tk
+            max_entries: Contenidos preparados que se conservan
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.root = root
+        self.prepare = prepare
+        self.warm_ui = warm_ui
+        self.max_entries = max_entries
+        self._ready: Dict[int, PreparedContent] = {}
+        self._scheduled: Dict[int, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def schedule(self, mission_num: int) -> None:
+        """
+        Encola la preparación de una misión para el próximo momento ocioso.
+
+        Args:
+            mission_num: Número de misión a preparar
+        """
+        if mission_num in self._ready or mission_num in self._scheduled:
+            return
+        try:
+            self._scheduled[mission_num] = self.root.after_idle(lambda: self._run(mission_num))
+        except Exception as e:
+            self.logger.debug(f"No se pudo programar la precarga de {mission_num}: {e}")
+
+    def _run(self, mission_num: int) -> None:
+        if self._scheduled.pop(mission_num, None) is None or mission_num in self._ready:
+            return
+        try:
+            content = self.prepare(mission_num)
+        except Exception as e:
+            # take() volverá a intentarlo y mostrará el error en su contexto
+            self.logger.warning(f"Precarga fallida para misión {mission_num}: {e}")
+            return
+        self._store(content)
+        if self.warm_ui is not None:
+            try:
+                self.warm_ui(content)
+            except Exception as e:
+                self.logger.debug(f"No se pudo preparar la interfaz: {e}")
+
+    def _store(self, content: PreparedContent) -> None:
+        self._ready[content.mission_num] = content
+        while len(self._ready) > self.max_entries:
+            self._ready.pop(min(self._ready))
+
+    def take(self, mission_num: int) -> PreparedContent:
+        """
+        Obtiene el contenido de una misión, preparado o construido al momento.
+
+        Args:
+            mission_num: Número de misión
+
+        Returns:
+            PreparedContent listo para mostrar
+        """
+        content = self._ready.pop(mission_num, None)
+        if content is not None:
+            self.hits += 1
+            return content
+        self.misses += 1
+        self._cancel(mission_num)
+        return self.prepare(mission_num)
+
+    def _cancel(self, mission_num: int) -> None:
+        after_id = self._scheduled.pop(mission_num, None)
+        if after_id is not None:
+            try:
+                self.root.after_cancel(after_id)
+            except Exception:
+                pass
+
+    def clear(self) -> None:
+        """Descarta lo preparado y lo pendiente (nueva sesión, cambio de modo)."""
+        for mission_num in list(self._scheduled):
+            self._cancel(mission_num)
+        self._ready.clear()
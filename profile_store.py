@@ -0,0 +1,292 @@
+"""
+Profile Store Module - Proyecto Alpha v4.0
+Perfiles de varios alumnos por equipo: índice, carga perezosa y caché LRU.
+"""
+
+import hashlib
+import logging
+import os
+import re
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from academic_metrics import AcademicMetrics
+from achievement_system import AchievementSystem
+from config import PROFILES_CONFIG, SAVE_FILE
+from storage import save_json, load_json
+
+INDEX_FORMAT = 1
+
+# Campos de game_state que no se guardan (objetos en memoria)
+TRANSIENT_STATE_KEYS = ("current_puzzle",)
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+def profile_filename(user_id: str) -> str:
+    """
+    Nombre de archivo estable para un usuario.
+
+    El texto legible se limpia y se añade un hash corto, de modo que dos
+    identificadores que se limpian igual ("ana.g" y "ana g") no colisionan.
+    """
+    slug = _UNSAFE_CHARS.sub("_", user_id).strip("_")[:32] or "usuario"
+    digest = hashlib.sha1(user_id.encode("utf-8")).hexdigest()[:8]
+    return f"{slug}-{digest}.json"
+
+
+class Profile:
+    """
+    Estado completo de un alumno.
+
+    GameController trabaja directamente sobre estos objetos: cambiar de
+    usuario es cambiar tres referencias, sin copiar nada.
+    """
+
+    def __init__(self, user_id: str, game_state: Dict[str, Any],
+                 academic_metrics: Optional[AcademicMetrics] = None,
+                 achievement_system: Optional[AchievementSystem] = None):
+        self.user_id = user_id
+        self.game_state = game_state
+        self.academic_metrics = academic_metrics or AcademicMetrics()
+        self.achievement_system = achievement_system or AchievementSystem()
+        self.game_state["user_id"] = user_id
+        self.dirty = False
+
+    def apply(self, save_data: Dict[str, Any]) -> None:
+        """
+        Restaura un guardado (mismo formato que GameController.save_progress).
+
+        Args:
+            save_data: Diccionario con game_state, academic_metrics y achievements
+        """
+        if "game_state" in save_data:
+            self.game_state.update(save_data["game_state"])
+            self.game_state["user_id"] = self.user_id
+        if "academic_metrics" in save_data:
+            self.academic_metrics.metrics.update(save_data["academic_metrics"])
+        if "question_history" in save_data:
+            self.academic_metrics.question_history = list(save_data["question_history"])
+        if "achievements" in save_data:
+            # Los guardados antiguos contienen nombres en lugar de identificadores
+            definitions = self.achievement_system.achievement_definitions
+            by_name = {definition["name"]: achievement_id for achievement_id, definition in definitions.items()}
+            self.achievement_system.unlocked_achievements = {
+                by_name.get(achievement, achievement) for achievement in save_data["achievements"]
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Datos a guardar en el archivo del perfil."""
+        return {
+            "user_id": self.user_id,
+            "game_state": {key: value for key, value in self.game_state.items()
+                           if key not in TRANSIENT_STATE_KEYS},
+            "academic_metrics": self.academic_metrics.metrics,
+            "question_history": self.academic_metrics.question_history,
+            "achievements": sorted(self.achievement_system.unlocked_achievements),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Entrada del índice (lo necesario para listar usuarios sin cargarlos)."""
+        return {
+            "score": self.game_state.get("score", 0),
+            "best_streak": self.game_state.get("best_streak", 0),
+            "total_questions": self.academic_metrics.metrics.get("total_questions", 0),
+            "achievements": len(self.achievement_system.unlocked_achievements),
+        }
+
+
+class ProfileStore:
+    """
+    Almacén de perfiles indexado por identificador de usuario.
+
+    El índice (un único JSON pequeño) lista los usuarios y su archivo; cada
+    perfil se lee del disco sólo la primera vez que se activa y queda en
+    una caché LRU. Los perfiles modificados se escriben al salir de la
+    caché o con `flush()`. Con `directory=None` todo vive en memoria.
+    """
+
+    def __init__(self, directory: Optional[str] = None, capacity: int = 8,
+                 state_factory: Optional[Callable[[], Dict[str, Any]]] = None,
+                 legacy_file: Optional[str] = None):
+        """
+        Inicializa el almacén.
+
+        Args:
+            directory: Carpeta de perfiles (None = sólo memoria)
+            capacity: Perfiles que se mantienen cargados
+            state_factory: Crea el game_state inicial de un usuario nuevo
+            legacy_file: Guardado de un solo usuario que se importa al crear el usuario por defecto
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.directory = directory
+        self.capacity = max(1, capacity)
+        self.state_factory = state_factory or dict
+        self.legacy_file = legacy_file
+        self.index: Dict[str, Dict[str, Any]] = {}
+        self._cache: "OrderedDict[str, Profile]" = OrderedDict()
+        self.loads = 0
+        self.hits = 0
+        if directory:
+            self._load_index()
+
+    @property
+    def index_path(self) -> Optional[str]:
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, PROFILES_CONFIG.get("index_file", "index.json"))
+
+    def _load_index(self) -> None:
+        try:
+            if os.path.exists(self.index_path):
+                data = load_json(self.index_path)
+                self.index = dict(data.get("users", {}))
+        except Exception as e:
+            self.logger.error(f"Índice de perfiles ilegible, se reconstruye al guardar: {e}")
+            self.index = {}
+
+    def _save_index(self) -> None:
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        save_json(self.index_path, {"format": INDEX_FORMAT, "users": self.index}, compact=True)
+
+    def users(self) -> List[str]:
+        """Usuarios conocidos (índice más los que sólo están en memoria), ordenados."""
+        return sorted(set(self.index) | set(self._cache))
+
+    def get(self, user_id: str) -> Profile:
+        """
+        Obtiene un perfil, cargándolo o creándolo si no está en la caché.
+
+        Args:
+            user_id: Identificador del usuario
+
+        Returns:
+            Profile activo (pasa a ser el más reciente de la caché)
+        """
+        profile = self._cache.get(user_id)
+        if profile is not None:
+            self.hits += 1
+            self._cache.move_to_end(user_id)
+            return profile
+        profile = self._load(user_id)
+        self._cache[user_id] = profile
+        self._evict()
+        return profile
+
+    def reload(self, user_id: str) -> Profile:
+        """
+        Descarta la copia en caché (sin guardarla) y vuelve a leer el perfil.
+
+        Si el usuario aún no tiene nada guardado se conserva la copia en
+        caché: recargar no debe dejar en blanco una sesión sin guardar.
+        """
+        if user_id in self._cache and self._saved_source(user_id) is None:
+            return self.get(user_id)
+        self._cache.pop(user_id, None)
+        return self.get(user_id)
+
+    def adopt(self, profile: Profile) -> Profile:
+        """Incorpora a la caché un perfil creado fuera del almacén (p. ej. sin pantalla)."""
+        self._cache[profile.user_id] = profile
+        self._cache.move_to_end(profile.user_id)
+        self._evict()
+        return profile
+
+    def _saved_source(self, user_id: str) -> Optional[str]:
+        """Archivo del que se leería el perfil (None si no hay nada guardado)."""
+        path = self._path_for(user_id)
+        if path is None:
+            return None
+        if os.path.exists(path):
+            return path
+        if user_id == PROFILES_CONFIG.get("default_user") and \
+                self.legacy_file and os.path.exists(self.legacy_file):
+            return self.legacy_file
+        return None
+
+    def _load(self, user_id: str) -> Profile:
+        profile = Profile(user_id, self.state_factory())
+        source = self._saved_source(user_id)
+        if source is not None:
+            try:
+                profile.apply(load_json(source))
+                self.loads += 1
+            except Exception as e:
+                self.logger.error(f"No se pudo cargar el perfil de {user_id}: {e}")
+            if source == self.legacy_file:
+                profile.dirty = True
+        return profile
+
+    def _path_for(self, user_id: str) -> Optional[str]:
+        if not self.directory:
+            return None
+        entry = self.index.get(user_id)
+        filename = entry["file"] if entry else profile_filename(user_id)
+        return os.path.join(self.directory, filename)
+
+    def _evict(self) -> None:
+        while len(self._cache) > self.capacity:
+            user_id, profile = self._cache.popitem(last=False)
+            if profile.dirty:
+                self.save(profile)
+
+    def mark_dirty(self, user_id: str) -> None:
+        """Marca un perfil en caché como pendiente de guardar."""
+        profile = self._cache.get(user_id)
+        if profile is not None:
+            profile.dirty = True
+
+    def save(self, profile: Profile) -> Optional[str]:
+        """
+        Escribe un perfil y actualiza su entrada del índice.
+
+        Args:
+            profile: Perfil a guardar
+
+        Returns:
+            Ruta escrita (None en modo memoria)
+        """
+        entry = dict(self.index.get(profile.user_id, {"file": profile_filename(profile.user_id)}))
+        entry.update(profile.summary(), last_active=datetime.now().isoformat(timespec="seconds"))
+        self.index[profile.user_id] = entry
+        if not self.directory:
+            profile.dirty = False
+            return None
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, entry["file"])
+        save_json(path, profile.to_dict())
+        self._save_index()
+        profile.dirty = False
+        return path
+
+    def flush(self) -> int:
+        """
+        Guarda todos los perfiles modificados que siguen en caché.
+
+        Returns:
+            Número de perfiles escritos
+        """
+        written = 0
+        for profile in list(self._cache.values()):
+            if profile.dirty:
+                self.save(profile)
+                written += 1
+        return written
+
+
+_store: Optional[ProfileStore] = None
+
+
+def get_profile_store(state_factory: Optional[Callable[[], Dict[str, Any]]] = None) -> ProfileStore:
+    """Obtiene el almacén de perfiles compartido (según PROFILES_CONFIG)."""
+    global _store
+    if _store is None:
+        _store = ProfileStore(directory=PROFILES_CONFIG.get("directory"),
+                              capacity=PROFILES_CONFIG.get("lru_size", 8),
+                              state_factory=state_factory,
+                              legacy_file=SAVE_FILE)
+    return _store
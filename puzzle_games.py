@@ -3,11 +3,18 @@ Puzzle Games Module - Juegos Mentales para Proyecto Alpha
 Diferentes tipos de desafíos cognitivos para hacer pensar al jugador.
 """
 
+import heapq
 import random
 import time
-from typing import Dict, List, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, NamedTuple, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:  # El cálculo por lotes funciona igual en Python puro
+    np = None
+
 @dataclass
 class PuzzleChallenge:
     """Estructura para un desafío de puzzle."""
@@ -20,13 +27,164 @@ class PuzzleChallenge:
     difficulty: str
     time_limit: int = 60
 
+class ScoringWeights(NamedTuple):
+    """Pesos de la puntuación de puzzles."""
+    base_score: float = 100
+    # De solo lectura: el valor por defecto lo comparten todas las instancias
+    multipliers: Mapping[str, float] = MappingProxyType({"easy": 1, "medium": 1.5, "hard": 2})
+    max_time_penalty: float = 0.5   # Máxima reducción por tiempo
+    hint_penalty: float = 0.1       # Reducción por pista usada
+    min_score: int = 10
+
+
+DEFAULT_WEIGHTS = ScoringWeights()
+
+
+class AttemptLog:
+    """
+    Historial de intentos en columnas paralelas.
+
+    Guardar cada campo en su propia lista permite puntuar todo el
+    historial de una vez (y convertirlo en arrays de NumPy sin copiar
+    objeto por objeto).
+    """
+
+    def __init__(self):
+        self.students: List[str] = []
+        self.difficulties: List[str] = []
+        self.times_taken: List[float] = []
+        self.time_limits: List[float] = []
+        self.hints_used: List[int] = []
+
+    def append(self, student: str, difficulty: str, time_taken: float,
+               time_limit: float, hints_used: int) -> int:
+        """Añade un intento y devuelve su índice."""
+        self.students.append(student)
+        self.difficulties.append(difficulty)
+        self.times_taken.append(time_taken)
+        self.time_limits.append(time_limit)
+        self.hints_used.append(hints_used)
+        return len(self.students) - 1
+
+    def __len__(self) -> int:
+        return len(self.students)
+
+
+def score_batch(difficulties: Sequence[str], times_taken: Sequence[float],
+                time_limits: Sequence[float], hints_used: Sequence[int],
+                weights: ScoringWeights = DEFAULT_WEIGHTS, use_numpy: Optional[bool] = None) -> List[int]:
+    """
+    Puntúa muchos intentos a la vez (calculate_score es el caso de uno solo).
+
+    Args:
+        difficulties: Dificultad de cada intento ("easy", "medium", "hard")
+        times_taken: Segundos empleados
+        time_limits: Tiempo límite de cada puzzle (<= 0 aplica la penalización máxima)
+        hints_used: Pistas usadas
+        weights: Pesos de puntuación
+        use_numpy: Forzar (True) o evitar (False) NumPy; None = usarlo si está instalado
+
+    Returns:
+        Lista de puntuaciones enteras
+
+    Raises:
+        KeyError: Si alguna dificultad no tiene multiplicador
+    """
+    count = len(difficulties)
+    if not (len(times_taken) == len(time_limits) == len(hints_used) == count):
+        raise ValueError("Todas las columnas deben tener la misma longitud")
+    if count == 0:
+        return []
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy and np is None:
+        raise ImportError("NumPy no está instalado")
+
+    if use_numpy:
+        levels, codes = np.unique(np.asarray(difficulties, dtype=object), return_inverse=True)
+        multipliers = np.array([weights.multipliers[level] for level in levels], dtype=float)[codes]
+        times = np.asarray(times_taken, dtype=float)
+        limits = np.asarray(time_limits, dtype=float)
+        ratio = np.divide(times, limits, out=np.full(count, np.inf), where=limits > 0)
+        time_penalty = np.minimum(weights.max_time_penalty, ratio)
+        hint_penalty = np.asarray(hints_used, dtype=float) * weights.hint_penalty
+        final = weights.base_score * multipliers * (1 - time_penalty - hint_penalty)
+        return np.maximum(weights.min_score, np.trunc(final)).astype(np.int64).tolist()
+
+    multipliers = weights.multipliers
+    max_time_penalty, per_hint = weights.max_time_penalty, weights.hint_penalty
+    base, minimum = weights.base_score, weights.min_score
+    return [
+        max(minimum, int(base * multipliers[difficulty]
+                         * (1 - (min(max_time_penalty, taken / limit) if limit > 0 else max_time_penalty)
+                            - hints * per_hint)))
+        for difficulty, taken, limit, hints in zip(difficulties, times_taken, time_limits, hints_used)
+    ]
+
+
+class Leaderboard:
+    """
+    Clasificación de los K mejores intentos.
+
+    Un montículo mínimo de tamaño K guarda los mejores: insertar cuesta
+    O(log K) y el peor de la tabla está siempre en la raíz. A igual
+    puntuación gana el intento más antiguo.
+    """
+
+    def __init__(self, capacity: int = 10):
+        self.capacity = capacity
+        self._heap: List[Tuple[int, int, str, int]] = []
+        self._sequence = 0
+
+    def add(self, score: int, student: str, attempt_id: int = -1) -> bool:
+        """
+        Propone un intento a la tabla.
+
+        Returns:
+            True si entró en el top K
+        """
+        self._sequence += 1
+        entry = (score, -self._sequence, student, attempt_id)
+        if len(self._heap) < self.capacity:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def rebuild(self, scores: Sequence[int], students: Sequence[str]) -> None:
+        """Reconstruye la tabla a partir de puntuaciones completas (p. ej. tras repuntuar)."""
+        self._sequence = len(scores)
+        entries = ((score, -index, student, index)
+                   for index, (score, student) in enumerate(zip(scores, students)))
+        self._heap = heapq.nlargest(self.capacity, entries)
+        heapq.heapify(self._heap)
+
+    def threshold(self) -> Optional[int]:
+        """Puntuación mínima para entrar (None si aún hay hueco)."""
+        return self._heap[0][0] if len(self._heap) >= self.capacity else None
+
+    def top(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Mejores intentos de mayor a menor."""
+        ranked = sorted(self._heap, reverse=True)[:n]
+        return [{"rank": position, "student": student, "score": score, "attempt_id": attempt_id}
+                for position, (score, _, student, attempt_id) in enumerate(ranked, start=1)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
 class PuzzleGameManager:
     """Gestor de juegos mentales y rompecabezas."""
     
-    def __init__(self):
+    def __init__(self, weights: ScoringWeights = DEFAULT_WEIGHTS, leaderboard_size: int = 10):
         self.current_puzzle = None
-        self.puzzle_history = []
-        self.score_multiplier = {"easy": 1, "medium": 1.5, "hard": 2}
+        self.puzzle_history = AttemptLog()
+        self.weights = weights
+        self.score_multiplier = dict(weights.multipliers)
+        self.scores: List[int] = []
+        self.leaderboard = Leaderboard(leaderboard_size)
         
     def create_logic_puzzle(self, concept: str, difficulty: str = "medium") -> PuzzleChallenge:
         """Crea un rompecabezas de lógica basado en conceptos de IA."""
@@ -257,18 +415,49 @@ class PuzzleGameManager:
             return "💡 ¡Ya has usado todas las pistas disponibles! Confía en tu conocimiento."
     
     def calculate_score(self, puzzle: PuzzleChallenge, time_taken: float, hints_used: int) -> int:
-        """Calcula la puntuación basada en dificultad, tiempo y pistas usadas."""
-        base_score = 100
-        difficulty_multiplier = self.score_multiplier[puzzle.difficulty]
-        
-        # Penalización por tiempo (máximo 50% de reducción)
-        time_penalty = min(0.5, time_taken / puzzle.time_limit)
-        
-        # Penalización por pistas (10% por pista)
-        hint_penalty = hints_used * 0.1
-        
-        final_score = base_score * difficulty_multiplier * (1 - time_penalty - hint_penalty)
-        return max(10, int(final_score))  # Mínimo 10 puntos
+        """Calcula la puntuación basada en dificultad, tiempo y pistas usadas (con los pesos actuales)."""
+        return score_batch([puzzle.difficulty], [time_taken], [puzzle.time_limit], [hints_used],
+                           self.weights, use_numpy=False)[0]
+
+    def record_attempt(self, student: str, puzzle: PuzzleChallenge, time_taken: float,
+                       hints_used: int) -> int:
+        """
+        Registra un intento, lo puntúa y lo propone a la clasificación.
+
+        Args:
+            student: Identificador del estudiante
+            puzzle: Puzzle resuelto
+            time_taken: Segundos empleados
+            hints_used: Pistas usadas
+
+        Returns:
+            Puntuación obtenida
+        """
+        attempt_id = self.puzzle_history.append(student, puzzle.difficulty, time_taken,
+                                                puzzle.time_limit, hints_used)
+        score = self.calculate_score(puzzle, time_taken, hints_used)
+        self.scores.append(score)
+        self.leaderboard.add(score, student, attempt_id)
+        return score
+
+    def rescore_history(self, weights: Optional[ScoringWeights] = None) -> List[int]:
+        """
+        Vuelve a puntuar todo el historial (p. ej. tras cambiar los pesos).
+
+        Args:
+            weights: Nuevos pesos (None mantiene los actuales)
+
+        Returns:
+            Puntuaciones recalculadas, en el orden del historial
+        """
+        if weights is not None:
+            self.weights = weights
+            self.score_multiplier = dict(weights.multipliers)
+        history = self.puzzle_history
+        self.scores = score_batch(history.difficulties, history.times_taken,
+                                  history.time_limits, history.hints_used, self.weights)
+        self.leaderboard.rebuild(self.scores, history.students)
+        return self.scores
 
 # Conceptos de IA para generar puzzles
 AI_CONCEPTS = [
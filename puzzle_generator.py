@@ -0,0 +1,467 @@
+"""
+Puzzle Generator Module - Proyecto Alpha v4.0
+Generación procedural de puzzles a partir de MISSIONS y del banco de preguntas.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from config import PUZZLE_GENERATOR_CONFIG
+from simple_puzzles import SimplePuzzle, get_random_puzzle, validate_puzzle_data
+from storage import save_json, load_json
+
+# Versión del generador; cambiarla invalida las reservas guardadas en disco
+GENERATOR_VERSION = 1
+
+# Orden de tipos al servir por número de misión (tipo = n % 4)
+GENERATED_TYPES: Tuple[str, ...] = ("memory", "pattern", "ordering", "riddle")
+
+OPTIONS_PER_PUZZLE = 4
+MEMORY_ITEMS = 4
+MAX_OPTION_CHARS = 90
+
+logger = logging.getLogger("PuzzleGenerator")
+
+
+class ConceptFact(NamedTuple):
+    """Concepto del banco: término, definición y posición en el temario."""
+
+    term: str
+    definition: str
+    category: str
+    order: int
+    hints: Tuple[str, ...]
+
+
+def _shorten(text: str, limit: int = MAX_OPTION_CHARS) -> str:
+    """Recorta un texto a un máximo de caracteres sin partir palabras."""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0].rstrip(",.;:") + "…"
+
+
+def _mask(text: str, term: str) -> str:
+    """Oculta el término (y su traducción entre paréntesis) dentro de un texto."""
+    parts = [part.strip() for part in re.split(r"[()]", term) if len(part.strip()) > 2]
+    for part in sorted(parts, key=len, reverse=True):
+        text = re.sub(re.escape(part), "____", text, flags=re.IGNORECASE)
+    return text
+
+
+def _category_label(category: str) -> str:
+    return category.replace("_", " ").upper()
+
+
+def extract_facts(missions: Dict[int, Dict[str, Any]],
+                  questions: List[Dict[str, Any]]) -> List[ConceptFact]:
+    """
+    Reúne los conceptos de las misiones y del banco de preguntas.
+
+    Args:
+        missions: Diccionario id -> misión (MISSIONS)
+        questions: Preguntas de questions_data.json
+
+    Returns:
+        Conceptos únicos por término, en orden de temario
+    """
+    facts: Dict[str, ConceptFact] = {}
+    for mission_id in sorted(missions):
+        mission = missions[mission_id]
+        answer = mission.get("answer")
+        if not answer or mission.get("category") in (None, "final") or answer not in mission.get("options", {}):
+            continue
+        definition = mission.get("explanation") or mission["options"][answer]
+        facts.setdefault(answer, ConceptFact(answer, definition, mission["category"], mission_id,
+                                             tuple(mission.get("hints", ()))))
+    for index, question in enumerate(questions):
+        answer = question.get("answer")
+        definition = question.get("formula") or question.get("concept")
+        if not answer or not definition:
+            continue
+        category = question.get("category") or question.get("concept") or "banco"
+        hints = (f"💡 Tema: {question['concept']}",) if question.get("concept") else ()
+        facts.setdefault(answer, ConceptFact(answer, definition, category, 1000 + index, hints))
+    return sorted(facts.values(), key=lambda fact: fact.order)
+
+
+def bank_version(missions: Dict[int, Dict[str, Any]], questions: List[Dict[str, Any]],
+                 pool_size: int, seed: int) -> str:
+    """
+    Huella del banco de contenidos y de los parámetros de generación.
+
+    Returns:
+        Hash SHA-256 abreviado
+    """
+    payload = json.dumps({
+        "generator": GENERATOR_VERSION,
+        "missions": {str(key): value for key, value in missions.items()},
+        "questions": questions,
+        "pool_size": pool_size,
+        "seed": seed,
+    }, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class _Builder:
+    """Construcción determinista de puzzles a partir de los conceptos."""
+
+    def __init__(self, facts: List[ConceptFact], seed: int):
+        self.facts = facts
+        self.seed = seed
+        by_category: Dict[str, List[ConceptFact]] = {}
+        for fact in facts:
+            by_category.setdefault(fact.category, []).append(fact)
+        # Temas con suficientes conceptos para ordenar o continuar una secuencia
+        self.sequences = [group for _, group in sorted(by_category.items()) if len(group) >= 3]
+        self.by_category = by_category
+
+    def _distractors(self, rng: random.Random, target: ConceptFact, count: int) -> List[ConceptFact]:
+        """Conceptos distintos del objetivo, priorizando su mismo tema."""
+        same = [f for f in self.by_category[target.category] if f.term != target.term]
+        other = [f for f in self.facts if f.category != target.category]
+        rng.shuffle(same)
+        rng.shuffle(other)
+        return (same + other)[:count]
+
+    def memory(self, rng: random.Random) -> Optional[Dict[str, Any]]:
+        shown = rng.sample(self.facts, min(MEMORY_ITEMS, len(self.facts)))
+        target = rng.choice(shown)
+        definitions = {fact.term: _shorten(_mask(fact.definition, fact.term)) for fact in shown}
+        if len(set(definitions.values())) < len(definitions):
+            return None
+        story = "FASE DE ESTUDIO (10 segundos):\n\n"
+        story += "\n".join(f"📌 {fact.term}: {definitions[fact.term]}" for fact in shown)
+        story += f"\n\n⏰ Tiempo terminado. ¿Qué definición corresponde a '{target.term}'?"
+        options = {
+            definitions[fact.term]: (f"¡Correcto! {fact.term}: {_shorten(fact.definition, 160)}"
+                                     if fact is target else f"Esto describe {fact.term}")
+            for fact in shown
+        }
+        return {
+            "title": f"🧠 Test de Memoria: {target.term}",
+            "story": story,
+            "options": options,
+            "answer": definitions[target.term],
+            "hints": list(target.hints[:2]) or [f"💡 Tema: {_category_label(target.category)}"],
+        }
+
+    def riddle(self, rng: random.Random) -> Optional[Dict[str, Any]]:
+        target = rng.choice(self.facts)
+        choices = [target] + self._distractors(rng, target, OPTIONS_PER_PUZZLE - 1)
+        rng.shuffle(choices)
+        story = (f"🤔 ADIVINANZA DE IA:\n\n'{_mask(target.definition, target.term)}'\n\n"
+                 f"¿Qué concepto soy?")
+        options = {
+            fact.term: ("¡Correcto! " + _shorten(fact.definition, 160) if fact is target
+                        else f"No, {fact.term} es otro concepto: {_shorten(fact.definition, 100)}")
+            for fact in choices
+        }
+        return {
+            "title": "🎭 Acertijo: ¿Qué soy?",
+            "story": story,
+            "options": options,
+            "answer": target.term,
+            "hints": list(target.hints[:2]) or [f"💡 Tema: {_category_label(target.category)}"],
+        }
+
+    def ordering(self, rng: random.Random) -> Optional[Dict[str, Any]]:
+        if not self.sequences:
+            return None
+        group = rng.choice(self.sequences)
+        length = min(len(group), rng.choice((3, 4)))
+        start = rng.randrange(len(group) - length + 1)
+        steps = [fact.term for fact in group[start:start + length]]
+        correct = " → ".join(steps)
+        options = {correct: f"¡Perfecto! Es el orden en que el temario presenta {_category_label(group[0].category)}"}
+        for _ in range(50):
+            if len(options) >= OPTIONS_PER_PUZZLE:
+                break
+            permutation = steps[:]
+            rng.shuffle(permutation)
+            key = " → ".join(permutation)
+            if key not in options:
+                options[key] = f"No, '{permutation[0]}' no es el primer paso de esta secuencia"
+        if len(options) < 2:
+            return None
+        keys = list(options)
+        rng.shuffle(keys)
+        scrambled = steps[:]
+        rng.shuffle(scrambled)
+        story = (f"🔗 DESAFÍO DE ORDEN ({_category_label(group[0].category)}):\n\n"
+                 + "\n".join(f"• {step}" for step in scrambled)
+                 + "\n\n🤔 ¿En qué ORDEN se aprenden estos conceptos?")
+        return {
+            "title": "🧩 Rompecabezas: Ordena los Conceptos",
+            "story": story,
+            "options": {key: options[key] for key in keys},
+            "answer": correct,
+            "hints": [f"💡 Empieza por: {steps[0]}", "🔍 Sigue el orden de las misiones"],
+        }
+
+    def pattern(self, rng: random.Random) -> Optional[Dict[str, Any]]:
+        if not self.sequences:
+            return None
+        group = rng.choice(self.sequences)
+        end = rng.randrange(2, len(group))
+        shown = group[max(0, end - 3):end]
+        target = group[end]
+        distractors = [f for f in self.facts if f.category != target.category]
+        rng.shuffle(distractors)
+        choices = [target] + distractors[:OPTIONS_PER_PUZZLE - 1]
+        rng.shuffle(choices)
+        story = (f"🔍 SECUENCIA DEL TEMARIO ({_category_label(target.category)}):\n\n"
+                 + " → ".join(fact.term for fact in shown) + " → ?\n\n"
+                 "🎯 ¿Qué concepto continúa la secuencia?")
+        options = {
+            fact.term: ("¡Correcto! Continúa el mismo tema" if fact is target
+                        else f"No, pertenece a {_category_label(fact.category)}")
+            for fact in choices
+        }
+        return {
+            "title": "🌊 Patrón: ¿Qué sigue?",
+            "story": story,
+            "options": options,
+            "answer": target.term,
+            "hints": [f"💡 Mismo tema: {_category_label(target.category)}"] + list(target.hints[:1]),
+        }
+
+    def pool(self, puzzle_type: str, size: int) -> List[Dict[str, Any]]:
+        """Genera hasta `size` puzzles distintos de un tipo."""
+        make = getattr(self, puzzle_type)
+        pool: List[Dict[str, Any]] = []
+        seen = set()
+        for attempt in range(size * 10):
+            if len(pool) >= size:
+                break
+            rng = random.Random(f"{self.seed}:{puzzle_type}:{attempt}")
+            data = make(rng)
+            if data is None:
+                continue
+            key = (data["story"], data["answer"], tuple(data["options"]))
+            if key in seen:
+                continue
+            seen.add(key)
+            data["puzzle_type"] = puzzle_type
+            pool.append(data)
+        return pool
+
+
+def generate_pools(missions: Dict[int, Dict[str, Any]], questions: List[Dict[str, Any]],
+                   pool_size: int, seed: int) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Genera las reservas de puzzles de todos los tipos.
+
+    Args:
+        missions: Diccionario id -> misión
+        questions: Preguntas del banco
+        pool_size: Puzzles por tipo
+        seed: Semilla de generación
+
+    Returns:
+        Tipo -> lista de puzzles en diccionario (serializable)
+    """
+    facts = extract_facts(missions, questions)
+    if len(facts) < OPTIONS_PER_PUZZLE:
+        return {}
+    builder = _Builder(facts, seed)
+    pools = {puzzle_type: builder.pool(puzzle_type, pool_size) for puzzle_type in GENERATED_TYPES}
+    return {puzzle_type: pool for puzzle_type, pool in pools.items() if pool}
+
+
+class PuzzleGenerator:
+    """
+    Reservas de puzzles generados, construidas en segundo plano.
+
+    `start()` lanza un hilo que carga las reservas de la caché en disco
+    (si la versión del banco coincide) o las genera y las guarda. Servir
+    un puzzle es indexar una tupla; si las reservas no existen se usa el
+    catálogo de simple_puzzles.
+    """
+
+    def __init__(self, missions: Optional[Dict[int, Dict[str, Any]]] = None,
+                 questions_file: Optional[str] = None, cache_path: Optional[str] = None,
+                 pool_size: int = 40, seed: int = 7, enabled: bool = True):
+        """
+        Inicializa el generador.
+
+        Args:
+            missions: Diccionario id -> misión (usa MISSIONS si es None)
+            questions_file: Banco de preguntas JSON (None = sólo misiones)
+            cache_path: Archivo de caché de las reservas (None desactiva la caché)
+            pool_size: Puzzles por tipo
+            seed: Semilla de generación
+            enabled: Si False se sirve siempre el catálogo de simple_puzzles
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.missions = missions
+        self.questions_file = questions_file
+        self.cache_path = cache_path
+        self.pool_size = pool_size
+        self.seed = seed
+        self.enabled = enabled
+
+        self.pools: Dict[str, Tuple[SimplePuzzle, ...]] = {}
+        self.version: Optional[str] = None
+        self.from_cache = False
+        self._cycle: Tuple[str, ...] = ()
+        self._cursor = 0
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        """Indica si las reservas ya están construidas."""
+        return self._ready.is_set()
+
+    def start(self) -> "PuzzleGenerator":
+        """Lanza la construcción de las reservas en un hilo de fondo."""
+        with self._lock:
+            if self.enabled and self._thread is None and not self.ready:
+                self._thread = threading.Thread(target=self.build, name="PuzzleGenerator", daemon=True)
+                self._thread.start()
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que las reservas estén listas (las construye aquí si no se lanzó el hilo).
+
+        Returns:
+            True si están listas
+        """
+        if not self.enabled:
+            return False
+        if self._thread is None and not self.ready:
+            self.build()
+        return self._ready.wait(timeout)
+
+    def _load_sources(self) -> Tuple[Dict[int, Dict[str, Any]], List[Dict[str, Any]]]:
+        missions = self.missions
+        if missions is None:
+            from missions import MISSIONS
+            missions = MISSIONS
+        questions: List[Dict[str, Any]] = []
+        if self.questions_file and os.path.exists(self.questions_file):
+            try:
+                with open(self.questions_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                questions = [q for q in data if isinstance(q, dict)] if isinstance(data, list) else []
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Banco de preguntas ilegible, se usan sólo las misiones: {e}")
+        return missions, questions
+
+    def _load_cache(self, version: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            artifact = load_json(self.cache_path)
+        except Exception as e:
+            self.logger.warning(f"Caché de puzzles ilegible, se regenera: {e}")
+            return None
+        if artifact.get("bank_version") != version:
+            return None
+        return artifact.get("pools")
+
+    def build(self) -> None:
+        """Carga o genera las reservas (se ejecuta en el hilo de fondo)."""
+        try:
+            missions, questions = self._load_sources()
+            version = bank_version(missions, questions, self.pool_size, self.seed)
+            pools = self._load_cache(version)
+            from_cache = pools is not None
+            if pools is None:
+                pools = generate_pools(missions, questions, self.pool_size, self.seed)
+            errors = validate_puzzle_data(pools)
+            if errors:
+                raise ValueError("; ".join(errors[:5]))
+            if not from_cache and self.cache_path:
+                try:
+                    save_json(self.cache_path, {"bank_version": version, "pools": pools}, compact=True)
+                except Exception as e:
+                    self.logger.warning(f"No se pudo guardar la caché de puzzles: {e}")
+            frozen = {
+                puzzle_type: tuple(
+                    SimplePuzzle(title=data["title"], story=data["story"], options=data["options"],
+                                 answer=data["answer"], puzzle_type=data["puzzle_type"],
+                                 hints=data.get("hints")).freeze()
+                    for data in pool
+                )
+                for puzzle_type, pool in pools.items()
+            }
+            self.pools, self.version, self.from_cache = frozen, version, from_cache
+            self._cycle = tuple(t for t in GENERATED_TYPES if frozen.get(t))
+            self.logger.info(f"Reservas de puzzles listas ({len(self)} puzzles, "
+                             f"{'caché' if from_cache else 'generadas'})")
+        except Exception as e:
+            self.logger.error(f"Error al generar puzzles: {e}")
+            self.pools, self._cycle = {}, ()
+        finally:
+            self._ready.set()
+
+    def __len__(self) -> int:
+        return sum(len(pool) for pool in self.pools.values())
+
+    def puzzle_for(self, mission_num: int) -> SimplePuzzle:
+        """
+        Puzzle determinista para un número de misión.
+
+        El tipo rota con mission_num y la posición avanza una vez por
+        vuelta de tipos, así misiones consecutivas recorren toda la reserva.
+
+        Args:
+            mission_num: Número de misión (o de reintento con desplazamiento)
+
+        Returns:
+            Puzzle inmutable compartido
+        """
+        if not self.wait() or not self._cycle:
+            return get_random_puzzle(mission_num)
+        cycle = self._cycle
+        pool = self.pools[cycle[mission_num % len(cycle)]]
+        return pool[(mission_num // len(cycle)) % len(pool)]
+
+    def next_puzzle(self, puzzle_type: Optional[str] = None) -> SimplePuzzle:
+        """
+        Siguiente puzzle sin repetir hasta agotar la reserva.
+
+        Args:
+            puzzle_type: Tipo concreto o None para alternar tipos
+
+        Returns:
+            Puzzle inmutable compartido
+        """
+        with self._lock:
+            cursor = self._cursor
+            self._cursor += 1
+        if puzzle_type is None or not self.wait() or not self.pools.get(puzzle_type):
+            return self.puzzle_for(cursor)
+        pool = self.pools[puzzle_type]
+        return pool[cursor % len(pool)]
+
+
+_generator: Optional[PuzzleGenerator] = None
+
+
+def get_puzzle_generator() -> PuzzleGenerator:
+    """
+    Obtiene el generador compartido y lanza su construcción en segundo plano.
+
+    Returns:
+        PuzzleGenerator configurado con PUZZLE_GENERATOR_CONFIG
+    """
+    global _generator
+    if _generator is None:
+        _generator = PuzzleGenerator(questions_file=PUZZLE_GENERATOR_CONFIG.get("questions_file"),
+                                     cache_path=PUZZLE_GENERATOR_CONFIG.get("cache_file"),
+                                     pool_size=PUZZLE_GENERATOR_CONFIG.get("pool_size", 40),
+                                     seed=PUZZLE_GENERATOR_CONFIG.get("seed", 7),
+                                     enabled=bool(PUZZLE_GENERATOR_CONFIG.get("enabled", True)))
+        _generator.start()
+    return _generator
@@ -8,6 +8,7 @@ from tkinter import ttk, messagebox
 import time
 from typing import Dict, List, Any, Callable
 from puzzle_games import PuzzleChallenge
+from frame_scheduler import get_scheduler, PRIORITY_LOW, PRIORITY_NORMAL
 
 class PuzzleUI:
     """Interfaz de usuario para juegos mentales y puzzles."""
@@ -16,9 +17,8 @@ class PuzzleUI:
         self.parent_frame = parent_frame
         self.current_puzzle = None
         self.start_time = None
-        self.timer_job = None
-        self.memory_study_job = None
         self.callback_function = None
+        self.scheduler = get_scheduler(parent_frame)
         
         # Variables de UI
         self.puzzle_frame = None
@@ -326,31 +326,33 @@ class PuzzleUI:
     def _start_timer(self):
         """Inicia el temporizador del puzzle."""
         self._update_timer()
+        self.scheduler.add_task("puzzle_timer", self._update_timer,
+                                interval_ms=1000, priority=PRIORITY_LOW)
     
     def _update_timer(self):
         """Actualiza el temporizador."""
-        if self.start_time:
-            elapsed = int(time.time() - self.start_time)
-            minutes = elapsed // 60
-            seconds = elapsed % 60
-            self.timer_var.set(f"⏱️ {minutes:02d}:{seconds:02d}")
-            
-            # Continuar actualizando
-            self.timer_job = self.content_frame.after(1000, self._update_timer)
+        if not self.start_time:
+            return False
+        elapsed = int(time.time() - self.start_time)
+        minutes = elapsed // 60
+        seconds = elapsed % 60
+        self.timer_var.set(f"⏱️ {minutes:02d}:{seconds:02d}")
     
     def _start_memory_study_timer(self, duration: int):
         """Inicia el temporizador de estudio para memory test."""
         self.study_time_left = duration
-        self._update_study_timer()
+        if self._update_study_timer() is not False:
+            self.scheduler.add_task("memory_study_timer", self._update_study_timer,
+                                    interval_ms=1000, priority=PRIORITY_NORMAL)
     
     def _update_study_timer(self):
         """Actualiza el temporizador de estudio."""
         if self.study_time_left > 0:
             self.study_timer_var.set(f"⏰ Tiempo de estudio: {self.study_time_left}s")
             self.study_time_left -= 1
-            self.memory_study_job = self.content_frame.after(1000, self._update_study_timer)
         else:
             self._start_memory_questions()
+            return False
     
     def _start_memory_questions(self):
         """Inicia la fase de preguntas del memory test."""
@@ -403,10 +405,8 @@ class PuzzleUI:
     
     def hide_puzzle(self):
         """Oculta la interfaz del puzzle."""
-        if self.timer_job:
-            self.content_frame.after_cancel(self.timer_job)
-        if self.memory_study_job:
-            self.content_frame.after_cancel(self.memory_study_job)
+        self.scheduler.remove_task("puzzle_timer")
+        self.scheduler.remove_task("memory_study_timer")
         
         self.puzzle_frame.pack_forget()
     
@@ -0,0 +1,506 @@
+"""
+Quiz Rooms Module - Proyecto Alpha v4.0
+Salas multijugador con rondas sincronizadas, marcador incremental y difusión por lotes.
+"""
+
+import json
+import logging
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from answer_key import AnswerKey
+from classroom_server import RoomQuestion, encode_message
+from config import QUIZ_ROOMS_CONFIG
+
+# Fases de una sala
+PHASE_LOBBY = "lobby"
+PHASE_QUESTION = "question"
+PHASE_REVIEW = "review"
+PHASE_FINISHED = "finished"
+
+
+class FenwickTree:
+    """Árbol de Fenwick de conteos: suma de prefijos y actualización en O(log n)."""
+
+    __slots__ = ("size", "tree")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index: int, delta: int) -> None:
+        """Suma `delta` en la posición `index` (base 0)."""
+        i = index + 1
+        tree, size = self.tree, self.size
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index: int) -> int:
+        """Suma de las posiciones 0..index (incluida)."""
+        i = min(index, self.size - 1) + 1
+        total = 0
+        tree = self.tree
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+class Scoreboard:
+    """
+    Marcador con rango en O(log S), siendo S la puntuación máxima.
+
+    Un árbol de Fenwick cuenta participantes por puntuación: el rango de
+    una puntuación es 1 + cuántos tienen más puntos. Los empates comparten
+    rango. Si alguien supera la puntuación máxima prevista, el árbol se
+    reconstruye con el doble de tamaño.
+    """
+
+    def __init__(self, max_score: int = 1024):
+        self.scores: Dict[str, int] = {}
+        self._buckets: Dict[int, Set[str]] = {}
+        self._tree = FenwickTree(max(1, max_score) + 1)
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def __contains__(self, participant: str) -> bool:
+        return participant in self.scores
+
+    def _ensure(self, score: int) -> None:
+        if score < self._tree.size:
+            return
+        size = self._tree.size
+        while size <= score:
+            size *= 2
+        self._tree = FenwickTree(size)
+        for value, members in self._buckets.items():
+            self._tree.add(value, len(members))
+
+    def _place(self, participant: str, score: int) -> None:
+        self._ensure(score)
+        self.scores[participant] = score
+        self._buckets.setdefault(score, set()).add(participant)
+        self._tree.add(score, 1)
+
+    def _unplace(self, participant: str) -> int:
+        score = self.scores.pop(participant)
+        members = self._buckets[score]
+        members.discard(participant)
+        if not members:
+            del self._buckets[score]
+        self._tree.add(score, -1)
+        return score
+
+    def add(self, participant: str, score: int = 0) -> None:
+        """Añade un participante (o lo reubica si ya estaba)."""
+        if participant in self.scores:
+            self._unplace(participant)
+        self._place(participant, score)
+
+    def remove(self, participant: str) -> None:
+        if participant in self.scores:
+            self._unplace(participant)
+
+    def update(self, participant: str, score: int) -> int:
+        """
+        Cambia la puntuación de un participante.
+
+        Returns:
+            Nuevo rango
+        """
+        if self.scores.get(participant) != score:
+            self.add(participant, score)
+        return self.rank_of_score(score)
+
+    def rank_of_score(self, score: int) -> int:
+        """Rango que tendría una puntuación (1 = primero)."""
+        return 1 + len(self.scores) - self._tree.prefix(score)
+
+    def rank(self, participant: str) -> int:
+        return self.rank_of_score(self.scores[participant])
+
+    def top(self, count: int) -> List[Tuple[str, int, int]]:
+        """
+        Primeros puestos.
+
+        Returns:
+            Lista de (participante, puntos, rango), empates ordenados por nombre
+        """
+        result: List[Tuple[str, int, int]] = []
+        above = 0
+        for score in sorted(self._buckets, reverse=True):
+            members = sorted(self._buckets[score])
+            for participant in members:
+                if len(result) >= count:
+                    return result
+                result.append((participant, score, above + 1))
+            above += len(members)
+        return result
+
+
+class RoomParticipant:
+    """Participante de una sala (mismos contadores que GameSession de repaso_ia)."""
+
+    __slots__ = ("participant_id", "score", "errors", "points", "answered_round", "connected")
+
+    def __init__(self, participant_id: str):
+        self.participant_id = participant_id
+        self.score = 0              # Respuestas correctas
+        self.errors = 0             # Incorrectas o sin responder a tiempo
+        self.points = 0             # Puntos del marcador (aciertos + rapidez)
+        self.answered_round = -1
+        self.connected = True
+
+
+# Destinatarios de un envío: None = todos los participantes conectados
+Deliver = Callable[[Optional[Sequence[str]], bytes], None]
+
+
+class QuizRoomEngine:
+    """
+    Motor de una sala con rondas sincronizadas.
+
+    Sigue el flujo de QuizGame (start_quiz, check_answer, next_question y
+    show_results), pero todos los participantes reciben la misma pregunta
+    y las respuestas se aceptan hasta un plazo. El motor no hace E/S por
+    sí mismo: los mensajes se acumulan y `flush()` los entrega por lotes
+    mediante `deliver`, serializando una sola vez cada difusión. Las
+    actualizaciones del marcador se agrupan: aunque lleguen cientos de
+    respuestas entre dos `tick()`, sale un único mensaje de marcador.
+    """
+
+    def __init__(self, room_id: str, questions: List[RoomQuestion], answer_key: AnswerKey,
+                 deliver: Deliver, clock: Callable[[], float] = time.monotonic,
+                 config: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa la sala.
+
+        Args:
+            room_id: Identificador de la sala
+            questions: Banco de preguntas disponible
+            answer_key: Clave compilada del banco
+            deliver: Entrega (destinatarios, bytes); None = a todos
+            clock: Reloj en segundos (las pruebas usan uno manual)
+            config: Ajustes (QUIZ_ROOMS_CONFIG si es None)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.room_id = room_id
+        self.bank = questions
+        self.answer_key = answer_key
+        self.deliver = deliver
+        self.clock = clock
+        self.config = dict(QUIZ_ROOMS_CONFIG, **(config or {}))
+        self.participants: Dict[str, RoomParticipant] = {}
+        self.questions: List[RoomQuestion] = []
+        self.round_index = -1
+        self.phase = PHASE_LOBBY
+        self.deadline: Optional[float] = None
+        self.round_started: Optional[float] = None
+        self.review_until: Optional[float] = None
+        self.round_answers = 0
+        # Conectados que aún no han respondido la ronda abierta
+        self._pending = 0
+        max_points = self.config["base_points"] + self.config["speed_bonus"]
+        self.scoreboard = Scoreboard(max_points * max(1, len(questions)))
+        self._broadcasts: List[Dict[str, Any]] = []
+        self._direct: List[Tuple[str, Dict[str, Any]]] = []
+        self._changed: Set[str] = set()
+        self._connected_count = 0
+        self.broadcasts_sent = 0
+
+    # ------------------------------------------------------------------
+    # Participantes
+    # ------------------------------------------------------------------
+
+    def join(self, participant_id: str) -> RoomParticipant:
+        """Entra en la sala; quien vuelve conserva sus puntos."""
+        participant = self.participants.get(participant_id)
+        if participant is None:
+            participant = self.participants[participant_id] = RoomParticipant(participant_id)
+            participant.connected = False
+            self.scoreboard.add(participant_id, 0)
+        if not participant.connected:
+            participant.connected = True
+            self._connected_count += 1
+            if self.phase == PHASE_QUESTION and participant.answered_round != self.round_index:
+                self._pending += 1
+        self._direct.append((participant_id, {"type": "welcome", "room": self.room_id, "phase": self.phase,
+                                              "participants": len(self.participants)}))
+        if self.phase == PHASE_QUESTION:
+            self._direct.append((participant_id, self._question_message()))
+        return participant
+
+    def leave(self, participant_id: str) -> None:
+        """Sale de la sala; si sólo faltaba su respuesta, la ronda se cierra."""
+        participant = self.participants.get(participant_id)
+        if participant is not None and participant.connected:
+            participant.connected = False
+            self._connected_count -= 1
+            if self.phase == PHASE_QUESTION and participant.answered_round != self.round_index:
+                self._pending -= 1
+                if self._pending <= 0:
+                    self._close_round(self.clock())
+
+    def connected(self) -> List[str]:
+        return [pid for pid, participant in self.participants.items() if participant.connected]
+
+    # ------------------------------------------------------------------
+    # Flujo de juego
+    # ------------------------------------------------------------------
+
+    def start_quiz(self, count: Optional[int] = None, seed: Optional[Any] = None) -> None:
+        """
+        Baraja las preguntas y lanza la primera ronda.
+
+        Args:
+            count: Número de rondas (todas si es None)
+            seed: Semilla del barajado (reproducible en pruebas)
+        """
+        questions = list(self.bank)
+        random.Random(seed).shuffle(questions)
+        self.questions = questions[:count] if count else questions
+        self.round_index = -1
+        for participant in self.participants.values():
+            participant.score = participant.errors = participant.points = 0
+            participant.answered_round = -1
+            self.scoreboard.update(participant.participant_id, 0)
+        self._broadcasts.append({"type": "quiz_started", "rounds": len(self.questions)})
+        self.next_question()
+
+    def _question_message(self) -> Dict[str, Any]:
+        question = self.questions[self.round_index]
+        return {
+            "type": "question",
+            "round": self.round_index,
+            "total": len(self.questions),
+            "title": question.title,
+            "prompt": question.prompt,
+            "options": list(question.options),
+            "deadline_s": max(0.0, self.deadline - self.clock()),
+        }
+
+    def next_question(self) -> None:
+        """Abre la ronda siguiente o termina si no quedan preguntas."""
+        self.round_index += 1
+        if self.round_index >= len(self.questions):
+            self.show_results()
+            return
+        now = self.clock()
+        self.phase = PHASE_QUESTION
+        self.round_started = now
+        self.deadline = now + self.config["deadline_s"]
+        self.review_until = None
+        self.round_answers = 0
+        self._pending = self._connected_count
+        self._broadcasts.append(self._question_message())
+
+    def points_for(self, elapsed: float) -> int:
+        """Puntos de un acierto: base más bonificación lineal por rapidez."""
+        deadline_s = self.config["deadline_s"]
+        remaining = max(0.0, deadline_s - elapsed) / deadline_s if deadline_s > 0 else 0.0
+        return self.config["base_points"] + int(round(self.config["speed_bonus"] * remaining))
+
+    def check_answer(self, participant_id: str, option: str) -> Dict[str, Any]:
+        """
+        Registra la respuesta de un participante a la ronda abierta.
+
+        El resultado se envía sólo a ese participante; el marcador se
+        actualiza al momento (O(log S)) y se difunde en el siguiente flush.
+
+        Args:
+            participant_id: Quien responde
+            option: Opción elegida
+
+        Returns:
+            Mensaje de resultado (también encolado para el participante)
+        """
+        participant = self.participants.get(participant_id)
+        now = self.clock()
+        if participant is None:
+            result = {"type": "rejected", "reason": "no está en la sala"}
+        elif self.phase != PHASE_QUESTION or now > self.deadline:
+            result = {"type": "rejected", "reason": "la ronda está cerrada"}
+        elif participant.answered_round == self.round_index:
+            result = {"type": "rejected", "reason": "ya has respondido"}
+        else:
+            question = self.questions[self.round_index]
+            graded = self.answer_key.grade(question.item_id, option)
+            participant.answered_round = self.round_index
+            self.round_answers += 1
+            if participant.connected:
+                self._pending -= 1
+            gained = 0
+            if graded.correct:
+                participant.score += 1
+                gained = self.points_for(now - self.round_started)
+                participant.points += gained
+            else:
+                participant.errors += 1
+            rank = self.scoreboard.update(participant_id, participant.points)
+            self._changed.add(participant_id)
+            result = {"type": "answer_result", "round": self.round_index, "correct": graded.correct,
+                      "points": gained, "total_points": participant.points, "rank": rank}
+            if self._pending <= 0:
+                self._close_round(now)
+        if participant is not None:
+            self._direct.append((participant_id, result))
+        return result
+
+    def _close_round(self, now: float) -> None:
+        round_index = self.round_index
+        for participant in self.participants.values():
+            if participant.answered_round != round_index:
+                participant.answered_round = round_index
+                participant.errors += 1  # Sin respuesta dentro del plazo
+        question = self.questions[round_index]
+        self._pending = 0
+        self.phase = PHASE_REVIEW
+        self.review_until = now + self.config["review_s"]
+        self._broadcasts.append({
+            "type": "round_closed",
+            "round": round_index,
+            "answer": self.answer_key.get(question.item_id).answer,
+            "answered": self.round_answers,
+            "participants": len(self.participants),
+        })
+
+    def tick(self) -> None:
+        """
+        Avanza el reloj de la sala: cierra rondas vencidas, pasa a la
+        siguiente tras la revisión y entrega lo pendiente.
+        """
+        now = self.clock()
+        if self.phase == PHASE_QUESTION and now >= self.deadline:
+            self._close_round(now)
+        elif self.phase == PHASE_REVIEW and self.config["auto_advance"] and now >= self.review_until:
+            self.next_question()
+        self.flush()
+
+    def show_results(self) -> List[Dict[str, Any]]:
+        """
+        Termina la partida y difunde la clasificación final.
+
+        Returns:
+            Clasificación completa (un diccionario por participante)
+        """
+        self.phase = PHASE_FINISHED
+        self.deadline = None
+        standings = [
+            {"participant": pid, "points": points, "rank": rank,
+             "score": self.participants[pid].score, "errors": self.participants[pid].errors,
+             "total_questions": len(self.questions)}
+            for pid, points, rank in self.scoreboard.top(len(self.scoreboard))
+        ]
+        self._broadcasts.append({"type": "final_results", "standings": standings})
+        return standings
+
+    # ------------------------------------------------------------------
+    # Difusión
+    # ------------------------------------------------------------------
+
+    def _scoreboard_message(self) -> Dict[str, Any]:
+        changed = sorted(self._changed)
+        self._changed.clear()
+        return {
+            "type": "scoreboard",
+            "round": self.round_index,
+            "top": [[pid, points, rank] for pid, points, rank in self.scoreboard.top(self.config["top_n"])],
+            "changes": [[pid, self.scoreboard.scores[pid], self.scoreboard.rank(pid)]
+                        for pid in changed if pid in self.scoreboard],
+        }
+
+    def flush(self) -> int:
+        """
+        Entrega los mensajes pendientes.
+
+        Cada difusión se serializa una vez y se entrega como un solo envío
+        a todos los conectados; los cambios del marcador acumulados desde
+        el último flush salen en un único mensaje.
+
+        Returns:
+            Número de envíos realizados
+        """
+        if self._changed:
+            self._broadcasts.append(self._scoreboard_message())
+        sends = 0
+        if self._direct:
+            direct, self._direct = self._direct, []
+            for participant_id, message in direct:
+                self.deliver([participant_id], encode_message(message))
+                sends += 1
+        if self._broadcasts:
+            broadcasts, self._broadcasts = self._broadcasts, []
+            payload = b"".join(encode_message(message) for message in broadcasts)
+            self.deliver(None, payload)
+            self.broadcasts_sent += len(broadcasts)
+            sends += 1
+        return sends
+
+
+class LocalClient:
+    """Cliente simulado en memoria: recibe las líneas que le entrega la sala."""
+
+    def __init__(self, participant_id: str):
+        self.participant_id = participant_id
+        self.inbox: List[Dict[str, Any]] = []
+        self.bytes_received = 0
+
+    def receive(self, payload: bytes) -> None:
+        self.bytes_received += len(payload)
+        for line in payload.splitlines():
+            if line:
+                self.inbox.append(json.loads(line))
+
+    def last(self, kind: str) -> Optional[Dict[str, Any]]:
+        """Último mensaje recibido de un tipo."""
+        for message in reversed(self.inbox):
+            if message.get("type") == kind:
+                return message
+        return None
+
+
+class LocalHub:
+    """
+    Red local simulada: conecta una sala con clientes en memoria.
+
+    Sirve de `deliver` para QuizRoomEngine; cuenta envíos para poder
+    comprobar que la difusión va por lotes.
+    """
+
+    def __init__(self):
+        self.clients: Dict[str, LocalClient] = {}
+        self.engine: Optional[QuizRoomEngine] = None
+        self.deliveries = 0
+
+    def connect(self, participant_id: str) -> LocalClient:
+        client = self.clients[participant_id] = LocalClient(participant_id)
+        if self.engine is not None:
+            self.engine.join(participant_id)
+        return client
+
+    def __call__(self, recipients: Optional[Sequence[str]], payload: bytes) -> None:
+        self.deliveries += 1
+        if recipients is None:
+            recipients = self.engine.connected() if self.engine is not None else list(self.clients)
+        for participant_id in recipients:
+            client = self.clients.get(participant_id)
+            if client is not None:
+                client.receive(payload)
+
+
+def create_local_room(questions: List[RoomQuestion], answer_key: AnswerKey, room_id: str = "sala",
+                      clock: Callable[[], float] = time.monotonic,
+                      config: Optional[Dict[str, Any]] = None) -> Tuple[QuizRoomEngine, LocalHub]:
+    """
+    Crea una sala conectada a una red local simulada.
+
+    Returns:
+        (motor de la sala, hub al que conectar LocalClient)
+    """
+    hub = LocalHub()
+    engine = QuizRoomEngine(room_id, questions, answer_key, hub, clock=clock, config=config)
+    hub.engine = engine
+    return engine, hub
@@ -20,6 +20,11 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 
+from storage import save_json, load_json
+from frame_scheduler import get_scheduler
+from logging_setup import configure_logging
+from answer_key import AnswerKey, GradeResult, UNKNOWN_OPTION, compile_question, question_feedback
+
 # ==============================================================================
 # 1. CONFIGURACIÓN INICIAL Y LOGGING
 # ==============================================================================
@@ -32,14 +37,7 @@ STATS_FILE = "game_stats.json"
 
 try:
     # Configuración de logging para registrar eventos en consola y archivo
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(LOG_FILE, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
+    configure_logging(LOG_FILE, fmt='%(asctime)s - %(levelname)s - %(message)s')
 except Exception:
     # Fallback básico si hay problemas con la configuración avanzada
     logging.basicConfig(level=logging.INFO)
@@ -207,6 +205,9 @@ class QuestionManager:
         self.questions_file = questions_file
         self.questions: List[Question] = []
         self.categories: List[str] = []
+        self.answer_key = AnswerKey()
+        # id(Question) -> posición en self.questions (clave de answer_key)
+        self._positions: Dict[int, int] = {}
         self._load_questions()
 
     def _load_questions(self) -> None:
@@ -217,6 +218,9 @@ class QuestionManager:
                     data = json.load(f)
                     # Convertir cada diccionario a un objeto Question
                     self.questions = [Question.from_dict(q) for q in data]
+                    # Claves compiladas: corregir es comparar el índice de la opción
+                    self.answer_key = self._compile_answer_key(self.questions)
+                    self._positions = {id(q): position for position, q in enumerate(self.questions)}
                     # Extraer categorías únicas y ordenarlas
                     self.categories = sorted(list(set(q.category for q in self.questions)))
                     logger.info(f"Cargadas {len(self.questions)} preguntas")
@@ -229,6 +233,43 @@ class QuestionManager:
             self.questions = []
             self.categories = []
 
+    @staticmethod
+    def _compile_answer_key(questions: List[Question]) -> AnswerKey:
+        """
+        Compila las preguntas válidas, por posición en la lista.
+
+        Se usa la posición y no el texto: dos preguntas con el mismo
+        enunciado y distintas opciones no comparten clave. Las que no
+        tienen la respuesta entre sus opciones se omiten.
+        """
+        answer_key = AnswerKey()
+        for position, question in enumerate(questions):
+            try:
+                answer_key.add(compile_question(position, question))
+            except ValueError as e:
+                logger.warning(str(e))
+        return answer_key
+
+    def grade(self, question: Question, selected_option: str) -> GradeResult:
+        """
+        Corrige una respuesta con la clave compilada de la pregunta.
+
+        Args:
+            question: Pregunta cargada por este gestor
+            selected_option: Opción elegida
+
+        Returns:
+            GradeResult; una pregunta sin clave (respuesta fuera de sus
+            opciones) se corrige comparando textos, como antes de compilar
+        """
+        compiled = self.answer_key.get(self._positions.get(id(question)))
+        if compiled is not None:
+            return compiled.grade(selected_option)
+        option_index = question.options.index(selected_option) \
+            if selected_option in question.options else UNKNOWN_OPTION
+        return GradeResult(selected_option == question.answer, option_index,
+                           question_feedback(question.answer, selected_option))
+
     def get_questions_by_category(self, category: str = "Todas") -> List[Question]:
         """
         Obtiene una lista de preguntas filtradas por la categoría especificada.
@@ -276,8 +317,8 @@ class StatsManager:
         """
         try:
             if os.path.exists(self.stats_file):
-                with open(self.stats_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # Acepta tanto JSON plano como los formatos comprimidos de storage
+                return load_json(self.stats_file)
             else:
                 # Retorna estructura por defecto si no existe el archivo
                 return {"total_games": 0, "sessions": []}
@@ -301,9 +342,8 @@ class StatsManager:
             if len(self.stats["sessions"]) > 50:
                 self.stats["sessions"] = self.stats["sessions"][-50:]
 
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                # El indent=2 mejora la legibilidad del JSON
-                json.dump(self.stats, f, indent=2, ensure_ascii=False)
+            # El formato (indentado, compacto o comprimido) lo define STORAGE_CONFIG
+            save_json(self.stats_file, self.stats)
 
             logger.info(f"Sesión guardada: {session.score}/{session.total_questions}")
         except Exception as e:
@@ -334,6 +374,7 @@ class QuizGame(tk.Tk):
         self.current_question_index = 0
         self.selected_category = tk.StringVar(value="Todas")
         self.study_mode = tk.BooleanVar(value=False)
+        self.scheduler = get_scheduler(self)
 
         self._setup_window()
 
@@ -445,7 +486,8 @@ class QuizGame(tk.Tk):
             return
 
         current_question = self.current_questions[self.current_question_index]
-        is_correct = selected_option == current_question.answer
+        graded = self.question_manager.grade(current_question, selected_option)
+        is_correct = graded.correct
 
         if is_correct:
             self.current_session.score += 1
@@ -456,11 +498,10 @@ class QuizGame(tk.Tk):
         quiz_screen = self.frames["QuizScreen"]
         colors = self.config_manager.get_colors()
 
+        feedback_text = graded.feedback
         if is_correct:
-            feedback_text = "✅ ¡Correcto!"
             feedback_color = colors.get("secondary_green", "#4CAF50")
         else:
-            feedback_text = f"❌ Incorrecto. Respuesta correcta: {current_question.answer}"
             feedback_color = colors.get("color_error", "#D32F2F")
 
         # Añadir explicación en modo estudio
@@ -470,8 +511,9 @@ class QuizGame(tk.Tk):
         quiz_screen.show_feedback(feedback_text, feedback_color)
 
         # Configurar un retraso antes de pasar a la siguiente pregunta
+        # Con nombre: un doble clic no programa dos avances de pregunta
         delay = 3000 if self.study_mode.get() else 1500
-        self.after(delay, self.next_question)
+        self.scheduler.call_later("next_question", delay, self.next_question)
 
     def next_question(self) -> None:
         """Pasa a la siguiente pregunta o finaliza el quiz si no quedan más."""
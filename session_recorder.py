@@ -0,0 +1,340 @@
+"""
+Session Recorder Module - Proyecto Alpha v4.0
+Grabación compacta de las entradas de una sesión y reproducción determinista sin pantalla.
+"""
+
+import atexit
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from config import DIAGNOSTICS_CONFIG
+from storage import save_json, load_json, suggested_extension
+
+# Variable de entorno que activa la grabación sin tocar config.py
+RECORD_ENV_VAR = "ALPHA_RECORD_SESSION"
+
+RECORDING_FORMAT = 1
+
+# Entradas que se graban (tipo -> acción del usuario)
+EVENT_TYPES = ("answer", "hint", "retry", "next", "mode", "restart", "user")
+
+# Campos de game_state que dependen del reloj real o de objetos no serializables
+VOLATILE_STATE_KEYS = ("session_id", "time_started", "time_spent", "current_question_time")
+
+# Tolerancia al comparar tiempos: la grabación resta marcas de época y la
+# reproducción usa segundos relativos, con redondeos distintos
+FLOAT_TOLERANCE = 1e-3
+
+logger = logging.getLogger("SessionRecorder")
+
+
+def _plain(value: Any) -> Any:
+    """Convierte a tipos JSON (defaultdict, sets, tuplas...)."""
+    return json.loads(json.dumps(value, default=lambda o: sorted(o) if isinstance(o, set) else str(o)))
+
+
+def capture_state(controller) -> Dict[str, Any]:
+    """
+    Resume el estado comparable de un controlador.
+
+    Args:
+        controller: GameController
+
+    Returns:
+        Estado del juego, métricas, historial y logros en tipos JSON
+    """
+    state = {}
+    for key, value in controller.game_state.items():
+        if key in VOLATILE_STATE_KEYS:
+            continue
+        if key == "current_puzzle":
+            value = getattr(value, "title", None)
+        elif key == "error_log":
+            value = [entry.get("message") for entry in value]
+        state[key] = value
+    history = [{key: value for key, value in entry.items() if key != "timestamp"}
+               for entry in controller.academic_metrics.question_history]
+    return _plain({
+        "game_state": state,
+        "metrics": controller.academic_metrics.metrics,
+        "question_history": history,
+        "achievements": sorted(controller.achievement_system.unlocked_achievements),
+    })
+
+
+def restore_state(controller, snapshot: Dict[str, Any]) -> None:
+    """
+    Aplica el estado inicial grabado a un controlador recién creado.
+
+    Args:
+        controller: GameController
+        snapshot: Estado devuelto por capture_state
+    """
+    state = dict(snapshot["game_state"])
+    state.pop("current_puzzle", None)
+    state["error_log"] = [{"timestamp": None, "message": message} for message in state.get("error_log", [])]
+    controller.game_state.update(state)
+    controller.academic_metrics.metrics.update(snapshot["metrics"])
+    controller.academic_metrics.question_history = [dict(entry) for entry in snapshot["question_history"]]
+    controller.achievement_system.unlocked_achievements = set(snapshot["achievements"])
+
+
+def compare_states(expected: Any, actual: Any, path: str = "",
+                   tolerance: float = FLOAT_TOLERANCE) -> List[str]:
+    """
+    Compara dos estados y lista las diferencias.
+
+    Args:
+        expected: Estado grabado
+        actual: Estado reproducido
+        path: Prefijo de la ruta (uso interno)
+        tolerance: Diferencia absoluta admitida entre números reales
+
+    Returns:
+        Lista de diferencias "ruta: esperado != obtenido"
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        differences = []
+        for key in sorted(set(expected) | set(actual), key=str):
+            child = f"{path}.{key}" if path else str(key)
+            if key not in expected or key not in actual:
+                differences.append(f"{child}: {expected.get(key, '<falta>')!r} != {actual.get(key, '<falta>')!r}")
+            else:
+                differences.extend(compare_states(expected[key], actual[key], child, tolerance))
+        return differences
+    if isinstance(expected, list) and isinstance(actual, list) and len(expected) == len(actual):
+        differences = []
+        for index, (left, right) in enumerate(zip(expected, actual)):
+            differences.extend(compare_states(left, right, f"{path}[{index}]", tolerance))
+        return differences
+    if (isinstance(expected, float) or isinstance(actual, float)) and \
+            isinstance(expected, (int, float)) and isinstance(actual, (int, float)) and \
+            not isinstance(expected, bool) and not isinstance(actual, bool):
+        return [] if abs(expected - actual) <= tolerance else [f"{path}: {expected!r} != {actual!r}"]
+    return [] if expected == actual else [f"{path}: {expected!r} != {actual!r}"]
+
+
+class SessionRecorder:
+    """
+    Registro de las entradas del usuario durante una sesión.
+
+    Cada evento es una lista compacta [t, tipo] o [t, tipo, valor], con t en
+    segundos desde el inicio medido con el reloj del controlador. Junto a
+    los eventos se guardan el estado inicial y el final, de modo que una
+    reproducción puede comprobar que llega exactamente al mismo resultado.
+    Desactivado, `record()` no hace nada.
+    """
+
+    def __init__(self, enabled: bool = False, directory: Optional[str] = None):
+        """
+        Inicializa el grabador.
+
+        Args:
+            enabled: Si se graba algo
+            directory: Carpeta donde guardar las grabaciones
+        """
+        self.enabled = enabled
+        self.directory = directory or DIAGNOSTICS_CONFIG.get("recording_dir", "recordings")
+        self.events: List[List[Any]] = []
+        self.header: Dict[str, Any] = {}
+        self.path: Optional[str] = None
+        self._controller = None
+        self._origin = 0.0
+        self._finished = False
+
+    def begin(self, controller) -> None:
+        """
+        Empieza a grabar desde el estado actual del controlador.
+
+        Args:
+            controller: GameController ya inicializado
+        """
+        if not self.enabled:
+            return
+        if self._controller is None:
+            atexit.register(self.finish)
+        self._controller = controller
+        self._origin = controller.clock()
+        self._finished = False
+        self.events = []
+        self.header = {
+            "format": RECORDING_FORMAT,
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "puzzle_mode": controller.puzzle_mode,
+            "initial_state": capture_state(controller),
+        }
+
+    def record(self, kind: str, value: Any = None) -> None:
+        """
+        Añade una entrada del usuario.
+
+        Args:
+            kind: Uno de EVENT_TYPES
+            value: Opción elegida o modo seleccionado
+        """
+        if not self.enabled or self._controller is None:
+            return
+        event = [self._controller.clock() - self._origin, kind]
+        if value is not None:
+            event.append(value)
+        self.events.append(event)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Grabación completa con el estado final actual."""
+        return dict(self.header, events=self.events,
+                    final_state=capture_state(self._controller))
+
+    def finish(self) -> Optional[str]:
+        """
+        Guarda la grabación (una sola vez por sesión).
+
+        Returns:
+            Ruta escrita o None si no había nada que guardar
+        """
+        if not self.enabled or self._controller is None or self._finished or not self.events:
+            return None
+        self._finished = True
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            name = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suggested_extension()}"
+            self.path = os.path.join(self.directory, name)
+            save_json(self.path, self.to_dict(), compact=True)
+            logger.info(f"Sesión grabada en {self.path} ({len(self.events)} eventos)")
+            return self.path
+        except Exception as e:
+            logger.error(f"No se pudo guardar la grabación: {e}")
+            return None
+
+
+_recorder: Optional[SessionRecorder] = None
+
+
+def get_session_recorder() -> SessionRecorder:
+    """Obtiene el grabador compartido (activo según DIAGNOSTICS_CONFIG o ALPHA_RECORD_SESSION=1)."""
+    global _recorder
+    if _recorder is None:
+        enabled = bool(DIAGNOSTICS_CONFIG.get("session_recording")) or os.environ.get(RECORD_ENV_VAR) == "1"
+        _recorder = SessionRecorder(enabled=enabled)
+    return _recorder
+
+
+class VirtualClock:
+    """Reloj controlado por la reproducción."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ReplayResult(NamedTuple):
+    """Resultado de una reproducción."""
+
+    events: int
+    elapsed_s: float
+    mismatches: List[str]
+    final_state: Dict[str, Any]
+
+    @property
+    def matches(self) -> bool:
+        return not self.mismatches
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed_s if self.elapsed_s > 0 else float("inf")
+
+
+def create_headless_controller():
+    """
+    Crea un GameController sin pantalla, sin persistencia y sin grabación.
+
+    La interfaz headless se pasa como clase: no se registra como skin, así
+    que el registro global de skins no cambia.
+
+    Returns:
+        GameController con la interfaz headless
+    """
+    from ui_manager_headless import HeadlessRoot, UIManager
+    from game_controller import GameController
+
+    return GameController(HeadlessRoot(), ui_backend=UIManager, headless=True)
+
+
+def _dispatch(controller) -> Dict[str, Callable[..., Any]]:
+    """Acción de la interfaz que corresponde a cada tipo de evento."""
+    ui = controller.ui_manager
+    return {
+        "answer": ui.select_option,
+        "hint": ui.hint_button.invoke,
+        "retry": ui.retry_button.invoke,
+        "next": ui.next_button.invoke,
+        "mode": controller.set_learning_mode,
+        "restart": controller.restart_session,
+        "user": controller.switch_user,
+    }
+
+
+def replay_session(recording: Dict[str, Any], controller=None) -> ReplayResult:
+    """
+    Reproduce una grabación a máxima velocidad y compara el estado final.
+
+    Args:
+        recording: Grabación (SessionRecorder.to_dict o archivo cargado)
+        controller: Controlador sin pantalla (se crea uno si es None)
+
+    Returns:
+        ReplayResult con las diferencias encontradas
+
+    Raises:
+        ValueError: Si el formato de la grabación no es compatible
+    """
+    if recording.get("format") != RECORDING_FORMAT:
+        raise ValueError(f"Formato de grabación no soportado: {recording.get('format')}")
+    controller = controller or create_headless_controller()
+    clock = VirtualClock()
+    controller.clock = clock
+    controller.puzzle_mode = recording.get("puzzle_mode", controller.puzzle_mode)
+    restore_state(controller, recording["initial_state"])
+    actions = _dispatch(controller)
+
+    start = time.perf_counter()
+    for event in recording["events"]:
+        clock.now = event[0]
+        action = actions[event[1]]
+        if len(event) > 2:
+            action(event[2])
+        else:
+            action()
+    elapsed = time.perf_counter() - start
+
+    final_state = capture_state(controller)
+    mismatches = compare_states(recording.get("final_state", {}), final_state)
+    return ReplayResult(len(recording["events"]), elapsed, mismatches, final_state)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Reproduce grabaciones desde la línea de comandos; devuelve 1 si alguna difiere."""
+    paths = argv if argv is not None else sys.argv[1:]
+    if not paths:
+        print("Uso: python session_recorder.py GRABACION [GRABACION ...]")
+        return 2
+    failed = 0
+    for path in paths:
+        result = replay_session(load_json(path))
+        status = "✅ coincide" if result.matches else f"❌ {len(result.mismatches)} diferencias"
+        print(f"{path}: {result.events} eventos en {result.elapsed_s * 1000:.1f} ms "
+              f"({result.events_per_second:.0f} eventos/s) {status}")
+        for mismatch in result.mismatches[:20]:
+            print(f"    {mismatch}")
+        failed += not result.matches
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,8 +3,12 @@ Simple Puzzles - Versión simplificada de juegos mentales
 Integración directa con el sistema existente.
 """
 
+import math
 import random
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
+
+DEFAULT_HINTS = ["💡 Piensa en los conceptos básicos de IA"]
 
 class SimplePuzzle:
     """Puzzle simple que funciona con la UI existente."""
@@ -16,167 +20,283 @@ class SimplePuzzle:
         self.options = options
         self.answer = answer
         self.puzzle_type = puzzle_type
-        self.hints = hints or ["💡 Piensa en los conceptos básicos de IA"]
+        self.hints = hints or list(DEFAULT_HINTS)
+        # Respuesta -> (es_correcta, feedback); lo rellena el catálogo
+        self.feedback: Optional[Dict[str, Tuple[bool, str]]] = None
 
-def create_memory_puzzle(mission_num: int) -> SimplePuzzle:
-    """Crea un puzzle de memoria."""
-    memory_puzzles = [
-        {
-            "title": "🧠 Test de Memoria: Definiciones de IA",
-            "story": "FASE DE ESTUDIO (10 segundos):\n\n📌 Machine Learning: Algoritmos que mejoran automáticamente con la experiencia\n📌 Deep Learning: Redes neuronales con múltiples capas ocultas\n📌 Overfitting: Cuando el modelo memoriza en lugar de generalizar\n📌 Big Data: Conjuntos de datos extremadamente grandes y complejos\n\n⏰ Tiempo terminado. ¿Qué definición corresponde a 'Deep Learning'?",
-            "options": {
-                "Algoritmos que mejoran automáticamente": "Esto es Machine Learning, no Deep Learning",
-                "Redes neuronales con múltiples capas": "¡Correcto! Deep Learning usa redes neuronales profundas",
-                "Cuando el modelo memoriza datos": "Esto describe el Overfitting",
-                "Conjuntos de datos muy grandes": "Esto es Big Data"
-            },
-            "answer": "Redes neuronales con múltiples capas"
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.__dict__.get("_frozen"):
+            raise AttributeError(f"SimplePuzzle del catálogo es inmutable: {name}")
+        super().__setattr__(name, value)
+
+    def freeze(self) -> "SimplePuzzle":
+        """
+        Precalcula el feedback de cada opción y bloquea el puzzle.
+
+        Returns:
+            El mismo puzzle, ya inmutable
+        """
+        self.options = MappingProxyType(dict(self.options))
+        self.hints = tuple(self.hints)
+        self.feedback = MappingProxyType({
+            option: (option == self.answer, _build_feedback(self, option))
+            for option in self.options
+        })
+        self._frozen = True
+        return self
+
+# Datos de los puzzles por tipo (se recorren con mission_num % len)
+MEMORY_PUZZLES: Tuple[Dict[str, Any], ...] = (
+    {
+        "title": "🧠 Test de Memoria: Definiciones de IA",
+        "story": "FASE DE ESTUDIO (10 segundos):\n\n📌 Machine Learning: Algoritmos que mejoran automáticamente con la experiencia\n📌 Deep Learning: Redes neuronales con múltiples capas ocultas\n📌 Overfitting: Cuando el modelo memoriza en lugar de generalizar\n📌 Big Data: Conjuntos de datos extremadamente grandes y complejos\n\n⏰ Tiempo terminado. ¿Qué definición corresponde a 'Deep Learning'?",
+        "options": {
+            "Algoritmos que mejoran automáticamente": "Esto es Machine Learning, no Deep Learning",
+            "Redes neuronales con múltiples capas": "¡Correcto! Deep Learning usa redes neuronales profundas",
+            "Cuando el modelo memoriza datos": "Esto describe el Overfitting",
+            "Conjuntos de datos muy grandes": "Esto es Big Data"
+        },
+        "answer": "Redes neuronales con múltiples capas"
+    },
+    {
+        "title": "🧠 Secuencia de Procesamiento de Datos",
+        "story": "MEMORIZA esta secuencia de procesamiento:\n\n1️⃣ Recolección de datos\n2️⃣ Limpieza de datos\n3️⃣ Análisis exploratorio\n4️⃣ Entrenamiento del modelo\n5️⃣ Validación\n6️⃣ Implementación\n\n❓ ¿Qué paso viene DESPUÉS de 'Análisis exploratorio'?",
+        "options": {
+            "Limpieza de datos": "No, eso viene antes del análisis",
+            "Entrenamiento del modelo": "¡Correcto! Después del análisis viene el entrenamiento",
+            "Validación": "No, la validación viene después del entrenamiento",
+            "Recolección de datos": "No, eso es el primer paso"
         },
-        {
-            "title": "🧠 Secuencia de Procesamiento de Datos",
-            "story": "MEMORIZA esta secuencia de procesamiento:\n\n1️⃣ Recolección de datos\n2️⃣ Limpieza de datos\n3️⃣ Análisis exploratorio\n4️⃣ Entrenamiento del modelo\n5️⃣ Validación\n6️⃣ Implementación\n\n❓ ¿Qué paso viene DESPUÉS de 'Análisis exploratorio'?",
-            "options": {
-                "Limpieza de datos": "No, eso viene antes del análisis",
-                "Entrenamiento del modelo": "¡Correcto! Después del análisis viene el entrenamiento",
-                "Validación": "No, la validación viene después del entrenamiento",
-                "Recolección de datos": "No, eso es el primer paso"
-            },
-            "answer": "Entrenamiento del modelo"
+        "answer": "Entrenamiento del modelo"
+    },
+)
+
+LOGIC_PUZZLES: Tuple[Dict[str, Any], ...] = (
+    {
+        "title": "🧩 Rompecabezas: Conecta los Conceptos",
+        "story": "🔗 DESAFÍO DE LÓGICA:\n\nTienes estos elementos de un sistema de IA:\n• Datos de entrada\n• Algoritmo de procesamiento  \n• Modelo entrenado\n• Predicción de salida\n\n🤔 ¿Cuál es el ORDEN CORRECTO del flujo de información?",
+        "options": {
+            "Datos → Algoritmo → Modelo → Predicción": "¡Perfecto! Este es el flujo lógico correcto de la IA",
+            "Algoritmo → Datos → Predicción → Modelo": "No, los datos deben procesarse antes de generar predicciones",
+            "Modelo → Datos → Algoritmo → Predicción": "No, el modelo se crea después de procesar los datos",
+            "Predicción → Modelo → Datos → Algoritmo": "No, las predicciones son el resultado final"
+        },
+        "answer": "Datos → Algoritmo → Modelo → Predicción"
+    },
+    {
+        "title": "🕸️ Red Neuronal: Conecta las Capas",
+        "story": "🧠 PUZZLE DE ARQUITECTURA:\n\nUna red neuronal tiene estas capas:\n• Capa de entrada (Input)\n• Capa oculta 1\n• Capa oculta 2  \n• Capa de salida (Output)\n\n⚡ ¿Cómo fluye la información en una red neuronal?",
+        "options": {
+            "Input → Oculta1 → Oculta2 → Output": "¡Excelente! La información fluye hacia adelante capa por capa",
+            "Output → Oculta2 → Oculta1 → Input": "No, esto sería flujo hacia atrás (backpropagation)",
+            "Input → Output → Oculta1 → Oculta2": "No, las capas ocultas procesan antes de la salida",
+            "Todas las capas se conectan entre sí": "No, en redes feedforward el flujo es secuencial"
+        },
+        "answer": "Input → Oculta1 → Oculta2 → Output"
+    },
+)
+
+RIDDLE_PUZZLES: Tuple[Dict[str, Any], ...] = (
+    {
+        "title": "🎭 Acertijo: ¿Qué soy?",
+        "story": "🤔 ADIVINANZA DE IA:\n\n'Soy un proceso que aprende de la experiencia,\nno me programan directamente con reglas,\nmejoro mi rendimiento con más datos,\ny puedo hacer predicciones sobre el futuro.\n\n¿Qué soy?'",
+        "options": {
+            "Una base de datos": "No, las bases de datos solo almacenan información",
+            "Machine Learning": "¡Correcto! El ML aprende de datos sin programación explícita",
+            "Un programa tradicional": "No, los programas tradicionales siguen reglas fijas",
+            "Internet": "No, Internet es una red de comunicación"
+        },
+        "answer": "Machine Learning"
+    },
+    {
+        "title": "🎭 Acertijo: El Cerebro Artificial",
+        "story": "🧠 ADIVINANZA NEURONAL:\n\n'Tengo capas como una cebolla,\nneuronas como un cerebro,\npero soy completamente artificial.\nProceso información en paralelo,\ny aprendo ajustando mis conexiones.\n\n¿Qué soy?'",
+        "options": {
+            "Una computadora normal": "No, las computadoras normales no tienen 'neuronas'",
+            "Una red neuronal artificial": "¡Perfecto! Las redes neuronales imitan el cerebro con capas",
+            "Un algoritmo simple": "No, los algoritmos simples no tienen estructura neuronal",
+            "Un robot": "No, un robot es el hardware, no la arquitectura de procesamiento"
+        },
+        "answer": "Una red neuronal artificial"
+    },
+)
+
+PATTERN_PUZZLES: Tuple[Dict[str, Any], ...] = (
+    {
+        "title": "🔍 Patrón: Complejidad Algorítmica",
+        "story": "📈 SECUENCIA DE COMPLEJIDAD:\n\nObserva esta secuencia de eficiencia algorítmica:\nO(1) → O(log n) → O(n) → O(n log n) → ?\n\n🧮 ¿Qué sigue en el patrón de complejidad computacional?",
+        "options": {
+            "O(n²)": "¡Correcto! Sigue la progresión: constante, log, lineal, n log n, cuadrática",
+            "O(2n)": "No, O(2n) es equivalente a O(n), no sigue la progresión",
+            "O(n!)": "No, factorial es mucho más complejo, no el siguiente paso",
+            "O(n³)": "No, cúbica viene después de cuadrática"
+        },
+        "answer": "O(n²)"
+    },
+    {
+        "title": "🌊 Patrón: Flujo de Datos",
+        "story": "🔄 PIPELINE DE PROCESAMIENTO:\n\nSigue este flujo típico de datos en IA:\nInput → Preprocessing → Feature Extraction → ?\n\n🎯 ¿Cuál es el siguiente paso lógico en el pipeline?",
+        "options": {
+            "Model Training": "¡Excelente! Después de extraer características viene el entrenamiento",
+            "Data Storage": "No, el almacenamiento no es el siguiente paso del procesamiento",
+            "User Interface": "No, la interfaz es para mostrar resultados finales",
+            "Error Handling": "No, el manejo de errores es transversal, no un paso específico"
+        },
+        "answer": "Model Training"
+    },
+)
+
+PUZZLE_DATA: Dict[str, Tuple[Dict[str, Any], ...]] = {
+    "memory": MEMORY_PUZZLES,
+    "logic": LOGIC_PUZZLES,
+    "riddle": RIDDLE_PUZZLES,
+    "pattern": PATTERN_PUZZLES,
+}
+
+# Orden de tipos que usa get_random_puzzle (mission_num % 4)
+PUZZLE_TYPE_ORDER: Tuple[str, ...] = ("memory", "logic", "riddle", "pattern")
+
+
+def validate_puzzle_data(puzzle_data: Dict[str, Tuple[Dict[str, Any], ...]]) -> List[str]:
+    """
+    Valida la estructura de los datos de puzzles.
+
+    Args:
+        puzzle_data: Tipo -> tupla de puzzles en diccionario
+
+    Returns:
+        Lista de errores (vacía si todo es válido)
+    """
+    errors = []
+    for puzzle_type, puzzles in puzzle_data.items():
+        if not puzzles:
+            errors.append(f"{puzzle_type}: sin puzzles")
+        for index, data in enumerate(puzzles):
+            where = f"{puzzle_type}[{index}]"
+            for field in ("title", "story", "options", "answer"):
+                if not data.get(field):
+                    errors.append(f"{where}: falta '{field}'")
+            options = data.get("options") or {}
+            if len(options) < 2:
+                errors.append(f"{where}: se necesitan al menos 2 opciones")
+            if data.get("answer") not in options:
+                errors.append(f"{where}: la respuesta no está entre las opciones")
+    return errors
+
+
+class PuzzleCatalog:
+    """
+    Catálogo de puzzles construido una sola vez.
+
+    Guarda instancias SimplePuzzle validadas e inmutables por tipo y por
+    posición, con el feedback de cada opción ya calculado: servir un
+    puzzle o validar una respuesta es una búsqueda en diccionario.
+    """
+
+    def __init__(self, puzzle_data: Optional[Dict[str, Tuple[Dict[str, Any], ...]]] = None):
+        """
+        Construye el catálogo.
+
+        Args:
+            puzzle_data: Tipo -> tupla de puzzles (usa PUZZLE_DATA si es None)
+
+        Raises:
+            ValueError: Si los datos no son válidos
+        """
+        puzzle_data = PUZZLE_DATA if puzzle_data is None else puzzle_data
+        errors = validate_puzzle_data(puzzle_data)
+        if errors:
+            raise ValueError("Datos de puzzles inválidos: " + "; ".join(errors))
+        self.by_type: Dict[str, Tuple[SimplePuzzle, ...]] = {
+            puzzle_type: tuple(
+                SimplePuzzle(
+                    title=data["title"],
+                    story=data["story"],
+                    options=data["options"],
+                    answer=data["answer"],
+                    puzzle_type=puzzle_type,
+                    hints=data.get("hints"),
+                ).freeze()
+                for data in puzzles
+            )
+            for puzzle_type, puzzles in puzzle_data.items()
         }
-    ]
-    
-    puzzle_data = memory_puzzles[mission_num % len(memory_puzzles)]
-    return SimplePuzzle(
-        title=puzzle_data["title"],
-        story=puzzle_data["story"],
-        options=puzzle_data["options"],
-        answer=puzzle_data["answer"],
-        puzzle_type="memory"
-    )
+        # Ciclo completo de get_random_puzzle: mission_num % len(_cycle)
+        # cubre todas las combinaciones (tipo, posición) posibles
+        type_order = [t for t in PUZZLE_TYPE_ORDER if t in self.by_type]
+        period = len(type_order)
+        for puzzles in self.by_type.values():
+            period = _lcm(period, len(puzzles))
+        self._cycle: Tuple[SimplePuzzle, ...] = tuple(
+            self.get(type_order[m % len(type_order)], m) for m in range(period)
+        )
+
+    def get(self, puzzle_type: str, mission_num: int) -> SimplePuzzle:
+        """
+        Obtiene el puzzle de un tipo para una misión.
+
+        Args:
+            puzzle_type: "memory", "logic", "riddle" o "pattern"
+            mission_num: Número de misión
+
+        Returns:
+            Puzzle compartido e inmutable
+        """
+        puzzles = self.by_type[puzzle_type]
+        return puzzles[mission_num % len(puzzles)]
+
+    def for_mission(self, mission_num: int) -> SimplePuzzle:
+        """Puzzle que corresponde a una misión (tipo según mission_num % 4)."""
+        return self._cycle[mission_num % len(self._cycle)]
+
+    def __len__(self) -> int:
+        return sum(len(puzzles) for puzzles in self.by_type.values())
+
+
+def _lcm(a: int, b: int) -> int:
+    """Mínimo común múltiplo."""
+    return a * b // math.gcd(a, b)
+
+
+_catalog: Optional[PuzzleCatalog] = None
+
+
+def get_puzzle_catalog() -> PuzzleCatalog:
+    """Obtiene el catálogo de puzzles compartido (se construye en la primera llamada)."""
+    global _catalog
+    if _catalog is None:
+        _catalog = PuzzleCatalog()
+    return _catalog
+
+def create_memory_puzzle(mission_num: int) -> SimplePuzzle:
+    """Crea un puzzle de memoria."""
+    return get_puzzle_catalog().get("memory", mission_num)
 
 def create_logic_puzzle(mission_num: int) -> SimplePuzzle:
     """Crea un puzzle de lógica."""
-    logic_puzzles = [
-        {
-            "title": "🧩 Rompecabezas: Conecta los Conceptos",
-            "story": "🔗 DESAFÍO DE LÓGICA:\n\nTienes estos elementos de un sistema de IA:\n• Datos de entrada\n• Algoritmo de procesamiento  \n• Modelo entrenado\n• Predicción de salida\n\n🤔 ¿Cuál es el ORDEN CORRECTO del flujo de información?",
-            "options": {
-                "Datos → Algoritmo → Modelo → Predicción": "¡Perfecto! Este es el flujo lógico correcto de la IA",
-                "Algoritmo → Datos → Predicción → Modelo": "No, los datos deben procesarse antes de generar predicciones",
-                "Modelo → Datos → Algoritmo → Predicción": "No, el modelo se crea después de procesar los datos",
-                "Predicción → Modelo → Datos → Algoritmo": "No, las predicciones son el resultado final"
-            },
-            "answer": "Datos → Algoritmo → Modelo → Predicción"
-        },
-        {
-            "title": "🕸️ Red Neuronal: Conecta las Capas",
-            "story": "🧠 PUZZLE DE ARQUITECTURA:\n\nUna red neuronal tiene estas capas:\n• Capa de entrada (Input)\n• Capa oculta 1\n• Capa oculta 2  \n• Capa de salida (Output)\n\n⚡ ¿Cómo fluye la información en una red neuronal?",
-            "options": {
-                "Input → Oculta1 → Oculta2 → Output": "¡Excelente! La información fluye hacia adelante capa por capa",
-                "Output → Oculta2 → Oculta1 → Input": "No, esto sería flujo hacia atrás (backpropagation)",
-                "Input → Output → Oculta1 → Oculta2": "No, las capas ocultas procesan antes de la salida",
-                "Todas las capas se conectan entre sí": "No, en redes feedforward el flujo es secuencial"
-            },
-            "answer": "Input → Oculta1 → Oculta2 → Output"
-        }
-    ]
-    
-    puzzle_data = logic_puzzles[mission_num % len(logic_puzzles)]
-    return SimplePuzzle(
-        title=puzzle_data["title"],
-        story=puzzle_data["story"],
-        options=puzzle_data["options"],
-        answer=puzzle_data["answer"],
-        puzzle_type="logic"
-    )
+    return get_puzzle_catalog().get("logic", mission_num)
 
 def create_riddle_puzzle(mission_num: int) -> SimplePuzzle:
     """Crea un acertijo."""
-    riddles = [
-        {
-            "title": "🎭 Acertijo: ¿Qué soy?",
-            "story": "🤔 ADIVINANZA DE IA:\n\n'Soy un proceso que aprende de la experiencia,\nno me programan directamente con reglas,\nmejoro mi rendimiento con más datos,\ny puedo hacer predicciones sobre el futuro.\n\n¿Qué soy?'",
-            "options": {
-                "Una base de datos": "No, las bases de datos solo almacenan información",
-                "Machine Learning": "¡Correcto! El ML aprende de datos sin programación explícita",
-                "Un programa tradicional": "No, los programas tradicionales siguen reglas fijas",
-                "Internet": "No, Internet es una red de comunicación"
-            },
-            "answer": "Machine Learning"
-        },
-        {
-            "title": "🎭 Acertijo: El Cerebro Artificial",
-            "story": "🧠 ADIVINANZA NEURONAL:\n\n'Tengo capas como una cebolla,\nneuronas como un cerebro,\npero soy completamente artificial.\nProceso información en paralelo,\ny aprendo ajustando mis conexiones.\n\n¿Qué soy?'",
-            "options": {
-                "Una computadora normal": "No, las computadoras normales no tienen 'neuronas'",
-                "Una red neuronal artificial": "¡Perfecto! Las redes neuronales imitan el cerebro con capas",
-                "Un algoritmo simple": "No, los algoritmos simples no tienen estructura neuronal",
-                "Un robot": "No, un robot es el hardware, no la arquitectura de procesamiento"
-            },
-            "answer": "Una red neuronal artificial"
-        }
-    ]
-    
-    riddle_data = riddles[mission_num % len(riddles)]
-    return SimplePuzzle(
-        title=riddle_data["title"],
-        story=riddle_data["story"],
-        options=riddle_data["options"],
-        answer=riddle_data["answer"],
-        puzzle_type="riddle"
-    )
+    return get_puzzle_catalog().get("riddle", mission_num)
 
 def create_pattern_puzzle(mission_num: int) -> SimplePuzzle:
     """Crea un puzzle de patrones."""
-    patterns = [
-        {
-            "title": "🔍 Patrón: Complejidad Algorítmica",
-            "story": "📈 SECUENCIA DE COMPLEJIDAD:\n\nObserva esta secuencia de eficiencia algorítmica:\nO(1) → O(log n) → O(n) → O(n log n) → ?\n\n🧮 ¿Qué sigue en el patrón de complejidad computacional?",
-            "options": {
-                "O(n²)": "¡Correcto! Sigue la progresión: constante, log, lineal, n log n, cuadrática",
-                "O(2n)": "No, O(2n) es equivalente a O(n), no sigue la progresión",
-                "O(n!)": "No, factorial es mucho más complejo, no el siguiente paso",
-                "O(n³)": "No, cúbica viene después de cuadrática"
-            },
-            "answer": "O(n²)"
-        },
-        {
-            "title": "🌊 Patrón: Flujo de Datos",
-            "story": "🔄 PIPELINE DE PROCESAMIENTO:\n\nSigue este flujo típico de datos en IA:\nInput → Preprocessing → Feature Extraction → ?\n\n🎯 ¿Cuál es el siguiente paso lógico en el pipeline?",
-            "options": {
-                "Model Training": "¡Excelente! Después de extraer características viene el entrenamiento",
-                "Data Storage": "No, el almacenamiento no es el siguiente paso del procesamiento",
-                "User Interface": "No, la interfaz es para mostrar resultados finales",
-                "Error Handling": "No, el manejo de errores es transversal, no un paso específico"
-            },
-            "answer": "Model Training"
-        }
-    ]
-    
-    pattern_data = patterns[mission_num % len(patterns)]
-    return SimplePuzzle(
-        title=pattern_data["title"],
-        story=pattern_data["story"],
-        options=pattern_data["options"],
-        answer=pattern_data["answer"],
-        puzzle_type="pattern"
-    )
+    return get_puzzle_catalog().get("pattern", mission_num)
 
 def get_random_puzzle(mission_num: int) -> SimplePuzzle:
     """Obtiene un puzzle aleatorio."""
-    puzzle_types = [
-        create_memory_puzzle,
-        create_logic_puzzle, 
-        create_riddle_puzzle,
-        create_pattern_puzzle
-    ]
-    
     # Usar el número de misión para determinismo pero con variedad
-    puzzle_creator = puzzle_types[mission_num % len(puzzle_types)]
-    return puzzle_creator(mission_num)
+    return get_puzzle_catalog().for_mission(mission_num)
 
 def validate_puzzle_answer(puzzle: SimplePuzzle, user_answer: str) -> tuple[bool, str]:
     """Valida la respuesta del puzzle."""
+    if puzzle.feedback is not None and user_answer in puzzle.feedback:
+        return puzzle.feedback[user_answer]
+    return user_answer == puzzle.answer, _build_feedback(puzzle, user_answer)
+
+def _build_feedback(puzzle: SimplePuzzle, user_answer: str) -> str:
+    """Construye el texto de feedback para una respuesta."""
     is_correct = user_answer == puzzle.answer
     
     if is_correct:
@@ -191,4 +311,4 @@ def validate_puzzle_answer(puzzle: SimplePuzzle, user_answer: str) -> tuple[bool
         feedback += f"💡 Explicación: {puzzle.options[puzzle.answer]}\n\n"
         feedback += "💪 ¡Los puzzles mentales requieren práctica!"
     
-    return is_correct, feedback
\ No newline at end of file
+    return feedback
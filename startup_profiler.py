@@ -0,0 +1,350 @@
+"""
+Startup Profiler Module - Proyecto Alpha v4.0
+Perfil de arranque: coste de importación por módulo, fases de inicio y presupuestos.
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# subprocess y argparse se importan dentro de las funciones que los usan:
+# este módulo se carga en cada arranque y no debe encarecerlo.
+from config import DIAGNOSTICS_CONFIG
+from storage import save_json, load_json
+
+# Variable de entorno que activa el perfilado sin tocar config.py
+PROFILE_ENV_VAR = "ALPHA_STARTUP_PROFILE"
+
+STARTUP_PHASES = ("load_system_config", "load_progress", "_setup_ui", "first_paint")
+
+logger = logging.getLogger("StartupProfiler")
+
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """
+    Interpreta la salida de `python -X importtime`.
+
+    Args:
+        output: Texto de stderr con líneas "import time: self | cumulative | módulo"
+
+    Returns:
+        Lista de registros con module, self_ms, cumulative_ms y depth
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0])
+            cumulative_us = int(parts[1])
+        except ValueError:
+            continue  # Cabecera "self [us] | cumulative | imported package"
+        name_field = parts[2]
+        stripped = name_field.lstrip(" ")
+        # Un espacio de separación y dos por nivel de anidamiento
+        depth = max(0, (len(name_field) - len(stripped) - 1) // 2)
+        records.append({
+            "module": stripped.strip(),
+            "self_ms": self_us / 1000.0,
+            "cumulative_ms": cumulative_us / 1000.0,
+            "depth": depth,
+        })
+    return records
+
+
+def measure_imports(module: str = "game_controller",
+                    python: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Mide el coste de importar un módulo en un intérprete nuevo.
+
+    Args:
+        module: Módulo de entrada a importar
+        python: Intérprete a usar (por defecto, el actual)
+
+    Returns:
+        Diccionario con total_ms y la lista de registros por módulo
+    """
+    import subprocess
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=base_dir, capture_output=True, text=True, timeout=120)
+    records = parse_importtime(result.stderr)
+    if result.returncode != 0:
+        raise RuntimeError(f"No se pudo importar {module}: {result.stderr.strip().splitlines()[-1:]}")
+    total_ms = sum(r["cumulative_ms"] for r in records if r["depth"] == 0)
+    return {"entry_module": module, "total_ms": total_ms, "modules": records}
+
+
+class StartupProfiler:
+    """
+    Cronómetro de fases de arranque.
+
+    Desactivado, `phase()` no mide nada; el coste para el arranque normal
+    es una comprobación booleana por fase.
+    """
+
+    def __init__(self, enabled: bool = False, clock: Callable[[], float] = time.perf_counter):
+        self.enabled = enabled
+        self.clock = clock
+        self.start_time = clock()
+        self.phases: Dict[str, float] = {}
+        self._first_paint_callbacks: List[Callable[[], Any]] = []
+
+    def enable(self) -> None:
+        """Activa el perfilado y reinicia el origen de tiempos."""
+        self.enabled = True
+        self.start_time = self.clock()
+        self.phases.clear()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Mide la duración de una fase de arranque.
+
+        Args:
+            name: Nombre de la fase
+        """
+        if not self.enabled:
+            yield
+            return
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (self.clock() - start) * 1000.0
+
+    def watch_first_paint(self, root, on_paint: Optional[Callable[[], Any]] = None) -> None:
+        """
+        Registra el primer pintado de la ventana.
+
+        Tk dibuja en tareas de inactividad, así que la primera llamada
+        after_idle tras construir la interfaz marca el primer frame visible.
+        La fase first_paint es el tiempo desde el inicio del perfilado.
+
+        Args:
+            root: Ventana Tk principal
+            on_paint: Función opcional a llamar tras registrar la fase
+        """
+        if not self.enabled:
+            return
+        if on_paint:
+            self._first_paint_callbacks.append(on_paint)
+
+        def mark_paint():
+            self.phases["first_paint"] = (self.clock() - self.start_time) * 1000.0
+            callbacks, self._first_paint_callbacks = self._first_paint_callbacks, []
+            for callback in callbacks:
+                callback()
+
+        root.after_idle(mark_paint)
+
+    def report(self, imports: Optional[Dict[str, Any]] = None, top: int = 15) -> Dict[str, Any]:
+        """
+        Construye el informe de arranque.
+
+        Args:
+            imports: Resultado de measure_imports (opcional)
+            top: Número de módulos más costosos a incluir
+
+        Returns:
+            Diccionario serializable a JSON
+        """
+        report: Dict[str, Any] = {"phases_ms": dict(self.phases)}
+        if imports is not None:
+            modules = imports["modules"]
+            report["imports"] = {
+                "entry_module": imports["entry_module"],
+                "total_ms": imports["total_ms"],
+                "module_count": len(modules),
+                "top_cumulative": sorted(modules, key=lambda r: r["cumulative_ms"], reverse=True)[:top],
+                "top_self": sorted(modules, key=lambda r: r["self_ms"], reverse=True)[:top],
+                "modules_ms": {r["module"]: r["cumulative_ms"] for r in modules},
+            }
+        return report
+
+    def save_report(self, path: Optional[str] = None, imports: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Guarda el informe en disco.
+
+        Args:
+            path: Ruta destino (usa DIAGNOSTICS_CONFIG si es None)
+            imports: Resultado de measure_imports (opcional)
+
+        Returns:
+            Ruta escrita
+        """
+        path = path or DIAGNOSTICS_CONFIG["startup_report_file"]
+        save_json(path, self.report(imports), compression="none")
+        return path
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """
+    Da formato legible a un informe de arranque.
+
+    Args:
+        report: Informe generado por StartupProfiler.report
+
+    Returns:
+        Texto multilínea
+    """
+    lines = ["🚀 INFORME DE ARRANQUE"]
+    imports = report.get("imports")
+    if imports:
+        lines.append(f"\n📦 Importación de '{imports['entry_module']}': {imports['total_ms']:.1f} ms "
+                     f"({imports['module_count']} módulos)")
+        for record in imports["top_cumulative"]:
+            lines.append(f"  {record['cumulative_ms']:8.1f} ms acumulado  {record['self_ms']:7.1f} ms propio  "
+                         f"{'  ' * record['depth']}{record['module']}")
+    phases = report.get("phases_ms") or {}
+    if phases:
+        lines.append("\n⏱️ Fases de inicio:")
+        for name in STARTUP_PHASES:
+            if name in phases:
+                lines.append(f"  {name:<20} {phases[name]:8.1f} ms")
+        for name, value in phases.items():
+            if name not in STARTUP_PHASES:
+                lines.append(f"  {name:<20} {value:8.1f} ms")
+    return "\n".join(lines)
+
+
+def check_budget(report: Dict[str, Any], budget: Dict[str, Any]) -> List[str]:
+    """
+    Compara un informe con un presupuesto de arranque.
+
+    Formato del presupuesto::
+
+        {"total_import_ms": 400,
+         "modules": {"missions": 20},
+         "phases": {"_setup_ui": 150, "first_paint": 600}}
+
+    Las métricas ausentes en el informe (por ejemplo, fases sin pantalla)
+    no se evalúan.
+
+    Args:
+        report: Informe generado por StartupProfiler.report
+        budget: Límites en milisegundos
+
+    Returns:
+        Lista de incumplimientos (vacía si todo está dentro del presupuesto)
+    """
+    violations = []
+    imports = report.get("imports") or {}
+    limit = budget.get("total_import_ms")
+    if limit is not None and "total_ms" in imports and imports["total_ms"] > limit:
+        violations.append(f"importación total {imports['total_ms']:.1f} ms > {limit} ms")
+
+    modules_ms = imports.get("modules_ms", {})
+    for module, limit in budget.get("modules", {}).items():
+        if module in modules_ms and modules_ms[module] > limit:
+            violations.append(f"módulo {module} {modules_ms[module]:.1f} ms > {limit} ms")
+
+    phases = report.get("phases_ms") or {}
+    for name, limit in budget.get("phases", {}).items():
+        if name in phases and phases[name] > limit:
+            violations.append(f"fase {name} {phases[name]:.1f} ms > {limit} ms")
+    return violations
+
+
+_PHASE_PROBE = (
+    "import json, sys, time\n"
+    "import startup_profiler\n"
+    "profiler = startup_profiler.get_profiler()\n"
+    "profiler.enable()\n"
+    "import tkinter as tk\n"
+    "from game_controller import GameController\n"
+    "root = tk.Tk()\n"
+    "GameController(root)\n"
+    "def done():\n"
+    "    print(json.dumps(profiler.phases))\n"
+    "    root.after(0, root.destroy)\n"
+    "profiler.watch_first_paint(root, done)\n"
+    "root.mainloop()\n"
+)
+
+
+def measure_phases(python: Optional[str] = None) -> Dict[str, float]:
+    """
+    Arranca el juego en un proceso aparte y mide sus fases hasta el primer pintado.
+
+    Args:
+        python: Intérprete a usar (por defecto, el actual)
+
+    Returns:
+        Fase -> milisegundos (vacío si no hay pantalla disponible)
+    """
+    import subprocess
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    try:
+        result = subprocess.run([python or sys.executable, "-c", _PHASE_PROBE], cwd=base_dir,
+                                capture_output=True, text=True, timeout=120)
+        lines = result.stdout.strip().splitlines()
+        if result.returncode == 0 and lines:
+            return json.loads(lines[-1])
+        logger.warning(f"No se pudieron medir las fases: {result.stderr.strip().splitlines()[-1:]}")
+    except Exception as e:
+        logger.warning(f"No se pudieron medir las fases: {e}")
+    return {}
+
+
+_profiler: Optional[StartupProfiler] = None
+
+
+def get_profiler() -> StartupProfiler:
+    """Obtiene el perfilador de arranque compartido del proceso."""
+    global _profiler
+    if _profiler is None:
+        enabled = bool(DIAGNOSTICS_CONFIG.get("startup_profiling")) or os.environ.get(PROFILE_ENV_VAR) == "1"
+        _profiler = StartupProfiler(enabled=enabled)
+    return _profiler
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de línea de comandos.
+
+    Returns:
+        0 si el arranque cumple el presupuesto, 1 en caso contrario
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Perfil de arranque del Proyecto Alpha")
+    parser.add_argument("--module", default="game_controller", help="Módulo de entrada a importar")
+    parser.add_argument("--phases", action="store_true", help="Medir también las fases de inicio (requiere pantalla)")
+    parser.add_argument("--budget", default=DIAGNOSTICS_CONFIG.get("startup_budget_file"),
+                        help="Archivo JSON con el presupuesto de arranque")
+    parser.add_argument("--output", help="Guardar el informe JSON en esta ruta")
+    args = parser.parse_args(argv)
+
+    profiler = StartupProfiler(enabled=True)
+    imports = measure_imports(args.module)
+    if args.phases:
+        profiler.phases.update(measure_phases())
+    report = profiler.report(imports)
+    print(format_report(report))
+
+    if args.output:
+        save_json(args.output, report, compression="none")
+
+    if args.budget:
+        violations = check_budget(report, load_json(args.budget))
+        if violations:
+            print("\n❌ Presupuesto de arranque superado:")
+            for violation in violations:
+                print(f"  • {violation}")
+            return 1
+        print("\n✅ Arranque dentro del presupuesto")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,511 @@
+"""
+Static Export Module - Proyecto Alpha v4.0
+Exportación incremental del banco de preguntas, las misiones y los puzzles a un paquete HTML/JS estático.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from answer_key import compile_item
+from config import STATIC_EXPORT_CONFIG
+
+# Cambiar al modificar el formato de los fragmentos o el runtime: fuerza una exportación completa
+EXPORT_FORMAT = 1
+
+STATE_FILE = ".export_state.json"
+SHARD_DIR = "shards"
+
+# Grupos del selector de categorías del runtime
+GROUP_QUESTIONS = "preguntas"
+GROUP_MISSIONS = "misiones"
+GROUP_PUZZLES = "puzzles"
+
+_SLUG_CHARS = re.compile(r"[^a-z0-9]+")
+
+
+class Shard(NamedTuple):
+    """Fragmento de preguntas de una categoría."""
+
+    shard_id: str
+    group: str
+    label: str
+    items: List[Dict[str, Any]]
+
+
+class ExportReport(NamedTuple):
+    """Resultado de una exportación."""
+
+    written: int
+    skipped: int
+    removed: int
+    sources_rebuilt: List[str]
+    shards: int
+
+
+def slugify(text: str) -> str:
+    """Identificador ASCII para nombres de archivo."""
+    import unicodedata
+
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return _SLUG_CHARS.sub("-", ascii_text.lower()).strip("-") or "categoria"
+
+
+def _item(prompt: str, options: Iterable[str], answer: str, concept: str, title: str = "") -> Dict[str, Any]:
+    """
+    Ítem compacto del runtime.
+
+    La respuesta se guarda como índice canónico (la misma compilación que
+    usa la corrección en Python) y `c` es el texto del modo estudio.
+    """
+    compiled = compile_item(prompt, options, answer, str)
+    item = {"q": prompt, "o": list(compiled.options), "a": compiled.correct_index, "c": concept}
+    if title:
+        item["t"] = title
+    return item
+
+
+def question_shards(questions: List[Dict[str, Any]]) -> List[Shard]:
+    """Un fragmento por categoría de questions_data.json."""
+    by_category: Dict[str, List[Dict[str, Any]]] = {}
+    for data in questions:
+        try:
+            item = _item(data["question"], data["options"], data["answer"], data.get("formula", ""))
+        except (KeyError, ValueError):
+            continue
+        by_category.setdefault(data.get("category", "General"), []).append(item)
+    return [Shard(f"{GROUP_QUESTIONS}-{slugify(category)}", GROUP_QUESTIONS, category, items)
+            for category, items in sorted(by_category.items())]
+
+
+def mission_shards(missions: Dict[int, Dict[str, Any]]) -> List[Shard]:
+    """Las misiones con más de una opción, en orden."""
+    items = []
+    for mission_id in sorted(missions):
+        mission = missions[mission_id]
+        if len(mission.get("options", {})) < 2:
+            continue
+        concept = mission.get("explanation") or mission["options"].get(mission["answer"], "")
+        items.append(_item(mission["story"], mission["options"], mission["answer"], concept, mission["title"]))
+    return [Shard(GROUP_MISSIONS, GROUP_MISSIONS, "Misiones de IA", items)] if items else []
+
+
+def puzzle_shards(catalog) -> List[Shard]:
+    """Un fragmento por tipo de puzzle del catálogo."""
+    from simple_puzzles import PUZZLE_TYPE_ORDER
+
+    shards = []
+    for puzzle_type in PUZZLE_TYPE_ORDER:
+        puzzles = catalog.by_type.get(puzzle_type, ())
+        items = [_item(p.story, p.options, p.answer, p.options[p.answer], p.title) for p in puzzles]
+        if items:
+            shards.append(Shard(f"{GROUP_PUZZLES}-{puzzle_type}", GROUP_PUZZLES,
+                                f"Puzzles: {puzzle_type.title()}", items))
+    return shards
+
+
+def encode_shard(shard: Shard) -> bytes:
+    """Fragmento minificado, envuelto para cargarse con <script> también desde file://."""
+    payload = json.dumps({"id": shard.shard_id, "items": shard.items},
+                         ensure_ascii=False, separators=(",", ":"))
+    return f"AlphaQuiz.loadShard({payload});\n".encode("utf-8")
+
+
+def _fingerprint(paths: Iterable[str]) -> str:
+    """Huella barata (tamaño y fecha) de los archivos de los que sale una fuente."""
+    parts = [str(EXPORT_FORMAT)]
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            parts.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{path}:-")
+    return "|".join(parts)
+
+
+def _module_path(name: str) -> str:
+    import importlib
+
+    return importlib.import_module(name).__file__
+
+
+class Source(NamedTuple):
+    """Origen de fragmentos: archivos de los que depende y cómo construirlos."""
+
+    name: str
+    paths: Callable[[], List[str]]
+    build: Callable[[], List[Shard]]
+
+
+def default_sources(questions_file: str) -> List[Source]:
+    """Banco de preguntas, MISSIONS y catálogo de puzzles."""
+    from storage import load_json
+
+    def build_questions() -> List[Shard]:
+        return question_shards(load_json(questions_file)) if os.path.exists(questions_file) else []
+
+    def build_missions() -> List[Shard]:
+        from missions import MISSIONS
+
+        return mission_shards(MISSIONS)
+
+    def build_puzzles() -> List[Shard]:
+        from simple_puzzles import get_puzzle_catalog
+
+        return puzzle_shards(get_puzzle_catalog())
+
+    return [
+        Source("questions", lambda: [questions_file], build_questions),
+        Source("missions", lambda: [_module_path("missions")], build_missions),
+        Source("puzzles", lambda: [_module_path("simple_puzzles")], build_puzzles),
+    ]
+
+
+def _write_if_changed(path: str, payload: bytes) -> bool:
+    """Escribe sólo si el contenido cambia (conserva fechas y cachés del navegador)."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == payload:
+                return False
+    except OSError:
+        pass
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return True
+
+
+class StaticExporter:
+    """
+    Exportador incremental a un paquete estático.
+
+    Cada fuente tiene una huella (tamaño y fecha de sus archivos); si no
+    cambió y sus fragmentos siguen en disco, ni siquiera se vuelve a leer.
+    Cuando hay que reconstruirla, cada fragmento se nombra por el hash de
+    su contenido y sólo se escriben los que no existen. Los fragmentos que
+    ya no aparecen en el manifiesto se borran.
+    """
+
+    def __init__(self, output_dir: Optional[str] = None, sources: Optional[List[Source]] = None,
+                 force: bool = False):
+        """
+        Inicializa el exportador.
+
+        Args:
+            output_dir: Carpeta del paquete (STATIC_EXPORT_CONFIG si es None)
+            sources: Orígenes de los fragmentos (banco, misiones y puzzles si es None)
+            force: Reconstruir todas las fuentes aunque no hayan cambiado
+        """
+        self.output_dir = output_dir or STATIC_EXPORT_CONFIG.get("output_dir", "web_export")
+        self.sources = sources if sources is not None else \
+            default_sources(STATIC_EXPORT_CONFIG.get("questions_file", "questions_data.json"))
+        self.force = force
+
+    def _load_state(self) -> Dict[str, Any]:
+        path = os.path.join(self.output_dir, STATE_FILE)
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("format") == EXPORT_FORMAT:
+                return state
+        except (OSError, ValueError):
+            pass
+        return {"format": EXPORT_FORMAT, "sources": {}}
+
+    def _files_exist(self, entries: List[Dict[str, Any]]) -> bool:
+        return all(os.path.exists(os.path.join(self.output_dir, entry["file"])) for entry in entries)
+
+    def export(self) -> ExportReport:
+        """
+        Genera o actualiza el paquete.
+
+        Returns:
+            ExportReport con lo escrito, lo reutilizado y lo borrado
+        """
+        shard_dir = os.path.join(self.output_dir, SHARD_DIR)
+        os.makedirs(shard_dir, exist_ok=True)
+        state = self._load_state()
+        new_sources: Dict[str, Any] = {}
+        written = skipped = 0
+        rebuilt: List[str] = []
+
+        for source in self.sources:
+            fingerprint = _fingerprint(source.paths())
+            previous = state["sources"].get(source.name)
+            if not self.force and previous and previous["fingerprint"] == fingerprint \
+                    and self._files_exist(previous["shards"]):
+                new_sources[source.name] = previous
+                skipped += len(previous["shards"])
+                continue
+            rebuilt.append(source.name)
+            entries = []
+            for shard in source.build():
+                payload = encode_shard(shard)
+                digest = hashlib.sha1(payload).hexdigest()[:10]
+                relative = f"{SHARD_DIR}/{slugify(shard.shard_id)}.{digest}.js"
+                path = os.path.join(self.output_dir, relative)
+                if os.path.exists(path):
+                    skipped += 1
+                else:
+                    _write_if_changed(path, payload)
+                    written += 1
+                entries.append({"id": shard.shard_id, "group": shard.group, "label": shard.label,
+                                "file": relative, "count": len(shard.items)})
+            new_sources[source.name] = {"fingerprint": fingerprint, "shards": entries}
+
+        manifest = [entry for source in self.sources for entry in new_sources[source.name]["shards"]]
+        referenced = {entry["file"] for entry in manifest}
+        removed = 0
+        for name in os.listdir(shard_dir):
+            if f"{SHARD_DIR}/{name}" not in referenced:
+                os.remove(os.path.join(shard_dir, name))
+                removed += 1
+
+        manifest_payload = json.dumps({"format": EXPORT_FORMAT, "shards": manifest},
+                                      ensure_ascii=False, separators=(",", ":"))
+        assets = {
+            "manifest.js": f"AlphaQuiz.manifest({manifest_payload});\n",
+            "index.html": INDEX_HTML,
+            "alpha_quiz.js": RUNTIME_JS,
+            "style.css": STYLE_CSS,
+        }
+        for name, text in assets.items():
+            _write_if_changed(os.path.join(self.output_dir, name), text.encode("utf-8"))
+
+        state = {"format": EXPORT_FORMAT, "sources": new_sources}
+        _write_if_changed(os.path.join(self.output_dir, STATE_FILE),
+                          json.dumps(state, ensure_ascii=False, indent=1).encode("utf-8"))
+        return ExportReport(written, skipped, removed, rebuilt, len(manifest))
+
+
+# ----------------------------------------------------------------------
+# Runtime del navegador
+# ----------------------------------------------------------------------
+
+# Reproduce QuizGame: start_quiz baraja, check_answer suma aciertos o
+# errores y compone el mismo feedback, next_question espera 3000 ms en
+# modo estudio y 1500 ms en el resto, y show_results guarda la sesión
+# (máximo 50) como StatsManager, aquí en localStorage.
+RUNTIME_JS = r"""(function (root) {
+  "use strict";
+  var MAX_SESSIONS = 50, STATS_KEY = "alpha_quiz_stats";
+  var AQ = { shards: {}, entries: [], waiting: {} };
+
+  AQ.manifest = function (data) { AQ.entries = data.shards; if (AQ.onManifest) AQ.onManifest(); };
+  AQ.loadShard = function (data) {
+    AQ.shards[data.id] = data.items;
+    var callbacks = AQ.waiting[data.id] || [];
+    delete AQ.waiting[data.id];
+    callbacks.forEach(function (cb) { cb(data.items); });
+  };
+
+  AQ.newSession = function (category, total) {
+    return { score: 0, errors: 0, total_questions: total, category: category,
+             start_time: new Date().toISOString(), end_time: null };
+  };
+
+  AQ.checkAnswer = function (session, item, optionIndex, studyMode) {
+    var correct = optionIndex === item.a, text;
+    if (correct) { session.score += 1; text = "✅ ¡Correcto!"; }
+    else { session.errors += 1; text = "❌ Incorrecto. Respuesta correcta: " + item.o[item.a]; }
+    if (studyMode) text += "\n\n💡 Concepto clave: " + item.c;
+    return { correct: correct, feedback: text, delay: studyMode ? 3000 : 1500 };
+  };
+
+  AQ.shuffle = function (items, random) {
+    var list = items.slice(), rnd = random || Math.random;
+    for (var i = list.length - 1; i > 0; i--) {
+      var j = Math.floor(rnd() * (i + 1)), tmp = list[i];
+      list[i] = list[j]; list[j] = tmp;
+    }
+    return list;
+  };
+
+  AQ.saveSession = function (session, storage) {
+    var stats;
+    try { stats = JSON.parse(storage.getItem(STATS_KEY)) || null; } catch (e) { stats = null; }
+    stats = stats || { total_games: 0, sessions: [] };
+    stats.total_games += 1;
+    stats.sessions.push(session);
+    if (stats.sessions.length > MAX_SESSIONS) stats.sessions = stats.sessions.slice(-MAX_SESSIONS);
+    storage.setItem(STATS_KEY, JSON.stringify(stats));
+    return stats;
+  };
+
+  AQ.fetchShard = function (entry, cb) {
+    if (AQ.shards[entry.id]) return cb(AQ.shards[entry.id]);
+    (AQ.waiting[entry.id] = AQ.waiting[entry.id] || []).push(cb);
+    var script = root.document.createElement("script");
+    script.src = entry.file;
+    root.document.head.appendChild(script);
+  };
+
+  AQ.fetchCategory = function (value, cb) {
+    var parts = value.split(":"), group = parts[0], id = parts[1];
+    var wanted = AQ.entries.filter(function (e) { return id ? e.id === id : e.group === group; });
+    var items = [], pending = wanted.length;
+    if (!pending) return cb(items);
+    wanted.forEach(function (entry) {
+      AQ.fetchShard(entry, function (shardItems) {
+        items = items.concat(shardItems);
+        if (--pending === 0) cb(items);
+      });
+    });
+  };
+
+  function ui() {
+    var doc = root.document, $ = function (id) { return doc.getElementById(id); };
+    var state = { questions: [], index: 0, session: null, locked: false };
+
+    function show(screen) {
+      ["start", "quiz", "results"].forEach(function (name) { $(name).hidden = name !== screen; });
+    }
+    function fillCategories() {
+      var select = $("category"), groups = {};
+      AQ.entries.forEach(function (e) { (groups[e.group] = groups[e.group] || []).push(e); });
+      Object.keys(groups).forEach(function (group) {
+        var all = doc.createElement("option");
+        all.value = group; all.textContent = "Todas: " + group;
+        select.appendChild(all);
+        groups[group].forEach(function (e) {
+          var opt = doc.createElement("option");
+          opt.value = group + ":" + e.id; opt.textContent = "  " + e.label + " (" + e.count + ")";
+          select.appendChild(opt);
+        });
+      });
+    }
+    function loadQuestion() {
+      var item = state.questions[state.index];
+      state.locked = false;
+      $("progress").textContent = "Pregunta " + (state.index + 1) + " de " + state.questions.length;
+      $("title").textContent = item.t || "";
+      $("question").textContent = item.q;
+      $("feedback").textContent = "";
+      var box = $("options");
+      box.innerHTML = "";
+      item.o.forEach(function (text, i) {
+        var button = doc.createElement("button");
+        button.textContent = text;
+        button.onclick = function () { answer(i); };
+        box.appendChild(button);
+      });
+    }
+    function answer(i) {
+      if (state.locked) return;
+      state.locked = true;
+      var result = AQ.checkAnswer(state.session, state.questions[state.index], i, $("study").checked);
+      $("feedback").textContent = result.feedback;
+      $("feedback").className = result.correct ? "ok" : "bad";
+      root.setTimeout(nextQuestion, result.delay);
+    }
+    function nextQuestion() {
+      state.index += 1;
+      if (state.index < state.questions.length) loadQuestion(); else showResults();
+    }
+    function showResults() {
+      var s = state.session;
+      s.end_time = new Date().toISOString();
+      try { AQ.saveSession(s, root.localStorage); } catch (e) { /* navegador sin almacenamiento */ }
+      $("summary").textContent = "Aciertos: " + s.score + " · Errores: " + s.errors +
+        " · Total: " + s.total_questions;
+      show("results");
+    }
+    $("start-button").onclick = function () {
+      var value = $("category").value;
+      AQ.fetchCategory(value, function (items) {
+        if (!items.length) { $("start-message").textContent = "No hay preguntas en esa categoría."; return; }
+        state.questions = AQ.shuffle(items);
+        state.index = 0;
+        state.session = AQ.newSession(value, items.length);
+        show("quiz");
+        loadQuestion();
+      });
+    };
+    $("again").onclick = function () { show("start"); };
+    fillCategories();
+    show("start");
+  }
+
+  AQ.onManifest = function () {
+    if (root.document && root.document.readyState !== "loading") ui();
+    else if (root.document) root.document.addEventListener("DOMContentLoaded", ui);
+  };
+
+  root.AlphaQuiz = AQ;
+  if (typeof module !== "undefined" && module.exports) module.exports = AQ;
+})(typeof window !== "undefined" ? window : this);
+"""
+
+INDEX_HTML = """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Proyecto Alpha - Repaso de IA</title>
+<link rel="stylesheet" href="style.css">
+</head>
+<body>
+<main>
+  <section id="start">
+    <h1>🎯 Repaso de IA</h1>
+    <label>Categoría <select id="category"></select></label>
+    <label><input type="checkbox" id="study"> Modo estudio</label>
+    <button id="start-button">Comenzar</button>
+    <p id="start-message"></p>
+  </section>
+  <section id="quiz" hidden>
+    <p id="progress"></p>
+    <h2 id="title"></h2>
+    <p id="question"></p>
+    <div id="options"></div>
+    <pre id="feedback"></pre>
+  </section>
+  <section id="results" hidden>
+    <h2>🏁 Resultados</h2>
+    <p id="summary"></p>
+    <button id="again">Volver a jugar</button>
+  </section>
+</main>
+<script src="alpha_quiz.js"></script>
+<script src="manifest.js"></script>
+</body>
+</html>
+"""
+
+STYLE_CSS = """body{font-family:system-ui,sans-serif;background:#F8FAFC;color:#111827;margin:0}
+main{max-width:760px;margin:2rem auto;padding:1rem}
+section{background:#fff;border-radius:12px;padding:1.5rem;box-shadow:0 2px 8px rgba(0,0,0,.08)}
+label{display:block;margin:.75rem 0}
+button{display:block;width:100%;margin:.5rem 0;padding:.75rem;border:0;border-radius:8px;
+background:#2563EB;color:#fff;font-size:1rem;cursor:pointer;text-align:left}
+#start-button,#again{text-align:center}
+#question{white-space:pre-line}
+pre{white-space:pre-wrap;font-family:inherit}
+.ok{color:#047857}.bad{color:#B91C1C}
+"""
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Exporta el repaso a un paquete HTML/JS estático")
+    parser.add_argument("--out", help="Carpeta de salida (por defecto STATIC_EXPORT_CONFIG)")
+    parser.add_argument("--questions", help="JSON de preguntas (por defecto STATIC_EXPORT_CONFIG)")
+    parser.add_argument("--force", action="store_true", help="Reconstruir todos los fragmentos")
+    args = parser.parse_args(argv)
+
+    sources = default_sources(args.questions) if args.questions else None
+    report = StaticExporter(args.out, sources=sources, force=args.force).export()
+    rebuilt = ", ".join(report.sources_rebuilt) or "ninguna"
+    print(f"📦 {report.shards} fragmentos: {report.written} escritos, {report.skipped} reutilizados, "
+          f"{report.removed} borrados (fuentes reconstruidas: {rebuilt})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,10 @@
-import json
 import os
 from datetime import datetime
 import logging
 
+from storage import save_json, load_json
+from logging_setup import configure_logging
+
 class StatsManager:
     """Maneja estadísticas y persistencia de datos del juego"""
     
@@ -13,22 +15,14 @@ class StatsManager:
     
     def _setup_logger(self):
         """Configura el sistema de logging"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('quiz_game.log'),
-                logging.StreamHandler()
-            ]
-        )
+        configure_logging('quiz_game.log', fmt='%(asctime)s - %(levelname)s - %(message)s')
         return logging.getLogger(__name__)
     
     def _load_stats(self):
         """Carga estadísticas desde archivo"""
         try:
             if os.path.exists(self.stats_file):
-                with open(self.stats_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return load_json(self.stats_file)
             return self._create_default_stats()
         except Exception as e:
             self.logger.error(f"Error cargando estadísticas: {e}")
@@ -74,8 +68,7 @@ class StatsManager:
     def _save_stats(self):
         """Guarda estadísticas a archivo"""
         try:
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(self.stats, f, indent=2, ensure_ascii=False)
+            save_json(self.stats_file, self.stats)
         except Exception as e:
             self.logger.error(f"Error guardando estadísticas: {e}")
     
@@ -0,0 +1,169 @@
+"""
+Storage Module - Proyecto Alpha v4.0
+Persistencia JSON con formato compacto y compresión opcional.
+"""
+
+import gzip
+import json
+import lzma
+import os
+import zlib
+from typing import Any, Dict, Optional
+
+from config import STORAGE_CONFIG
+
+# Firmas de cabecera para detectar el contenedor al leer
+GZIP_MAGIC = b"\x1f\x8b"
+LZMA_MAGIC = b"\xfd7zXZ\x00"
+
+COMPRESSION_METHODS = ("gzip", "zlib", "lzma")
+
+# Extensiones sugeridas para archivos exportados
+COMPRESSION_EXTENSIONS: Dict[Optional[str], str] = {
+    None: ".json",
+    "gzip": ".json.gz",
+    "zlib": ".json.zz",
+    "lzma": ".json.xz",
+}
+
+
+def _resolve_options(compression: Optional[str], level: Optional[int],
+                     compact: Optional[bool]) -> Dict[str, Any]:
+    """Combina los argumentos explícitos con STORAGE_CONFIG."""
+    if compression is None:
+        compression = STORAGE_CONFIG.get("compression")
+    if compression in ("", "none"):
+        compression = None
+    if compression is not None and compression not in COMPRESSION_METHODS:
+        raise ValueError(f"Método de compresión no soportado: {compression}")
+
+    if level is None:
+        level = STORAGE_CONFIG.get("compression_level", 6)
+    if compact is None:
+        compact = STORAGE_CONFIG.get("compact_json", False)
+
+    return {"compression": compression, "level": int(level), "compact": bool(compact)}
+
+
+def detect_format(raw: bytes) -> Optional[str]:
+    """
+    Detecta el contenedor de un bloque de bytes.
+
+    Args:
+        raw: Contenido leído del disco
+
+    Returns:
+        "gzip", "zlib", "lzma" o None si es JSON plano
+    """
+    if raw.startswith(GZIP_MAGIC):
+        return "gzip"
+    if raw.startswith(LZMA_MAGIC):
+        return "lzma"
+    # Cabecera zlib: CMF=0x78 y (CMF*256 + FLG) múltiplo de 31.
+    # Un documento JSON nunca empieza con el carácter 'x'.
+    if len(raw) >= 2 and raw[0] == 0x78 and ((raw[0] << 8) | raw[1]) % 31 == 0:
+        return "zlib"
+    return None
+
+
+def encode_json(data: Any, compression: Optional[str] = None,
+                level: Optional[int] = None, compact: Optional[bool] = None) -> bytes:
+    """
+    Serializa datos a bytes JSON, opcionalmente comprimidos.
+
+    Args:
+        data: Estructura serializable a JSON
+        compression: "gzip", "zlib", "lzma", "none" o None (usa STORAGE_CONFIG)
+        level: Nivel de compresión (usa STORAGE_CONFIG si es None)
+        compact: True para JSON sin indentación (usa STORAGE_CONFIG si es None)
+
+    Returns:
+        Bytes listos para escribir en disco
+    """
+    options = _resolve_options(compression, level, compact)
+
+    if options["compact"]:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    else:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    payload = text.encode("utf-8")
+
+    method = options["compression"]
+    if method == "gzip":
+        # mtime=0 para que el mismo contenido produzca los mismos bytes
+        return gzip.compress(payload, compresslevel=options["level"], mtime=0)
+    if method == "zlib":
+        return zlib.compress(payload, options["level"])
+    if method == "lzma":
+        return lzma.compress(payload, preset=min(options["level"], 9))
+    return payload
+
+
+def decode_json(raw: bytes) -> Any:
+    """
+    Decodifica bytes JSON detectando automáticamente la compresión.
+
+    Args:
+        raw: Contenido leído del disco
+
+    Returns:
+        Estructura de datos decodificada
+    """
+    method = detect_format(raw)
+    if method == "gzip":
+        raw = gzip.decompress(raw)
+    elif method == "zlib":
+        raw = zlib.decompress(raw)
+    elif method == "lzma":
+        raw = lzma.decompress(raw)
+    return json.loads(raw.decode("utf-8-sig"))
+
+
+def save_json(path: str, data: Any, compression: Optional[str] = None,
+              level: Optional[int] = None, compact: Optional[bool] = None) -> None:
+    """
+    Guarda datos en disco de forma atómica.
+
+    Escribe primero en un archivo temporal y luego lo reemplaza, para que un
+    cierre inesperado no deje un guardado a medias.
+
+    Args:
+        path: Ruta del archivo destino
+        data: Estructura serializable a JSON
+        compression: Método de compresión (usa STORAGE_CONFIG si es None)
+        level: Nivel de compresión (usa STORAGE_CONFIG si es None)
+        compact: JSON sin indentación (usa STORAGE_CONFIG si es None)
+    """
+    payload = encode_json(data, compression=compression, level=level, compact=compact)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def load_json(path: str) -> Any:
+    """
+    Carga un archivo JSON plano o comprimido.
+
+    Args:
+        path: Ruta del archivo
+
+    Returns:
+        Estructura de datos decodificada
+    """
+    with open(path, "rb") as f:
+        return decode_json(f.read())
+
+
+def suggested_extension(compression: Optional[str] = None) -> str:
+    """
+    Obtiene la extensión recomendada para el formato configurado.
+
+    Args:
+        compression: Método de compresión (usa STORAGE_CONFIG si es None)
+
+    Returns:
+        Extensión con punto inicial, por ejemplo ".json.gz"
+    """
+    options = _resolve_options(compression, None, None)
+    return COMPRESSION_EXTENSIONS[options["compression"]]
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas de las claves de respuesta compiladas
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+
+from answer_key import (AnswerKey, UNKNOWN_OPTION, build_mission_key, compile_item,
+                        compile_puzzle, compile_question, mission_feedback, question_feedback)
+from missions import MISSIONS
+from repaso_ia import QuestionManager
+from simple_puzzles import get_puzzle_catalog, validate_puzzle_answer
+
+
+def test_compiled_feedback_matches_templates():
+    """El feedback precalculado es el mismo que se construía al corregir"""
+    print("🔑 Verificando feedback compilado...")
+    key = build_mission_key(MISSIONS)
+    assert len(key) == len(MISSIONS)
+    for mission_id, mission in MISSIONS.items():
+        item = key.get(mission_id)
+        for option in mission["options"]:
+            result = item.grade(option)
+            assert result.correct == (option == mission["answer"])
+            assert result.feedback == mission_feedback(mission, option)
+    question = {"question": "¿2+2?", "options": ["3", "4"], "answer": "4"}
+    item = compile_question(question["question"], question)
+    assert item.grade("4").feedback == question_feedback("4", "4") == "✅ ¡Correcto!"
+    assert item.grade("3").feedback == "❌ Incorrecto. Respuesta correcta: 4"
+    catalog = get_puzzle_catalog()
+    for puzzle in catalog.for_mission(0), catalog.for_mission(1):
+        compiled = compile_puzzle(puzzle.title, puzzle)
+        for option in puzzle.options:
+            expected_correct, expected_feedback = validate_puzzle_answer(puzzle, option)
+            result = compiled.grade(option)
+            assert (result.correct, result.feedback) == (expected_correct, expected_feedback)
+    print(f"  ✅ {len(key)} misiones compiladas")
+
+
+def test_unknown_options_and_invalid_items():
+    """Las opciones desconocidas son incorrectas y los ítems sin respuesta válida se rechazan"""
+    print("\n❓ Verificando opciones desconocidas...")
+    item = compile_question("q", {"options": ["a", "b"], "answer": "b"})
+    result = item.grade("z")
+    assert not result.correct and result.option_index == UNKNOWN_OPTION
+    assert result.feedback == "❌ Incorrecto. Respuesta correcta: b"
+    try:
+        compile_item("roto", ["a", "b"], "c", str)
+        assert False, "Debería rechazar una respuesta fuera de las opciones"
+    except ValueError:
+        pass
+    print("  ✅ Opciones e ítems inválidos controlados")
+
+
+def test_quiz_questions_keyed_by_position():
+    """Las preguntas del quiz se corrigen por posición, también las repetidas o sin clave válida"""
+    print("\n🔢 Verificando claves del quiz por posición...")
+    questions = [
+        {"question": "¿Cuál?", "options": ["a", "b"], "answer": "a", "concept": "", "formula": ""},
+        {"question": "¿Cuál?", "options": ["c", "d"], "answer": "d", "concept": "", "formula": ""},
+        {"question": "¿Rota?", "options": ["x", "y"], "answer": "z", "concept": "", "formula": ""},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "preguntas.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(questions, f)
+        manager = QuestionManager(path)
+    first, second, broken = manager.get_questions_by_category("Todas")
+    assert len(manager.answer_key) == 2
+    assert manager.grade(first, "a").correct and not manager.grade(first, "c").correct
+    assert manager.grade(second, "d").correct and not manager.grade(second, "a").correct
+    result = manager.grade(broken, "x")  # sin clave: incorrecta, sin excepción
+    assert not result.correct and result.option_index == 0
+    assert result.feedback == question_feedback("z", "x")
+    print("  ✅ Preguntas repetidas e inválidas corregidas")
+
+
+def test_batch_grading_matches_individual():
+    """La corrección por lotes coincide con la individual"""
+    print("\n📦 Verificando corrección por lotes...")
+    key = build_mission_key(MISSIONS)
+    rng = random.Random(45)
+    item_ids, options = [], []
+    for _ in range(500):
+        mission_id = rng.choice(list(MISSIONS) + [999])
+        choices = list(MISSIONS.get(mission_id, {}).get("options", {})) + ["Z"]
+        item_ids.append(mission_id)
+        options.append(rng.choice(choices))
+    expected = [mission_id in key and key.grade(mission_id, option).correct
+                for mission_id, option in zip(item_ids, options)]
+    assert key.grade_batch(item_ids, options, use_numpy=False) == expected
+    assert any(expected) and not all(expected)
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("  ⚠️ NumPy no disponible, sólo se prueba Python puro")
+    else:
+        assert key.grade_batch(item_ids, options, use_numpy=True) == expected
+    print(f"  ✅ {sum(expected)}/{len(expected)} aciertos coinciden")
+
+
+def test_replacing_an_item_updates_batch():
+    """Reemplazar un ítem actualiza su respuesta canónica"""
+    print("\n♻️ Verificando reemplazo de ítems...")
+    key = AnswerKey([compile_question(1, {"options": ["a", "b"], "answer": "a"})])
+    assert key.grade_batch([1], ["a"], use_numpy=False) == [True]
+    key.add(compile_question(1, {"options": ["a", "b"], "answer": "b"}))
+    assert len(key) == 1
+    assert key.grade_batch([1, 1], ["a", "b"], use_numpy=False) == [False, True]
+    print("  ✅ Respuesta actualizada")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_compiled_feedback_matches_templates,
+        test_unknown_options_and_invalid_items,
+        test_quiz_questions_keyed_by_position,
+        test_batch_grading_matches_individual,
+        test_replacing_an_item_updates_batch,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
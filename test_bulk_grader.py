@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas de la corrección masiva de hojas de respuestas
+"""
+import csv
+import gzip
+import json
+import os
+import random
+import sys
+import tempfile
+
+from academic_metrics import AcademicMetrics
+from bulk_grader import grade_files, grade_rows, load_bank, main
+from missions import MISSIONS
+
+
+def _sample_rows(count=400, seed=46):
+    """Respuestas de varios alumnos, con alguna opción y pregunta desconocidas."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        mission_id = rng.choice(list(MISSIONS))
+        options = list(MISSIONS[mission_id]["options"]) + ["Z"]
+        rows.append({
+            "student": rng.choice(["ana", "luis", "eva", "sol"]),
+            "question_id": str(mission_id),
+            "option": rng.choice(options),
+            "time": str(round(rng.uniform(1, 60), 2)),
+            "hints": rng.choice(["0", "1"]),
+            "retried": rng.choice(["", "true"]),
+        })
+    rows.append({"student": "ana", "question_id": "999", "option": "A", "time": "3"})
+    rows.append({"student": "ana", "question_id": "1", "option": "A", "time": "rápido"})
+    return rows
+
+
+def _expected_metrics(rows):
+    """Métricas que produciría la aplicación con las mismas respuestas."""
+    per_student = {}
+    for row in rows:
+        mission_id = int(row["question_id"])
+        if mission_id not in MISSIONS:
+            continue
+        try:
+            time_taken = float(row["time"])
+        except ValueError:
+            continue
+        metrics = per_student.setdefault(row["student"], AcademicMetrics())
+        metrics.record_answer(mission_id, row["option"] == MISSIONS[mission_id]["answer"], time_taken,
+                              hints_used=row.get("hints") == "1", retried=row.get("retried") == "true")
+    return {student: dict(metrics.metrics, concept_mastery={})
+            for student, metrics in per_student.items()}
+
+
+def test_metrics_match_application():
+    """Las métricas por alumno son idénticas a las de AcademicMetrics"""
+    print("📝 Verificando métricas por alumno...")
+    rows = _sample_rows()
+    answer_key, normalize_id = load_bank("missions")
+    report = grade_rows(rows, answer_key, normalize_id, batch_size=37, use_numpy=False)
+    assert report.rows == len(rows) and report.unknown_items == 1 and report.malformed == 1
+    assert report.batches == -(-(len(rows) - 1) // 37)
+    expected = _expected_metrics(rows)
+    actual = report.to_dict()["students"]
+    assert actual == expected, (actual, expected)
+    print(f"  ✅ {len(actual)} alumnos, {report.graded} respuestas corregidas")
+
+
+def test_csv_jsonl_and_gzip_inputs():
+    """CSV, JSONL y archivos comprimidos dan el mismo resultado"""
+    print("\n📂 Verificando formatos de entrada...")
+    rows = _sample_rows(200, seed=7)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "hojas.csv")
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["student", "question_id", "option", "time", "hints", "retried"])
+            writer.writeheader()
+            writer.writerows(rows)
+        jsonl_path = os.path.join(tmp, "hojas.jsonl.gz")
+        with gzip.open(jsonl_path, "wt", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+        from_csv = grade_files([csv_path], use_numpy=False).to_dict()
+        from_jsonl = grade_files([jsonl_path], batch_size=10, use_numpy=False).to_dict()
+    assert from_csv == from_jsonl
+    assert from_csv["students"] == _expected_metrics(rows)
+    print(f"  ✅ {from_csv['graded']} respuestas en ambos formatos")
+
+
+def test_malformed_jsonl_lines_are_skipped():
+    """Una línea JSONL ilegible se cuenta como mal formada y la corrección sigue"""
+    print("\n🧹 Verificando líneas JSONL ilegibles...")
+    rows = _sample_rows(50, seed=3)[:50]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "hojas.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(rows[0]) + "\n")
+            f.write("not json\n")
+            f.write("[1, 2]\n")
+            f.writelines(json.dumps(row) + "\n" for row in rows[1:])
+            f.write('{"student": "ana", "question_id": "1"')  # última línea truncada
+        report = grade_files([path], batch_size=8, use_numpy=False)
+    assert report.rows == len(rows) + 3 and report.malformed == 3
+    assert report.to_dict()["students"] == _expected_metrics(rows)
+    print(f"  ✅ {report.malformed} líneas descartadas, {report.graded} respuestas corregidas")
+
+
+def test_question_bank_and_cli_output():
+    """Se corrige contra un banco de preguntas y la CLI guarda el CSV por alumno"""
+    print("\n💻 Verificando banco de preguntas y CLI...")
+    bank = [{"question": "¿2+2?", "options": ["3", "4"], "answer": "4"},
+            {"question": "¿Capital de Francia?", "options": ["París", "Roma"], "answer": "París"}]
+    rows = [{"alumno": "ana", "pregunta": "¿2+2?", "respuesta": "4", "tiempo": 2},
+            {"alumno": "ana", "pregunta": "¿Capital de Francia?", "respuesta": "Roma", "tiempo": 3},
+            {"alumno": "luis", "pregunta": "¿2+2?", "respuesta": "4", "tiempo": 1.5}]
+    with tempfile.TemporaryDirectory() as tmp:
+        bank_path = os.path.join(tmp, "banco.json")
+        with open(bank_path, "w", encoding="utf-8") as f:
+            json.dump(bank, f)
+        rows_path = os.path.join(tmp, "hojas.jsonl")
+        with open(rows_path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(row) + "\n" for row in rows)
+        out_path = os.path.join(tmp, "notas.csv")
+        assert main([rows_path, "--bank", bank_path, "--no-numpy", "--output", out_path]) == 0
+        with open(out_path, encoding="utf-8") as f:
+            table = {row["student"]: row for row in csv.DictReader(f)}
+    assert table["ana"]["correct_answers"] == "1" and table["ana"]["incorrect_answers"] == "1"
+    assert table["luis"]["streak_best"] == "1" and table["luis"]["time_spent"] == "1.5"
+    print("  ✅ Banco de preguntas y CSV correctos")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_metrics_match_application,
+        test_csv_jsonl_and_gzip_inputs,
+        test_malformed_jsonl_lines_are_skipped,
+        test_question_bank_and_cli_output,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
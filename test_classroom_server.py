@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del servidor de aula y su cliente de carga
+"""
+import asyncio
+import json
+import sys
+
+from classroom_server import ClassroomServer, QuizRoom, encode_message, load_room_bank, run_load_test
+from missions import MISSIONS
+from test_support import FakeClock
+
+
+def test_room_grades_and_times_centrally():
+    """La sala corrige con la clave compilada y mide el tiempo en el servidor"""
+    print("🏫 Verificando lógica de sala...")
+    questions, answer_key = load_room_bank("missions")
+    assert len(questions) == sum(1 for mission in MISSIONS.values() if len(mission["options"]) > 1)
+    clock = FakeClock(100.0)
+    room = QuizRoom("aula", questions, answer_key, clock=clock)
+    session = room.join("ana")
+    question = room.question_message(session)
+    assert question["type"] == "question" and question["index"] == 0
+    assert "answer" not in question
+    clock.advance(4.5)
+    correct = MISSIONS[questions[0].item_id]["answer"]
+    result = room.answer(session, 0, correct)
+    assert result["correct"] and result["time_taken"] == 4.5 and result["score"] == 1
+    try:
+        room.answer(session, 0, correct)
+        assert False, "No se puede responder dos veces la misma pregunta"
+    except ValueError:
+        pass
+    assert room.join("ana") is session  # volver a entrar conserva el progreso
+    room.question_message(session)
+    clock.advance(2.0)
+    assert not room.answer(session, 1, "opción inexistente")["correct"]
+    metrics = room.summary()["students"]["ana"]
+    assert metrics["total_questions"] == 2 and metrics["time_spent"] == 6.5 and metrics["position"] == 2
+    print("  ✅ Corrección y tiempos centralizados")
+
+
+def test_protocol_over_localhost():
+    """Un cliente completa la sala por TCP con JSON delimitado por líneas"""
+    print("\n🔌 Verificando protocolo...")
+
+    async def scenario():
+        questions, answer_key = load_room_bank("missions")
+        server = ClassroomServer(questions[:3], answer_key, "127.0.0.1", 0)
+        port = await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def send(message):
+            writer.write(encode_message(message))
+            await writer.drain()
+
+        async def receive():
+            return json.loads(await reader.readline())
+
+        await send({"type": "answer", "index": 0, "option": "x"})
+        errors = [await receive()]
+        writer.write(b"no es json\n")
+        errors.append(await receive())
+        await send({"type": "join", "room": "3B", "student": "luis"})
+        joined, message = await receive(), await receive()
+        for bad_index in (None, [0], "uno"):
+            await send({"type": "answer", "index": bad_index, "option": "x"})
+            errors.append(await receive())
+        results = []
+        while message["type"] == "question":
+            answer = MISSIONS[questions[message["index"]].item_id]["answer"]
+            await send({"type": "answer", "index": message["index"], "option": answer})
+            results.append(await receive())
+            message = await receive()
+        await send({"type": "leave"})
+        bye = await receive()
+        writer.close()
+        stats = server.stats()
+        await server.close()
+        return errors, joined, results, message, bye, stats, server.rooms["3B"].summary()
+
+    errors, joined, results, finished, bye, stats, summary = asyncio.run(scenario())
+    assert [error["type"] for error in errors] == ["error"] * 5
+    assert all("no válido" in error["message"] for error in errors[2:])
+    assert joined["room"] == "3B" and joined["questions"] == 3
+    assert all(result["correct"] for result in results) and len(results) == 3
+    assert finished["type"] == "finished" and finished["metrics"]["correct_answers"] == 3
+    assert bye["type"] == "bye" and stats["answers"] == 3
+    assert summary["students"]["luis"]["streak_best"] == 3 and not summary["students"]["luis"]["connected"]
+    print(f"  ✅ {stats['messages']} mensajes procesados")
+
+
+def test_load_test_client():
+    """El cliente de carga completa todas las respuestas sin errores"""
+    print("\n🚀 Verificando cliente de carga...")
+
+    async def scenario():
+        questions, answer_key = load_room_bank("missions")
+        server = ClassroomServer(questions[:5], answer_key, "127.0.0.1", 0)
+        port = await server.start()
+        report = await run_load_test("127.0.0.1", port, clients=40)
+        room = server.rooms["carga"].summary()
+        await server.close()
+        return report, room
+
+    report, room = asyncio.run(scenario())
+    assert report.errors == 0 and report.answers == 40 * 5
+    assert report.round_trip["count"] == 200 and report.round_trip["p99_ms"] >= report.round_trip["p50_ms"]
+    assert len(room["students"]) == 40 and room["answers"] == 200
+    print(f"  ✅ {report.answers_per_second:.0f} respuestas/s, p99={report.round_trip['p99_ms']:.2f}ms")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_room_grades_and_times_centrally,
+        test_protocol_over_localhost,
+        test_load_test_client,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
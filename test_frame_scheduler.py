@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del planificador central de frames (sin pantalla)
+"""
+import sys
+
+from frame_scheduler import FrameScheduler, PRIORITY_HIGH, PRIORITY_LOW
+from test_support import FakeClock
+
+
+class FakeRoot:
+    """Imita after/after_cancel de Tk con un reloj manual"""
+    def __init__(self, clock):
+        self.clock = clock
+        self.pending = {}
+        self.next_id = 0
+        self.after_calls = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        self.after_calls += 1
+        self.pending[self.next_id] = (self.clock.now + ms / 1000.0, func)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def advance(self, seconds):
+        """Avanza el reloj ejecutando los callbacks vencidos en orden"""
+        target = self.clock.now + seconds
+        while True:
+            due = [(t, i) for i, (t, _) in self.pending.items() if t <= target]
+            if not due:
+                break
+            t, after_id = min(due)
+            self.clock.now = max(self.clock.now, t)
+            _, func = self.pending.pop(after_id)
+            func()
+        self.clock.now = target
+
+
+def make_scheduler():
+    clock = FakeClock()
+    root = FakeRoot(clock)
+    return FrameScheduler(root, clock=clock), root
+
+
+def test_single_tick_for_many_tasks():
+    """Varias tareas comparten un único temporizador pendiente"""
+    print("🔍 Verificando multiplexación de tareas...")
+    scheduler, root = make_scheduler()
+    calls = {"a": 0, "b": 0}
+    scheduler.add_task("a", lambda: calls.__setitem__("a", calls["a"] + 1), interval_ms=100)
+    scheduler.add_task("b", lambda: calls.__setitem__("b", calls["b"] + 1), interval_ms=100)
+    assert len(root.pending) == 1
+    root.advance(1.0)
+    assert calls == {"a": 10, "b": 10}, calls
+    print(f"  ✅ 20 ejecuciones con {root.after_calls} programaciones de after")
+
+
+def test_no_drift_and_stop():
+    """Los vencimientos son absolutos y False detiene la tarea"""
+    print("\n⏱️ Verificando deriva y parada...")
+    scheduler, root = make_scheduler()
+    ticks = []
+
+    def clock_task():
+        ticks.append(root.clock.now)
+        root.clock.now += 0.05  # Simula un callback lento
+        return len(ticks) < 5
+
+    scheduler.add_task("clock", clock_task, interval_ms=1000)
+    root.advance(10.0)
+    assert ticks == [1.0, 2.0, 3.0, 4.0, 5.0], ticks
+    assert not scheduler.has_task("clock")
+    assert not root.pending
+    print("  ✅ Reloj sin deriva y sin despertares tras terminar")
+
+
+def test_priority_and_call_later():
+    """Mayor prioridad primero; call_later reemplaza la llamada pendiente"""
+    print("\n🎯 Verificando prioridades y llamadas únicas...")
+    scheduler, root = make_scheduler()
+    order = []
+    scheduler.add_task("low", lambda: order.append("low"), interval_ms=50, priority=PRIORITY_LOW)
+    scheduler.add_task("high", lambda: order.append("high"), interval_ms=50, priority=PRIORITY_HIGH)
+    root.advance(0.05)
+    assert order == ["high", "low"], order
+
+    hits = []
+    scheduler.call_later("next", 100, lambda: hits.append(1))
+    scheduler.call_later("next", 100, lambda: hits.append(2))
+    root.advance(0.2)
+    assert hits == [2], hits
+    print("  ✅ Orden por prioridad y sin duplicados")
+
+
+def test_redraw_coalescing_and_stats():
+    """Los refrescos con la misma clave se agrupan y hay estadísticas"""
+    print("\n🖼️ Verificando coalescencia de refrescos...")
+    scheduler, root = make_scheduler()
+    drawn = []
+    for i in range(5):
+        scheduler.request_redraw("stats", lambda i=i: drawn.append(i))
+    root.advance(0.0)
+    assert drawn == [4], drawn
+    scheduler.add_task("anim", lambda: None, interval_ms=16, budget_ms=4)
+    root.advance(0.1)
+    stats = scheduler.get_stats()["anim"]
+    assert stats["calls"] == 6, stats
+    assert scheduler.get_summary()["redraws_flushed"] == 1
+    print(f"  ✅ 5 solicitudes → 1 refresco; anim: {stats['calls']} llamadas")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_single_tick_for_many_tasks,
+        test_no_drift_and_stop,
+        test_priority_and_call_later,
+        test_redraw_coalescing_and_stats,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del monitor de latencia (sin pantalla)
+"""
+import json
+import os
+import sys
+import tempfile
+
+import latency_monitor
+from frame_scheduler import get_scheduler
+from latency_monitor import LatencyHistogram, LatencyMonitor, get_latency_monitor
+from test_support import FakeClock
+
+
+class FakeRoot:
+    """Imita after/after_cancel de Tk; cada callback llega con un retraso fijo"""
+    def __init__(self, clock, lag_ms=0.0):
+        self.clock = clock
+        self.lag_ms = lag_ms
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        self.pending[self.next_id] = (self.clock.now + (ms + self.lag_ms) / 1000.0, func)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def advance(self, seconds):
+        target = self.clock.now + seconds
+        while True:
+            due = [(t, i) for i, (t, _) in self.pending.items() if t <= target]
+            if not due:
+                break
+            t, after_id = min(due)
+            self.clock.now = max(self.clock.now, t)
+            _, func = self.pending.pop(after_id)
+            func()
+        self.clock.now = target
+
+
+def test_histogram_percentiles():
+    """Los percentiles tienen error relativo acotado"""
+    print("📊 Verificando percentiles del histograma...")
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):  # 1..1000 ms
+        histogram.record(float(value))
+    summary = histogram.summary()
+    assert summary["count"] == 1000
+    for p, expected in ((50, 500), (95, 950), (99, 990)):
+        value = summary[f"p{p}_ms"]
+        assert expected <= value <= expected * 1.11, (p, value)
+    assert summary["max_ms"] == 1000.0
+    print(f"  ✅ p50={summary['p50_ms']:.0f} p95={summary['p95_ms']:.0f} p99={summary['p99_ms']:.0f} ms")
+
+
+def test_probe_records_loop_drift():
+    """La sonda registra el retraso del bucle de eventos"""
+    print("\n⏱️ Verificando sonda del bucle...")
+    clock = FakeClock()
+    root = FakeRoot(clock, lag_ms=5.0)
+    monitor = LatencyMonitor(root, enabled=True, probe_interval_ms=10, clock=clock)
+    monitor.start()
+    root.advance(1.0)
+    drift = monitor.snapshot()["loop_drift"]
+    assert drift["count"] >= 60, drift
+    assert 4.5 <= drift["p50_ms"] <= 5.6, drift
+    monitor.stop()
+    assert not root.pending
+    print(f"  ✅ {drift['count']} muestras, p50={drift['p50_ms']:.1f} ms")
+
+
+def test_wrapped_callbacks_are_timed():
+    """Los callbacks envueltos se cronometran; desactivado no se envuelven"""
+    print("\n🖱️ Verificando callbacks cronometrados...")
+    clock = FakeClock()
+    monitor = LatencyMonitor(FakeRoot(clock), enabled=True, clock=clock)
+
+    def slow_save():
+        clock.now += 0.120
+        return "ok"
+
+    callbacks = monitor.instrument({"save_progress": slow_save}, prefix="menu")
+    assert callbacks["save_progress"]() == "ok"
+    with monitor.timed("option_click"):
+        clock.now += 0.004
+    snapshot = monitor.snapshot()
+    assert round(snapshot["menu:save_progress"]["max_ms"]) == 120
+    assert round(snapshot["option_click"]["max_ms"]) == 4
+
+    disabled = LatencyMonitor(FakeRoot(clock), enabled=False, clock=clock)
+    assert disabled.wrap("x", slow_save) is slow_save
+    disabled.start()
+    assert disabled.snapshot() == {}
+    print("  ✅ Callbacks medidos y modo desactivado sin coste")
+
+
+def test_dump_to_file():
+    """El volcado escribe los histogramas en JSON"""
+    print("\n💾 Verificando volcado...")
+    clock = FakeClock()
+    monitor = LatencyMonitor(FakeRoot(clock), enabled=True, clock=clock)
+    monitor.record("loop_drift", 3.0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = monitor.dump(os.path.join(tmp, "latency.json"))
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    assert data["histograms"]["loop_drift"]["count"] == 1
+    print("  ✅ Informe volcado")
+
+
+class FakeOverlay:
+    """Panel sin widgets: sólo registra su planificador"""
+    def __init__(self, root, monitor):
+        self.scheduler = get_scheduler(root)
+        self.destroyed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+
+def test_overlay_survives_scheduler_reset():
+    """El panel abierto se recrea sobre el planificador nuevo de la ventana"""
+    print("\n🔁 Verificando panel tras cambiar de planificador...")
+    clock = FakeClock()
+    root = FakeRoot(clock)
+    monitor = LatencyMonitor(root, enabled=True, clock=clock)
+    root._latency_monitor = monitor
+    original = latency_monitor.LatencyOverlay
+    latency_monitor.LatencyOverlay = FakeOverlay
+    try:
+        monitor.toggle_overlay()
+        first = monitor.overlay
+        assert get_latency_monitor(root) is monitor and monitor.overlay is first
+        get_scheduler(root).shutdown()  # lo que hace _reset_root al montar otro modo
+        assert get_latency_monitor(root) is monitor
+        assert first.destroyed and monitor.overlay.scheduler is get_scheduler(root)
+    finally:
+        latency_monitor.LatencyOverlay = original
+    print("  ✅ Panel reabierto")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_histogram_percentiles,
+        test_probe_records_loop_drift,
+        test_wrapped_callbacks_are_timed,
+        test_dump_to_file,
+        test_overlay_survives_scheduler_reset,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
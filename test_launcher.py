@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del lanzador en proceso (precarga de módulos, sin pantalla)
+"""
+import sys
+
+import logging
+
+from launcher import GameLauncher, ModulePreloader, PRELOAD_MODULES
+from session_recorder import create_headless_controller
+
+
+def test_preloader_imports_in_background():
+    """La precarga importa los módulos compartidos y registra sus tiempos"""
+    print("🔍 Verificando precarga en segundo plano...")
+    preloader = ModulePreloader(["config", "missions", "academic_metrics"])
+    preloader.start()
+    assert preloader.wait(timeout=30)
+    assert set(preloader.load_times) == {"config", "missions", "academic_metrics"}
+    assert "missions" in sys.modules
+    print(f"  ✅ {len(preloader.load_times)} módulos precargados")
+
+
+def test_preloader_tolerates_missing_modules():
+    """Un módulo inexistente se registra como error sin detener la precarga"""
+    print("\n⚠️ Verificando tolerancia a módulos ausentes...")
+    preloader = ModulePreloader(["repaso_ia_refactored", "config"])
+    preloader.start()
+    preloader.wait(timeout=30)
+    assert "repaso_ia_refactored" in preloader.errors
+    assert "config" in preloader.load_times
+    print("  ✅ Error registrado y precarga completada")
+
+
+def test_main_entry_point_imports():
+    """main.py ya no depende de un módulo inexistente"""
+    print("\n🚪 Verificando punto de entrada...")
+    import main
+    assert callable(main.run_application)
+    assert "game_controller" in PRELOAD_MODULES
+    print("  ✅ main.py importable")
+
+
+def test_teardown_runs_controller_shutdown():
+    """Desmontar un modo ejecuta su cierre (perfiles guardados) una sola vez"""
+    print("\n💾 Verificando cierre del modo montado...")
+    launcher = GameLauncher.__new__(GameLauncher)  # sin ventana: sólo la lógica de desmontaje
+    launcher.logger = logging.getLogger("GameLauncher")
+    launcher.active_mode = "original"
+    controller = create_headless_controller()
+    profile = controller._current_profile()
+    profile.dirty = True
+    launcher.controller = controller
+    launcher._teardown()
+    assert launcher.controller is None and not profile.dirty
+    profile.dirty = True
+    controller.shutdown()  # quit_application después del launcher: no repite el cierre
+    assert profile.dirty
+    launcher._teardown()  # sin modo montado no hace nada
+    print("  ✅ Progreso y perfiles guardados al desmontar")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_preloader_imports_in_background,
+        test_preloader_tolerates_missing_modules,
+        test_main_entry_point_imports,
+        test_teardown_runs_controller_shutdown,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del analizador de logs en streaming
+"""
+import gzip
+import os
+import sys
+import tempfile
+
+from log_analyzer import analyze_files, analyze_lines, parse_line, error_signature
+
+SESSION_LOG = """\
+2025-10-27 13:34:52,544 - GameController - INFO - Progreso cargado exitosamente
+2025-10-27 13:34:52,544 - GameController - INFO - Sesión iniciada
+2025-10-27 13:35:17,665 - GameController - INFO - Misión 1 cargada: Misión 1
+2025-10-27 13:45:42,321 - GameController - INFO - Progreso cargado exitosamente
+2025-10-27 13:45:42,321 - GameController - ERROR - Error al iniciar sesión: 'NoneType' object has no attribute 'config'
+2025-10-27 13:45:53,855 - GameController - INFO - Misión 1 cargada: Misión 1
+2025-10-27 13:46:11,686 - GameController - ERROR - Error al cargar misión 12: 'NoneType' object has no attribute 'config'
+Traceback (most recent call last):
+  File "/home/alumno/game_controller.py", line 640, in load_mission
+2025-10-28 09:00:00,000 - GameController - ERROR - Error al cargar misión 3: 'NoneType' object has no attribute 'config'
+"""
+
+QUIZ_LOG = """\
+2025-10-27 14:48:33,750 - INFO - Sesión guardada: 5/10
+2025-10-27 15:05:38,264 - WARNING - Archivo de preguntas no encontrado
+"""
+
+
+def test_parse_both_formats():
+    """Se interpretan los formatos con y sin nombre de logger"""
+    print("🔎 Verificando formatos de línea...")
+    with_logger = parse_line("2025-10-27 13:26:33,058 - GameController - INFO - Sesión iniciada")
+    without_logger = parse_line("2025-10-27 14:48:33,750 - INFO - Sesión guardada: 5/10")
+    assert with_logger.logger_name == "GameController" and with_logger.level == "INFO"
+    assert without_logger.logger_name == "" and without_logger.message == "Sesión guardada: 5/10"
+    assert parse_line("  File \"x.py\", line 3") is None
+    print("  ✅ Ambos formatos reconocidos")
+
+
+def test_signatures_sessions_and_buckets():
+    """Los errores se agrupan por firma y las sesiones detectan fallos de arranque"""
+    print("\n🔥 Verificando firmas, sesiones y franjas...")
+    report = analyze_lines(SESSION_LOG.splitlines(), source="alpha_session.log")
+    top = report.top_signatures(1)[0]
+    assert top["count"] == 2
+    assert top["signature"] == "GameController: Error al cargar misión <n>: 'NoneType' object has no attribute 'config'"
+    assert report.continuation_lines == 2 and report.unparsed == 0
+    assert report.sessions_total == 3, report.sessions
+    assert report.sessions_crashed_on_init == 1
+    assert sorted(report.buckets) == ["2025-10-27", "2025-10-28"]
+    assert report.buckets["2025-10-28"]["ERROR"] == 1
+    record = parse_line("2025-10-27 14:00:00,000 - X - ERROR - Fallo en 0x7f3a y /tmp/a.json")
+    assert error_signature(record) == "X: Fallo en <hex> y <ruta>"
+    print(f"  ✅ {report.sessions_total} sesiones, {len(report.signatures)} firmas")
+
+
+def test_parallel_matches_sequential():
+    """El análisis en paralelo da el mismo resultado que el secuencial"""
+    print("\n⚡ Verificando análisis en paralelo...")
+    with tempfile.TemporaryDirectory() as tmp:
+        session_path = os.path.join(tmp, "alpha_session.log")
+        quiz_path = os.path.join(tmp, "quiz_game.log.gz")
+        with open(session_path, "w", encoding="utf-8") as f:
+            f.write(SESSION_LOG)
+        with gzip.open(quiz_path, "wt", encoding="utf-8") as f:
+            f.write(QUIZ_LOG)
+        sequential = analyze_files([session_path, quiz_path], bucket="week")
+        parallel = analyze_files([session_path, quiz_path], bucket="week", workers=2)
+    assert sequential.to_dict() == parallel.to_dict()
+    assert sequential.records == 10 and sequential.by_level["WARNING"] == 1
+    assert list(sequential.buckets) == ["2025-W44"]
+    print(f"  ✅ {sequential.records} registros en {len(sequential.files)} archivos")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_parse_both_formats,
+        test_signatures_sessions_and_buckets,
+        test_parallel_matches_sequential,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del pipeline de logging asíncrono
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+
+from logging_setup import configure_logging, shutdown_logging
+
+
+def _isolated(test):
+    """Ejecuta la prueba con el logger raíz limpio y lo restaura después"""
+    def run():
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        shutdown_logging()
+        root.handlers = []
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                try:
+                    test(tmp)
+                finally:
+                    shutdown_logging()
+        finally:
+            root.handlers, root.level = saved_handlers, saved_level
+    run.__name__ = test.__name__
+    run.__doc__ = test.__doc__
+    return run
+
+
+@_isolated
+def test_async_writes_and_first_call_wins(tmp):
+    """Los registros se escriben desde el hilo del listener; la primera configuración gana"""
+    print("📨 Verificando escritura asíncrona...")
+    path = os.path.join(tmp, "session.log")
+    pipeline = configure_logging(path, console=False, rotation=None)
+    assert configure_logging(os.path.join(tmp, "otro.log"), console=False) is pipeline
+    assert pipeline.listener is not None
+    logging.getLogger("Prueba").info("Sesión iniciada")
+    shutdown_logging()
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    assert "INFO - Sesión iniciada" in content
+    assert not os.path.exists(os.path.join(tmp, "otro.log"))
+    print("  ✅ Registro escrito al vaciar la cola")
+
+
+@_isolated
+def test_size_rotation(tmp):
+    """El archivo rota al superar el tamaño máximo"""
+    print("\n🔄 Verificando rotación por tamaño...")
+    path = os.path.join(tmp, "rotating.log")
+    configure_logging(path, console=False, rotation="size", max_bytes=200, backup_count=2)
+    for i in range(50):
+        logging.getLogger("Prueba").info(f"Evento número {i:03d}")
+    shutdown_logging()
+    files = sorted(os.listdir(tmp))
+    assert files == ["rotating.log", "rotating.log.1", "rotating.log.2"], files
+    assert all(os.path.getsize(os.path.join(tmp, name)) <= 200 for name in files)
+    print(f"  ✅ {len(files)} archivos conservados")
+
+
+@_isolated
+def test_sampling_keeps_one_in_n(tmp):
+    """El muestreo conserva 1 de cada N eventos frecuentes, nunca los avisos"""
+    print("\n🎲 Verificando muestreo...")
+    path = os.path.join(tmp, "sampled.log")
+    pipeline = configure_logging(path, console=False, sampling={"Frame": 10})
+    logger = logging.getLogger("Prueba")
+    for i in range(100):
+        logger.info(f"Frame {i}")
+    logger.warning("Frame lento")
+    logger.info("Respuesta correcta")
+    dropped = pipeline.dropped
+    shutdown_logging()
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert len([line for line in lines if "Frame " in line and "INFO" in line]) == 10
+    assert any("Frame lento" in line for line in lines)
+    assert any("Respuesta correcta" in line for line in lines)
+    assert dropped == 90
+    print(f"  ✅ {dropped} registros descartados")
+
+
+@_isolated
+def test_json_lines_mode(tmp):
+    """El modo estructurado escribe un objeto JSON por línea con el contexto extra"""
+    print("\n🧾 Verificando JSON Lines...")
+    path = os.path.join(tmp, "structured.log")
+    configure_logging(path, console=False, json_lines=True)
+    logging.getLogger("GameController").info("Respuesta registrada", extra={"mission": 4})
+    shutdown_logging()
+    with open(path, encoding="utf-8") as f:
+        entry = json.loads(f.readline())
+    assert entry["message"] == "Respuesta registrada"
+    assert entry["logger"] == "GameController" and entry["mission"] == 4
+    print("  ✅ Registro estructurado")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_async_writes_and_first_call_wins,
+        test_size_rotation,
+        test_sampling_keeps_one_in_n,
+        test_json_lines_mode,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
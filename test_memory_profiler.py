@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del perfilador de memoria por subsistemas
+"""
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from academic_metrics import AcademicMetrics
+from frame_scheduler import get_scheduler
+from memory_profiler import MemoryProfiler, classify, format_report, get_memory_profiler
+from test_support import FakeClock
+
+
+def test_classify_subsystems():
+    """Los archivos se asignan al subsistema correcto"""
+    print("🗂️ Verificando clasificación de archivos...")
+    assert classify("/app/academic_metrics.py") == "metrics"
+    assert classify("/app/achievement_system.py") == "achievements"
+    assert classify("/app/ui_manager_clean.py") == "ui"
+    assert classify("/usr/lib/python3.11/tkinter/__init__.py") == "ui"
+    assert classify("/app/simple_puzzles.py") == "puzzles"
+    assert classify("/usr/lib/python3.11/json/encoder.py") == "storage"
+    assert classify("/app/otro.py") == "other"
+    print("  ✅ Subsistemas reconocidos")
+
+
+def test_growth_is_attributed():
+    """El crecimiento de question_history se atribuye a métricas"""
+    print("\n📈 Verificando atribución del crecimiento...")
+    clock = FakeClock()
+    was_tracing = tracemalloc.is_tracing()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "memory.json")
+        profiler = MemoryProfiler(enabled=True, top_n=5, report_file=path, clock=clock)
+        profiler.start()
+        metrics = AcademicMetrics()
+        for i in range(3000):
+            metrics.record_answer(mission_id=i % 10 + 1, correct=i % 3 != 0, time_taken=5.0)
+        clock.now = 60.0
+        sample = profiler.take_snapshot()
+        profiler.stop()
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+    assert sample["elapsed_s"] == 60.0
+    assert sample["subsystem_growth_kb"]["metrics"] > 100, sample["subsystem_growth_kb"]
+    assert sample["top_growth_since_start"][0]["subsystem"] == "metrics"
+    assert len(sample["top_growth_since_start"]) <= 5
+    assert len(report["samples"]) == 2 and not profiler.running
+    assert tracemalloc.is_tracing() == was_tracing
+    assert "metrics" in format_report(report)
+    print(f"  ✅ {sample['subsystem_growth_kb']['metrics']:.0f} KB atribuidos a métricas")
+
+
+def test_disabled_profiler_is_inert():
+    """Desactivado no arranca tracemalloc ni toma muestras"""
+    print("\n💤 Verificando modo desactivado...")
+    was_tracing = tracemalloc.is_tracing()
+    profiler = MemoryProfiler(enabled=False)
+    profiler.start()
+    assert profiler.take_snapshot() is None
+    assert tracemalloc.is_tracing() == was_tracing
+    print("  ✅ Sin coste desactivado")
+
+
+class FakeRoot:
+    """Ventana mínima: sólo after/after_cancel (las tareas no llegan a ejecutarse)"""
+    def __init__(self):
+        self.next_id = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        pass
+
+
+def test_snapshots_survive_scheduler_reset():
+    """Si el launcher cierra el planificador, las instantáneas se reprograman en el nuevo"""
+    print("\n🔁 Verificando cambio de planificador...")
+    root = FakeRoot()
+    profiler = MemoryProfiler(enabled=True, interval_s=60)
+    root._memory_profiler = profiler
+    profiler.start(root)
+    try:
+        assert get_scheduler(root).has_task("memory_snapshot")
+        get_scheduler(root).shutdown()  # lo que hace _reset_root al montar otro modo
+        assert get_memory_profiler(root) is profiler
+        scheduler = get_scheduler(root)
+        assert scheduler.has_task("memory_snapshot") and profiler._scheduler is scheduler
+    finally:
+        profiler.stop()
+    print("  ✅ Tarea de instantáneas reprogramada")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_classify_subsystems,
+        test_growth_is_attributed,
+        test_disabled_profiler_is_inert,
+        test_snapshots_survive_scheduler_reset,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
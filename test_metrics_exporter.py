@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del exportador de métricas OpenMetrics
+"""
+import os
+import sys
+import tempfile
+import urllib.request
+
+from metrics_exporter import AppMetrics, MetricsExporter, CONTENT_TYPE
+
+
+def test_exposition_format():
+    """Contadores e histogramas siguen el formato de texto OpenMetrics"""
+    print("📈 Verificando formato de exposición...")
+    metrics = AppMetrics()
+    metrics.record_answer(True, 4.0)
+    metrics.record_answer(False, 45.0)
+    metrics.record_answer(True, 400.0)
+    metrics.record_achievements([{"rarity": "rare"}, {"rarity": "rare"}])
+    metrics.record_error("Error al guardar progreso: disco lleno")
+    metrics.record_error("Fallo imprevisto: 'x' de 4096 bytes")
+    text = metrics.render()
+    assert text.endswith("# EOF\n")
+    assert "# TYPE alpha_answers counter" in text
+    assert 'alpha_answers_total{result="correct"} 2' in text
+    assert 'alpha_answer_time_seconds_bucket{le="5.0"} 1' in text
+    assert 'alpha_answer_time_seconds_bucket{le="60.0"} 2' in text
+    assert 'alpha_answer_time_seconds_bucket{le="+Inf"} 3' in text
+    assert "alpha_answer_time_seconds_count 3" in text
+    assert "alpha_answer_time_seconds_sum 449.0" in text
+    assert 'alpha_achievements_unlocked_total{rarity="rare"} 2' in text
+    assert 'alpha_errors_total{kind="persistence"} 1' in text
+    assert 'alpha_errors_total{kind="other"} 1' in text
+    print("  ✅ Exposición válida")
+
+
+def test_latency_listener_splits_metrics():
+    """Las muestras del monitor de latencia se reparten por callback"""
+    print("\n🖱️ Verificando latencia de callbacks...")
+    metrics = AppMetrics()
+    metrics.record_latency("loop_drift", 3.0)
+    metrics.record_latency("menu:save_progress", 120.0)
+    text = metrics.render()
+    assert "alpha_event_loop_drift_seconds_count 1" in text
+    assert 'alpha_ui_callback_seconds_bucket{callback="menu:save_progress",le="0.1"} 0' in text
+    assert 'alpha_ui_callback_seconds_bucket{callback="menu:save_progress",le="0.25"} 1' in text
+    print("  ✅ Deriva y callbacks separados")
+
+
+def test_http_and_textfile_modes():
+    """El endpoint HTTP y el archivo de texto publican la misma exposición"""
+    print("\n🌐 Verificando modos de exportación...")
+    metrics = AppMetrics()
+    metrics.record_answer(True, 3.0)
+
+    exporter = MetricsExporter(metrics, mode="http", port=0)
+    exporter.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/metrics", timeout=5) as response:
+            body = response.read().decode("utf-8")
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+    finally:
+        exporter.stop()
+    assert 'alpha_answers_total{result="correct"} 1' in body
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "alpha.prom")
+        exporter = MetricsExporter(metrics, mode="textfile", textfile=path, interval_s=60)
+        exporter.start()
+        metrics.record_answer(False, 8.0)
+        exporter.stop()
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+    assert 'alpha_answers_total{result="incorrect"} 1' in content
+    print("  ✅ HTTP y archivo de texto")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_exposition_format,
+        test_latency_listener_splits_metrics,
+        test_http_and_textfile_modes,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
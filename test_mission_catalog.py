@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del catálogo inmutable de misiones
+"""
+import os
+import sys
+import tempfile
+
+from missions import MISSIONS, get_missions_by_category, get_missions_by_difficulty, validate_missions
+from mission_catalog import MissionCatalog, get_catalog
+
+
+def test_indexes_match_linear_scan():
+    """Los índices devuelven lo mismo que el recorrido completo original"""
+    print("🔍 Verificando índices por categoría y dificultad...")
+    catalog = get_catalog()
+    categories = {m.get("category") for m in MISSIONS.values()}
+    for category in categories:
+        expected = [m for m in MISSIONS.values() if m.get("category") == category]
+        assert get_missions_by_category(category) == expected, category
+    for difficulty in {m.get("difficulty") for m in MISSIONS.values()}:
+        expected = [m for m in MISSIONS.values() if m.get("difficulty") == difficulty]
+        assert get_missions_by_difficulty(difficulty) == expected, difficulty
+    assert get_missions_by_category("inexistente") == []
+    concept = MISSIONS[1]["concept_name"]
+    assert catalog.for_concept(concept)[0].mission_id == 1
+    print(f"  ✅ {len(categories)} categorías indexadas")
+
+
+def test_records_are_read_only():
+    """Los registros y los índices no se pueden modificar"""
+    print("\n🔒 Verificando inmutabilidad...")
+    catalog = get_catalog()
+    record = catalog.get(1)
+    for mutate in (lambda: setattr(record, "answer", "x"),
+                   lambda: record.options.__setitem__("x", "y"),
+                   lambda: catalog.by_category.__setitem__("x", ()),
+                   lambda: record.__dict__):
+        try:
+            mutate()
+        except (AttributeError, TypeError):
+            continue
+        raise AssertionError("Se esperaba un error al modificar")
+    assert record.option_keys == tuple(MISSIONS[1]["options"])
+    print("  ✅ Registros e índices de solo lectura")
+
+
+def test_validation_artifact_is_cached():
+    """El artefacto validado se reutiliza mientras la huella no cambie"""
+    print("\n💾 Verificando caché del artefacto...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = os.path.join(tmp, "catalog.cache")
+        first = MissionCatalog(MISSIONS, source_hash="abc", cache_path=cache)
+        second = MissionCatalog(MISSIONS, source_hash="abc", cache_path=cache)
+        changed = MissionCatalog(MISSIONS, source_hash="def", cache_path=cache)
+        assert not first.from_cache and second.from_cache and not changed.from_cache
+        assert dict(second.by_difficulty) == dict(first.by_difficulty)
+        assert second.valid and validate_missions()
+    print("  ✅ Validación reutilizada y reconstruida al cambiar el origen")
+
+
+def test_invalid_missions_are_reported():
+    """Las misiones mal formadas se informan sin romper el catálogo"""
+    print("\n⚠️ Verificando detección de errores...")
+    broken = {
+        1: dict(MISSIONS[1]),
+        2: {key: value for key, value in MISSIONS[2].items() if key != "story"},
+        3: dict(MISSIONS[3], answer="Respuesta inexistente"),
+    }
+    catalog = MissionCatalog(broken)
+    assert not catalog.valid
+    assert len(catalog.validation_errors) == 2, catalog.validation_errors
+    assert 2 not in catalog and 1 in catalog
+    print(f"  ✅ {len(catalog.validation_errors)} errores detectados")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_indexes_match_linear_scan,
+        test_records_are_read_only,
+        test_validation_artifact_is_cached,
+        test_invalid_missions_are_reported,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas de la precarga de la siguiente misión
+"""
+import sys
+
+from prefetch import MissionPrefetcher, PreparedContent, shuffled_layout
+
+
+class FakeRoot:
+    """Imita after_idle/after_cancel de Tk con una cola manual"""
+    def __init__(self):
+        self.idle = {}
+        self.next_id = 0
+
+    def after_idle(self, func):
+        self.next_id += 1
+        self.idle[self.next_id] = func
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.idle.pop(after_id, None)
+
+    def run_idle(self):
+        pending, self.idle = self.idle, {}
+        for func in pending.values():
+            func()
+
+
+def _preparer(calls):
+    def prepare(mission_num):
+        calls.append(mission_num)
+        options = {f"opción {i}": f"descripción {i}" for i in range(4)}
+        return PreparedContent(mission_num, f"Misión {mission_num}", "historia",
+                               shuffled_layout(options, str(mission_num)), "opción 0",
+                               "feedback inicial", None)
+    return prepare
+
+
+def test_idle_prefetch_is_a_hit():
+    """Lo preparado en tiempo ocioso se entrega sin volver a construirlo"""
+    print("⏳ Verificando precarga en tiempo ocioso...")
+    root, calls, warmed = FakeRoot(), [], []
+    prefetcher = MissionPrefetcher(root, _preparer(calls), warm_ui=lambda c: warmed.append(c.mission_num))
+    prefetcher.schedule(2)
+    prefetcher.schedule(2)  # no se duplica
+    assert calls == [] and len(root.idle) == 1
+    root.run_idle()
+    assert calls == [2] and warmed == [2]
+    content = prefetcher.take(2)
+    assert content.mission_num == 2 and calls == [2]
+    assert prefetcher.hits == 1 and prefetcher.misses == 0
+    print("  ✅ Clic en 'siguiente' sin trabajo adicional")
+
+
+def test_take_without_idle_builds_synchronously():
+    """Si la tarea ociosa no se ejecutó, take construye y cancela la pendiente"""
+    print("\n⚡ Verificando construcción bajo demanda...")
+    root, calls = FakeRoot(), []
+    prefetcher = MissionPrefetcher(root, _preparer(calls))
+    prefetcher.schedule(3)
+    content = prefetcher.take(3)
+    assert content.mission_num == 3 and calls == [3]
+    assert not root.idle and prefetcher.misses == 1
+    prefetcher.schedule(4)
+    prefetcher.clear()
+    root.run_idle()
+    assert calls == [3]
+    print("  ✅ Mismo contenido por ambos caminos")
+
+
+def test_layout_is_deterministic_permutation():
+    """El orden barajado es estable por misión y conserva las opciones"""
+    print("\n🔀 Verificando orden de opciones...")
+    options = {chr(65 + i): f"texto {i}" for i in range(6)}
+    first = shuffled_layout(options, "7:Puzzle")
+    assert first == options and list(first) == list(shuffled_layout(options, "7:Puzzle"))
+    layouts = {tuple(shuffled_layout(options, f"{n}:Puzzle")) for n in range(20)}
+    assert len(layouts) > 1
+    print("  ✅ Permutación determinista")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_idle_prefetch_is_a_hit,
+        test_take_without_idle_builds_synchronously,
+        test_layout_is_deterministic_permutation,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del almacén de perfiles y el cambio rápido de usuario
+"""
+import json
+import os
+import sys
+import tempfile
+
+from profile_store import ProfileStore, profile_filename
+from session_recorder import SessionRecorder, create_headless_controller, replay_session
+from storage import load_json, save_json
+
+
+def _fresh_state():
+    return {"score": 0, "best_streak": 0, "user_id": None}
+
+
+def test_index_and_lazy_loading():
+    """Cada perfil se escribe en su archivo y sólo se lee al activarse"""
+    print("🗂️ Verificando índice y carga perezosa...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ProfileStore(tmp, capacity=4, state_factory=_fresh_state)
+        ana = store.get("ana")
+        ana.game_state["score"] = 7
+        ana.academic_metrics.record_answer(1, True, 3.0)
+        ana.achievement_system.unlocked_achievements.add("first_victory")
+        store.save(ana)
+        store.save(store.get("luis"))
+        index = load_json(os.path.join(tmp, "index.json"))
+        assert sorted(index["users"]) == ["ana", "luis"]
+        assert index["users"]["ana"]["score"] == 7 and index["users"]["ana"]["file"] == profile_filename("ana")
+
+        reopened = ProfileStore(tmp, capacity=4, state_factory=_fresh_state)
+        assert reopened.users() == ["ana", "luis"] and reopened.loads == 0
+        again = reopened.get("ana")
+        assert reopened.loads == 1
+        assert again.game_state["score"] == 7 and again.game_state["user_id"] == "ana"
+        assert again.academic_metrics.metrics["correct_answers"] == 1
+        assert again.achievement_system.unlocked_achievements == {"first_victory"}
+        assert reopened.get("ana") is again and reopened.hits == 1
+    assert profile_filename("ana.g") != profile_filename("ana g")
+    print("  ✅ Índice escrito y perfiles cargados bajo demanda")
+
+
+def test_lru_eviction_saves_dirty_profiles():
+    """Al salir de la caché un perfil modificado se guarda"""
+    print("\n♻️ Verificando caché LRU...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ProfileStore(tmp, capacity=2, state_factory=_fresh_state)
+        first = store.get("u1")
+        first.game_state["score"] = 3
+        store.mark_dirty("u1")
+        store.get("u2")
+        store.get("u3")  # expulsa u1
+        assert store.users() == ["u1", "u2", "u3"]
+        assert os.path.exists(os.path.join(tmp, profile_filename("u1")))
+        assert not os.path.exists(os.path.join(tmp, profile_filename("u2")))
+        reloaded = store.get("u1")
+        assert reloaded is not first and reloaded.game_state["score"] == 3
+    print("  ✅ Perfiles expulsados guardados en disco")
+
+
+def test_reload_without_saved_file_keeps_session():
+    """Recargar antes del primer guardado no borra la sesión en curso"""
+    print("\n🔄 Verificando recarga sin archivo guardado...")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ProfileStore(tmp, state_factory=_fresh_state)
+        ana = store.get("ana")
+        ana.game_state["score"] = 4
+        ana.achievement_system.unlocked_achievements.add("first_victory")
+        assert store.reload("ana") is ana and ana.game_state["score"] == 4
+        store.save(ana)
+        ana.game_state["score"] = 9  # cambio sin guardar: recargar lo descarta
+        reloaded = store.reload("ana")
+        assert reloaded is not ana and reloaded.game_state["score"] == 4
+        assert reloaded.achievement_system.unlocked_achievements == {"first_victory"}
+    memory = ProfileStore(state_factory=_fresh_state)
+    luis = memory.get("luis")
+    assert memory.reload("luis") is luis
+    print("  ✅ Sólo se recarga lo que existe en disco")
+
+
+def test_legacy_save_is_imported():
+    """El guardado de un solo usuario se importa como perfil por defecto"""
+    print("\n📦 Verificando importación del guardado antiguo...")
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = os.path.join(tmp, "alpha_progress_v3.json")
+        save_json(legacy, {"game_state": {"score": 5, "user_id": "default_user"},
+                           "academic_metrics": {"total_questions": 9},
+                           "achievements": ["🏆 Primera Victoria"]})
+        store = ProfileStore(os.path.join(tmp, "profiles"), state_factory=_fresh_state, legacy_file=legacy)
+        profile = store.get("default_user")
+        assert profile.game_state["score"] == 5 and profile.dirty
+        assert profile.academic_metrics.metrics["total_questions"] == 9
+        assert profile.achievement_system.unlocked_achievements == {"first_victory"}
+        assert store.flush() == 1 and "default_user" in store.index
+    print("  ✅ Guardado antiguo migrado")
+
+
+def test_switch_user_keeps_each_profile():
+    """Cambiar de usuario conserva el estado de cada alumno sin reinicializar"""
+    print("\n👥 Verificando cambio de usuario...")
+    controller = create_headless_controller()
+    recorder = SessionRecorder(enabled=True, directory=tempfile.gettempdir())
+    controller.recorder = recorder
+    recorder.begin(controller)
+    calls = []
+    controller._initialize_system = lambda: calls.append("init")
+    ui = controller.ui_manager
+
+    def play(correct_answers):
+        ui.next_button.invoke()
+        for _ in range(correct_answers):
+            ui.select_option(controller.game_state["current_puzzle"].answer)
+            ui.next_button.invoke()
+
+    play(2)
+    ana_state, ana_metrics = controller.game_state, controller.academic_metrics
+    controller.switch_user("luis")
+    assert controller.game_state["user_id"] == "luis" and controller.game_state["puzzles_completed"] == 0
+    assert controller.academic_metrics is not ana_metrics
+    play(1)
+    controller.switch_user("default_user")
+    assert controller.game_state is ana_state and controller.academic_metrics is ana_metrics
+    assert ana_metrics.metrics["correct_answers"] == 2
+    controller.restart_session()
+    assert controller.game_state["user_id"] == "default_user"
+    assert controller.profile.game_state is controller.game_state
+    assert calls == []
+    recording = json.loads(json.dumps(recorder.to_dict()))
+    assert [event[2] for event in recording["events"] if event[1] == "user"] == ["luis", "default_user"]
+    result = replay_session(recording)
+    assert result.matches, result.mismatches
+    print("  ✅ Perfiles independientes y reproducción coherente")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_index_and_lazy_loading,
+        test_lru_eviction_saves_dirty_profiles,
+        test_reload_without_saved_file_keeps_session,
+        test_legacy_save_is_imported,
+        test_switch_user_keeps_each_profile,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
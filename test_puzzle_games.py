@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas de la puntuación por lotes y la clasificación de puzzles
+"""
+import random
+import sys
+
+import puzzle_games
+from puzzle_games import (PuzzleChallenge, PuzzleGameManager, Leaderboard, ScoringWeights,
+                          score_batch)
+
+
+def _attempts(count, seed=3):
+    rng = random.Random(seed)
+    return ([rng.choice(["easy", "medium", "hard"]) for _ in range(count)],
+            [rng.uniform(0, 150) for _ in range(count)],
+            [rng.choice([30, 60, 90]) for _ in range(count)],
+            [rng.randint(0, 6) for _ in range(count)])
+
+
+def _original_score(difficulty, time_taken, time_limit, hints_used):
+    """Fórmula original de calculate_score (pesos por defecto)."""
+    multiplier = {"easy": 1, "medium": 1.5, "hard": 2}[difficulty]
+    final_score = 100 * multiplier * (1 - min(0.5, time_taken / time_limit) - hints_used * 0.1)
+    return max(10, int(final_score))
+
+
+def test_batch_matches_calculate_score():
+    """La puntuación por lotes coincide con calculate_score intento a intento"""
+    print("🧮 Verificando puntuación por lotes...")
+    manager = PuzzleGameManager()
+    difficulties, times, limits, hints = _attempts(2000)
+    expected = [_original_score(d, t, l, h) for d, t, l, h in zip(difficulties, times, limits, hints)]
+    assert expected == [
+        manager.calculate_score(PuzzleChallenge("riddle", "", "", None, None, [], d, l), t, h)
+        for d, t, l, h in zip(difficulties, times, limits, hints)
+    ]
+    assert score_batch(difficulties, times, limits, hints, use_numpy=False) == expected
+    if puzzle_games.np is not None:
+        assert score_batch(difficulties, times, limits, hints, use_numpy=True) == expected
+        print("  ✅ Python puro y NumPy coinciden")
+    else:
+        print("  ✅ Python puro coincide (NumPy no instalado)")
+
+
+def test_leaderboard_keeps_top_k():
+    """El montículo conserva exactamente los K mejores, con desempate por antigüedad"""
+    print("\n🏆 Verificando clasificación top-K...")
+    rng = random.Random(9)
+    scores = [rng.randint(10, 200) for _ in range(5000)]
+    board = Leaderboard(capacity=25)
+    for index, score in enumerate(scores):
+        board.add(score, f"alumno{index}", index)
+    expected = sorted(range(len(scores)), key=lambda i: (-scores[i], i))[:25]
+    assert [entry["attempt_id"] for entry in board.top()] == expected
+    assert board.threshold() == scores[expected[-1]]
+
+    rebuilt = Leaderboard(capacity=25)
+    rebuilt.rebuild(scores, [f"alumno{i}" for i in range(len(scores))])
+    assert rebuilt.top() == board.top()
+    print("  ✅ Top-25 correcto")
+
+
+def test_rescore_history_with_new_weights():
+    """Cambiar los pesos repuntúa todo el historial y la clasificación"""
+    print("\n⚖️ Verificando repuntuación del historial...")
+    manager = PuzzleGameManager(leaderboard_size=3)
+    easy = PuzzleChallenge("riddle", "", "", None, None, [], "easy", 60)
+    hard = PuzzleChallenge("riddle", "", "", None, None, [], "hard", 60)
+    manager.record_attempt("ana", easy, 6.0, 0)
+    manager.record_attempt("luis", hard, 30.0, 2)
+    manager.record_attempt("eva", hard, 6.0, 1)
+    assert manager.scores == [90, 60, 160]
+    assert [e["student"] for e in manager.leaderboard.top()] == ["eva", "ana", "luis"]
+
+    weights = ScoringWeights(multipliers={"easy": 3, "medium": 1.5, "hard": 1}, hint_penalty=0.3)
+    assert manager.rescore_history(weights) == [270, 10, 60]
+    assert manager.calculate_score(easy, 6.0, 0) == 270  # misma fórmula y pesos que el historial
+    try:
+        ScoringWeights().multipliers["easy"] = 5
+        assert False, "Los multiplicadores por defecto son de solo lectura"
+    except TypeError:
+        pass
+    assert [e["student"] for e in manager.leaderboard.top()] == ["ana", "eva", "luis"]
+    print("  ✅ Historial repuntuado")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_batch_matches_calculate_score,
+        test_leaderboard_keeps_top_k,
+        test_rescore_history_with_new_weights,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del generador procedural de puzzles
+"""
+import os
+import sys
+import tempfile
+
+from missions import MISSIONS
+from puzzle_generator import PuzzleGenerator, GENERATED_TYPES, extract_facts
+from simple_puzzles import get_random_puzzle, validate_puzzle_answer
+
+
+def test_pools_generated_from_bank():
+    """Se generan reservas válidas de los cuatro tipos a partir del banco"""
+    print("🧩 Verificando generación de reservas...")
+    generator = PuzzleGenerator(questions_file="questions_data.json", cache_path=None, pool_size=25)
+    generator.start()
+    assert generator.wait(timeout=30)
+    assert set(generator.pools) == set(GENERATED_TYPES)
+    assert all(len(pool) == 25 for pool in generator.pools.values())
+    terms = {fact.term for fact in extract_facts(MISSIONS, [])}
+    for pool in generator.pools.values():
+        for puzzle in pool:
+            assert puzzle.answer in puzzle.options
+            assert len(puzzle.options) >= 2
+            assert validate_puzzle_answer(puzzle, puzzle.answer)[0]
+    riddle = generator.pools["riddle"][0]
+    assert riddle.answer in terms or riddle.answer in ("Random Forest", "ReLU", "Accuracy")
+    ordering = generator.pools["ordering"][0]
+    assert " → " in ordering.answer
+    print(f"  ✅ {len(generator)} puzzles generados")
+
+
+def test_cache_keyed_by_bank_version():
+    """La caché se reutiliza con el mismo banco y se regenera si cambia"""
+    print("\n💾 Verificando caché por versión del banco...")
+    missions = {k: v for k, v in MISSIONS.items() if k <= 12}
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = os.path.join(tmp, "pools.cache")
+        first = PuzzleGenerator(missions=missions, cache_path=cache, pool_size=10)
+        first.wait()
+        assert not first.from_cache and os.path.exists(cache)
+
+        second = PuzzleGenerator(missions=missions, cache_path=cache, pool_size=10)
+        second.wait()
+        assert second.from_cache and second.version == first.version
+        assert [p.story for p in second.pools["riddle"]] == [p.story for p in first.pools["riddle"]]
+
+        changed = dict(missions)
+        changed[13] = MISSIONS[13]
+        third = PuzzleGenerator(missions=changed, cache_path=cache, pool_size=10)
+        third.wait()
+        assert not third.from_cache and third.version != first.version
+    print("  ✅ Caché invalidada al cambiar el banco")
+
+
+def test_serving_is_deterministic_with_fallback():
+    """Servir por misión es determinista y sin reservas se usa el catálogo fijo"""
+    print("\n🎯 Verificando servicio de puzzles...")
+    generator = PuzzleGenerator(cache_path=None, pool_size=8)
+    types = [generator.puzzle_for(m).puzzle_type for m in range(8)]
+    assert types == list(GENERATED_TYPES) * 2
+    assert generator.puzzle_for(0) is not generator.puzzle_for(4)
+    assert generator.puzzle_for(3) is generator.puzzle_for(3 + 4 * 8)
+    seen = {generator.next_puzzle("memory").story for _ in range(8)}
+    assert len(seen) == 8
+
+    disabled = PuzzleGenerator(enabled=False)
+    assert disabled.puzzle_for(5) is get_random_puzzle(5)
+    print("  ✅ Determinista y con alternativa")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_pools_generated_from_bank,
+        test_cache_keyed_by_bank_version,
+        test_serving_is_deterministic_with_fallback,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas de las salas multijugador con rondas sincronizadas
+"""
+import random
+import sys
+
+from classroom_server import load_room_bank
+from missions import MISSIONS
+from quiz_rooms import PHASE_FINISHED, PHASE_QUESTION, PHASE_REVIEW, Scoreboard, create_local_room
+from test_support import FakeClock
+
+CONFIG = {"deadline_s": 10.0, "review_s": 2.0, "base_points": 100, "speed_bonus": 50, "top_n": 5}
+
+
+def _answer_for(engine):
+    return MISSIONS[engine.questions[engine.round_index].item_id]["answer"]
+
+
+def test_scoreboard_ranks_match_sorting():
+    """Los rangos del árbol de Fenwick coinciden con ordenar todo"""
+    print("🏅 Verificando marcador incremental...")
+    rng = random.Random(49)
+    board = Scoreboard(max_score=50)
+    scores = {}
+    for step in range(2000):
+        participant = f"p{rng.randrange(150)}"
+        score = rng.randrange(0, 120)  # supera max_score: el árbol crece
+        board.update(participant, score)
+        scores[participant] = score
+        if step % 97 == 0:
+            for pid, value in scores.items():
+                assert board.rank(pid) == 1 + sum(1 for other in scores.values() if other > value)
+    expected = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:10]
+    assert [(pid, points) for pid, points, _ in board.top(10)] == expected
+    board.remove(expected[0][0])
+    assert len(board) == len(scores) - 1 and board.top(1)[0][0] == expected[1][0]
+    print(f"  ✅ {len(scores)} participantes con rangos correctos")
+
+
+def test_synchronized_round_with_deadline():
+    """Todos reciben la misma pregunta y sólo cuentan las respuestas a tiempo"""
+    print("\n⏱️ Verificando rondas sincronizadas...")
+    questions, answer_key = load_room_bank("missions")
+    clock = FakeClock()
+    engine, hub = create_local_room(questions, answer_key, clock=clock, config=CONFIG)
+    clients = {name: hub.connect(name) for name in ("ana", "luis", "eva")}
+    engine.start_quiz(count=2, seed=1)
+    engine.flush()
+    prompts = {client.last("question")["prompt"] for client in clients.values()}
+    assert len(prompts) == 1 and engine.phase == PHASE_QUESTION
+
+    clock.advance(2.0)
+    fast = engine.check_answer("ana", _answer_for(engine))
+    assert fast["correct"] and fast["points"] == 100 + 40 and fast["rank"] == 1
+    assert engine.check_answer("ana", _answer_for(engine))["type"] == "rejected"
+    wrong = next(option for option in engine.questions[0].options if option != _answer_for(engine))
+    assert not engine.check_answer("luis", wrong)["correct"]
+    clock.advance(9.0)
+    engine.tick()  # vence el plazo: eva no respondió
+    assert engine.phase == PHASE_REVIEW
+    assert engine.check_answer("eva", _answer_for(engine))["type"] == "rejected"
+    assert engine.participants["eva"].errors == 1
+    assert clients["eva"].last("round_closed")["answer"] == _answer_for(engine)
+
+    clock.advance(2.0)
+    engine.tick()  # fin de la revisión: segunda ronda
+    assert engine.round_index == 1 and clients["luis"].last("question")["round"] == 1
+    for name in ("ana", "luis", "eva"):
+        engine.check_answer(name, _answer_for(engine))
+    assert engine.phase == PHASE_REVIEW  # todos respondieron: cierre anticipado
+    clock.advance(2.0)
+    engine.tick()
+    assert engine.phase == PHASE_FINISHED
+    standings = clients["eva"].last("final_results")["standings"]
+    assert [row["participant"] for row in standings] == ["ana", "eva", "luis"]
+    assert standings[0]["score"] == 2 and standings[2]["errors"] == 1
+    assert standings[1]["rank"] == standings[2]["rank"] == 2  # mismos puntos, mismo rango
+    print("  ✅ Plazos, cierre anticipado y clasificación final correctos")
+
+
+def test_round_waits_for_connected_after_leave():
+    """Quien sale a mitad de ronda no cuenta; la ronda espera a los conectados"""
+    print("\n🚪 Verificando salidas a mitad de ronda...")
+    questions, answer_key = load_room_bank("missions")
+    clock = FakeClock()
+    engine, hub = create_local_room(questions, answer_key, clock=clock, config=CONFIG)
+    for name in ("a", "b", "c"):
+        hub.connect(name)
+    engine.start_quiz(count=2, seed=3)
+    engine.check_answer("a", _answer_for(engine))
+    engine.leave("a")
+    engine.check_answer("b", _answer_for(engine))
+    assert engine.phase == PHASE_QUESTION  # c sigue conectado y sin responder
+    assert engine.check_answer("c", _answer_for(engine))["type"] == "answer_result"
+    assert engine.phase == PHASE_REVIEW
+
+    clock.advance(CONFIG["review_s"])
+    engine.tick()
+    engine.check_answer("b", _answer_for(engine))
+    engine.leave("c")  # sólo faltaba c: salir cierra la ronda
+    assert engine.phase == PHASE_REVIEW and engine.participants["c"].errors == 1
+    hub.connect("a")
+    clock.advance(CONFIG["review_s"])
+    engine.tick()
+    assert engine.phase == PHASE_FINISHED
+    print("  ✅ Rondas cerradas sólo cuando responden los conectados")
+
+
+def test_batched_broadcast_with_hundreds_of_clients():
+    """Cientos de respuestas entre dos ticks producen un solo envío difundido"""
+    print("\n📡 Verificando difusión por lotes...")
+    questions, answer_key = load_room_bank("missions")
+    clock = FakeClock()
+    engine, hub = create_local_room(questions, answer_key, clock=clock, config=CONFIG)
+    clients = [hub.connect(f"alumno{n:03d}") for n in range(400)]
+    engine.start_quiz(count=3, seed=2)
+    engine.flush()
+    rng = random.Random(5)
+    for round_index in range(3):
+        hub.deliveries = 0
+        for client in clients[:-1]:  # el último nunca responde
+            clock.advance(0.01)
+            question = engine.questions[engine.round_index]
+            option = _answer_for(engine) if rng.random() < 0.6 else rng.choice(question.options)
+            engine.check_answer(client.participant_id, option)
+        sends = engine.flush()
+        assert sends == len(clients) - 1 + 1  # respuestas directas + una difusión
+        assert hub.deliveries == sends
+        board = clients[-1].last("scoreboard")
+        assert board["round"] == round_index and len(board["top"]) == 5
+        assert len(board["changes"]) == len(clients) - 1
+        clock.advance(CONFIG["deadline_s"])
+        engine.tick()
+        clock.advance(CONFIG["review_s"])
+        engine.tick()
+    assert engine.phase == PHASE_FINISHED
+    final = clients[0].last("final_results")["standings"]
+    assert len(final) == 400 and final[-1]["participant"] == "alumno399" and final[-1]["errors"] == 3
+    points = [row["points"] for row in final]
+    assert points == sorted(points, reverse=True)
+    print(f"  ✅ {len(clients)} clientes, {engine.broadcasts_sent} mensajes difundidos")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_scoreboard_ranks_match_sorting,
+        test_synchronized_round_with_deadline,
+        test_round_waits_for_connected_after_leave,
+        test_batched_broadcast_with_hundreds_of_clients,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del grabador de sesiones y la reproducción sin pantalla
+"""
+import json
+import os
+import sys
+import tempfile
+
+from session_recorder import SessionRecorder, create_headless_controller, replay_session
+from storage import load_json
+from test_support import FakeClock
+from ui_registry import available_skins
+
+
+def _record_session(directory):
+    """Juega una sesión corta sin pantalla con el grabador activo."""
+    controller = create_headless_controller()
+    clock = FakeClock(1_700_000_000.0)
+    controller.clock = clock
+    recorder = SessionRecorder(enabled=True, directory=directory)
+    controller.recorder = recorder
+    recorder.begin(controller)
+    ui = controller.ui_manager
+
+    def answer(correct):
+        puzzle = controller.game_state["current_puzzle"]
+        key = puzzle.answer if correct else next(k for k in ui.options if k != puzzle.answer)
+        clock.advance(7.25)
+        ui.select_option(key)
+
+    controller.set_learning_mode("quiz")
+    for correct in (True, True, False, True, False):
+        clock.advance(1.5)
+        ui.next_button.invoke()
+        clock.advance(0.5)
+        ui.hint_button.invoke()
+        answer(correct)
+    clock.advance(2.0)
+    ui.retry_button.invoke()
+    return controller, recorder
+
+
+def test_recording_is_compact():
+    """Cada entrada se guarda como una lista corta con tiempo relativo"""
+    print("🎬 Verificando formato de grabación...")
+    skins = available_skins()
+    with tempfile.TemporaryDirectory() as tmp:
+        controller, recorder = _record_session(tmp)
+        assert available_skins() == skins  # la interfaz headless no se registra como skin
+        kinds = [event[1] for event in recorder.events]
+        assert kinds[0] == "mode" and recorder.events[0] == [0.0, "mode", "quiz"]
+        assert kinds.count("next") == 5 and kinds.count("answer") == 5 and kinds.count("hint") == 5
+        assert kinds[-1] == "retry"
+        assert all(len(event) in (2, 3) for event in recorder.events)
+        path = recorder.finish()
+        assert path and os.path.exists(path)
+        assert recorder.finish() is None  # sólo se guarda una vez
+        saved = load_json(path)
+    assert saved["events"] == recorder.events
+    assert saved["final_state"]["game_state"]["puzzles_completed"] == 3
+    assert saved["final_state"]["metrics"]["total_questions"] == 5
+    print(f"  ✅ {len(saved['events'])} eventos guardados")
+
+
+def test_replay_matches_recorded_state():
+    """La reproducción llega al mismo estado, métricas y logros"""
+    print("\n▶️ Verificando reproducción determinista...")
+    with tempfile.TemporaryDirectory() as tmp:
+        controller, recorder = _record_session(tmp)
+        recording = json.loads(json.dumps(recorder.to_dict()))
+    result = replay_session(recording)
+    assert result.matches, result.mismatches
+    assert result.events == len(recording["events"])
+    assert result.final_state["game_state"]["score"] == controller.game_state["score"]
+    assert result.final_state["achievements"] == recording["final_state"]["achievements"]
+    print(f"  ✅ {result.events} eventos, {result.events_per_second:.0f} eventos/s")
+
+
+def test_replay_detects_divergence():
+    """Una grabación alterada produce diferencias"""
+    print("\n🔍 Verificando detección de diferencias...")
+    with tempfile.TemporaryDirectory() as tmp:
+        controller, recorder = _record_session(tmp)
+        recording = json.loads(json.dumps(recorder.to_dict()))
+    answers = [event for event in recording["events"] if event[1] == "answer"]
+    answers[0][0] += 30.0  # respuesta más lenta: cambian los tiempos
+    recording["final_state"]["achievements"].append("logro_inexistente")
+    result = replay_session(recording)
+    assert not result.matches
+    assert any(m.startswith("metrics.time_spent") for m in result.mismatches)
+    assert any(m.startswith("achievements") for m in result.mismatches)
+    print(f"  ✅ {len(result.mismatches)} diferencias detectadas")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_recording_is_compact,
+        test_replay_matches_recorded_state,
+        test_replay_detects_divergence,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
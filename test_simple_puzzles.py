@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del catálogo memoizado de puzzles simples
+"""
+import sys
+
+from simple_puzzles import (PUZZLE_DATA, PUZZLE_TYPE_ORDER, PuzzleCatalog, get_puzzle_catalog,
+                            get_random_puzzle, create_logic_puzzle, validate_puzzle_answer,
+                            _build_feedback)
+
+
+def test_selection_semantics_preserved():
+    """El tipo sale de mission_num % 4 y el puzzle de mission_num % len(tipo)"""
+    print("🧩 Verificando selección de puzzles...")
+    for mission_num in range(-3, 250):
+        puzzle = get_random_puzzle(mission_num)
+        puzzle_type = PUZZLE_TYPE_ORDER[mission_num % len(PUZZLE_TYPE_ORDER)]
+        pool = PUZZLE_DATA[puzzle_type]
+        expected = pool[mission_num % len(pool)]
+        assert puzzle.puzzle_type == puzzle_type
+        assert puzzle.title == expected["title"]
+        assert dict(puzzle.options) == expected["options"]
+        assert puzzle.answer == expected["answer"]
+    assert create_logic_puzzle(3).title == PUZZLE_DATA["logic"][1]["title"]
+    print("  ✅ Misma secuencia que las fábricas originales")
+
+
+def test_catalog_instances_are_shared_and_frozen():
+    """El catálogo se construye una vez y sus puzzles no se pueden modificar"""
+    print("\n🔒 Verificando instancias inmutables...")
+    assert get_puzzle_catalog() is get_puzzle_catalog()
+    assert get_random_puzzle(5) is get_random_puzzle(5 + 4 * 2)
+    puzzle = get_random_puzzle(0)
+    for mutate in (lambda: setattr(puzzle, "answer", "otra"),
+                   lambda: puzzle.options.__setitem__("nueva", "opción")):
+        try:
+            mutate()
+        except (AttributeError, TypeError):
+            pass
+        else:
+            raise AssertionError("El puzzle del catálogo no debería ser mutable")
+    try:
+        PuzzleCatalog({"logic": ({"title": "t", "story": "s", "options": {"a": "1", "b": "2"},
+                                  "answer": "c"},)})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Se esperaba ValueError con datos inválidos")
+    print("  ✅ Compartidas, inmutables y validadas")
+
+
+def test_feedback_precomputed():
+    """El feedback precalculado es idéntico al construido bajo demanda"""
+    print("\n💬 Verificando feedback precalculado...")
+    puzzle = get_random_puzzle(2)
+    for option in puzzle.options:
+        is_correct, feedback = validate_puzzle_answer(puzzle, option)
+        assert is_correct == (option == puzzle.answer)
+        assert feedback == _build_feedback(puzzle, option)
+        assert feedback is puzzle.feedback[option][1]
+    is_correct, feedback = validate_puzzle_answer(puzzle, "respuesta inexistente")
+    assert not is_correct and "respuesta inexistente" in feedback
+    print("  ✅ Validar una respuesta es una búsqueda")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_selection_semantics_preserved,
+        test_catalog_instances_are_shared_and_frozen,
+        test_feedback_precomputed,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del perfil de arranque (importaciones, fases y presupuesto)
+"""
+import json
+import os
+import sys
+import tempfile
+
+from startup_profiler import (StartupProfiler, check_budget, format_report,
+                              main, parse_importtime)
+from test_support import FakeClock
+
+SAMPLE_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      3100 |       3100 |     _tkinter
+import time:      2900 |       6000 |   tkinter
+import time:     15000 |      15000 |   missions
+import time:      4000 |      25000 | game_controller
+"""
+
+
+def test_parse_importtime():
+    """Se interpretan coste propio, acumulado y anidamiento"""
+    print("🔍 Verificando lectura de -X importtime...")
+    records = parse_importtime(SAMPLE_IMPORTTIME)
+    assert [r["module"] for r in records] == ["_io", "_tkinter", "tkinter", "missions", "game_controller"]
+    by_name = {r["module"]: r for r in records}
+    assert by_name["game_controller"]["depth"] == 0
+    assert by_name["tkinter"]["depth"] == 1
+    assert by_name["_tkinter"]["depth"] == 2
+    assert by_name["missions"]["self_ms"] == 15.0
+    print(f"  ✅ {len(records)} módulos interpretados")
+
+
+def test_phases_and_budget():
+    """Las fases se miden y el presupuesto detecta regresiones"""
+    print("\n⏱️ Verificando fases y presupuesto...")
+    clock = FakeClock()
+    profiler = StartupProfiler(enabled=True, clock=clock)
+    with profiler.phase("load_progress"):
+        clock.now += 0.030
+    with profiler.phase("_setup_ui"):
+        clock.now += 0.200
+    imports = {"entry_module": "game_controller", "total_ms": 25.0,
+               "modules": parse_importtime(SAMPLE_IMPORTTIME)}
+    report = profiler.report(imports)
+    assert round(report["phases_ms"]["_setup_ui"]) == 200
+    assert "load_progress" in format_report(report)
+
+    budget = {"total_import_ms": 50, "modules": {"missions": 10},
+              "phases": {"_setup_ui": 150, "load_progress": 100, "first_paint": 10}}
+    violations = check_budget(report, budget)
+    assert len(violations) == 2, violations  # missions y _setup_ui; first_paint no se midió
+    print(f"  ✅ {len(violations)} incumplimientos detectados")
+
+
+def test_disabled_profiler_records_nothing():
+    """Desactivado, el perfilador no registra fases"""
+    print("\n💤 Verificando modo desactivado...")
+    profiler = StartupProfiler(enabled=False)
+    with profiler.phase("load_system_config"):
+        pass
+    assert profiler.phases == {}
+    print("  ✅ Sin mediciones")
+
+
+def test_cli_budget_exit_code():
+    """La línea de comandos falla con un presupuesto imposible"""
+    print("\n🚦 Verificando código de salida con presupuesto...")
+    with tempfile.TemporaryDirectory() as tmp:
+        tight = os.path.join(tmp, "budget.json")
+        with open(tight, "w", encoding="utf-8") as f:
+            json.dump({"total_import_ms": 0.001}, f)
+        assert main(["--module", "config", "--budget", tight]) == 1
+        loose = os.path.join(tmp, "loose.json")
+        with open(loose, "w", encoding="utf-8") as f:
+            json.dump({"total_import_ms": 60000}, f)
+        assert main(["--module", "config", "--budget", loose]) == 0
+    print("  ✅ Códigos de salida correctos")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_parse_importtime,
+        test_phases_and_budget,
+        test_disabled_profiler_records_nothing,
+        test_cli_budget_exit_code,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas de la exportación estática HTML/JS
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from answer_key import question_feedback
+from static_export import StaticExporter, default_sources
+
+QUESTIONS = [
+    {"question": "¿2+2?", "options": ["3", "4"], "answer": "4", "formula": "Suma básica", "category": "Matemáticas"},
+    {"question": "¿Qué es CNN?", "options": ["Red convolucional", "Árbol"], "answer": "Red convolucional",
+     "formula": "Capas convolucionales", "category": "Deep Learning"},
+    {"question": "¿Qué es RNN?", "options": ["Red recurrente", "Regresión"], "answer": "Red recurrente",
+     "formula": "Memoria de secuencia", "category": "Deep Learning"},
+]
+
+
+def _write_questions(path, questions):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(questions, f, ensure_ascii=False)
+
+
+def _read_shard(out, entry):
+    with open(os.path.join(out, entry["file"]), encoding="utf-8") as f:
+        text = f.read().strip()
+    assert text.startswith("AlphaQuiz.loadShard(") and text.endswith(");")
+    return json.loads(text[len("AlphaQuiz.loadShard("):-2])
+
+
+def _manifest(out):
+    with open(os.path.join(out, "manifest.js"), encoding="utf-8") as f:
+        text = f.read().strip()
+    return json.loads(text[len("AlphaQuiz.manifest("):-2])["shards"]
+
+
+def test_bundle_contents():
+    """El paquete trae un fragmento minificado por categoría con el índice de la respuesta"""
+    print("📦 Verificando contenido del paquete...")
+    with tempfile.TemporaryDirectory() as tmp:
+        questions_file = os.path.join(tmp, "questions_data.json")
+        _write_questions(questions_file, QUESTIONS)
+        out = os.path.join(tmp, "web")
+        report = StaticExporter(out, sources=default_sources(questions_file)).export()
+        for name in ("index.html", "alpha_quiz.js", "style.css", "manifest.js"):
+            assert os.path.exists(os.path.join(out, name)), name
+        manifest = _manifest(out)
+        groups = {entry["group"] for entry in manifest}
+        assert groups == {"preguntas", "misiones", "puzzles"} and report.shards == len(manifest)
+        deep = next(entry for entry in manifest if entry["label"] == "Deep Learning")
+        shard = _read_shard(out, deep)
+        assert deep["count"] == 2 and shard["id"] == deep["id"]
+        for item, source in zip(shard["items"], QUESTIONS[1:]):
+            assert item["o"][item["a"]] == source["answer"] and item["c"] == source["formula"]
+        with open(os.path.join(out, deep["file"]), encoding="utf-8") as f:
+            assert "\n" not in f.read().rstrip("\n")  # minificado
+    print(f"  ✅ {report.shards} fragmentos generados")
+
+
+def test_incremental_rebuild():
+    """Sólo se regeneran los fragmentos cuya fuente cambió"""
+    print("\n⚡ Verificando exportación incremental...")
+    with tempfile.TemporaryDirectory() as tmp:
+        questions_file = os.path.join(tmp, "questions_data.json")
+        _write_questions(questions_file, QUESTIONS)
+        out = os.path.join(tmp, "web")
+        first = StaticExporter(out, sources=default_sources(questions_file)).export()
+        second = StaticExporter(out, sources=default_sources(questions_file)).export()
+        assert second.written == 0 and second.sources_rebuilt == [] and second.skipped == first.written
+
+        changed = [dict(QUESTIONS[0], options=["3", "4", "5"])] + QUESTIONS[1:]
+        _write_questions(questions_file, changed)
+        os.utime(questions_file, ns=(1, 1))  # fecha distinta aunque el sistema sea rápido
+        third = StaticExporter(out, sources=default_sources(questions_file)).export()
+        assert third.sources_rebuilt == ["questions"]
+        assert third.written == 1 and third.removed == 1  # sólo Matemáticas
+        math_entry = next(entry for entry in _manifest(out) if entry["label"] == "Matemáticas")
+        assert _read_shard(out, math_entry)["items"][0]["o"] == ["3", "4", "5"]
+
+        forced = StaticExporter(out, sources=default_sources(questions_file), force=True).export()
+        assert forced.written == 0 and len(forced.sources_rebuilt) == 3
+    print(f"  ✅ Primera: {first.written} escritos; tras el cambio: {third.written} escrito")
+
+
+def test_runtime_scoring_mirrors_quiz_game():
+    """El runtime JS puntúa y redacta el feedback como QuizGame.check_answer"""
+    print("\n🧮 Verificando runtime del navegador...")
+    node = shutil.which("node") or shutil.which("nodejs")
+    if node is None:
+        print("  ⚠️ Node.js no disponible, se omite la ejecución del runtime")
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        questions_file = os.path.join(tmp, "questions_data.json")
+        _write_questions(questions_file, QUESTIONS)
+        out = os.path.join(tmp, "web")
+        StaticExporter(out, sources=default_sources(questions_file)).export()
+        item = {"q": "¿2+2?", "o": ["3", "4"], "a": 1, "c": "Suma básica"}
+        script = (
+            "const AQ = require(process.argv[1]);"
+            "const item = JSON.parse(process.argv[2]);"
+            "const s = AQ.newSession('Matemáticas', 3);"
+            "const r = [AQ.checkAnswer(s, item, 1, false), AQ.checkAnswer(s, item, 0, false),"
+            " AQ.checkAnswer(s, item, 0, true)];"
+            "const store = {}; const storage = {getItem: k => store[k] || null, setItem: (k, v) => { store[k] = v; }};"
+            "let stats; for (let i = 0; i < 55; i++) stats = AQ.saveSession(s, storage);"
+            "console.log(JSON.stringify({r, s, games: stats.total_games, kept: stats.sessions.length}));"
+        )
+        output = subprocess.run([node, "-e", script, os.path.join(out, "alpha_quiz.js"),
+                                 json.dumps(item, ensure_ascii=False)],
+                                capture_output=True, text=True, encoding="utf-8", timeout=60, check=True)
+    data = json.loads(output.stdout)
+    assert [r["feedback"] for r in data["r"]] == [
+        question_feedback("4", "4"),
+        question_feedback("4", "3"),
+        question_feedback("4", "3") + "\n\n💡 Concepto clave: Suma básica",
+    ]
+    assert [r["delay"] for r in data["r"]] == [1500, 1500, 3000]
+    assert data["s"]["score"] == 1 and data["s"]["errors"] == 2
+    assert data["games"] == 55 and data["kept"] == 50
+    print("  ✅ Puntuación, feedback y estadísticas coinciden")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_bundle_contents,
+        test_incremental_rebuild,
+        test_runtime_scoring_mirrors_quiz_game,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
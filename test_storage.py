@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del módulo de almacenamiento (JSON compacto y comprimido)
+"""
+import os
+import sys
+import tempfile
+
+from storage import save_json, load_json, encode_json, decode_json, detect_format
+
+SAMPLE_DATA = {
+    "game_state": {"mission": 3, "score": 2, "user_id": "default_user"},
+    "achievements": ["🏆 Primera Victoria"],
+    "timestamp": "2025-10-27T14:28:22",
+}
+
+
+def test_round_trip_all_formats():
+    """Cada formato debe poder leerse de vuelta sin pérdida"""
+    print("🔍 Verificando ida y vuelta en todos los formatos...")
+    with tempfile.TemporaryDirectory() as tmp:
+        for method in ("none", "gzip", "zlib", "lzma"):
+            for compact in (False, True):
+                path = os.path.join(tmp, f"save_{method}_{compact}.json")
+                save_json(path, SAMPLE_DATA, compression=method, compact=compact)
+                assert load_json(path) == SAMPLE_DATA, f"{method}/{compact}"
+                print(f"  ✅ {method} (compacto={compact})")
+
+
+def test_format_detection():
+    """El lector detecta el contenedor por su cabecera"""
+    print("\n📦 Verificando detección de formato...")
+    assert detect_format(encode_json(SAMPLE_DATA, compression="none")) is None
+    assert detect_format(encode_json(SAMPLE_DATA, compression="gzip")) == "gzip"
+    assert detect_format(encode_json(SAMPLE_DATA, compression="zlib")) == "zlib"
+    assert detect_format(encode_json(SAMPLE_DATA, compression="lzma")) == "lzma"
+    # Archivos antiguos con BOM siguen siendo legibles
+    assert decode_json(b"\xef\xbb\xbf" + encode_json(SAMPLE_DATA, compression="none")) == SAMPLE_DATA
+    print("  ✅ Cabeceras reconocidas")
+
+
+def test_compact_is_smaller():
+    """El modo compacto y la compresión reducen el tamaño"""
+    print("\n📉 Verificando reducción de tamaño...")
+    pretty = encode_json(SAMPLE_DATA, compression="none", compact=False)
+    compact = encode_json(SAMPLE_DATA, compression="none", compact=True)
+    assert len(compact) < len(pretty)
+    assert b"\n" not in compact
+    print(f"  ✅ {len(pretty)} → {len(compact)} bytes")
+
+
+def test_invalid_method():
+    """Un método desconocido produce ValueError"""
+    print("\n⚠️ Verificando método inválido...")
+    try:
+        encode_json(SAMPLE_DATA, compression="zip")
+    except ValueError:
+        print("  ✅ ValueError lanzado")
+    else:
+        raise AssertionError("Se esperaba ValueError")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_round_trip_all_formats,
+        test_format_detection,
+        test_compact_is_smaller,
+        test_invalid_method,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Utilidades compartidas por las pruebas (no contiene pruebas)
+"""
+
+
+class FakeClock:
+    """Reloj manual en segundos para pruebas deterministas."""
+
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
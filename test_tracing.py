@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas de las trazas de rutas críticas
+"""
+import json
+import os
+import sys
+import tempfile
+
+from test_support import FakeClock
+from tracing import Tracer, HOT_PATHS
+
+
+class Game:
+    """Clase mínima con una llamada anidada"""
+    def __init__(self, clock):
+        self.clock = clock
+
+    def handle_answer(self):
+        self.clock.now += 0.001
+        self.record_answer()
+        self.clock.now += 0.001
+        return "ok"
+
+    def record_answer(self):
+        self.clock.now += 0.003
+
+
+def test_nested_spans():
+    """Las llamadas anidadas producen spans contenidos en el padre"""
+    print("🧵 Verificando spans anidados...")
+    clock = FakeClock()
+    tracer = Tracer(enabled=True, clock=clock)
+    assert tracer.instrument_class(Game, ("handle_answer", "record_answer", "inexistente"), "game") == 2
+    try:
+        assert Game(clock).handle_answer() == "ok"
+    finally:
+        tracer.uninstall()
+    child, parent = tracer.events
+    assert parent["name"] == "Game.handle_answer" and child["name"] == "Game.record_answer"
+    assert parent["ts"] <= child["ts"]
+    assert child["ts"] + child["dur"] <= parent["ts"] + parent["dur"]
+    assert round(parent["dur"]) == 5000 and round(child["dur"]) == 3000
+    assert not getattr(Game.__dict__["handle_answer"], "_traced", False)
+    print("  ✅ Anidamiento correcto y métodos restaurados")
+
+
+def test_disabled_tracer_records_nothing():
+    """Desactivado no registra eventos ni altera resultados"""
+    print("\n💤 Verificando modo desactivado...")
+    clock = FakeClock()
+    tracer = Tracer(enabled=False, clock=clock)
+    wrapped = tracer.wrap(lambda x: x * 2, "doble")
+    with tracer.span("bloque"):
+        assert wrapped(21) == 42
+    assert tracer.events == []
+    print("  ✅ Sin eventos registrados")
+
+
+def test_chrome_trace_export():
+    """La exportación sigue el formato trace_event de Chrome"""
+    print("\n💾 Verificando exportación Chrome trace...")
+    clock = FakeClock()
+    tracer = Tracer(enabled=True, clock=clock)
+    with tracer.span("clic", category="ui", mission=3):
+        clock.now += 0.002
+    with tempfile.TemporaryDirectory() as tmp:
+        path = tracer.export_chrome_trace(os.path.join(tmp, "trace.json"))
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    complete = [e for e in data["traceEvents"] if e["ph"] == "X"]
+    assert len(complete) == 1 and complete[0]["args"] == {"mission": 3}
+    assert all(key in complete[0] for key in ("name", "cat", "ts", "dur", "pid", "tid"))
+    assert any(e["ph"] == "M" for e in data["traceEvents"])
+    assert Tracer(enabled=True).export_chrome_trace(os.devnull) is None
+    print("  ✅ Archivo compatible con el visor")
+
+
+def test_hot_paths_install_and_restore():
+    """Las rutas críticas reales se instrumentan y se restauran"""
+    print("\n🔥 Verificando instrumentación de rutas críticas...")
+    from academic_metrics import AcademicMetrics
+
+    original = AcademicMetrics.__dict__["record_answer"]
+    tracer = Tracer(enabled=True)
+    hot_paths = {key: value for key, value in HOT_PATHS.items() if key.startswith("academic_metrics")}
+    assert tracer.install_hot_paths(hot_paths) == 1
+    assert AcademicMetrics.record_answer is not original
+    assert tracer.install_hot_paths(hot_paths) == 0  # Idempotente
+    tracer.uninstall()
+    assert AcademicMetrics.__dict__["record_answer"] is original
+    print("  ✅ Métodos envueltos y restaurados")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_nested_spans,
+        test_disabled_tracer_records_nothing,
+        test_chrome_trace_export,
+        test_hot_paths_install_and_restore,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del renderizador de teletipo por bloques (sin pantalla)
+"""
+import sys
+
+from frame_scheduler import FrameScheduler
+from test_support import FakeClock
+from typewriter import TypewriterRenderer, TextWidgetTarget
+
+STORY = "🔍 CONCEPTO: Overfitting\n\n" + "El modelo memoriza el ruido del entrenamiento. " * 20
+
+
+class FakeRoot:
+    """Imita after/after_cancel de Tk con un reloj manual"""
+    def __init__(self, clock):
+        self.clock = clock
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        self.pending[self.next_id] = (self.clock.now + ms / 1000.0, func)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def advance(self, seconds):
+        target = self.clock.now + seconds
+        while True:
+            due = [(t, i) for i, (t, _) in self.pending.items() if t <= target]
+            if not due:
+                break
+            t, after_id = min(due)
+            self.clock.now = max(self.clock.now, t)
+            _, func = self.pending.pop(after_id)
+            func()
+        self.clock.now = target
+
+
+class FakeText:
+    """Widget Text mínimo que registra cada inserción"""
+    def __init__(self, clock=None, ms_per_char=0.0, width=80):
+        self.content = ""
+        self.inserts = []
+        self.state = None
+        self.height = 1
+        self.width = width
+        self.clock = clock
+        self.ms_per_char = ms_per_char
+
+    def config(self, state=None, height=None):
+        if state is not None:
+            self.state = state
+        if height is not None:
+            self.height = height
+
+    def cget(self, option):
+        return getattr(self, option)
+
+    def delete(self, start, end):
+        assert self.state == "normal", "Text de solo lectura modificado sin habilitar"
+        self.content = ""
+
+    def insert(self, index, chunk):
+        assert self.state == "normal", "Text de solo lectura modificado sin habilitar"
+        self.inserts.append(chunk)
+        self.content += chunk
+        if self.clock is not None:
+            self.clock.now += len(chunk) * self.ms_per_char / 1000.0
+
+
+class FakeVar:
+    """StringVar mínima que cuenta asignaciones"""
+    def __init__(self):
+        self.value = ""
+        self.sets = 0
+
+    def set(self, value):
+        self.value = value
+        self.sets += 1
+
+    def get(self):
+        return self.value
+
+
+def make_scheduler():
+    clock = FakeClock()
+    root = FakeRoot(clock)
+    return FrameScheduler(root, clock=clock), root, clock
+
+
+def test_text_widget_chunks():
+    """Sobre un Text sólo se inserta lo nuevo, en bloques"""
+    print("🔍 Verificando inserción por bloques en Text...")
+    scheduler, root, _ = make_scheduler()
+    widget = FakeText()
+    done = []
+    renderer = TypewriterRenderer(scheduler, widget, chars_per_second=40)
+    renderer.start(STORY, on_complete=lambda: done.append(True))
+    assert isinstance(renderer.target, TextWidgetTarget)
+    root.advance(len(STORY) / 40.0 + 1)
+    assert widget.content == STORY
+    assert done == [True]
+    assert not renderer.running
+    assert widget.state == "disabled"
+    assert len(widget.inserts) < len(STORY)
+    print(f"  ✅ {len(STORY)} caracteres en {len(widget.inserts)} inserciones")
+
+
+def test_read_only_text_target():
+    """El Text queda deshabilitado entre bloques y su altura se ajusta al texto completo"""
+    print("\n🔒 Verificando Text de solo lectura...")
+    scheduler, root, _ = make_scheduler()
+    widget = FakeText(width=40)
+    target = TextWidgetTarget(widget, fit_height=True)
+    renderer = TypewriterRenderer(scheduler, target, chars_per_second=40)
+    renderer.start(STORY)
+    assert widget.state == "disabled" and widget.height == target.estimate_lines(STORY)
+    root.advance(0.5)
+    assert widget.state == "disabled" and 0 < len(widget.content) < len(STORY)
+    target.replace("Hola\n\nMundo")
+    assert widget.content == "Hola\n\nMundo" and widget.height == 3 and widget.state == "disabled"
+    assert target.estimate_lines("x" * 100) == 3  # 36 caracteres útiles por línea
+    print(f"  ✅ Historia de {widget.height} líneas sin edición posible")
+
+
+def test_late_frames_catch_up():
+    """Con frames lentos la velocidad nominal se mantiene con bloques mayores"""
+    print("\n⏱️ Verificando recuperación con frames tardíos...")
+    scheduler, root, clock = make_scheduler()
+    widget = FakeText()
+    renderer = TypewriterRenderer(scheduler, widget, chars_per_second=40)
+    renderer.start(STORY)
+    root.pending.clear()  # Simula un bucle de eventos bloqueado medio segundo
+    clock.now += 0.5
+    scheduler.flush()
+    assert len(widget.inserts[-1]) >= 19, widget.inserts
+    print(f"  ✅ Bloque de {len(widget.inserts[-1])} caracteres tras 500 ms")
+
+
+def test_skip_completes_once():
+    """Saltar muestra el resto y avisa una sola vez"""
+    print("\n⏩ Verificando salto instantáneo...")
+    scheduler, root, _ = make_scheduler()
+    variable = FakeVar()
+    done = []
+    renderer = TypewriterRenderer(scheduler, variable)
+    renderer.start(STORY, on_complete=lambda: done.append(True))
+    root.advance(0.2)
+    renderer.skip()
+    renderer.skip()
+    root.advance(1.0)
+    assert variable.get() == STORY
+    assert done == [True]
+    print(f"  ✅ Texto completo con {variable.sets} asignaciones")
+
+
+def test_budget_limits_chunk_and_interval():
+    """Un pintado caro limita el bloque y espacia los frames"""
+    print("\n🐢 Verificando adaptación a pintado lento...")
+    scheduler, root, clock = make_scheduler()
+    widget = FakeText(clock, ms_per_char=2.0)
+    renderer = TypewriterRenderer(scheduler, widget, chars_per_second=200,
+                                  render_budget_ms=4.0)
+    renderer.start(STORY)
+    root.advance(1.0)
+    assert max(len(chunk) for chunk in widget.inserts[1:]) <= 3, widget.inserts[:10]
+    assert renderer._interval_ms > renderer._base_interval_ms
+    renderer.skip()
+    assert widget.content == STORY
+    print(f"  ✅ Intervalo adaptado a {renderer._interval_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_text_widget_chunks,
+        test_read_only_text_target,
+        test_late_frames_catch_up,
+        test_skip_completes_once,
+        test_budget_limits_chunk_and_interval,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
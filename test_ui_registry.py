@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pruebas del registro de skins de interfaz (sin pantalla)
+"""
+import os
+import subprocess
+import sys
+
+import ui_registry
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_only_selected_skin_is_imported():
+    """Resolver una skin importa únicamente su módulo"""
+    print("🔍 Verificando carga diferida de skins...")
+    code = (
+        "import sys, ui_registry\n"
+        "ui_registry.resolve_ui_backend('basic')\n"
+        "print(','.join(sorted(m for m in sys.modules if m.startswith('ui_manager'))))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], cwd=BASE_DIR,
+                            capture_output=True, text=True, check=True).stdout.strip()
+    assert output == "ui_manager_basic", output
+    print(f"  ✅ Módulos cargados: {output}")
+
+
+def test_registry_resolution():
+    """Todas las skins registradas exponen un UIManager; las desconocidas fallan"""
+    print("\n🎨 Verificando resolución de skins...")
+    assert len(ui_registry.available_skins()) == 7
+    backend = ui_registry.resolve_ui_backend("clean")
+    assert backend.__name__ == "UIManager"
+    assert ui_registry.resolve_ui_backend("clean") is backend
+    try:
+        ui_registry.resolve_ui_backend("retro")
+    except ValueError:
+        print("  ✅ Skin desconocida rechazada")
+    else:
+        raise AssertionError("Se esperaba ValueError")
+
+
+def test_font_table_is_cached():
+    """La tabla de fuentes se construye una vez por especificación"""
+    print("\n🔤 Verificando tabla de fuentes compartida...")
+    first = ui_registry.get_font_table()
+    assert first is ui_registry.get_font_table()
+    assert first["body"] == ("Arial", 16, "normal")
+    custom = ui_registry.get_font_table({"body": ("Arial", 14, "normal")})
+    assert custom is not first
+    print("  ✅ Tablas cacheadas por especificación")
+
+
+def test_measure_import_cost():
+    """La medición de coste de importación devuelve milisegundos"""
+    print("\n⏱️ Verificando medición de costes...")
+    costs = ui_registry.measure_skin_costs(["basic"])
+    assert costs["basic"]["import_ms"] > 0
+    assert "construct_ms" not in costs["basic"]
+    print(f"  ✅ basic: {costs['basic']['import_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_only_selected_skin_is_imported,
+        test_registry_resolution,
+        test_font_table_is_cached,
+        test_measure_import_cost,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {test.__name__}: {e}")
+    print(f"\n🎯 Resultado: {len(tests) - failed}/{len(tests)} pruebas pasaron")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,260 @@
+"""
+Tracing Module - Proyecto Alpha v4.0
+Trazas de rutas críticas con spans anidados y exportación a Chrome trace_event.
+"""
+
+import atexit
+import functools
+import importlib
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from config import DIAGNOSTICS_CONFIG
+from storage import save_json
+
+# Variable de entorno que activa las trazas sin tocar config.py
+TRACE_ENV_VAR = "ALPHA_TRACE"
+
+# Rutas críticas: "módulo.Clase" -> métodos a envolver cuando las trazas están activas
+HOT_PATHS: Dict[str, Tuple[str, ...]] = {
+    "game_controller.GameController": (
+        "handle_answer", "handle_puzzle_answer", "load_mission", "start_puzzle_mission",
+        "next_mission", "update_stats_display", "update_progress_display",
+    ),
+    "academic_metrics.AcademicMetrics": ("record_answer",),
+    "achievement_system.AchievementSystem": ("check_achievements",),
+    "ui_manager.UIManager": (
+        "create_option_buttons", "clear_options", "type_story_effect",
+        "update_progress_display", "update_stats_display", "update_achievements_display",
+    ),
+}
+
+logger = logging.getLogger("Tracing")
+
+
+class Tracer:
+    """
+    Registro de spans en memoria.
+
+    Cada span se guarda como un evento completo ("ph": "X") con inicio y
+    duración en microsegundos; el visor reconstruye el anidamiento a partir
+    de los tiempos de cada hilo.
+    """
+
+    def __init__(self, enabled: bool = False, max_events: int = 200000,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.enabled = enabled
+        self.max_events = max_events
+        self.clock = clock
+        self.origin = clock()
+        self.events: List[Dict[str, Any]] = []
+        self.dropped = 0
+        self._patched: List[Tuple[type, str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _complete(self, name: str, category: str, start: float, end: float,
+                  args: Optional[Dict[str, Any]] = None) -> None:
+        """Añade un evento completo al registro."""
+        if len(self.events) >= self.max_events:
+            self.dropped += 1
+            return
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, category: str = "app", **args) -> Iterator[None]:
+        """
+        Mide un bloque como span.
+
+        Args:
+            name: Nombre del span
+            category: Categoría (agrupa en el visor)
+            **args: Datos adicionales a adjuntar al evento
+        """
+        if not self.enabled:
+            yield
+            return
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self._complete(name, category, start, self.clock(), args)
+
+    def wrap(self, func: Callable, name: str, category: str = "app") -> Callable:
+        """
+        Envuelve una función para registrar cada llamada como span.
+
+        Args:
+            func: Función a envolver
+            name: Nombre del span
+            category: Categoría del span
+
+        Returns:
+            Función envuelta
+        """
+        @functools.wraps(func)
+        def traced_call(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            start = self.clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._complete(name, category, start, self.clock())
+
+        traced_call._traced = True
+        return traced_call
+
+    def instrument_class(self, cls: type, method_names: Tuple[str, ...], category: str) -> int:
+        """
+        Sustituye métodos de una clase por versiones trazadas.
+
+        Args:
+            cls: Clase a instrumentar
+            method_names: Métodos a envolver (los inexistentes se ignoran)
+            category: Categoría de los spans
+
+        Returns:
+            Número de métodos instrumentados
+        """
+        count = 0
+        for method_name in method_names:
+            original = cls.__dict__.get(method_name)
+            if original is None or getattr(original, "_traced", False):
+                continue
+            wrapped = self.wrap(original, f"{cls.__name__}.{method_name}", category)
+            setattr(cls, method_name, wrapped)
+            self._patched.append((cls, method_name, original))
+            count += 1
+        return count
+
+    def install_hot_paths(self, hot_paths: Optional[Dict[str, Tuple[str, ...]]] = None) -> int:
+        """
+        Instrumenta las rutas críticas de la aplicación.
+
+        Args:
+            hot_paths: "módulo.Clase" -> métodos (por defecto HOT_PATHS)
+
+        Returns:
+            Número total de métodos instrumentados
+        """
+        total = 0
+        for target, method_names in (hot_paths or HOT_PATHS).items():
+            module_name, class_name = target.rsplit(".", 1)
+            try:
+                cls = getattr(importlib.import_module(module_name), class_name)
+            except Exception as e:
+                logger.warning(f"No se pudo instrumentar {target}: {e}")
+                continue
+            total += self.instrument_class(cls, method_names, module_name)
+        return total
+
+    def uninstall(self) -> None:
+        """Restaura todos los métodos originales."""
+        for cls, method_name, original in reversed(self._patched):
+            setattr(cls, method_name, original)
+        self._patched.clear()
+
+    def clear(self) -> None:
+        """Descarta los eventos registrados."""
+        with self._lock:
+            self.events.clear()
+        self.dropped = 0
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Construye el documento en formato Chrome trace_event.
+
+        Returns:
+            Diccionario con traceEvents, listo para chrome://tracing o Perfetto
+        """
+        with self._lock:
+            events = list(self.events)
+        pid = os.getpid()
+        metadata = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                     "args": {"name": "Proyecto Alpha"}}]
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for tid in sorted({e["tid"] for e in events}):
+            metadata.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                             "args": {"name": names.get(tid, f"hilo-{tid}")}})
+        return {
+            "traceEvents": metadata + events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": self.dropped},
+        }
+
+    def export_chrome_trace(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Guarda las trazas en un archivo JSON.
+
+        Args:
+            path: Ruta destino (usa DIAGNOSTICS_CONFIG si es None)
+
+        Returns:
+            Ruta escrita o None si no había eventos
+        """
+        path = path or DIAGNOSTICS_CONFIG.get("trace_file", "alpha_trace.json")
+        if not self.events:
+            return None
+        save_json(path, self.to_chrome_trace(), compression="none", compact=True)
+        return path
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Obtiene el trazador compartido del proceso."""
+    global _tracer
+    if _tracer is None:
+        enabled = bool(DIAGNOSTICS_CONFIG.get("tracing")) or os.environ.get(TRACE_ENV_VAR) == "1"
+        _tracer = Tracer(enabled=enabled, max_events=DIAGNOSTICS_CONFIG.get("trace_max_events", 200000))
+    return _tracer
+
+
+def traced(name: Optional[str] = None, category: str = "app") -> Callable[[Callable], Callable]:
+    """
+    Decorador para trazar una función concreta.
+
+    Desactivado, el coste es una comprobación booleana por llamada.
+
+    Args:
+        name: Nombre del span (por defecto, el nombre calificado de la función)
+        category: Categoría del span
+    """
+    def decorator(func: Callable) -> Callable:
+        return get_tracer().wrap(func, name or func.__qualname__, category)
+    return decorator
+
+
+def setup_tracing() -> Tracer:
+    """
+    Activa las trazas de rutas críticas si la configuración lo pide.
+
+    Sin trazas activas no se modifica ninguna clase, de modo que el coste
+    es nulo. Con trazas activas, el archivo se exporta al salir.
+
+    Returns:
+        Trazador compartido
+    """
+    tracer = get_tracer()
+    if tracer.enabled and not tracer._patched:
+        count = tracer.install_hot_paths()
+        atexit.register(tracer.export_chrome_trace)
+        logger.info(f"Trazas activas en {count} métodos")
+    return tracer
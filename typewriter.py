@@ -0,0 +1,245 @@
+"""
+Typewriter Module - Proyecto Alpha v4.0
+Efecto de teletipo por bloques con presupuesto de tiempo por frame.
+"""
+
+import logging
+import tkinter as tk
+from typing import Any, Callable, Optional
+
+from frame_scheduler import FrameScheduler, PRIORITY_NORMAL
+
+DEFAULT_CHARS_PER_SECOND = 35.0
+DEFAULT_RENDER_BUDGET_MS = 4.0
+MIN_FRAME_INTERVAL_MS = 33      # ~30 actualizaciones por segundo bastan para texto
+MAX_FRAME_INTERVAL_MS = 100
+
+
+class TextWidgetTarget:
+    """
+    Destino de teletipo sobre un widget Text de solo lectura: inserta sólo el bloque nuevo.
+
+    El widget queda deshabilitado entre bloques, así que no se puede
+    escribir en él aunque tenga el foco. Con `fit_height` la altura se
+    ajusta al empezar a las líneas que ocupará el texto completo (según
+    el ancho en caracteres del widget), para que no salte al escribirse.
+    """
+
+    def __init__(self, widget, fit_height: bool = False, min_lines: int = 1, max_lines: int = 40):
+        self.widget = widget
+        self.fit_height = fit_height
+        self.min_lines = min_lines
+        self.max_lines = max_lines
+
+    def begin(self, text: str) -> None:
+        self.widget.config(state=tk.NORMAL)
+        self.widget.delete("1.0", tk.END)
+        self.widget.config(state=tk.DISABLED)
+        if self.fit_height:
+            self.widget.config(height=self.estimate_lines(text))
+
+    def show(self, text: str, start: int, end: int) -> None:
+        self.widget.config(state=tk.NORMAL)
+        self.widget.insert(tk.END, text[start:end])
+        self.widget.config(state=tk.DISABLED)
+
+    def finish(self, text: str) -> None:
+        self.widget.config(state=tk.DISABLED)
+
+    def replace(self, text: str) -> None:
+        """Muestra un texto completo de una vez (sin animación)."""
+        self.begin(text)
+        self.show(text, 0, len(text))
+        self.finish(text)
+
+    def estimate_lines(self, text: str) -> int:
+        """Líneas que ocupará el texto con ajuste por palabras (con un margen del 10%)."""
+        chars_per_line = max(1, int(int(self.widget.cget("width")) * 0.9))
+        lines = sum(max(1, -(-len(line) // chars_per_line)) for line in text.split("\n"))
+        return min(self.max_lines, max(self.min_lines, lines))
+
+
+class VariableTarget:
+    """
+    Destino de teletipo sobre una StringVar (Label con textvariable).
+
+    Una variable Tk sólo admite reemplazar el valor completo, así que se
+    hace una única asignación por frame en lugar de una por carácter.
+    """
+
+    def __init__(self, variable):
+        self.variable = variable
+
+    def begin(self, text: str) -> None:
+        self.variable.set("")
+
+    def show(self, text: str, start: int, end: int) -> None:
+        self.variable.set(text[:end])
+
+    def finish(self, text: str) -> None:
+        pass
+
+
+def make_target(obj) -> Any:
+    """
+    Envuelve un widget Text o una StringVar en el destino adecuado.
+
+    Args:
+        obj: Widget Text, StringVar o un destino ya construido
+
+    Returns:
+        Objeto con begin/show/finish
+    """
+    if all(hasattr(obj, name) for name in ("begin", "show", "finish")):
+        return obj
+    if hasattr(obj, "insert") and hasattr(obj, "delete"):
+        return TextWidgetTarget(obj)
+    if hasattr(obj, "set"):
+        return VariableTarget(obj)
+    raise TypeError(f"Destino de teletipo no soportado: {type(obj).__name__}")
+
+
+class TypewriterRenderer:
+    """
+    Renderizador de teletipo sobre el planificador de frames.
+
+    La velocidad se expresa en caracteres por segundo y se sigue por tiempo
+    real: si un frame llega tarde, el siguiente bloque es mayor para no
+    ralentizar la historia. El tamaño del bloque se limita por el coste
+    medido de pintar cada carácter, y si aun así se supera el presupuesto,
+    el intervalo entre frames se alarga (menos actualizaciones, más grandes).
+    """
+
+    def __init__(self, scheduler: FrameScheduler, target, name: str = "story_typewriter",
+                 chars_per_second: float = DEFAULT_CHARS_PER_SECOND,
+                 render_budget_ms: float = DEFAULT_RENDER_BUDGET_MS,
+                 priority: int = PRIORITY_NORMAL):
+        """
+        Inicializa el renderizador.
+
+        Args:
+            scheduler: Planificador de frames compartido de la ventana
+            target: Widget Text, StringVar o destino con begin/show/finish
+            name: Nombre de la tarea en el planificador
+            chars_per_second: Velocidad nominal del teletipo
+            render_budget_ms: Tiempo máximo de pintado por frame
+            priority: Prioridad de la tarea dentro del frame
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.scheduler = scheduler
+        self.target = make_target(target)
+        self.name = name
+        self.chars_per_second = chars_per_second
+        self.render_budget_ms = render_budget_ms
+        self.priority = priority
+
+        self.text = ""
+        self.position = 0
+        self.on_complete: Optional[Callable[[], Any]] = None
+        self._started_at = 0.0
+        self._base_interval_ms = max(scheduler.frame_ms, MIN_FRAME_INTERVAL_MS,
+                                     1000.0 / max(chars_per_second, 1.0))
+        self._interval_ms = self._base_interval_ms
+        self._ms_per_char = 0.0  # Media móvil del coste de pintado
+
+        self.frames = 0
+
+    @property
+    def running(self) -> bool:
+        """Indica si hay una animación en curso."""
+        return self.scheduler.has_task(self.name)
+
+    def start(self, text: str, on_complete: Optional[Callable[[], Any]] = None) -> None:
+        """
+        Comienza a escribir un texto, reemplazando cualquier animación previa.
+
+        Args:
+            text: Texto completo a mostrar
+            on_complete: Función a llamar al terminar (también tras skip)
+        """
+        self.scheduler.remove_task(self.name)
+        self.text = text
+        self.position = 0
+        self.on_complete = on_complete
+        self.frames = 0
+        self._interval_ms = self._base_interval_ms
+        self._started_at = self.scheduler.clock()
+        self.target.begin(text)
+        if not text:
+            self._complete()
+            return
+        self._register(delay_ms=0)
+
+    def skip(self) -> None:
+        """Muestra el texto restante de inmediato y termina la animación."""
+        if not self.running:
+            return
+        self.scheduler.remove_task(self.name)
+        if self.position < len(self.text):
+            self.target.show(self.text, self.position, len(self.text))
+            self.position = len(self.text)
+        self._complete()
+
+    def stop(self) -> None:
+        """Detiene la animación sin completar el texto ni avisar."""
+        self.scheduler.remove_task(self.name)
+
+    def _register(self, delay_ms: Optional[float] = None) -> None:
+        """Registra (o re-registra con otro intervalo) la tarea del teletipo."""
+        self.scheduler.add_task(self.name, self._frame, interval_ms=self._interval_ms,
+                                priority=self.priority, budget_ms=self.render_budget_ms,
+                                delay_ms=delay_ms)
+
+    def _chunk_size(self, now: float) -> int:
+        """Calcula cuántos caracteres tocan en este frame."""
+        due = int((now - self._started_at) * self.chars_per_second) + 1
+        size = due - self.position
+        if size <= 0:
+            return 0
+        if self._ms_per_char > 0:
+            size = min(size, max(1, int(self.render_budget_ms / self._ms_per_char)))
+        return size
+
+    def _frame(self) -> bool:
+        """Pinta el siguiente bloque; devuelve False al terminar."""
+        clock = self.scheduler.clock
+        start = clock()
+        end = min(len(self.text), self.position + self._chunk_size(start))
+        chars = end - self.position
+        if chars <= 0:
+            return True  # Frame adelantado: nada pendiente todavía
+        self.target.show(self.text, self.position, end)
+        self.position = end
+        self.frames += 1
+
+        render_ms = (clock() - start) * 1000.0
+        per_char = render_ms / chars
+        self._ms_per_char = per_char if self._ms_per_char == 0 else 0.7 * self._ms_per_char + 0.3 * per_char
+
+        if self.position >= len(self.text):
+            self._complete()
+            return False
+
+        self._adapt_interval(render_ms)
+        return True
+
+    def _adapt_interval(self, render_ms: float) -> None:
+        """Alarga el intervalo si el pintado excede el presupuesto y lo recupera después."""
+        interval = self._interval_ms
+        if render_ms > self.render_budget_ms:
+            interval = min(MAX_FRAME_INTERVAL_MS, interval * 1.5)
+        elif render_ms < self.render_budget_ms / 4:
+            interval = max(self._base_interval_ms, interval / 1.25)
+        if int(interval) != int(self._interval_ms):
+            self._interval_ms = interval
+            self._register()
+
+    def _complete(self) -> None:
+        """Cierra el destino y notifica el final."""
+        self.target.finish(self.text)
+        callback, self.on_complete = self.on_complete, None
+        if callback:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Error al finalizar teletipo: {e}")
@@ -10,11 +10,33 @@ import time
 from datetime import datetime
 
 from config import COLORS, UI_CONFIG, PROFESSIONAL_CONFIG
+from frame_scheduler import get_scheduler
+from typewriter import TextWidgetTarget, TypewriterRenderer
+from ui_registry import get_font_table, apply_styles
+from latency_monitor import get_latency_monitor
 import logging
 from academic_metrics import AcademicMetrics
 from achievement_system import AchievementSystem
 
 
+class _OptionCard:
+    """Tarjeta de opción reutilizable y la opción que muestra en cada momento."""
+
+    __slots__ = ("card", "inner", "letter_label", "title_label", "description_label",
+                 "key", "callback", "hovered")
+
+    def __init__(self, card: tk.Frame, inner: tk.Frame, letter_label: tk.Label,
+                 title_label: tk.Label, description_label: tk.Label):
+        self.card = card
+        self.inner = inner
+        self.letter_label = letter_label
+        self.title_label = title_label
+        self.description_label = description_label
+        self.key: Optional[str] = None
+        self.callback: Optional[Callable] = None
+        self.hovered = False
+
+
 class UIManager:
     """
     Gestor centralizado de la interfaz de usuario.
@@ -27,12 +49,14 @@ class UIManager:
         self.logger = logging.getLogger(self.__class__.__name__)
         """Inicializa el gestor de UI."""
         self.root = root
+        self.scheduler = get_scheduler(root)
+        self.latency_monitor = get_latency_monitor(root)
         self.style = ttk.Style()
 
         # Componentes principales
         self.main_canvas = None
         self.progress_canvas = None
-        self.story_label = None
+        self.story_text = None
         self.feedback_label = None
         self.metrics_label = None
         self.mission_title_label = None
@@ -51,10 +75,19 @@ class UIManager:
         # Variables de estado
         self.focusable_widgets = []
         self.current_focus_index = 0
-        self.after_id = None
+
+        # Tarjetas de opción reutilizables
+        self._option_pool: List[_OptionCard] = []
+        self._active_options = 0
 
         # Variables de texto
+        # La historia se muestra en un Text de solo lectura: el teletipo
+        # inserta sólo cada bloque nuevo. Asignar story_text_var (lo que hace
+        # el controlador) sustituye el texto completo de una vez.
         self.story_text_var = tk.StringVar()
+        self.story_text_var.trace_add("write", self._on_story_text_set)
+        self.story_target: Optional[TextWidgetTarget] = None
+        self.typewriter: Optional[TypewriterRenderer] = None
         self.progress_text_var = tk.StringVar()
         self.feedback_text_var = tk.StringVar()
         self.timer_text_var = tk.StringVar()
@@ -66,43 +99,17 @@ class UIManager:
 
     def setup_styles(self) -> None:
         """Configura estilos ttk profesionales."""
-        self.style.configure('Professional.TButton',
-                           font=UI_CONFIG["font_button"],
-                           padding=10)
-        self.style.configure('Professional.TLabel',
-                           font=UI_CONFIG["font_body"])
-        self.style.configure('Card.TFrame',
-                           relief='raised',
-                           borderwidth=2)
+        # Los estilos ttk son globales a la ventana: sólo se aplican una vez
+        apply_styles(self.style, {
+            'Professional.TButton': {"font": UI_CONFIG["font_button"], "padding": 10},
+            'Professional.TLabel': {"font": UI_CONFIG["font_body"]},
+            'Card.TFrame': {"relief": 'raised', "borderwidth": 2},
+        })
 
     def setup_fonts(self) -> None:
         """Configura fuentes tipográficas modernas."""
-        # Intentar usar Inter, fallback a fuentes del sistema
-        try:
-            # En un entorno real, cargaríamos la fuente Inter
-            # Por ahora usamos fuentes del sistema similares
-            self.fonts = {
-                "title": ("Arial", 28, "bold"),
-                "header": ("Arial", 20, "bold"),
-                "subheader": ("Arial", 18, "bold"),
-                "body": ("Arial", 16, "normal"),
-                "caption": ("Arial", 14, "normal"),
-                "small": ("Arial", 12, "normal"),
-                "button": ("Arial", 14, "bold"),
-                "metrics": ("Arial", 13, "normal"),
-            }
-        except:
-            # Fallback a configuración original
-            self.fonts = {
-                "title": UI_CONFIG["font_title"],
-                "header": UI_CONFIG["font_header"],
-                "subheader": UI_CONFIG["font_subheader"],
-                "body": UI_CONFIG["font_body"],
-                "caption": UI_CONFIG["font_caption"],
-                "small": UI_CONFIG["font_small"],
-                "button": UI_CONFIG["font_button"],
-                "metrics": UI_CONFIG["font_metrics"],
-            }
+        # Tabla compartida derivada de UI_CONFIG, cacheada por ventana
+        self.fonts = get_font_table(root=self.root)
 
     def _is_mac(self) -> bool:
         """Verifica si estamos en macOS."""
@@ -278,12 +285,24 @@ class UIManager:
         story_frame = tk.Frame(content_container, bg=COLORS["bg_card"])
         story_frame.pack(fill=tk.X)
 
-        # Texto de la historia - moderna y legible
-        self.story_label = tk.Label(story_frame, textvariable=self.story_text_var,
-                                   wraplength=UI_CONFIG["content_max_width"], justify=tk.LEFT,
-                                   font=self.fonts["body"], bg=COLORS["bg_card"],
-                                   fg=COLORS["text_primary"], anchor="w")
-        self.story_label.pack(fill=tk.X, anchor=tk.W)
+        # Texto de la historia - moderna y legible (mismo ancho que el antiguo wraplength)
+        body_font = self.fonts["body"]
+        self.story_text = tk.Text(story_frame, wrap=tk.WORD, font=body_font,
+                                  width=UI_CONFIG["content_max_width"] // max(1, body_font.measure("0")),
+                                  height=1, bg=COLORS["bg_card"], fg=COLORS["text_primary"],
+                                  relief=tk.FLAT, bd=0, highlightthickness=0, padx=0, pady=0,
+                                  cursor="arrow", takefocus=0, state=tk.DISABLED)
+        self.story_text.pack(anchor=tk.W)
+        self.story_target = TextWidgetTarget(self.story_text, fit_height=True)
+        self.typewriter = TypewriterRenderer(self.scheduler, self.story_target, chars_per_second=33)
+        self._on_story_text_set()
+
+    def _on_story_text_set(self, *args) -> None:
+        """Muestra de una vez el texto asignado a story_text_var."""
+        if self.story_target is None:
+            return
+        self.typewriter.stop()
+        self.story_target.replace(self.story_text_var.get())
 
     def create_options_section(self, parent: tk.Frame) -> None:
         """Crea la sección de opciones interactivas moderna."""
@@ -544,6 +563,7 @@ class UIManager:
         file_menu = tk.Menu(self.menubar, tearoff=0)
         self.menubar.add_cascade(label="📁 Archivo", menu=file_menu)
         file_menu.add_command(label="🆕 Nueva Sesión", command=callbacks.get("new_session"))
+        file_menu.add_command(label="👥 Cambiar Usuario", command=callbacks.get("switch_user"))
         file_menu.add_command(label="💾 Guardar Progreso", command=callbacks.get("save_progress"))
         file_menu.add_command(label="📂 Cargar Progreso", command=callbacks.get("load_progress"))
         file_menu.add_separator()
@@ -601,6 +621,9 @@ class UIManager:
             if callback:
                 self.root.bind(key, lambda e, cb=callback: cb() if callable(cb) else None)
 
+        if self.latency_monitor.enabled:
+            self.root.bind('<F12>', lambda e: self.latency_monitor.toggle_overlay())
+
     def setup_scroll_bindings(self) -> None:
         """Configura bindings para scroll con mouse."""
         self.root.bind_all("<MouseWheel>", self._on_mousewheel)
@@ -645,80 +668,110 @@ class UIManager:
         self.achievements_text.config(state=tk.DISABLED)
 
     def clear_options(self) -> None:
-        """Limpia todas las opciones de respuesta."""
+        """Oculta las opciones de respuesta (las tarjetas se reutilizan)."""
+        for slot in self._option_pool[:self._active_options]:
+            slot.card.pack_forget()
+            slot.key = None
+            slot.callback = None
+            self._set_option_hover(slot, False)
+        self._active_options = 0
+
+        # Cualquier widget ajeno al pool se sigue destruyendo como antes
+        pooled = {slot.card for slot in self._option_pool}
         for widget in self.options_frame.winfo_children():
-            widget.destroy()
+            if widget not in pooled:
+                widget.destroy()
 
     def create_option_buttons(self, mission_data: Dict[str, Any], callback: Callable) -> None:
         """Crea botones de opción interactivos modernos."""
-        options = list(mission_data["options"].items())
-
-        for i, (choice_key, choice_description) in enumerate(options):
-            # Card de opción moderna
-            option_card = tk.Frame(self.options_frame, bg=COLORS["bg_card"],
-                                  relief="flat", borderwidth=0, cursor="hand2")
-            option_card.pack(fill=tk.X, padx=UI_CONFIG["spacing_lg"], pady=UI_CONFIG["spacing_sm"])
-
-            # Contenedor interno con borde sutil
-            option_inner = tk.Frame(option_card, bg=COLORS["bg_card"],
-                                   padx=UI_CONFIG["card_padding"], pady=UI_CONFIG["card_padding"],
-                                   relief="solid", borderwidth=1)
-            option_inner.pack(fill=tk.X, padx=UI_CONFIG["spacing_xs"], pady=UI_CONFIG["spacing_xs"])
-
-            # Header de opción
-            option_header = tk.Frame(option_inner, bg=COLORS["bg_card"])
-            option_header.pack(fill=tk.X, pady=(0, UI_CONFIG["spacing_sm"]))
-
-            # Letra de opción (A, B, C, etc.)
-            option_letter = chr(65 + i)  # A, B, C...
-            letter_badge = tk.Frame(option_header, bg=COLORS["primary"],
-                                   padx=UI_CONFIG["spacing_sm"], pady=UI_CONFIG["spacing_xs"])
-            letter_badge.pack(side=tk.LEFT)
-
-            letter_label = tk.Label(letter_badge, text=option_letter,
-                                   font=self.fonts["caption"], bg=COLORS["primary"],
-                                   fg=COLORS["text_white"])
-            letter_label.pack()
-
-            # Título de opción
-            option_title = tk.Label(option_header, text=choice_key,
-                                   font=self.fonts["body"], bg=COLORS["bg_card"],
-                                   fg=COLORS["text_primary"])
-            option_title.pack(side=tk.LEFT, padx=UI_CONFIG["spacing_md"])
-
-            # Descripción
-            description_label = tk.Label(option_inner, text=choice_description,
-                                        font=self.fonts["caption"], bg=COLORS["bg_card"],
-                                        fg=COLORS["text_secondary"], wraplength=UI_CONFIG["content_max_width"],
-                                        justify=tk.LEFT)
-            description_label.pack(fill=tk.X, anchor=tk.W)
-
-            # Efectos hover modernos
-            def on_enter(e, card=option_card, inner=option_inner):
-                card.config(bg=COLORS["bg_overlay"])
-                inner.config(border=COLORS["primary"])
-
-            def on_leave(e, card=option_card, inner=option_inner):
-                card.config(bg=COLORS["bg_card"])
-                inner.config(border=COLORS["border_light"])
-
-            option_card.bind("<Enter>", on_enter)
-            option_card.bind("<Leave>", on_leave)
-            option_inner.bind("<Enter>", on_enter)
-            option_inner.bind("<Leave>", on_leave)
-            option_title.bind("<Enter>", on_enter)
-            option_title.bind("<Leave>", on_leave)
-            description_label.bind("<Enter>", on_enter)
-            description_label.bind("<Leave>", on_leave)
-
-            # Evento de selección
-            def select_option(e, key=choice_key, card=option_card):
-                callback(key, card)
-
-            option_card.bind("<Button-1>", select_option)
-            option_inner.bind("<Button-1>", select_option)
-            option_title.bind("<Button-1>", select_option)
-            description_label.bind("<Button-1>", select_option)
+        with self.latency_monitor.timed("option_rebuild"):
+            options = list(mission_data["options"].items())
+            self.clear_options()
+
+            # El pool sólo crece cuando una pregunta tiene más opciones de las creadas
+            self.reserve_option_slots(len(options))
+
+            for i, (choice_key, choice_description) in enumerate(options):
+                slot = self._option_pool[i]
+                slot.key = choice_key
+                slot.callback = callback
+                slot.letter_label.config(text=chr(65 + i))  # A, B, C...
+                slot.title_label.config(text=choice_key)
+                slot.description_label.config(text=choice_description)
+                slot.card.pack(fill=tk.X, padx=UI_CONFIG["spacing_lg"], pady=UI_CONFIG["spacing_sm"])
+
+            self._active_options = len(options)
+
+    def reserve_option_slots(self, count: int) -> None:
+        """
+        Crea por adelantado las tarjetas de opción que falten (sin mostrarlas).
+
+        Args:
+            count: Número de opciones que se van a necesitar
+        """
+        while len(self._option_pool) < count:
+            self._option_pool.append(self._build_option_card())
+
+    def _build_option_card(self) -> "_OptionCard":
+        """Construye una tarjeta de opción vacía con sus eventos enlazados una sola vez."""
+        # Card de opción moderna
+        option_card = tk.Frame(self.options_frame, bg=COLORS["bg_card"],
+                              relief="flat", borderwidth=0, cursor="hand2")
+
+        # Contenedor interno con borde sutil
+        option_inner = tk.Frame(option_card, bg=COLORS["bg_card"],
+                               padx=UI_CONFIG["card_padding"], pady=UI_CONFIG["card_padding"],
+                               relief="solid", borderwidth=1, highlightthickness=1,
+                               highlightbackground=COLORS["border_light"])
+        option_inner.pack(fill=tk.X, padx=UI_CONFIG["spacing_xs"], pady=UI_CONFIG["spacing_xs"])
+
+        # Header de opción
+        option_header = tk.Frame(option_inner, bg=COLORS["bg_card"])
+        option_header.pack(fill=tk.X, pady=(0, UI_CONFIG["spacing_sm"]))
+
+        # Letra de opción (A, B, C, etc.)
+        letter_badge = tk.Frame(option_header, bg=COLORS["primary"],
+                               padx=UI_CONFIG["spacing_sm"], pady=UI_CONFIG["spacing_xs"])
+        letter_badge.pack(side=tk.LEFT)
+
+        letter_label = tk.Label(letter_badge, font=self.fonts["caption"],
+                               bg=COLORS["primary"], fg=COLORS["text_white"])
+        letter_label.pack()
+
+        # Título de opción
+        option_title = tk.Label(option_header, font=self.fonts["body"],
+                               bg=COLORS["bg_card"], fg=COLORS["text_primary"])
+        option_title.pack(side=tk.LEFT, padx=UI_CONFIG["spacing_md"])
+
+        # Descripción
+        description_label = tk.Label(option_inner, font=self.fonts["caption"],
+                                    bg=COLORS["bg_card"], fg=COLORS["text_secondary"],
+                                    wraplength=UI_CONFIG["content_max_width"], justify=tk.LEFT)
+        description_label.pack(fill=tk.X, anchor=tk.W)
+
+        slot = _OptionCard(option_card, option_inner, letter_label, option_title, description_label)
+
+        # Los manejadores leen la opción actual del slot, así no hay que volver a enlazarlos
+        for widget in (option_card, option_inner, option_title, description_label):
+            widget.bind("<Enter>", lambda e, s=slot: self._set_option_hover(s, True))
+            widget.bind("<Leave>", lambda e, s=slot: self._set_option_hover(s, False))
+            widget.bind("<Button-1>", lambda e, s=slot: self._select_option(s))
+
+        return slot
+
+    def _set_option_hover(self, slot: "_OptionCard", hovered: bool) -> None:
+        """Aplica o retira el resaltado de una tarjeta."""
+        if slot.hovered == hovered:
+            return
+        slot.hovered = hovered
+        slot.card.config(bg=COLORS["bg_secondary"] if hovered else COLORS["bg_card"])
+        slot.inner.config(highlightbackground=COLORS["primary"] if hovered else COLORS["border_light"])
+
+    def _select_option(self, slot: "_OptionCard") -> None:
+        """Despacha el clic de una tarjeta a la opción que muestra actualmente."""
+        if slot.callback is not None and slot.key is not None:
+            with self.latency_monitor.timed("option_click"):
+                slot.callback(slot.key, slot.card)
 
     def show_message(self, title: str, message: str, type: str = "info") -> None:
         """Muestra un mensaje al usuario."""
@@ -836,11 +889,9 @@ class UIManager:
             self.retry_button
         ]
 
-        # Agregar opciones si existen
-        if self.options_frame:
-            for widget in self.options_frame.winfo_children():
-                if isinstance(widget, tk.Frame):
-                    self.focusable_widgets.append(widget)
+        # Agregar opciones visibles
+        for slot in self._option_pool[:self._active_options]:
+            self.focusable_widgets.append(slot.card)
 
     def handle_arrow_navigation(self, direction: str) -> None:
         """Maneja navegación con flechas."""
@@ -870,17 +921,9 @@ class UIManager:
 
     def type_story_effect(self, full_text: str, callback: callable = None) -> None:
         """Implementa el efecto de escritura de teletipo."""
-        if not hasattr(self, '_story_idx'):
-            self._story_idx = 0
-            self.story_text_var.set("")
-
-        if self._story_idx < len(full_text):
-            current_char = full_text[self._story_idx]
-            self.story_text_var.set(self.story_text_var.get() + current_char)
-            self._story_idx += 1
-            self.after_id = self.root.after(30, lambda: self.type_story_effect(full_text, callback))
-        else:
-            self.after_id = None
-            self._story_idx = 0
-            if callback:
-                callback()
\ No newline at end of file
+        # Volver a llamar reemplaza la animación en curso
+        self.typewriter.start(full_text, on_complete=callback)
+
+    def skip_story_effect(self) -> None:
+        """Muestra de inmediato el resto de la historia en curso."""
+        self.typewriter.skip()
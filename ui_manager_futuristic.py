@@ -7,6 +7,8 @@ import tkinter as tk
 from tkinter import messagebox, filedialog, scrolledtext
 from typing import Dict, Any, Optional, Callable, List
 
+from ui_registry import get_font_table
+
 
 class UIManager:
     """Gestor de interfaz futurística con excelente legibilidad."""
@@ -37,7 +39,7 @@ class UIManager:
         }
         
         # Fuentes grandes y legibles
-        self.fonts = {
+        self.fonts = get_font_table({
             "title": ("Arial", 28, "bold"),
             "header": ("Arial", 22, "bold"),
             "subheader": ("Arial", 18, "bold"),
@@ -46,7 +48,7 @@ class UIManager:
             "caption": ("Arial", 14, "normal"),
             "button": ("Arial", 16, "bold"),
             "stats": ("Arial", 14, "bold")
-        }
+        }, self.root)
         
         # Variables de texto
         self.story_text_var = tk.StringVar()
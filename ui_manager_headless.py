@@ -0,0 +1,149 @@
+"""
+UI Manager Headless - Proyecto Alpha v4.0
+Interfaz sin pantalla para reproducir sesiones y ejecutar la lógica del juego en pruebas.
+"""
+
+import itertools
+from typing import Any, Callable, Dict, Optional
+
+
+class HeadlessVar:
+    """Equivalente mínimo de tk.StringVar."""
+
+    def __init__(self, value: str = ""):
+        self.value = value
+
+    def get(self) -> str:
+        return self.value
+
+    def set(self, value: str) -> None:
+        self.value = value
+
+
+class HeadlessWidget:
+    """
+    Widget sin pantalla: guarda sus opciones y acepta cualquier llamada.
+
+    Los botones respetan `state` igual que Tk: invocar uno deshabilitado
+    no ejecuta su comando.
+    """
+
+    def __init__(self, **options):
+        self.options: Dict[str, Any] = dict(options)
+
+    def config(self, **options) -> None:
+        self.options.update(options)
+
+    configure = config
+
+    def cget(self, key: str) -> Any:
+        return self.options.get(key)
+
+    def invoke(self) -> Any:
+        command = self.options.get("command")
+        if command is None or str(self.options.get("state", "normal")) == "disabled":
+            return None
+        return command()
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        # Métodos de geometría, bind, destroy... no tienen efecto sin pantalla
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: None
+
+
+class HeadlessRoot(HeadlessWidget):
+    """Ventana raíz sin pantalla: los temporizadores se aceptan pero no se ejecutan."""
+
+    def __init__(self):
+        super().__init__()
+        self._after_ids = itertools.count(1)
+
+    def _root(self) -> "HeadlessRoot":
+        return self
+
+    def after(self, ms: int, func: Optional[Callable] = None, *args) -> str:
+        return f"after#{next(self._after_ids)}"
+
+    def after_idle(self, func: Callable, *args) -> str:
+        return self.after(0, func)
+
+    def winfo_exists(self) -> int:
+        return 1
+
+
+class UIManager:
+    """Gestor de UI sin pantalla con la misma interfaz que usa GameController."""
+
+    def __init__(self, root):
+        self.root = root
+
+        # Variables de texto
+        self.story_text_var = HeadlessVar()
+        self.progress_text_var = HeadlessVar()
+        self.feedback_text_var = HeadlessVar()
+        self.timer_text_var = HeadlessVar()
+        self.metrics_text_var = HeadlessVar()
+
+        # Componentes principales
+        self.mission_title_label = HeadlessWidget()
+        self.mode_indicator = HeadlessWidget()
+        self.next_button = HeadlessWidget(state="normal")
+        self.hint_button = HeadlessWidget(state="normal")
+        self.retry_button = HeadlessWidget(state="normal")
+
+        # Opciones activas
+        self.options: Dict[str, str] = {}
+        self.option_callback: Optional[Callable] = None
+        self.menu_callbacks: Dict[str, Callable] = {}
+        self.progress = (0, 0)
+        self.stats: Dict[str, Any] = {}
+
+    def create_main_layout(self) -> None:
+        pass
+
+    def create_side_panel(self) -> None:
+        pass
+
+    def create_animations_canvas(self) -> None:
+        pass
+
+    def setup_animations(self) -> None:
+        pass
+
+    def create_menu_bar(self, callbacks: Dict[str, Callable]) -> None:
+        self.menu_callbacks = dict(callbacks)
+
+    def clear_options(self) -> None:
+        self.options = {}
+        self.option_callback = None
+
+    def create_option_buttons(self, mission: Dict[str, Any], callback: Callable) -> None:
+        self.options = dict(mission["options"])
+        self.option_callback = callback
+
+    def select_option(self, key: str) -> Any:
+        """
+        Equivale a pulsar una opción.
+
+        Raises:
+            KeyError: Si la opción no está en pantalla
+        """
+        if self.option_callback is None or key not in self.options:
+            raise KeyError(f"Opción no disponible: {key}")
+        return self.option_callback(key, None)
+
+    def update_progress_display(self, score: int, max_score: int) -> None:
+        self.progress = (score, max_score)
+
+    def update_stats_display(self, stats: Dict[str, Any]) -> None:
+        self.stats = dict(stats)
+
+    def update_achievements_display(self, achievements) -> None:
+        pass
+
+    def show_tutorial(self) -> None:
+        pass
+
+    def show_about(self) -> None:
+        pass
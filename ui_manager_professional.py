@@ -7,6 +7,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Dict, Any, Optional, Callable, List
 
+from ui_registry import get_font_table
+
 
 class UIManager:
     """Gestor de interfaz profesional de calidad comercial."""
@@ -38,7 +40,7 @@ class UIManager:
         }
         
         # Tipografía profesional
-        self.fonts = {
+        self.fonts = get_font_table({
             "title": ("Segoe UI", 24, "bold"),
             "heading": ("Segoe UI", 18, "bold"),
             "subheading": ("Segoe UI", 16, "bold"),
@@ -46,7 +48,7 @@ class UIManager:
             "body_large": ("Segoe UI", 16, "normal"),
             "caption": ("Segoe UI", 12, "normal"),
             "button": ("Segoe UI", 14, "bold")
-        }
+        }, self.root)
         
         # Variables
         self.story_text_var = tk.StringVar()
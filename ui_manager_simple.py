@@ -10,6 +10,7 @@ import time
 from datetime import datetime
 
 from config import COLORS, UI_CONFIG, PROFESSIONAL_CONFIG
+from ui_registry import get_font_table
 
 
 class UIManager:
@@ -59,7 +60,7 @@ class UIManager:
 
     def setup_styles(self) -> None:
         """Configura estilos simples y claros."""
-        self.fonts = {
+        self.fonts = get_font_table({
             "title": ("Arial", 24, "bold"),
             "header": ("Arial", 18, "bold"),
             "subheader": ("Arial", 16, "bold"),
@@ -67,7 +68,7 @@ class UIManager:
             "caption": ("Arial", 12, "normal"),
             "small": ("Arial", 10, "normal"),
             "button": ("Arial", 12, "bold"),
-        }
+        }, self.root)
         
         self.colors = {
             "bg_main": "#FFFFFF",
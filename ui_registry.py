@@ -0,0 +1,244 @@
+"""
+UI Registry Module - Proyecto Alpha v4.0
+Registro de skins de interfaz con carga diferida y tabla compartida de fuentes.
+"""
+
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import UI_CONFIG
+
+logger = logging.getLogger("UIRegistry")
+
+# Skin -> (módulo, clase). Sólo se importa el módulo de la skin que se usa.
+UI_BACKENDS: Dict[str, Tuple[str, str]] = {
+    "default": ("ui_manager", "UIManager"),
+    "basic": ("ui_manager_basic", "UIManager"),
+    "clean": ("ui_manager_clean", "UIManager"),
+    "futuristic": ("ui_manager_futuristic", "UIManager"),
+    "perfect": ("ui_manager_perfect", "UIManager"),
+    "professional": ("ui_manager_professional", "UIManager"),
+    "simple": ("ui_manager_simple", "UIManager"),
+}
+
+DEFAULT_SKIN = "default"
+
+# Tabla tipográfica por defecto, derivada de UI_CONFIG
+DEFAULT_FONT_SPEC: Dict[str, Tuple] = {
+    "title": UI_CONFIG["font_title"],
+    "header": UI_CONFIG["font_header"],
+    "subheader": UI_CONFIG["font_subheader"],
+    "body": UI_CONFIG["font_body"],
+    "caption": UI_CONFIG["font_caption"],
+    "small": UI_CONFIG["font_small"],
+    "button": UI_CONFIG["font_button"],
+    "metrics": UI_CONFIG["font_metrics"],
+}
+
+_backend_cache: Dict[str, Any] = {}
+_import_times_ms: Dict[str, float] = {}
+_font_tables: Dict[Tuple, Dict[str, Any]] = {}
+
+
+def available_skins() -> List[str]:
+    """Lista los nombres de skin registrados."""
+    return list(UI_BACKENDS)
+
+
+def register_skin(name: str, module_name: str, class_name: str = "UIManager") -> None:
+    """
+    Registra una skin adicional.
+
+    Args:
+        name: Nombre de la skin
+        module_name: Módulo que contiene el gestor de UI
+        class_name: Clase del gestor dentro del módulo
+    """
+    UI_BACKENDS[name] = (module_name, class_name)
+    _backend_cache.pop(name, None)
+
+
+def resolve_ui_backend(skin: Any = None):
+    """
+    Obtiene la clase UIManager de una skin, importando su módulo bajo demanda.
+
+    Args:
+        skin: Nombre de la skin (usa UI_CONFIG["skin"] si es None) o
+              directamente una clase de gestor de UI sin registrar
+
+    Returns:
+        Clase del gestor de UI
+
+    Raises:
+        ValueError: Si la skin no está registrada
+    """
+    if skin is None:
+        skin = UI_CONFIG.get("skin", DEFAULT_SKIN)
+    if not isinstance(skin, str):
+        return skin
+    if skin in _backend_cache:
+        return _backend_cache[skin]
+    if skin not in UI_BACKENDS:
+        raise ValueError(f"Skin de interfaz desconocida: {skin} (disponibles: {', '.join(UI_BACKENDS)})")
+
+    module_name, class_name = UI_BACKENDS[skin]
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    _import_times_ms[skin] = (time.perf_counter() - start) * 1000.0
+    backend = getattr(module, class_name)
+    _backend_cache[skin] = backend
+    logger.info(f"Skin '{skin}' cargada desde {module_name} en {_import_times_ms[skin]:.1f} ms")
+    return backend
+
+
+def create_ui_manager(root, skin: Any = None):
+    """
+    Crea el gestor de UI de la skin indicada.
+
+    Args:
+        root: Ventana Tk principal
+        skin: Nombre de la skin (usa UI_CONFIG["skin"] si es None) o clase del gestor
+
+    Returns:
+        Instancia del gestor de UI
+    """
+    return resolve_ui_backend(skin)(root)
+
+
+def get_font_table(spec: Optional[Dict[str, Tuple]] = None, root=None) -> Dict[str, Any]:
+    """
+    Obtiene una tabla de fuentes compartida y cacheada.
+
+    Sin ventana devuelve las tuplas de fuente. Con ventana crea fuentes Tk
+    con nombre, una por descripción distinta, compartidas por todas las
+    skins de esa ventana: Tk no vuelve a resolver la fuente en cada widget.
+
+    Args:
+        spec: Clave -> (familia, tamaño, estilo); por defecto la de UI_CONFIG
+        root: Ventana Tk opcional
+
+    Returns:
+        Diccionario clave -> fuente (tupla o tkinter.font.Font)
+    """
+    if spec is None:
+        spec = DEFAULT_FONT_SPEC
+    key = tuple(sorted(spec.items()))
+    # Las tablas con fuentes Tk se guardan en la ventana para que vivan con ella
+    tables = _font_tables if root is None else root.__dict__.setdefault("_font_tables", {})
+    table = tables.get(key)
+    if table is not None:
+        return table
+
+    if root is None:
+        table = dict(spec)
+    else:
+        import tkinter.font as tkfont
+
+        named = root.__dict__.setdefault("_named_fonts", {})
+        table = {}
+        for name, description in spec.items():
+            font = named.get(description)
+            if font is None:
+                family, size = description[0], description[1]
+                style = description[2] if len(description) > 2 else "normal"
+                if style in ("bold", "normal"):
+                    font = tkfont.Font(root=root, family=family, size=size, weight=style)
+                else:
+                    font = tkfont.Font(root=root, family=family, size=size, slant=style)
+                named[description] = font
+            table[name] = font
+    tables[key] = table
+    return table
+
+
+def apply_styles(style, styles: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Aplica estilos ttk omitiendo los ya configurados con los mismos valores.
+
+    Args:
+        style: Instancia de ttk.Style
+        styles: Nombre de estilo -> opciones de configure
+    """
+    applied = style.master.__dict__.setdefault("_applied_styles", {})
+    for name, options in styles.items():
+        signature = tuple(sorted((k, str(v)) for k, v in options.items()))
+        if applied.get(name) == signature:
+            continue
+        style.configure(name, **options)
+        applied[name] = signature
+
+
+def get_import_times() -> Dict[str, float]:
+    """Tiempos de importación (ms) de las skins cargadas en este proceso."""
+    return dict(_import_times_ms)
+
+
+_IMPORT_PROBE = (
+    "import importlib, json, sys, time\n"
+    "start = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "print(json.dumps({'import_ms': (time.perf_counter() - start) * 1000.0}))\n"
+)
+
+
+def measure_skin_costs(skins: Optional[List[str]] = None, root=None) -> Dict[str, Dict[str, float]]:
+    """
+    Mide el coste de importación y construcción de cada skin.
+
+    La importación se mide en un proceso nuevo para obtener el coste en frío
+    sin contaminar los módulos ya cargados. La construcción sólo se mide si
+    se proporciona una ventana, sobre un Toplevel oculto que se destruye.
+
+    Args:
+        skins: Skins a medir (todas si es None)
+        root: Ventana Tk opcional para medir la construcción
+
+    Returns:
+        Diccionario skin -> {"import_ms", "construct_ms"}
+    """
+    import subprocess
+
+    results: Dict[str, Dict[str, float]] = {}
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+
+    for skin in skins or available_skins():
+        module_name, _ = UI_BACKENDS[skin]
+        entry: Dict[str, float] = {}
+        try:
+            output = subprocess.run([sys.executable, "-c", _IMPORT_PROBE, module_name],
+                                    cwd=base_dir, capture_output=True, text=True,
+                                    timeout=60, check=True).stdout
+            entry["import_ms"] = json.loads(output.strip().splitlines()[-1])["import_ms"]
+        except Exception as e:
+            logger.warning(f"No se pudo medir la importación de '{skin}': {e}")
+
+        if root is not None:
+            import tkinter as tk
+
+            top = tk.Toplevel(root)
+            top.withdraw()
+            try:
+                backend = resolve_ui_backend(skin)
+                start = time.perf_counter()
+                backend(top)
+                entry["construct_ms"] = (time.perf_counter() - start) * 1000.0
+            except Exception as e:
+                logger.warning(f"No se pudo medir la construcción de '{skin}': {e}")
+            finally:
+                top.destroy()
+
+        results[skin] = entry
+    return results
+
+
+if __name__ == "__main__":
+    print("🎨 Coste de las skins de interfaz")
+    for skin, costs in measure_skin_costs().items():
+        import_ms = costs.get("import_ms")
+        print(f"  {skin:<14} importación: {import_ms:7.1f} ms" if import_ms is not None
+              else f"  {skin:<14} importación: n/d")